@@ -1,3 +1,5 @@
+import time
+_STARTUP_T0 = time.perf_counter()
 import sys
 import os
 import json
@@ -7,9 +9,8 @@ import shutil
 import threading
 import csv
 import traceback
-import time
-import requests
-from packaging import version
+import importlib
+import importlib.util
 from functools import partial
 from datetime import datetime
 from PyQt5 import QtWidgets, QtCore, QtGui, QtMultimedia
@@ -17,27 +18,54 @@ from PyQt5.QtCore import QObject, pyqtSignal
 import xml.etree.ElementTree as ET
 import xml.dom.minidom as minidom
 import struct
-from collections import namedtuple
+import mmap
+import sqlite3
+import hashlib
+import pickle
+from collections import namedtuple, OrderedDict
+from collections.abc import MutableMapping
 from dataclasses import dataclass
 from typing import Optional, List
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-try:
-    import numpy as np
-    import scipy.io.wavfile as wavfile
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    text = str(ImportError)
-    MATPLOTLIB_AVAILABLE = False
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import multiprocessing
+
+def _module_installed(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+# Optional dependencies are imported on first use through the accessors below;
+# the *_AVAILABLE flags only record whether they are installed.
+NUMPY_AVAILABLE = _module_installed("numpy")
+SCIPY_AVAILABLE = _module_installed("scipy")
+PSUTIL_AVAILABLE = _module_installed("psutil")
+_LAZY_MODULES = {}
+
+def _lazy_import(name: str):
+    if name not in _LAZY_MODULES:
+        try:
+            _LAZY_MODULES[name] = importlib.import_module(name)
+        except ImportError as e:
+            DEBUG.log(f"Optional module '{name}' could not be imported: {e}", "WARNING")
+            _LAZY_MODULES[name] = None
+    return _LAZY_MODULES[name]
+
+def get_numpy():
+    """The numpy module, or None if it is not available."""
+    return _lazy_import("numpy") if NUMPY_AVAILABLE else None
+
+def get_wavfile():
+    """scipy.io.wavfile, or None if SciPy is not available."""
+    return _lazy_import("scipy.io.wavfile") if SCIPY_AVAILABLE else None
+
+def get_psutil():
+    """The psutil module, or None if it is not available."""
+    return _lazy_import("psutil") if PSUTIL_AVAILABLE else None
 CuePoint = namedtuple('CuePoint', ['id', 'position', 'chunk_id', 'chunk_start', 'block_start', 'sample_offset'])
 Label = namedtuple('Label', ['id', 'text'])
+DecodeJob = namedtuple('DecodeJob', ['wem_path', 'wav_path', 'label'])
 
 if sys.platform == "win32":
     import subprocess
@@ -50,3076 +78,48 @@ else:
     CREATE_NO_WINDOW = 0
 current_version = "v1.1.5"
 
-TRANSLATIONS = {
-    "en": {
-        # === ОСНОВНЫЕ ЭЛЕМЕНТЫ ИНТЕРФЕЙСА ===
-        "app_title": "Mercedes's Outlast Trials Audio Editor",
-        "file_menu": "File",
-        "edit_menu": "Edit",
-        "tools_menu": "Tools",
-        "help_menu": "Help",
-        "save_subtitles": "Save Subtitles",
-        "export_subtitles": "Export Subtitles...",
-        "import_subtitles": "Import Subtitles...",
-        "import_custom_subtitles": "Import Custom Subtitles (Beta)...",
-        "exit": "Exit",
-        "revert_to_original": "Revert to Original",
-        "find_replace": "Find && Replace...",
-        "compile_mod": "Compile Mod",
-        "deploy_and_run": "Deploy Mod && Run Game",
-        "show_debug": "Show Debug Console",
-        "settings": "Settings...",
-        "about": "About",
-        
-        # === ФИЛЬТРЫ И СОРТИРОВКА ===
-        "filter": "Filter:",
-        "sort": "Sort:",
-        "all_files": "All Files",
-        "with_subtitles": "With Subtitles",
-        "without_subtitles": "Without Subtitles",
-        "modified": "Modified",
-        "modded": "Modded (Audio)",
-        "name_a_z": "Name (A-Z)",
-        "name_z_a": "Name (Z-A)",
-        "id_asc": "ID ↑",
-        "id_desc": "ID ↓",
-        "recent_first": "Recent First",
-        
-        # === ОСНОВНЫЕ СЛОВА ===
-        "name": "Name",
-        "id": "ID",
-        "subtitle": "Subtitle",
-        "status": "Status",
-        "mod": "MOD",
-        "path": "Path",
-        "source": "Source",
-        "original": "Original",
-        "save": "Save",
-        "cancel": "Cancel",
-        "browse": "Browse...",
-        "confirmation": "Confirmation",
-        "error": "Error",
-        "warning": "Warning",
-        "success": "Success",
-        "info": "Information",
-        "close": "Close",
-        "ready": "Ready",
-        "waiting": "Waiting...",
-        "done": "Done",
-        "error_status": "Error",
-        "size_warning": "Size Warning",
-        "loading": "Loading...",
-        "processing": "Processing...",
-        "converting": "Converting...",
-        "complete": "Complete",
-        "stop": "Stop",
-        "clear": "Clear",
-        "language": "Language",
-        
-        # === ДИАЛОГИ И СООБЩЕНИЯ ===
-        "edit_subtitle": "Edit Subtitle",
-        "subtitle_preview": "Subtitle Preview",
-        "file_info": "File Information",
-        "select_game_path": "Select game root folder",
-        "game_path_saved": "Game path saved",
-        "mod_deployed": "Mod deployed successfully!",
-        "game_launching": "Launching game...",
-        "no_game_path": "Please set game path in settings first",
-        "no_changes": "No Changes",
-        "no_modified_subtitles": "No modified subtitles to export",
-        "import_error": "Import Error",
-        "export_error": "Export Error",
-        "save_error": "Save Error",
-        "file_not_found": "File not found",
-        "conversion_stopped": "Conversion stopped",
-        "deployment_complete": "Deployment complete",
-        "characters": "Characters:",
-        
-        # === КОНФЛИКТЫ СУБТИТРОВ ===
-        "conflict_detected": "Subtitle Conflict Detected",
-        "conflict_message": "The following keys already have subtitles:\n\n{conflicts}\n\nWhich subtitles would you like to keep?",
-        "use_existing": "Keep Existing",
-        "use_new": "Use New",
-        "merge_all": "Merge All (Keep Existing)",
-        
-        # === КОНВЕРТЕР WAV TO WEM ===
-        "wav_to_wem_converter": "Audio to WEM Converter",
-        "conversion_mode": "Conversion Mode (Only Size Matching Mode)",
-        "strict_mode": "Strict Mode",
-        "adaptive_mode": "Adaptive Mode",
-        "strict_mode_desc": "❌ Fails if too large",
-        "adaptive_mode_desc": "✅ Auto-adjusts quality",
-        "path_configuration": "Path Configuration",
-        "wwise_path": "Wwise:",
-        "project_path": "Project:",
-        "wav_path": "Audio:",
-        "files_for_conversion": "Files for Conversion",
-        "add_all_wav": "Add All Audio Files",
-        "convert": "Convert",
-        "files_ready": "Files ready:",
-        "wav_file": "Audio File",
-        "target_wem": "Target WEM",
-        "target_size": "Target Size",
-        "files_ready_count": "Files ready: {count}",
-        "confirm_clear": "Clear all files?",
-        
-        # === КОНВЕРТАЦИЯ И ЛОГИ ===
-        "conversion_complete": "Conversion Complete",
-        "conversion_logs": "Conversion Logs",
-        "clear_logs": "Clear Logs",
-        "save_logs": "Save Logs",
-        "logs_cleared": "Logs cleared...",
-        "logs_saved": "Logs saved",
-        "error_saving_logs": "Failed to save logs",
-        "starting_conversion": "Starting conversion in {mode} mode...",
-        "file_status": "File {current}/{total}: {name}",
-        "attempting": "attempt {attempts} (Conversion={value})",
-        "testing_sample_rate": "Testing {rate}Hz...",
-        "resampled_to": "Resampled to {rate}Hz",
-        "results_summary": "✅ Conversion and deployment complete!\n\nSuccessful: {successful}\nErrors: {failed}\nSize warnings: {warnings}\n\nFiles deployed to MOD_P\nSee 'Logs' tab for detailed results",
-        "add_files_warning": "Please add files for conversion first!",
-        
-        # === ИНСТРУКЦИИ ===
-        "converter_instructions": "Audio to WEM Converter:\n1) Set Wwise path 2) Choose temp project folder 3) Select Audio folder 4) Add files 5) Convert",
-        "converter_instructions2": "WEM Converter:\n1) Set Wwise project path 2) Convert to mod",
-        
-        # === ПУТИ И ПЛЕЙСХОЛДЕРЫ ===
-        "wwise_path_placeholder": "Wwise installation path... (Example: D:/Audiokinetic/Wwise2019.1.6.7110)",
-        "project_path_placeholder": "New/Old Project path... (Example: D:/ExampleProjects/MyNewProject) P.S. Can be empty",
-        "wav_folder_placeholder": "Audio files folder...",
-        
-        # === ПОИСК И ОБРАБОТКА ===
-        "select_wav_folder": "Please select Audio folder first!",
-        "wems_folder_not_found": "Wems folder not found",
-        "no_wav_files": "No Audio files found in folder!",
-        "search_complete": "Search complete",
-        "auto_search_result": "Automatically found matches: {matched} of {total}",
-        "target_language": "Target language for voice files",
-        "no_matches_found": "No matches found for",
-        
-        # === ЭКСПОРТ СУБТИТРОВ ===
-        "cleanup_mod_subtitles": "Clean Up MOD_P Subtitles",
-        "export_subtitles_for_game": "Export Subtitles for Game",
-        "subtitle_export_ready": "Ready to export subtitles...",
-        "deploying_files": "Deploying files to game structure...",
-        "deployment_error": "Deployment error",
-        "conversion_failed": "Conversion failed",
-        "all_files_failed": "All files failed",
-        "see_logs_for_details": "See 'Logs' tab for details",
-        "localization_editor": "Localization Editor",    
-        # === WEM ПРОЦЕССОР ===
-        "wem_processor_warning": "⚠️ WEM Processor (Not Recommended)",
-        "wem_processor_desc": "Legacy tool for processing ready WEM files.",
-        "wem_processor_recommendation": "Use 'Audio to WEM' for beginners.",
-        
-        # === ЭКСПОРТЕР ЛОКАЛИЗАЦИИ ===
-        "localization_exporter": "Localization Exporter",
-        "export_modified_subtitles": "Export Modified Subtitles",
-        "localization_editor_desc": "Edit localization directly. Use the global search bar above to filter results.",
-        # === ОЧИСТКА СУБТИТРОВ ===
-        "cleanup_subtitles_found": "Found {count} subtitle files in MOD_P",
-        "select_files_to_delete": "Please select files to delete",
-        "confirm_deletion": "Confirm Deletion",
-        "delete_files_warning": "Are you sure you want to delete {count} subtitle files?\n\nThis action cannot be undone!",
-        "cleanup_complete": "Cleanup Complete",
-        "cleanup_with_errors": "Cleanup Complete with Errors",
-        "files_deleted_successfully": "Successfully deleted {count} subtitle files from MOD_P",
-        "files_deleted_with_errors": "Deleted {count} files successfully\n{errors} files had errors\n\nCheck the status log for details",
-        "no_localization_found": "No Files Found",
-        "no_localization_message": "No localization folder found at:\n{path}",
-        "no_subtitle_files": "No subtitle files found in:\n{path}",
-        "select_all": "Select All",
-        "select_none": "Select None",
-        "quick_select": "Quick select:",
-        "select_by_language": "Select by language...",
-        "delete_selected": "Delete Selected",
-        "no_selection": "No Selection",
-        
-        # === АУДИО ИНФОРМАЦИЯ ===
-        "audio_comparison": "Audio Comparison",
-        "original_audio": "Original Audio",
-        "modified_audio": "Modified Audio",
-        "duration": "Duration",
-        "size": "Size",
-        "sample_rate": "Sample Rate",
-        "bitrate": "Bitrate",
-        "channels": "Channels",
-        "audio_markers": "Audio Markers",
-        "original_markers": "Original Markers",
-        "modified_markers": "Modified Markers",
-        
-        # === КОНТЕКСТНОЕ МЕНЮ ===
-        "play_original": "▶ Play Original",
-        "play_mod": "▶ Play Mod",
-        "export_as_wav": "💾 Export as WAV",
-        "delete_mod_audio": "🗑 Delete Mod Audio",
-        "copy_key": "📋 Copy Key",
-        "copy_text": "📋 Copy Text",
-        "remove": "❌ Remove",
-        "browse_target_wem": "📁 Browse for Target WEM...",
-        "quick_select_menu": "⚡ Quick Select",
-        
-        # === ИНСТРУМЕНТЫ ===
-        "expand_all": "📂 Expand All",
-        "collapse_all": "📁 Collapse All",
-        "edit_button": "✏ Edit",
-        "export_button": "💾 Export",
-        "delete_mod_button": "🗑 Delete Mod AUDIO",
-        "wemprocces_desc": "Select language for renaming and placing WEM files during processing",
-        # === ЭКСПОРТ АУДИО ===
-        "export_audio": "Export Audio",
-        "which_version_export": "Which version would you like to export?",
-        "save_as_wav": "Save as WAV",
-        "wav_files": "WAV Files",
-        "batch_export": "Batch Export",
-        "select_output_directory": "Select Output Directory",
-        "exporting_files": "Exporting {count} files...",
-        "export_results": "Exported {successful} files successfully.\n{errors} errors occurred.",
-        "export_complete": "Export Complete",
-        
-        # === ДИАЛОГИ СОХРАНЕНИЯ ===
-        "save_changes_question": "Save Changes?",
-        "unsaved_changes_message": "You have unsaved subtitle changes. Save before closing?",
-        
-        # === КОМПИЛЯЦИЯ МОДОВ ===
-        "mod_not_found_compile": "Mod file not found. Compile it first?",
-        "mod_compilation_failed": "Mod compilation failed",
-        "repak_not_found": "repak.exe not found!",
-        "compiling_mod": "Compiling Mod",
-        "running_repak": "Running repak...",
-        "mod_compiled_successfully": "Mod compiled successfully!",
-        "compilation_failed": "Compilation failed!",
-        
-        # === НАСТРОЙКИ ===
-        "auto_save": "Auto-save subtitles every 5 minutes",
-        "interface_language": "Interface Language (NEED RESTART):",
-        "theme": "Theme:",
-        "subtitle_language": "Subtitle Language:",
-        "game_path": "Game Path:",
-        "wem_process_language": "WEM Process Language:",
-        "light": "Light",
-        "dark": "Dark",
-        "rename_french_audio": "Rename French audio files to ID (in addition to English)",
-        
-        # === СПРАВКА И ОТЧЕТЫ ===
-        "keyboard_shortcuts": "Keyboard Shortcuts",
-        "documentation": "📖 Documentation",
-        "check_updates": "🔄 Check for Updates",
-        "report_bug": "🐛 Report Bug",
-        "getting_started": "Getting Started",
-        "features": "Features",
-        "file_structure": "File Structure",
-        "credits": "Credits",
-        "license": "License",
-        "github": "GitHub",
-        "discord": "Discord",
-        "donate": "Donate",
-        
-        # === ОТЧЕТ ОБ ОШИБКЕ ===
-        "bug_report_info": "Found a bug? Please provide details below.\nDebug logs will be automatically included.",
-        "description": "Description",
-        "email_optional": "Email (optional)",
-        "copy_report_clipboard": "Copy Report to Clipboard",
-        "open_github_issues": "Open GitHub Issues",
-        "bug_report_copied": "Bug report copied to clipboard!",
-        
-        # === TOOLTIPS ===
-        "has_audio_file": "Has audio file",
-        "no_audio_file": "No audio file",
-        
-        # === О ПРОГРАММЕ ===
-        "about_description": "A tool for managing WEM audio files and game subtitles for Outlast Trials, designed for modders and localization teams.",
-        "key_features": "Key Features",
-        "audio_management": "🎵 <b>Audio Management:</b> Play, convert, and organize WEM files",
-        "subtitle_editing": "📝 <b>Subtitle Editing:</b> Easy editing with conflict resolution",
-        "mod_creation": "📦 <b>Mod Creation:</b> One-click mod compilation and deployment",
-        "multi_language": "🌍 <b>Multi-language:</b> Support for 14+ languages",
-        "modern_ui": "🎨 <b>UI:</b> Clean interface with dark/light themes",
-        "technology_stack": "Technology Stack",
-        "built_with": "Built with Python 3 and PyQt5, utilizing:",
-        "unreal_locres_tool": "UnrealLocres for .locres file handling",
-        "vgmstream_tool": "vgmstream for audio conversion",
-        "repak_tool": "repak for mod packaging",
-        "ffmpeg_tool": "FFmpeg for audio processing",
-        "development_team": "Development Team",
-        "lead_developer": "<b>Lead Developers:</b> Bezna and Mercedes",
-        "developers_label": "Developers:",
-        "developers_names": "Bezna and Mercedes",
-        "polish_translator_label": "Tester/Polish Translator:",
-        "polish_translator_name": "Alaneg",
-        "spanish_translator_label": "Spanish Translator:",
-        "spanish_translator_name": "Mercedes",
-        "special_thanks": "Special Thanks",
-        "vgmstream_thanks": "vgmstream team - For audio conversion tools",
-        "unreal_locres_thanks": "UnrealLocres developers - For localization support",
-        "hypermetric_thanks": "hypermetric - For mod packaging",
-        "ffmpeg_thanks": "FFmpeg - For audio processing",
-        "red_barrels_thanks": "Red Barrels - For creating Outlast Trials",
-        "open_source_libraries": "Open Source Libraries",
-        "pyqt5_lib": "PyQt5 - GUI Framework",
-        "python_lib": "Python Standard Library",
-        "software_disclaimer": "This software is provided \"as is\" without warranty of any kind. Use at your own risk.",
-        "license_agreement": "License Agreement",
-        "copyright_notice": "Copyright (c) 2026 Mercedes's Outlast Trials Audio Editor",
-        "credits": "Credits",
-        "license": "License",
-        "mit_license_text": "Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the \"Software\"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:\n\nThe above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.\n\nTHE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.",
-        
-        # === ГОРЯЧИЕ КЛАВИШИ ===
-        "shortcuts_table_action": "Action",
-        "shortcuts_table_shortcut": "Shortcut",
-        "shortcuts_table_description": "Description",
-        "shortcut_edit_subtitle": "Edit Subtitle",
-        "shortcut_save_subtitles": "Save Subtitles",
-        "shortcut_export_audio": "Export Audio",
-        "shortcut_revert_original": "Revert to Original",
-        "shortcut_deploy_run": "Deploy & Run",
-        "shortcut_debug_console": "Debug Console",
-        "shortcut_settings": "Settings",
-        "shortcut_documentation": "Documentation",
-        "shortcut_exit": "Exit",
-        "shortcut_edit_selected": "Edit selected subtitle",
-        "shortcut_save_all_changes": "Save all subtitle changes",
-        "shortcut_export_selected": "Export selected audio as WAV",
-        "shortcut_revert_selected": "Revert selected subtitle to original",
-        "shortcut_deploy_launch": "Deploy mod and launch game",
-        "shortcut_show_debug": "Show debug console",
-        "shortcut_open_settings": "Open settings dialog",
-        "shortcut_show_help": "Show documentation",
-        "shortcut_close_app": "Close application",
-        "mouse_actions": "Mouse Actions",
-        "mouse_double_subtitle": "<b>Double-click subtitle:</b> Edit subtitle",
-        "mouse_double_file": "<b>Double-click file:</b> Play audio",
-        "exports_modified_subtitles_desc": "Exports modified subtitles in proper structure for the game:",
-        "creates_mod_p_structure": "Creates MOD_P/OPP/Content/Localization/ structure",
-        "supports_multiple_categories": "Supports multiple subtitle categories",
-        "each_language_separate_folder": "Each language placed in separate folder",
-        "ready_files_for_mods": "Ready files can be used in mods",
-        "mouse_right_click": "<b>Right-click:</b> Show context menu",
-        "verify_mod_integrity": "Verify Mod Integrity",
-        "rebuild_bnk_index": "Rebuild Mod BNK Index",
-        "rebuild_bnk_tooltip": "Forcefully syncs all BNK files with the actual WEM files in your mod.",
-        "verifying_mod_integrity": "Verifying Mod Integrity...",
-        "bnk_verification_complete": "Verification Complete",
-        "bnk_no_issues_found": "All modified audio files are consistent with their BNK entries. No issues found!",
-        "bnk_issues_found_title": "Mod Integrity Issues Found",
-        "bnk_issues_found_text": "Found {count} issues in your mod.\n\nThese problems can cause sounds to not play correctly in the game.\n\nDo you want to automatically fix these entries?",
-        "fix_all_btn": "Fix All",
-        "bnk_size_mismatch": "Size Mismatch",
-        "bnk_entry_missing": "BNK Entry Missing",
-        "bnk_report_size": "Type: {type} in {bnk_name}\n  Sound: {short_name} (ID: {source_id})\n  - BNK Size: {bnk_size} bytes\n  - WEM Size: {wem_size} bytes\n\n",
-        "bnk_report_missing": "Type: {type}\n  Sound: {short_name} (ID: {source_id})\n  - A .wem file exists, but no corresponding entry was found in any modified .bnk file.\n\n",
-        "fixing_mod_issues": "Fixing Mod Issues...",
-        "fix_complete_no_issues": "No automatically fixable issues were found (e.g., 'BNK Entry Missing').",
-        "fix_complete_title": "Fix Complete",
-        "fix_complete_message": "Fixed {count} size mismatch issues.",
-        "fix_complete_with_errors": "Fixed {fixed} size mismatch issues.\nFailed to fix {errors} entries. See debug console for details.",
-        "verification_error": "Verification Error",
-        "verification_error_message": "An error occurred during verification:\n\n{error}",
-        "rebuild_bnk_confirm_title": "Rebuild BNK Index",
-        "rebuild_bnk_confirm_text": "This will scan all modified audio (.wem) files and forcefully update the size records in your mod's .bnk files to match.\n\nThis is useful for fixing inconsistencies after manually adding, deleting, or editing WEM files.\n\nDo you want to proceed?",
-        "rebuilding_mod_bnk": "Rebuilding Mod BNK Index...",
-        "rebuild_complete_title": "Rebuild Complete",
-        "rebuild_complete_message": "Rebuild complete!\n\n✅ Re-created {created} BNK file(s) in your mod from originals.\n🔄 Updated {updated} entries to match your WEM files.\n⚙️ Applied {reverted} custom 'In-Game Effects' settings.",
-        "profiles": "Profiles",
-        "profile_manager_tooltip": "Open the Mod Profile Manager",
-        "edit_profile": "Edit Mod Profile",
-        "create_profile": "Create New Mod Profile",
-        "profile_name": "Profile Name:",
-        "author": "Author:",
-        "version": "Version:",
-        "icon_png": "Icon (PNG):",
-        "no_icon_selected": "No icon selected.",
-        "select_icon": "Select Icon",
-        "png_images": "PNG Images",
-        "validation_error": "Validation Error",
-        "profile_name_empty": "Profile Name cannot be empty.",
-        "profile_manager_title": "Mod Profile Manager",
-        "create_new_profile_btn": "➕ Create New...",
-        "add_existing_profile_btn": "📁 Add Existing...",
-        "remove_from_list_btn": "➖ Remove From List",
-        "select_a_profile": "Select a profile",
-        "author_label": "<b>Author:</b>",
-        "version_label": "<b>Version:</b>",
-        "no_description": "<i>No description.</i>",
-        "edit_details_btn": "⚙️ Edit Details...",
-        "active_profile_btn": "✓ Active",
-        "activate_profile_btn": "Activate Profile",
-        "error_reading_profile": "<i style='color:red;'>Could not read profile.json</i>",
-        "error_author": "<i style='color:red;'>Error</i>",
-        "select_folder_for_profile": "Select a Folder to Create the New Profile In",
-        "profile_exists_error": "A profile with this name already exists.",
-        "create_profile_error": "Could not create profile: {e}",
-        "select_existing_profile": "Select Existing Profile Folder",
-        "invalid_profile_folder": "The selected folder does not contain a required '{folder}' subfolder.",
-        "profile_already_added": "A profile with this name has already been added.",
-        "remove_profile_title": "Remove Profile",
-        "remove_profile_text": "Are you sure you want to remove the profile '{name}' from the list?\n\nThis will NOT delete the files on your disk.",
-        "profile_activated_title": "Profile Activated",
-        "profile_activated_text": "Profile '{name}' is now active.",
-        "no_active_profile_title": "No Active Profile",
-        "no_active_profile_text": "No mod profile is currently active. Please create or activate a profile first.",
-        "rebuild_complete_message_details": "Rebuild complete!\n\n"
-                                  "✅ Re-created {created} BNK file(s) in your mod from originals.\n"
-                                  "🔄 Updated {updated} entries to match your WEM files.\n"
-                                  "⚙️ Applied {reverted} custom 'In-Game Effects' settings.",
-        "select_version_title": "Select Version",
-        "adjust_volume_for": "Adjust volume for: {filename}\n\nWhich version would you like to adjust?",
-        "batch_adjust_volume_for": "Batch adjust volume for {count} files\n\nWhich version would you like to adjust?",
-        "no_language_selected": "No Language Selected",
-        "select_language_tab_first": "Please select a language tab first.",
-        "no_files_selected": "No Files Selected",
-        "select_files_for_volume": "Please select one or more audio files to adjust volume.",
-        "quick_load_audio_title": "🎵 Quick Load Custom Audio...",
-        "quick_load_audio_tooltip": "Replace this audio with your own file (any format)",
-        "restore_from_backup_title": "🔄 Restore from Backup",
-        "restore_from_backup_tooltip": "Restore previous version of modified audio",
-        "adjust_original_volume_title": "🔊 Adjust Original Volume...",
-        "trim_original_audio_title": "✂️ Trim Original Audio...",
-        "adjust_mod_volume_title": "🔊 Adjust Mod Volume...",
-        "trim_mod_audio_title": "✂️ Trim Mod Audio...",
-        "toggle_ingame_effects_title": "✨ Toggle In-Game Effects",
-        "marking_menu_title": "🖍 Marking",
-        "set_color_menu_title": "🎨 Set Color",
-        "set_tag_menu_title": "🏷 Set Tag",
-        "color_green": "Green",
-        "color_yellow": "Yellow",
-        "color_red": "Red",
-        "color_blue": "Blue",
-        "color_none": "None",
-        "tag_important": "Important",
-        "tag_check": "Check",
-        "tag_done": "Done",
-        "tag_review": "Review",
-        "tag_none": "None",
-        "tag_custom": "Custom...",
-        "custom_tag_title": "Custom Tag",
-        "custom_tag_prompt": "Enter custom tag:",
-        "select_folder_to_open_title": "Select Folder to Open",
-        "which_folder_to_open": "Which folder would you like to open?",
-        "voice_files_folder": "🎙 Voice Files\n{path}",
-        "sfx_files_folder": "🔊 SFX Files\n{path}",
-        "subtitles_folder": "📝 Subtitles\n{path}",
-        "no_target_folders_found": "No target folders found!",
-        "quick_load_mode_label": "Choose conversion mode for Quick Load Custom Audio:",
-        "quick_load_strict": "Strict Mode - Fail if too large",
-        "quick_load_adaptive": "Adaptive Mode - Auto-adjust quality",
-        "audio_files_dialog_title": "Audio Files",
-        "volume_editor_title": "Volume Editor - {shortname}",
-        "volume_deps_missing": "⚠️ Volume editing requires NumPy and SciPy libraries.\n\nPlease install them using:\npip install numpy scipy",
-        "audio_analysis_group": "Audio Analysis",
-        "analyzing": "Analyzing...",
-        "current_rms": "Current RMS:",
-        "current_peak": "Current Peak:",
-        "duration_label": "Duration:",
-        "recommended_max": "Recommended max:",
-        "no_limit": "No limit",
-        "volume_control_group": "Volume Control",
-        "volume_label_simple": "Volume:",
-        "quick_presets": "Quick presets:",
-        "waiting_for_analysis": "Waiting for analysis...",
-        "preview_rms_peak": "Preview: RMS {new_rms:.1f}%, Peak {new_peak:.1f}%",
-        "preview_clipping": " ⚠️ CLIPPING ({over:.1f}% over)",
-        "preview_near_clipping": " ⚠️ Near clipping",
-        "apply_volume_change_btn": "Apply Volume Change",
-        "volume_no_change_msg": "Volume is set to 100% (no change).",
-        "config_required": "Configuration Required",
-        "wwise_config_required_msg": "Wwise is not configured.\n\nPlease check:\n1. Go to Converter tab and configure Wwise paths\n2. Make sure Wwise project exists\n3. Try converting at least one file in Converter tab first",
-        "status_preparing": "Preparing...",
-        "status_using_backup": "Using backup as source...",
-        "status_backup_created": "Created backup and using as source...",
-        "status_using_original": "Using original as source...",
-        "status_converting_to_wav": "Converting WEM to WAV...",
-        "status_adjusting_volume": "Adjusting volume...",
-        "status_preparing_for_wem": "Preparing for WEM conversion...",
-        "status_converting_to_wem": "Converting to WEM...",
-        "status_deploying_to_mod": "Deploying to MOD_P...",
-        "status_complete": "Complete!",
-        "volume_change_success_msg": "Volume successfully changed to {volume}%\nActual change: {actual_change:.0f}%\n{clipping_info}\n{source_info}\n{backup_info}",
-        "clipping_info_text": "\nClipping: {percent:.2f}% of samples",
-        "backup_available_info": "\n\n💾 Backup available - you can restore the previous version if needed.",
-        "source_info_backup": "\n📁 Source: Backup (preserving original quality)",
-        "source_info_mod_backup_created": "\n📁 Source: Current mod (backup created)",
-        "source_info_original": "\n📁 Source: Original file",
-        "wem_conversion_failed_msg": "WEM conversion failed!\n\nPossible solutions:\n1. Check Wwise configuration in Converter tab\n2. Try converting a regular WAV file first to test setup\n3. Ensure Wwise project has correct audio settings\n4. Check if target file size is achievable\n\nTechnical error: {error_message}",
-        "wwise_not_configured_msg": "Wwise is not properly configured!\n\nPlease:\n1. Go to Converter tab\n2. Set valid Wwise installation path\n3. Set project path\n4. Try converting at least one file to verify setup\n\nThen try volume adjustment again.",
-        "required_file_not_found_msg": "Required file not found!\n\n{error_message}\n\nPlease check that:\n- The audio file exists\n- File permissions are correct\n- No other program is using the file",
-        "volume_change_failed_title": "Volume change failed",
-        
-        # === РЕДАКТОР ГРОМКОСТИ (ПАКЕТНЫЙ) ===
-        "batch_volume_editor_title": "Batch Volume Editor - {count} files",
-        "wwise_configured_auto": "✅ Wwise configured automatically",
-        "wwise_not_configured_warning": "⚠️ Wwise not configured - please configure in Converter tab first",
-        "backups_stored_in": "Backups are stored in: {path}",
-        "volume_control_all_files_group": "Volume Control (Applied to All Files)",
-        "files_to_process_group": "Files to Process",
-        "file_header": "File",
-        "language_header": "Language",
-        "current_rms_header": "Current RMS",
-        "current_peak_header": "Current Peak",
-        "new_preview_header": "New Preview",
-        "status_header": "Status",
-        "apply_to_all_btn": "Apply to All Files",
-        "status_skipped_no_analysis": "✗ Skipped (no analysis)",
-        "batch_process_complete_title": "Batch Processing Complete",
-        "batch_process_complete_msg": "Batch volume change complete!\n\nVolume changed to: {volume}%\nSuccessful: {successful}\nFailed: {failed}",
-        "batch_process_error_title": "Batch Processing Error",
-        
-        # === КОНСОЛЬ ОТЛАДКИ ===
-        "debug_console_title": "Debug Console",
-        "auto_scroll_check": "Auto-scroll",
-        "save_log_btn": "Save Log",
-        "save_debug_log_title": "Save Debug Log",
-        "log_files_filter": "Log Files (*.log)",
-        
-        # === DRAG & DROP АУДИО ===
-        "invalid_file_title": "Invalid File",
-        "audio_only_drop_msg": "Only audio files are supported for drag & drop.",
-        "drop_audio_title": "Drop Audio",
-        "drop_on_file_msg": "Please drop onto a specific audio file.",
-        "replace_audio_title": "Replace Audio",
-        "replace_audio_confirm_msg": "Replace audio for:\n{shortname}\n\nwith file:\n{filename}?",
-        
-        # === ПОИСК ===
-        "search_placeholder": "Search...",
-        
-        # === ЗАГРУЗЧИК СУБТИТРОВ ===
-        "processing_file_status": "Processing {filename}...",
-        "processing_additional_subs_status": "Processing additional subtitles...",
-        "loaded_subs_from_files_status": "Loaded {count} subtitles from {processed_files} files",
-        
-        # === РЕДАКТОР СУБТИТРОВ (ГЛОБАЛЬНЫЙ) ===
-        "subtitle_editor_tab_title": "Localization Editor",
-        "subtitle_editor_header": "Localization Editor",
-        "subtitle_editor_desc": "Edit localization directly. Use the global search bar above to filter results.",
-        "without_audio_filter": "Without audio",
-        "without_audio_filter_tooltip": "Show only subtitles that don't have corresponding audio files",
-        "modified_only_filter": "Modified only",
-        "modified_only_filter_tooltip": "Show only subtitles that have been modified",
-        "with_audio_only_filter": "With audio only",
-        "with_audio_only_filter_tooltip": "Show only subtitles that have corresponding audio files",
-        "refresh_btn": "🔄 Refresh",
-        "refresh_btn_tooltip": "Refresh subtitle data from files",
-        "key_header": "Key",
-        "original_header": "Original",
-        "current_header": "Current",
-        "audio_header": "Audio",
-        "edit_selected_btn": "✏ Edit Selected",
-        "save_all_changes_btn": "💾 Save All Changes",
-        "subtitle_save_success": "All subtitle changes have been saved!",
-        "go_to_audio_action": "🔊 Go to Audio File",
-        "audio_not_found_for_key": "Could not find audio file for subtitle key: {key}",
-        "tab_not_found_for_lang": "Could not find tab for language: {lang}",
-        
-        # === ОБРАБОТЧИК WEM (СТАРЫЙ) ===
-        "wem_processor_tab_title": "WEM Processor (Old)",
-        "process_wem_files_btn": "Process WEM Files",
-        "open_target_folder_btn": "Open Target Folder",
-        
-        # === ОЧИСТКА СУБТИТРОВ ===
-        "no_working_files_found": "No working subtitle files (_working.locres) found in Localization.",
-        "cleanup_complete_msg": "Deleted {deleted} working subtitle files.",
-        "cleanup_complete_with_errors_msg": "Deleted {deleted} working subtitle files.\nErrors: {errors}",
-        
-        # === РАЗНОЕ UI ===
-        "quick_load_settings_group": "Quick Load Settings",
-        "conversion_method_group": "Conversion Method",
-        "bnk_overwrite_radio": "BNK Overwrite (Recommended)",
-        "bnk_overwrite_tooltip": "Converts at max quality and overwrites file size in the .bnk file.",
-        "adaptive_size_matching_radio": "Adaptive Size Matching",
-        "adaptive_size_matching_tooltip": "Adjusts audio quality to match original WEM file size.",
-        "rescan_orphans_action": "Rescan Orphaned Files",
-        "rescan_orphans_tooltip": "Forces a new scan of the Wems folder to find files not in SoundbanksInfo",
-        "in_progress_msg": "Already processing. Please wait.",
-        "add_single_file_title": "Select Audio File",
-        "audio_files_filter": "Audio Files (*.wav *.mp3 *.ogg *.flac *.m4a *.aac *.wma *.opus *.webm);;All Files (*.*)",
-        "file_added_status": "Added: {filename}",
-        "file_not_added_status": "File not added: {filename}",
-        "error_adding_file_msg": "Error adding file:\n\n{error}",
-        "update_file_q_title": "File Already Added",
-        "update_file_q_msg": "File '{filename}' is already in the conversion list.\n\nDo you want to update its settings?",
-        "update_btn": "Update",
-        "skip_btn": "Skip",
-        "duplicate_target_q_title": "Duplicate Target WEM",
-        "duplicate_target_q_msg": "Target WEM '{file_id}.wem' is already assigned to:\n\nCurrent: {existing_name}\nNew: {new_name}\n\nDo you want to replace it?",
-        "replace_btn": "Replace",
-        "replace_all_btn": "Replace All",
-        "skip_all_btn": "Skip All",
-        "tags_group_filter": "--- Tags ---",
-        "with_tag_filter": "With Tag: {tag}",
-        "numeric_id_files_group": "Numeric ID Files",
-        "voice_group_name": "VO (Voice)",
-        "bnk_size_mismatch_tooltip": "BNK expects {expected_size:,} bytes, but file is {actual_size:,} bytes.\nClick to update the BNK record.",
-        "bnk_size_missing_wem_tooltip": "BNK record was modified, but the WEM file is missing.\nClick to revert the BNK record to its original state.",
-        "bnk_size_ok_tooltip": "OK: Actual file size matches the BNK record.",
-        "bnk_size_mismatch_btn": "Mismatch! Click to fix",
-        "bnk_size_missing_wem_btn": "Missing WEM! Click to revert",
-        "bnk_fix_success_msg": "BNK file size has been successfully updated!",
-        "bnk_fix_not_found_msg": "Could not find an entry for ID {file_id} in any modded BNK file to fix.",
-        "bnk_fix_error_msg": "An unexpected error occurred while fixing the BNK file:\n{error}",
-        "bnk_revert_success_msg": "BNK record reverted successfully to its original state.",
-        "bnk_revert_fail_msg": "Failed to revert BNK record. The entry might already be correct.",
-        "bnk_revert_error_msg": "An unexpected error occurred while reverting the BNK record:\n{error}",
-        "select_folder_for_mods_title": "Select a Folder to Store Your Mods",
-        "welcome_title": "Welcome!",
-        "first_time_setup_msg": "It looks like this is your first time running the editor.\n\nPlease select a root folder where you want to store your mod profiles (e.g., 'My Documents\\OutlastTrialsMods').\n\nA 'Default' profile will be created for you there.",
-        "setup_required_title": "Setup Required",
-        "setup_required_msg": "A folder for mods is required to continue. The application will now close.",
-        "setup_complete_title": "Setup Complete",
-        "setup_complete_msg": "Your 'Default' profile has been created in:\n{mods_root}",
-        "setup_failed_title": "Setup Failed",
-        "setup_failed_msg": "An error occurred: {e}",
-        "legacy_migration_title": "New Mod Profile System",
-        "legacy_migration_msg": "This version uses a new system to manage multiple mods.\n\nYour existing 'MOD_P' folder can be migrated into a new profile named 'Default'.\n\nPlease select a root folder where you want to store your mod profiles (e.g., 'My Documents\\OutlastTrialsMods').",
-        "migration_complete_title": "Migration Complete",
-        "migration_complete_msg": "Your mod has been successfully migrated to the 'Default' profile inside:\n{mods_root}",
-        "migration_failed_title": "Migration Failed",
-        "migration_failed_msg": "An error occurred: {e}",
-        "scan_progress_title": "Scanning for Additional Audio Files",
-        "scan_progress_msg": "Preparing to scan...",
-        "scan_complete_status": "Scan complete. Found and cached {count} additional audio files.",
-        "no_new_files_found_status": "No new audio files found during scan.",
-        "volume_adjust_tooltip_no_selection": "Adjust audio volume (select files first)",
-        "volume_adjust_tooltip_single": "Adjust volume for: {filename}",
-        "volume_adjust_tooltip_batch": "Batch adjust volume for {count} files",
-        "easter_egg_title": "You got jumpscared by Mooneon!",
-        "easter_egg_loading": "Loading jumpscare...",
-        "easter_egg_message": "I warned you before that Mooneon would jumpscare you.",
-        "crash_log_saved_msg": "\n\nCrash log saved to: {log_path}",
-        "crash_log_failed_msg": "\n\nFailed to save crash log: {error}",
-        "app_error_title": "Application Error",
-        "app_error_msg": "The application has encountered an error and will close.",
-        "app_error_info": "Please report this bug with the details below.",
-        "copy_error_btn": "Copy Error to Clipboard",
-        "stats_label_text": "Showing {filtered_count} of {total_count} files | Subtitles: {subtitle_count}",
-        "shortcut_play_original_action": "Play Original Audio",
-        "shortcut_play_original_desc": "Plays the original version of the selected audio file.",
-        "shortcut_play_mod_action": "Play Mod Audio",
-        "shortcut_play_mod_desc": "Plays the modified version of the selected audio file.",
-        "shortcut_delete_mod_action": "Delete Mod Audio",
-        "shortcut_delete_mod_desc": "Deletes the modified audio for the selected file(s).",
-        "volume_toolbar_btn": "🔊 Volume",
-        "show_scanned_files_check": "Show Scanned Files",
-        "show_scanned_files_tooltip": "Show/hide audio files found by scanning the 'Wems' folder that are not in the main database.",
-        "add_file_btn": "Add File...",
-
-        # === ИНФО-ПАНЕЛЬ ===
-        "bnk_size_label": "BNK Size:",
-        "in_game_effects_label": "In Game Effects:",
-        "last_modified_label": "Last Modified:",
-
-        # === РЕДАКТОР ОБРЕЗКИ (TRIM) ===
-        "trim_editor_title": "Audio Trimmer - {shortname}",
-        "trim_deps_missing": "Trimming is not available.\n\nPlease ensure the following libraries are installed:\n'pip install numpy scipy matplotlib'",
-        "trimming_audio_for": "Trimming audio for: {shortname}",
-        "version_mod": " (MOD version)",
-        "version_original": " (Original version)",
-        "zoom_label": "Zoom:",
-        "start_time_label": "Start Time:",
-        "end_time_label": "End Time:",
-        "new_duration_label": "New Duration:",
-        "new_duration_format": "{duration_sec:.3f} s ({duration_ms} ms)",
-        "play_pause_btn": "▶️ Play/Pause",
-        "preview_trim_btn": "🎬 Preview Trim",
-        "stop_btn": "⏹️ Stop",
-        "apply_trim_btn": "Apply Trim",
-        "preparing_audio_failed": "Failed to prepare audio: {e}",
-        "trimming_with_ffmpeg": "Trimming audio with FFmpeg...",
-        "trim_success_msg": "Audio trimmed and deployed successfully!",
-        "trim_failed_title": "Trimming failed",
-        "compiling_step_1": "Cleaning up a technical mess...",
-        "compiling_step_2": "Hacking into the game files... (Actually only using FModel)",
-        "compiling_step_3": "Organizing the new audio structure...",
-        "compiling_step_4": "Asking Kitty for a hand...",
-        "compiling_step_5": "Helping Amelia plan a new escape event...",
-        "compiling_step_6": "Telling Maddie for the #97 time that a brick is not food...",
-        "compiling_step_7": "Chilling with Neil as Easterman loses his mind...",
-        "splash_loading_app": "Waking up Osa...",
-        "splash_init_ui": "Initiating UI interface...",
-        "splash_loading_profiles": "Loading profiles...",
-        "app_already_running_title": "Tranquilo muchacho! Ya te escuche.",
-        "app_already_running_msg": "Mercedes's Outlast Trials Audio Editor is already running. Please check your taskbar or system tray for the open application.",
-        "project_statistics_title": "Project Statistics",
-        "mod_profile_label": "Mod Profile:",
-        "general_stats_group": "General Statistics",
-        "total_audio_files": "Total Modified Audio Files:",
-        "total_subtitle_files": "Total Modified Subtitle Files:",
-        "total_mod_size": "Total Mod Size (unpacked):",
-        "subtitle_stats_group": "Subtitle Statistics",
-        "modified_subtitle_entries": "Modified Subtitle Entries:",
-        "new_subtitle_entries": "New Subtitle Entries:",
-        "total_languages_affected": "Languages Affected:",
-        "modified_files_group": "List of Modified Files",
-        "copy_list_btn": "Copy List",
-        "list_copied_msg": "List of modified files copied to clipboard!",
-        "no_profile_active_for_stats": "No active profile. Statistics are unavailable.",
-        "calculating_stats": "Calculating...",
-        "recalculate_btn": "🔄 Recalculate",
-        "resource_updater_tab": "Resource Updater",
-        "updater_header": "Update Game Resources",
-        "updater_description": "Extract the latest audio (.wem) and localization (.locres) files directly from the game's .pak archives. This ensures you are always working with the most up-to-date files.",
-        "select_pak_file_group": "Select Game Pak File",
-        "pak_file_path_label": "Path to .pak file:",
-        "pak_file_path_placeholder": "e.g., C:/.../The Outlast Trials/OPP/Content/Paks/OPP-WindowsClient.pak",
-        "select_resources_group": "Select Resources to Update",
-        "update_audio_check": "Update Audio Files (Wems)",
-        "update_localization_check": "Update Localization Files",
-        "start_update_btn": "Start Update",
-        "update_process_group": "Update Process",
-        "update_log_ready": "Ready to start the update process.",
-        "update_confirm_title": "Confirm Resource Update",
-        "update_confirm_msg": "This will replace your current local '{resource_folder}' folder(s) with files extracted from the game.\n\n- Your current files will be deleted.\n- This action cannot be undone.\n\nAre you sure you want to continue?",
-        "pak_file_not_selected": "Please select a valid game .pak file first.",
-        "no_resources_selected": "Please select at least one resource type to update (Audio or Localization).",
-        "update_process_started": "Update process started...",
-        "unpacking_files_from": "Unpacking files from {pak_name}...",
-        "unpacking_path": "Unpacking '{path_to_unpack}'...",
-        "unpack_failed": "Repak failed to unpack files. See details below.",
-        "clearing_old_files": "Clearing old files in '{folder_name}'...",
-        "moving_new_files": "Moving new files to '{folder_name}'...",
-        "organizing_sfx": "Organizing SFX files...",
-        "update_complete_title": "Update Complete",
-        "update_complete_msg": "The following resources have been successfully updated:\n\n{updated_resources}\n\nIt is recommended to restart the application to apply all changes.",
-        "update_failed_title": "Update Failed",
-        "update_failed_msg": "The update process failed. Please check the log for details.",
-        "restart_recommended": "Restart Recommended",
-        "settings_saved_title": "Settings Saved",
-        "close_required_message": "Language settings have changed.\n\nThe application must be closed for the changes to take full effect.",
-        "close_now_button": "Close Now",
-        "update_warning_title": "Update in Progress",
-        "update_warning_msg": "The resource update process has started.\n\nPlease do not use or close the application until it is complete. This may take several minutes depending on your system.",
-        "update_fun_status_1": "Watching Avellanos give Easterman a lecture...",
-        "update_fun_status_2": "Attempting to cut through the sleep room's bars...",
-        "update_fun_status_3": "Preparing the shuttle for the next trials...",
-        "update_fun_status_4": "Training new impostors for invasion...",
-        "update_fun_status_5": "Containing the prime assets before they get wise...",
-        "update_fun_status_6": "Warning reagents about newest changes...",
-        "update_fun_status_7": "Finalizing update process...",
-        "update_step_unpacking": "Unpacking files from game archive...",
-        "update_step_clearing": "Clearing old local files...",
-        "update_step_moving": "Moving new files into place...",
-        "update_step_organizing": "Organizing new files...",
-        "update_unpacking_long_wait": "Unpacking process started. This may take several minutes depending on your system...",
-        "update_cancelled_by_user": "Update cancelled by user",
-        "update_step_finishing": "Finishing up...",
-        "update_in_progress_title": "Update in Progress",
-        "confirm_exit_during_update_message": "The resource update process is still running.\n\nAre you sure you want to exit? This will cancel the update.",
-        "update_rescanning_orphans": "Update complete. Now rescanning the Wems folder for changes...",
-        "initial_setup_title": "Initial Setup",
-        "wems_folder_missing_message": "The 'Wems' folder with game audio files was not found.\n\nThis is required for the application to function correctly.\n\nWould you like to go to the 'Resource Updater' tab to extract them from the game now?",
-        "localization_folder_missing_message": "The 'Localization' folder with game subtitle files was not found.\n\nThis is required for subtitle editing.\n\nWould you like to go to the 'Resource Updater' tab to extract them from the game now?",
-        "go_to_updater_button": "Go to Updater",
-        "import_mod_title": "Import Mod",
-        "select_pak_to_import": "Select .pak file to import",
-        "pak_files": "PAK files",
-        "enter_profile_name_for_pak": "Enter a name for the new profile (derived from .pak name):",
-        "importing_mod_progress": "Importing Mod...",
-        "unpacking_pak_file": "Unpacking .pak file...",
-        "creating_profile_structure": "Creating profile structure...",
-        "moving_mod_files": "Moving mod files...",
-        "cleaning_up": "Cleaning up...",
-        "import_successful_title": "Import Successful",
-        "import_successful_message": "Mod '{pak_name}' has been successfully imported as the '{profile_name}' profile.",
-        "import_failed_title": "Import Failed",
-        "import_mod_from_pak": "Import Mod from .pak...",
-        "wems_folder_loose_files_title": "Misplaced Audio Files Found",
-        "wems_folder_loose_files_message": "Found {count} audio files (.wem/.bnk) in the main 'Wems' folder.",
-        "wems_folder_loose_files_details": "These files should typically be inside the 'Wems/SFX' subfolder. Moving them helps keep your project organized and ensures they are found correctly.\n\nDo you want to move them to the 'Wems/SFX' folder now?",
-        "move_all_files_btn": "Move All Files",
-        "ignore_btn": "Ignore",
-        "move_complete_title": "Move Complete",
-        "move_complete_message": "Successfully moved {count} file(s) to the 'Wems/SFX' folder.",
-        "move_complete_errors": "Failed to move {count} file(s):\n{errors}",
-        "soundbanksinfo_missing_title": "Database File Missing",
-        "soundbanksinfo_missing_message": "The core audio database file (SoundbanksInfo.json) was not found.",
-        "soundbanksinfo_missing_details": "This file is required to identify most audio files. Would you like to go to the 'Resource Updater' tab to extract the latest game files now?",
-        "go_to_updater_btn": "Go to Updater",
-        "later_btn": "Later",
-        "critical_file_missing_title": "Critical File Missing",
-        "critical_file_missing_message": "SoundbanksInfo.json is missing and the Resource Updater tab could not be found.",
-        "move_complete_restart_note": "\n\nIt is recommended to restart the application for the changes to take full effect.",
-        "outdated_mod_structure_title": "Outdated Mod Structure",
-        "outdated_mod_structure_msg": "The mod you are importing uses the old file structure (pre-update).\n\nThe game now requires audio files to be in a 'Media' subfolder.\nDo you want to automatically reorganize the files to the new format?"
-
-    },
-    
-    "ru": {
-        # === ОСНОВНЫЕ ЭЛЕМЕНТЫ ИНТЕРФЕЙСА ===
-        "wemprocces_desc": "Выберите язык для переименования и размещения файлов WEM во время обработки",
-        "exports_modified_subtitles_desc": "Экспортирует изменённые субтитры в правильной структуре для игры:",
-        "creates_mod_p_structure": "Создаёт структуру MOD_P/OPP/Content/Localization/",
-        "supports_multiple_categories": "Поддерживает несколько категорий субтитров",
-        "each_language_separate_folder": "Каждый язык в отдельной папке",
-        "ready_files_for_mods": "Готовые файлы можно использовать в модах",
-        "app_title": "Аудиоредактор Outlast Trials от Мерседес",
-        "file_menu": "Файл",
-        "edit_menu": "Правка",
-        "tools_menu": "Инструменты",
-        "help_menu": "Справка",
-        "save_subtitles": "Сохранить субтитры",
-        "export_subtitles": "Экспорт субтитров...",
-        "import_subtitles": "Импорт субтитров...",
-        "import_custom_subtitles": "Импорт пользовательских субтитров (Бета)...",
-        "exit": "Выход",
-        "revert_to_original": "Вернуть оригинал",
-        "find_replace": "Найти и заменить...",
-        "compile_mod": "Скомпилировать мод",
-        "deploy_and_run": "Установить мод и запустить игру",
-        "show_debug": "Показать консоль отладки",
-        "settings": "Настройки...",
-        "about": "О программе",
-        
-        # === ФИЛЬТРЫ И СОРТИРОВКА ===
-        "filter": "Фильтр:",
-        "sort": "Сортировка:",
-        "all_files": "Все файлы",
-        "with_subtitles": "С субтитрами",
-        "without_subtitles": "Без субтитров",
-        "modified": "Изменённые",
-        "modded": "С модиф. аудио",
-        "name_a_z": "Имя (А-Я)",
-        "name_z_a": "Имя (Я-А)",
-        "id_asc": "ID ↑",
-        "id_desc": "ID ↓",
-        "recent_first": "Сначала новые",
-        
-        # === ОСНОВНЫЕ СЛОВА ===
-        "name": "Имя",
-        "id": "ID",
-        "subtitle": "Субтитр",
-        "status": "Статус",
-        "mod": "МОД",
-        "path": "Путь",
-        "source": "Источник",
-        "original": "Оригинал",
-        "save": "Сохранить",
-        "cancel": "Отмена",
-        "browse": "Обзор...",
-        "confirmation": "Подтверждение",
-        "error": "Ошибка",
-        "warning": "Предупреждение",
-        "success": "Успех",
-        "info": "Информация",
-        "close": "Закрыть",
-        "ready": "Готов",
-        "waiting": "Ожидание...",
-        "done": "Готово",
-        "error_status": "Ошибка",
-        "size_warning": "Предупреждение о размере",
-        "loading": "Загрузка...",
-        "processing": "Обработка...",
-        "converting": "Конвертация...",
-        "complete": "Завершено",
-        "stop": "Стоп",
-        "clear": "Очистить",
-        "language": "Язык",
-        
-        # === ДИАЛОГИ И СООБЩЕНИЯ ===
-        "edit_subtitle": "Редактировать субтитр",
-        "subtitle_preview": "Предпросмотр субтитров",
-        "file_info": "Информация о файле",
-        "select_game_path": "Выберите корневую папку игры",
-        "game_path_saved": "Путь к игре сохранён",
-        "mod_deployed": "Мод успешно установлен!",
-        "game_launching": "Запуск игры...",
-        "no_game_path": "Сначала укажите путь к игре в настройках",
-        "no_changes": "Нет изменений",
-        "no_modified_subtitles": "Нет изменённых субтитров для экспорта",
-        "import_error": "Ошибка импорта",
-        "export_error": "Ошибка экспорта",
-        "save_error": "Ошибка сохранения",
-        "file_not_found": "Файл не найден",
-        "conversion_stopped": "Конвертация остановлена",
-        "deployment_complete": "Размещение завершено",
-        "characters": "Символов:",
-        
-        # === КОНФЛИКТЫ СУБТИТРОВ ===
-        "conflict_detected": "Обнаружен конфликт субтитров",
-        "conflict_message": "Следующие ключи уже имеют субтитры:\n\n{conflicts}\n\nКакие субтитры использовать?",
-        "use_existing": "Оставить существующие",
-        "use_new": "Использовать новые",
-        "merge_all": "Объединить все (оставить существующие)",
-        
-        # === КОНВЕРТЕР WAV TO WEM ===
-        "wav_to_wem_converter": "Конвертер Audio в WEM",
-        "conversion_mode": "Режим конвертации (ТОЛЬКО Size matching mode)",
-        "strict_mode": "Строгий режим",
-        "adaptive_mode": "Адаптивный режим",
-        "strict_mode_desc": "❌ Ошибка, если слишком большой",
-        "adaptive_mode_desc": "✅ Авто-подстройка качества",
-        "path_configuration": "Настройка путей",
-        "wwise_path": "Wwise:",
-        "project_path": "Проект:",
-        "wav_path": "Audio:",
-        "files_for_conversion": "Файлы для конвертации",
-        "add_all_wav": "Добавить все Audio файлы",
-        "convert": "Конвертировать",
-        "files_ready": "Файлов готово:",
-        "wav_file": "Audio файл",
-        "target_wem": "Целевой WEM",
-        "target_size": "Целевой размер",
-        "files_ready_count": "Файлов готово: {count}",
-        "confirm_clear": "Очистить весь список файлов?",
-        
-        # === КОНВЕРТАЦИЯ И ЛОГИ ===
-        "conversion_complete": "Конвертация завершена",
-        "conversion_logs": "Логи конвертации",
-        "clear_logs": "Очистить логи",
-        "save_logs": "Сохранить логи",
-        "logs_cleared": "Логи очищены...",
-        "logs_saved": "Логи сохранены",
-        "error_saving_logs": "Не удалось сохранить логи",
-        "starting_conversion": "Начинается конвертация в режиме {mode}...",
-        "file_status": "Файл {current}/{total}: {name}",
-        "attempting": "попытка {attempts} (Conversion={value})",
-        "testing_sample_rate": "Тестирование {rate}Гц...",
-        "resampled_to": "Изменена частота на {rate}Гц",
-        "results_summary": "✅ Конвертация и размещение завершены!\n\nУспешно: {successful}\nОшибок: {failed}\nПредупреждений о размере: {warnings}\n\nФайлы размещены в MOD_P\nСм. вкладку 'Логи' для подробностей",
-        "add_files_warning": "Сначала добавьте файлы для конвертации!",
-        
-        # === ИНСТРУКЦИИ ===
-        "converter_instructions": "Конвертер Audio в WEM:\n1) Укажите путь Wwise 2) Выберите папку для проекта 3) Выберите папку Audio 4) Добавьте файлы 5) Конвертируйте",
-        "converter_instructions2": "Конвертер WEM:\n1) Укажите путь Wwise проекта 2) Конвертируйте в мод",
-        
-        # === ПУТИ И ПЛЕЙСХОЛДЕРЫ ===
-        "wwise_path_placeholder": "Путь установки Wwise... (Пример: D:/Audiokinetic/Wwise2019.1.6.7110)",
-        "project_path_placeholder": "Путь нового/старого проекта... (Пример: D:/ExampleProjects/MyNewProject) P.S. Может быть пустым",
-        "wav_folder_placeholder": "Папка с Audio файлами...",
-        
-        # === ПОИСК И ОБРАБОТКА ===
-        "select_wav_folder": "Сначала выберите папку с Audio файлами!",
-        "wems_folder_not_found": "Папка Wems не найдена",
-        "no_wav_files": "В папке нет Audio файлов!",
-        "search_complete": "Поиск завершен",
-        "auto_search_result": "Автоматически найдено соответствий: {matched} из {total}",
-        "target_language": "Целевой язык для голосовых файлов",
-        "no_matches_found": "Не найдены соответствия для",
-        
-        # === ЭКСПОРТ СУБТИТРОВ ===
-        "cleanup_mod_subtitles": "Очистить субтитры MOD_P",
-        "export_subtitles_for_game": "Экспорт субтитры для игры",
-        "subtitle_export_ready": "Готов к экспорту субтитров...",
-        "deploying_files": "Размещение файлов в игровой структуре...",
-        "deployment_error": "Ошибка размещения",
-        "conversion_failed": "Конвертация не удалась",
-        "all_files_failed": "Все файлы не удалось обработать",
-        "see_logs_for_details": "См. вкладку 'Логи' для подробностей",
-        
-        # === WEM ПРОЦЕССОР ===
-        "wem_processor_warning": "⚠️ Процессор WEM (Не рекомендуется)",
-        "wem_processor_desc": "Устаревший инструмент для обработки готовых WEM файлов.",
-        "wem_processor_recommendation": "Рекомендуется использовать 'Audio to WEM' для новичков.",
-        
-        # === ЭКСПОРТЕР ЛОКАЛИЗАЦИИ ===
-        "localization_exporter": "Экспортер локализации",
-        "export_modified_subtitles": "Экспорт измененных субтитров",
-        "localization_editor_desc": "Редактируйте локализацию напрямую. Используйте глобальную строку поиска выше для фильтрации результатов.",
-        # === ОЧИСТКА СУБТИТРОВ ===
-        "cleanup_subtitles_found": "Найдено {count} файлов субтитров в MOD_P",
-        "select_files_to_delete": "Пожалуйста, выберите файлы для удаления",
-        "confirm_deletion": "Подтвердить удаление",
-        "delete_files_warning": "Вы уверены, что хотите удалить {count} файлов субтитров?\n\nЭто действие нельзя отменить!",
-        "cleanup_complete": "Очистка завершена",
-        "cleanup_with_errors": "Очистка завершена с ошибками",
-        "files_deleted_successfully": "Успешно удалено {count} файлов субтитров из MOD_P",
-        "files_deleted_with_errors": "Удалено {count} файлов успешно\n{errors} файлов с ошибками\n\nПроверьте журнал состояния для подробностей",
-        "no_localization_found": "Файлы не найдены",
-        "no_localization_message": "Папка локализации не найдена:\n{path}",
-        "no_subtitle_files": "Файлы субтитров не найдены в:\n{path}",
-        "select_all": "Выбрать все",
-        "select_none": "Снять выделение",
-        "quick_select": "Быстрый выбор:",
-        "select_by_language": "Выбрать по языку...",
-        "delete_selected": "Удалить выбранные",
-        "no_selection": "Нет выбора",
-        "localization_editor": "Редактор локализации",        
-        # === АУДИО ИНФОРМАЦИЯ ===
-        "audio_comparison": "Сравнение аудио",
-        "original_audio": "Оригинальное аудио",
-        "modified_audio": "Изменённое аудио",
-        "duration": "Длительность:",
-        "size": "Размер:",
-        "sample_rate": "Частота дискретизации:",
-        "bitrate": "Битрейт:",
-        "channels": "Каналы:",
-        "audio_markers": "Аудио маркеры",
-        "original_markers": "Оригинальные маркеры",
-        "modified_markers": "Изменённые маркеры",
-        
-        # === КОНТЕКСТНОЕ МЕНЮ ===
-        "play_original": "▶ Воспроизвести оригинал",
-        "play_mod": "▶ Воспроизвести мод",
-        "export_as_wav": "💾 Экспорт в WAV",
-        "delete_mod_audio": "🗑 Удалить мод аудио",
-        "copy_key": "📋 Копировать ключ",
-        "copy_text": "📋 Копировать текст",
-        "remove": "❌ Удалить",
-        "browse_target_wem": "📁 Выбрать целевой WEM...",
-        "quick_select_menu": "⚡ Быстрый выбор",
-        
-        # === ИНСТРУМЕНТЫ ===
-        "expand_all": "📂 Развернуть все",
-        "collapse_all": "📁 Свернуть все",
-        "edit_button": "✏ Редактировать",
-        "export_button": "💾 Экспорт",
-        "delete_mod_button": "🗑 Удалить мод АУДИО",
-        
-        # === ЭКСПОРТ АУДИО ===
-        "export_audio": "Экспорт аудио",
-        "which_version_export": "Какую версию вы хотите экспортировать?",
-        "save_as_wav": "Сохранить как WAV",
-        "wav_files": "Файлы WAV",
-        "batch_export": "Пакетный экспорт",
-        "select_output_directory": "Выберите папку вывода",
-        "exporting_files": "Экспорт {count} файлов...",
-        "export_results": "Экспортировано {successful} файлов успешно.\nВозникло {errors} ошибок.",
-        "export_complete": "Экспорт завершён",
-        
-        # === ДИАЛОГИ СОХРАНЕНИЯ ===
-        "save_changes_question": "Сохранить изменения?",
-        "unsaved_changes_message": "У вас есть несохранённые изменения субтитров. Сохранить перед закрытием?",
-        
-        # === КОМПИЛЯЦИЯ МОДОВ ===
-        "mod_not_found_compile": "Файл мода не найден. Скомпилировать сначала?",
-        "mod_compilation_failed": "Компиляция мода не удалась",
-        "repak_not_found": "repak.exe не найден!",
-        "compiling_mod": "Компиляция мода",
-        "running_repak": "Запуск repak...",
-        "mod_compiled_successfully": "Мод скомпилирован успешно!",
-        "compilation_failed": "Компиляция не удалась!",
-        
-        # === НАСТРОЙКИ ===
-        "auto_save": "Автосохранение субтитров каждые 5 минут",
-        "interface_language": "Язык интерфейса (ТРЕБУЕТ ПЕРЕЗАПУСК):",
-        "theme": "Тема:",
-        "subtitle_language": "Язык субтитров:",
-        "game_path": "Путь к игре:",
-        "wem_process_language": "Язык обработки WEM:",
-        "light": "Светлая",
-        "dark": "Тёмная",
-        "rename_french_audio": "Переименовать французские аудиофайлы в ID (дополнительно к английским)",
-        
-        # === СПРАВКА И ОТЧЕТЫ ===
-        "keyboard_shortcuts": "Горячие клавиши",
-        "documentation": "📖 Документация",
-        "check_updates": "🔄 Проверить обновления",
-        "report_bug": "🐛 Сообщить об ошибке",
-        "getting_started": "Начало работы",
-        "features": "Возможности",
-        "file_structure": "Структура файлов",
-        "credits": "Создатели",
-        "license": "Лицензия",
-        "github": "GitHub",
-        "discord": "Discord",
-        "donate": "Поддержать",
-        
-        # === ОТЧЕТ ОБ ОШИБКЕ ===
-        "bug_report_info": "Нашли баг? Пожалуйста, предоставьте подробности ниже.\nЛоги отладки будут включены автоматически.",
-        "description": "Описание",
-        "email_optional": "Email (необязательно)",
-        "copy_report_clipboard": "Копировать отчёт в буфер",
-        "open_github_issues": "Открыть GitHub Issues",
-        "bug_report_copied": "Отчёт об ошибке скопирован в буфер обмена!",
-        
-        # === TOOLTIPS ===
-        "has_audio_file": "Есть аудиофайл",
-        "no_audio_file": "Нет аудиофайла",
-        
-        # === О ПРОГРАММЕ ===
-        "about_description": "Инструмент для управления WEM аудиофайлами и субтитрами игры для Outlast Trials, разработанный для моддеров и команд локализации.",
-        "key_features": "Ключевые возможности",
-        "audio_management": "🎵 <b>Управление аудио:</b> Воспроизведение, конвертация и организация WEM файлов",
-        "subtitle_editing": "📝 <b>Редактирование субтитров:</b> Простое редактирование с разрешением конфликтов",
-        "mod_creation": "📦 <b>Создание модов:</b> Компиляция и развёртывание модов в один клик",
-        "multi_language": "🌍 <b>Многоязычность:</b> Поддержка 14+ языков",
-        "modern_ui": "🎨 <b>Интерфейс:</b> Чистый интерфейс с тёмной/светлой темами",
-        "technology_stack": "Технологический стек",
-        "built_with": "Создано с Python 3 и PyQt5, используя:",
-        "unreal_locres_tool": "UnrealLocres для работы с .locres файлами",
-        "vgmstream_tool": "vgmstream для конвертации аудио",
-        "repak_tool": "repak для упаковки модов",
-        "ffmpeg_tool": "FFmpeg для обработки аудио",
-        "development_team": "Команда разработки",
-        "lead_developer": "<b>Ведущие разработчики:</b> Bezna и Mercedes",
-        "developers_label": "Разработчики:",
-        "developers_names": "Bezna и Mercedes",
-        "polish_translator_label": "Тестировщик/Польский переводчик:",
-        "polish_translator_name": "Alaneg",
-        "spanish_translator_label": "Испанский переводчик:",
-        "spanish_translator_name": "Mercedes",
-        "special_thanks": "Особая благодарность",
-        "vgmstream_thanks": "Команда vgmstream - За инструменты конвертации аудио",
-        "unreal_locres_thanks": "Разработчики UnrealLocres - За поддержку локализации",
-        "hypermetric_thanks": "hypermetric - За упаковку модов",
-        "ffmpeg_thanks": "FFmpeg - За обработку аудио",
-        "red_barrels_thanks": "Red Barrels - За создание Outlast Trials",
-        "open_source_libraries": "Библиотеки с открытым исходным кодом",
-        "pyqt5_lib": "PyQt5 - GUI Framework",
-        "python_lib": "Стандартная библиотека Python",
-        "software_disclaimer": "Это программное обеспечение предоставляется \"как есть\" без каких-либо гарантий. Используйте на свой страх и риск.",
-        "license_agreement": "Лицензионное соглашение",
-        "copyright_notice": "Copyright (c) 2026 Аудиоредактор Outlast Trials от Мерседес",
-        "credits": "Кредиты",
-        "license": "Лицензия",
-        "mit_license_text": "Настоящим предоставляется бесплатное разрешение любому лицу, получившему копию данного программного обеспечения и связанных с ним файлов документации (\"Программное обеспечение\"), на использование Программного обеспечения без ограничений, включая неограниченное право на использование, копирование, изменение, слияние, публикацию, распространение, сублицензирование и/или продажу копий Программного обеспечения, а также лицам, которым предоставляется данное Программное обеспечение, при соблюдении следующих условий:\n\nВышеуказанное уведомление об авторском праве и данное уведомление о разрешении должны быть включены во все копии или существенные части данного Программного обеспечения.\n\nДАННОЕ ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ \"КАК ЕСТЬ\", БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ, ЯВНЫХ ИЛИ ПОДРАЗУМЕВАЕМЫХ, ВКЛЮЧАЯ ГАРАНТИИ ТОВАРНОЙ ПРИГОДНОСТИ, СООТВЕТСТВИЯ ПО ЕГО КОНКРЕТНОМУ НАЗНАЧЕНИЮ И ОТСУТСТВИЯ НАРУШЕНИЙ, НО НЕ ОГРАНИЧИВАЯСЬ ИМИ. НИ В КАКОМ СЛУЧАЕ АВТОРЫ ИЛИ ПРАВООБЛАДАТЕЛИ НЕ НЕСУТ ОТВЕТСТВЕННОСТИ ПО КАКИМ-ЛИБО ИСКАМ, ЗА УЩЕРБ ИЛИ ПО ИНОЙ ОТВЕТСТВЕННОСТИ, БУДЬ ТО В ДЕЙСТВИИ ПО ДОГОВОРУ, ДЕЛИКТУ ИЛИ ИНОМУ, ВЫТЕКАЮЩИХ ИЗ, СВЯЗАННЫХ С ИЛИ В СВЯЗИ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ ИЛИ ИСПОЛЬЗОВАНИЕМ ИЛИ ИНЫМИ ДЕЙСТВИЯМИ В ПРОГРАММНОМ ОБЕСПЕЧЕНИИ.",
-        
-        # === ГОРЯЧИЕ КЛАВИШИ ===
-        "shortcuts_table_action": "Действие",
-        "shortcuts_table_shortcut": "Горячая клавиша",
-        "shortcuts_table_description": "Описание",
-        "shortcut_edit_subtitle": "Редактировать субтитр",
-        "shortcut_save_subtitles": "Сохранить субтитры",
-        "shortcut_export_audio": "Экспорт аудио",
-        "shortcut_revert_original": "Вернуть к оригиналу",
-        "shortcut_deploy_run": "Развернуть и запустить",
-        "shortcut_debug_console": "Консоль отладки",
-        "shortcut_settings": "Настройки",
-        "shortcut_documentation": "Документация",
-        "shortcut_exit": "Выход",
-        "shortcut_edit_selected": "Редактировать выбранный субтитр",
-        "shortcut_save_all_changes": "Сохранить все изменения субтитров",
-        "shortcut_export_selected": "Экспортировать выбранное аудио как WAV",
-        "shortcut_revert_selected": "Вернуть выбранный субтитр к оригиналу",
-        "shortcut_deploy_launch": "Развернуть мод и запустить игру",
-        "shortcut_show_debug": "Показать консоль отладки",
-        "shortcut_open_settings": "Открыть диалог настроек",
-        "shortcut_show_help": "Показать документацию",
-        "shortcut_close_app": "Закрыть приложение",
-        "mouse_actions": "Действия мыши",
-        "mouse_double_subtitle": "<b>Двойной клик по субтитру:</b> Редактировать субтитр",
-        "mouse_double_file": "<b>Двойной клик по файлу:</b> Воспроизвести аудио",
-        "mouse_right_click": "<b>Правый клик:</b> Показать контекстное меню",
-        "verify_mod_integrity": "Проверить целостность мода",
-        "rebuild_bnk_index": "Пересобрать BNK мода",
-        "rebuild_bnk_tooltip": "Принудительно синхронизирует все BNK-файлы с фактическими WEM-файлами в вашем моде.",
-        "verifying_mod_integrity": "Проверка целостности мода...",
-        "bnk_verification_complete": "Проверка завершена",
-        "bnk_no_issues_found": "Все измененные аудиофайлы соответствуют записям в BNK. Проблем не найдено!",
-        "bnk_issues_found_title": "Обнаружены проблемы с целостностью мода",
-        "bnk_issues_found_text": "Найдено {count} проблем в вашем моде.\n\nЭти проблемы могут привести к некорректному воспроизведению звуков в игре.\n\nХотите автоматически исправить эти записи?",
-        "fix_all_btn": "Исправить все",
-        "bnk_size_mismatch": "Несоответствие размера",
-        "bnk_entry_missing": "Отсутствует запись в BNK",
-        "bnk_report_size": "Тип: {type} в {bnk_name}\n  Звук: {short_name} (ID: {source_id})\n  - Размер в BNK: {bnk_size} байт\n  - Размер WEM: {wem_size} байт\n\n",
-        "bnk_report_missing": "Тип: {type}\n  Звук: {short_name} (ID: {source_id})\n  - Файл .wem существует, но соответствующая запись не найдена ни в одном измененном .bnk файле.\n\n",
-        "fixing_mod_issues": "Исправление проблем мода...",
-        "fix_complete_no_issues": "Автоматически исправляемых проблем не найдено (например, 'Отсутствует запись в BNK').",
-        "fix_complete_title": "Исправление завершено",
-        "fix_complete_message": "Исправлено {count} проблем с несоответствием размеров.",
-        "fix_complete_with_errors": "Исправлено {fixed} проблем с несоответствием размеров.\nНе удалось исправить {errors} записей. Подробности в консоли отладки.",
-        "verification_error": "Ошибка проверки",
-        "verification_error_message": "Во время проверки произошла ошибка:\n\n{error}",
-        "rebuild_bnk_confirm_title": "Пересобрать BNK",
-        "rebuild_bnk_confirm_text": "Это действие просканирует все измененные аудиофайлы (.wem) и принудительно обновит записи о размерах в .bnk файлах вашего мода.\n\nЭто полезно для устранения несоответствий после ручного добавления, удаления или редактирования WEM-файлов.\n\nВы хотите продолжить?",
-        "rebuilding_mod_bnk": "Пересборка BNK мода...",
-        "rebuild_complete_title": "Пересборка завершена",
-        "rebuild_complete_message": "Пересборка завершена!\n\n✅ Пересоздано {created} BNK-файлов в вашем моде из оригиналов.\n🔄 Обновлено {updated} записей в соответствии с вашими WEM-файлами.\n⚙️ Применено {reverted} пользовательских настроек 'Внутриигровых эффектов'.",
-        "profiles": "Профили",
-        "profile_manager_tooltip": "Открыть менеджер профилей модов",
-        "edit_profile": "Редактировать профиль мода",
-        "create_profile": "Создать новый профиль мода",
-        "profile_name": "Имя профиля:",
-        "author": "Автор:",
-        "version": "Версия:",
-        "icon_png": "Иконка (PNG):",
-        "no_icon_selected": "Иконка не выбрана.",
-        "select_icon": "Выбрать иконку",
-        "png_images": "Изображения PNG",
-        "validation_error": "Ошибка валидации",
-        "profile_name_empty": "Имя профиля не может быть пустым.",
-        "profile_manager_title": "Менеджер профилей модов",
-        "create_new_profile_btn": "➕ Создать новый...",
-        "add_existing_profile_btn": "📁 Добавить существующий...",
-        "remove_from_list_btn": "➖ Убрать из списка",
-        "select_a_profile": "Выберите профиль",
-        "author_label": "<b>Автор:</b>",
-        "version_label": "<b>Версия:</b>",
-        "no_description": "<i>Нет описания.</i>",
-        "edit_details_btn": "⚙️ Редактировать...",
-        "active_profile_btn": "✓ Активен",
-        "activate_profile_btn": "Активировать профиль",
-        "error_reading_profile": "<i style='color:red;'>Не удалось прочитать profile.json</i>",
-        "error_author": "<i style='color:red;'>Ошибка</i>",
-        "select_folder_for_profile": "Выберите папку для создания нового профиля",
-        "profile_exists_error": "Профиль с таким именем уже существует.",
-        "create_profile_error": "Не удалось создать профиль: {e}",
-        "select_existing_profile": "Выберите существующую папку профиля",
-        "invalid_profile_folder": "Выбранная папка не содержит обязательную подпапку '{folder}'.",
-        "profile_already_added": "Профиль с таким именем уже был добавлен.",
-        "remove_profile_title": "Удалить профиль",
-        "remove_profile_text": "Вы уверены, что хотите убрать профиль '{name}' из списка?\n\nЭто НЕ удалит файлы на вашем диске.",
-        "profile_activated_title": "Профиль активирован",
-        "profile_activated_text": "Профиль '{name}' теперь активен.",
-        "no_active_profile_title": "Нет активного профиля",
-        "no_active_profile_text": "В данный момент нет активного профиля. Пожалуйста, создайте или активируйте профиль.",
-        "rebuild_complete_message_details": "Пересборка завершена!\n\n"
-                                  "✅ Пересоздано {created} BNK-файлов в вашем моде из оригиналов.\n"
-                                  "🔄 Обновлено {updated} записей в соответствии с вашими WEM-файлами.\n"
-                                  "⚙️ Применено {reverted} пользовательских настроек 'Внутриигровых эффектов'.",
-        "select_version_title": "Выберите версию",
-        "adjust_volume_for": "Настроить громкость для: {filename}\n\nКакую версию вы хотите настроить?",
-        "batch_adjust_volume_for": "Пакетная настройка громкости для {count} файлов\n\nКакую версию вы хотите настроить?",
-        "no_language_selected": "Язык не выбран",
-        "select_language_tab_first": "Пожалуйста, сначала выберите вкладку с языком.",
-        "no_files_selected": "Файлы не выбраны",
-        "select_files_for_volume": "Пожалуйста, выберите один или несколько аудиофайлов для настройки громкости.",
-        "quick_load_audio_title": "🎵 Быстрая загрузка аудио...",
-        "quick_load_audio_tooltip": "Заменить этот звук своим файлом (любой формат)",
-        "restore_from_backup_title": "🔄 Восстановить из резервной копии",
-        "restore_from_backup_tooltip": "Восстановить предыдущую версию измененного аудио",
-        "adjust_original_volume_title": "🔊 Настроить громкость оригинала...",
-        "trim_original_audio_title": "✂️ Обрезать оригинал...",
-        "adjust_mod_volume_title": "🔊 Настроить громкость мода...",
-        "trim_mod_audio_title": "✂️ Обрезать мод...",
-        "toggle_ingame_effects_title": "✨ Переключить внутриигровые эффекты",
-        "marking_menu_title": "🖍 Пометки",
-        "set_color_menu_title": "🎨 Установить цвет",
-        "set_tag_menu_title": "🏷 Установить тег",
-        "color_green": "Зеленый",
-        "color_yellow": "Желтый",
-        "color_red": "Красный",
-        "color_blue": "Синий",
-        "color_none": "Нет",
-        "tag_important": "Важное",
-        "tag_check": "Проверить",
-        "tag_done": "Готово",
-        "tag_review": "На проверку",
-        "tag_none": "Нет",
-        "tag_custom": "Свой...",
-        "custom_tag_title": "Пользовательский тег",
-        "custom_tag_prompt": "Введите пользовательский тег:",
-        "select_folder_to_open_title": "Выберите папку для открытия",
-        "which_folder_to_open": "Какую папку вы хотели бы открыть?",
-        "voice_files_folder": "🎙 Голосовые файлы\n{path}",
-        "sfx_files_folder": "🔊 Звуковые эффекты\n{path}",
-        "subtitles_folder": "📝 Субтитры\n{path}",
-        "no_target_folders_found": "Целевые папки не найдены!",
-        "quick_load_mode_label": "Выберите режим конвертации для быстрой загрузки аудио:",
-        "quick_load_strict": "Строгий режим - Ошибка, если файл слишком большой",
-        "quick_load_adaptive": "Адаптивный режим - Авто-подстройка качества",
-        "audio_files_dialog_title": "Аудиофайлы",
-        "volume_editor_title": "Редактор громкости - {shortname}",
-        "volume_deps_missing": "⚠️ Для редактирования громкости требуются библиотеки NumPy и SciPy.\n\nПожалуйста, установите их, используя:\npip install numpy scipy",
-        "audio_analysis_group": "Анализ аудио",
-        "analyzing": "Анализ...",
-        "current_rms": "Текущий RMS:",
-        "current_peak": "Текущий пик:",
-        "duration_label": "Длительность:",
-        "recommended_max": "Рекомендуемый макс.:",
-        "no_limit": "Нет ограничений",
-        "volume_control_group": "Управление громкостью",
-        "volume_label_simple": "Громкость:",
-        "quick_presets": "Быстрые настройки:",
-        "waiting_for_analysis": "Ожидание анализа...",
-        "preview_rms_peak": "Предпросмотр: RMS {new_rms:.1f}%, Пик {new_peak:.1f}%",
-        "preview_clipping": " ⚠️ КЛИППИНГ (превышение на {over:.1f}%)",
-        "preview_near_clipping": " ⚠️ Близко к клиппингу",
-        "apply_volume_change_btn": "Применить изменение громкости",
-        "volume_no_change_msg": "Громкость установлена на 100% (без изменений).",
-        "config_required": "Требуется настройка",
-        "wwise_config_required_msg": "Wwise не настроен.\n\nПожалуйста, проверьте:\n1. Перейдите на вкладку 'Конвертер' и настройте пути Wwise\n2. Убедитесь, что проект Wwise существует\n3. Попробуйте сначала сконвертировать хотя бы один файл на вкладке 'Конвертер'",
-        "status_preparing": "Подготовка...",
-        "status_using_backup": "Используется бэкап как источник...",
-        "status_backup_created": "Создан бэкап и используется как источник...",
-        "status_using_original": "Используется оригинал как источник...",
-        "status_converting_to_wav": "Конвертация WEM в WAV...",
-        "status_adjusting_volume": "Настройка громкости...",
-        "status_preparing_for_wem": "Подготовка к конвертации в WEM...",
-        "status_converting_to_wem": "Конвертация в WEM...",
-        "status_deploying_to_mod": "Размещение в MOD_P...",
-        "status_complete": "Завершено!",
-        "volume_change_success_msg": "Громкость успешно изменена на {volume}%\nФактическое изменение: {actual_change:.0f}%\n{clipping_info}\n{source_info}\n{backup_info}",
-        "clipping_info_text": "\nКлиппинг: {percent:.2f}% сэмплов",
-        "backup_available_info": "\n\n💾 Доступна резервная копия - при необходимости вы можете восстановить предыдущую версию.",
-        "source_info_backup": "\n📁 Источник: Бэкап (сохранение оригинального качества)",
-        "source_info_mod_backup_created": "\n📁 Источник: Текущий мод (создан бэкап)",
-        "source_info_original": "\n📁 Источник: Оригинальный файл",
-        "wem_conversion_failed_msg": "Конвертация в WEM не удалась!\n\nВозможные решения:\n1. Проверьте конфигурацию Wwise на вкладке 'Конвертер'\n2. Попробуйте сначала сконвертировать обычный WAV-файл для проверки настроек\n3. Убедитесь, что проект Wwise имеет правильные настройки аудио\n4. Проверьте, достижим ли целевой размер файла\n\nТехническая ошибка: {error_message}",
-        "wwise_not_configured_msg": "Wwise не настроен должным образом!\n\nПожалуйста:\n1. Перейдите на вкладку 'Конвертер'\n2. Укажите действительный путь установки Wwise\n3. Укажите путь к проекту\n4. Попробуйте сконвертировать хотя бы один файл для проверки настроек\n\nЗатем попробуйте настроить громкость снова.",
-        "required_file_not_found_msg": "Не найден требуемый файл!\n\n{error_message}\n\nПожалуйста, убедитесь, что:\n- Аудиофайл существует\n- Права доступа к файлу корректны\n- Никакая другая программа не использует файл",
-        "volume_change_failed_title": "Не удалось изменить громкость",
-
-        # === РЕДАКТОР ГРОМКОСТИ (ПАКЕТНЫЙ) ===
-        "batch_volume_editor_title": "Пакетный редактор громкости ({count} файлов)",
-        "wwise_configured_auto": "✅ Wwise настроен автоматически",
-        "wwise_not_configured_warning": "⚠️ Wwise не настроен - пожалуйста, сначала настройте на вкладке 'Конвертер'",
-        "backups_stored_in": "Резервные копии хранятся в: {path}",
-        "volume_control_all_files_group": "Управление громкостью (для всех файлов)",
-        "files_to_process_group": "Файлы для обработки",
-        "file_header": "Файл",
-        "language_header": "Язык",
-        "current_rms_header": "Текущий RMS",
-        "current_peak_header": "Текущий пик",
-        "new_preview_header": "Предпросмотр",
-        "status_header": "Статус",
-        "apply_to_all_btn": "Применить ко всем файлам",
-        "status_skipped_no_analysis": "✗ Пропущено (нет анализа)",
-        "batch_process_complete_title": "Пакетная обработка завершена",
-        "batch_process_complete_msg": "Пакетное изменение громкости завершено!\n\nГромкость изменена на: {volume}%\nУспешно: {successful}\nС ошибками: {failed}",
-        "batch_process_error_title": "Ошибка пакетной обработки",
-
-        # === КОНСОЛЬ ОТЛАДКИ ===
-        "debug_console_title": "Консоль отладки",
-        "auto_scroll_check": "Автопрокрутка",
-        "save_log_btn": "Сохранить лог",
-        "save_debug_log_title": "Сохранить лог отладки",
-        "log_files_filter": "Файлы логов (*.log)",
-
-        # === DRAG & DROP АУДИО ===
-        "invalid_file_title": "Неверный файл",
-        "audio_only_drop_msg": "Поддерживается перетаскивание только аудиофайлов.",
-        "drop_audio_title": "Перетаскивание аудио",
-        "drop_on_file_msg": "Пожалуйста, перетащите на конкретный аудиофайл.",
-        "replace_audio_title": "Заменить аудио",
-        "replace_audio_confirm_msg": "Заменить аудио для:\n{shortname}\n\nфайлом:\n{filename}?",
-
-        # === ПОИСК ===
-        "search_placeholder": "Поиск...",
-
-        # === ЗАГРУЗЧИК СУБТИТРОВ ===
-        "processing_file_status": "Обработка {filename}...",
-        "processing_additional_subs_status": "Обработка дополнительных субтитров...",
-        "loaded_subs_from_files_status": "Загружено {count} субтитров из {processed_files} файлов",
-        
-        # === РЕДАКТОР СУБТИТРОВ (ГЛОБАЛЬНЫЙ) ===
-        "subtitle_editor_tab_title": "Редактор локализации",
-        "subtitle_editor_header": "Редактор локализации",
-        "subtitle_editor_desc": "Редактируйте локализацию напрямую. Используйте глобальную строку поиска для фильтрации.",
-        "without_audio_filter": "Без аудио",
-        "without_audio_filter_tooltip": "Показать только субтитры, у которых нет соответствующих аудиофайлов",
-        "modified_only_filter": "Только изменённые",
-        "modified_only_filter_tooltip": "Показать только изменённые субтитры",
-        "with_audio_only_filter": "Только с аудио",
-        "with_audio_only_filter_tooltip": "Показать только субтитры, у которых есть соответствующие аудиофайлы",
-        "refresh_btn": "🔄 Обновить",
-        "refresh_btn_tooltip": "Обновить данные субтитров из файлов",
-        "key_header": "Ключ",
-        "original_header": "Оригинал",
-        "current_header": "Текущий",
-        "audio_header": "Аудио",
-        "edit_selected_btn": "✏ Редактировать",
-        "save_all_changes_btn": "💾 Сохранить все изменения",
-        "subtitle_save_success": "Все изменения субтитров сохранены!",
-        "go_to_audio_action": "🔊 Перейти к аудиофайлу",
-        "audio_not_found_for_key": "Не удалось найти аудиофайл для ключа субтитра: {key}",
-        "tab_not_found_for_lang": "Не удалось найти вкладку для языка: {lang}",
-
-        # === ОБРАБОТЧИК WEM (СТАРЫЙ) ===
-        "wem_processor_tab_title": "Процессор WEM (Старый)",
-        "process_wem_files_btn": "Обработать WEM файлы",
-        "open_target_folder_btn": "Открыть целевую папку",
-
-        # === ОЧИСТКА СУБТИТРОВ ===
-        "no_working_files_found": "Рабочие файлы субтитров (_working.locres) не найдены в Localization.",
-        "cleanup_complete_msg": "Удалено {deleted} рабочих файлов субтитров.",
-        "cleanup_complete_with_errors_msg": "Удалено {deleted} рабочих файлов субтитров.\nОшибок: {errors}",
-
-        # === РАЗНОЕ UI ===
-        "quick_load_settings_group": "Настройки быстрой загрузки",
-        "conversion_method_group": "Метод конвертации",
-        "bnk_overwrite_radio": "Перезапись BNK (Рекомендуется)",
-        "bnk_overwrite_tooltip": "Конвертирует с максимальным качеством и перезаписывает размер файла в .bnk файле.",
-        "adaptive_size_matching_radio": "Адаптивное соответствие размера",
-        "adaptive_size_matching_tooltip": "Подстраивает качество аудио, чтобы соответствовать размеру оригинального WEM файла.",
-        "rescan_orphans_action": "Пересканировать файлы-сироты",
-        "rescan_orphans_tooltip": "Принудительно запускает новое сканирование папки Wems для поиска файлов, отсутствующих в SoundbanksInfo",
-        "in_progress_msg": "Уже в процессе. Пожалуйста, подождите.",
-        "add_single_file_title": "Выберите аудиофайл",
-        "audio_files_filter": "Аудиофайлы (*.wav *.mp3 *.ogg *.flac *.m4a *.aac *.wma *.opus *.webm);;Все файлы (*.*)",
-        "file_added_status": "Добавлен: {filename}",
-        "file_not_added_status": "Файл не добавлен: {filename}",
-        "error_adding_file_msg": "Ошибка при добавлении файла:\n\n{error}",
-        "update_file_q_title": "Файл уже добавлен",
-        "update_file_q_msg": "Файл '{filename}' уже в списке на конвертацию.\n\nХотите обновить его настройки?",
-        "update_btn": "Обновить",
-        "skip_btn": "Пропустить",
-        "duplicate_target_q_title": "Дубликат целевого WEM",
-        "duplicate_target_q_msg": "Целевой WEM '{file_id}.wem' уже назначен для:\n\nТекущий: {existing_name}\nНовый: {new_name}\n\nХотите заменить?",
-        "replace_btn": "Заменить",
-        "replace_all_btn": "Заменить все",
-        "skip_all_btn": "Пропустить все",
-        "tags_group_filter": "--- Теги ---",
-        "with_tag_filter": "С тегом: {tag}",
-        "numeric_id_files_group": "Файлы с числовым ID",
-        "voice_group_name": "VO (Озвучка)",
-        "bnk_size_mismatch_tooltip": "BNK ожидает {expected_size:,} байт, но файл {actual_size:,} байт.\nНажмите, чтобы обновить запись в BNK.",
-        "bnk_size_missing_wem_tooltip": "Запись в BNK была изменена, но WEM-файл отсутствует.\nНажмите, чтобы вернуть запись в BNK к исходному состоянию.",
-        "bnk_size_ok_tooltip": "ОК: Фактический размер файла совпадает с записью в BNK.",
-        "bnk_size_mismatch_btn": "Несовпадение! Нажмите для исправления",
-        "bnk_size_missing_wem_btn": "Отсутствует WEM! Нажмите для отмены",
-        "bnk_fix_success_msg": "Размер файла в BNK успешно обновлен!",
-        "bnk_fix_not_found_msg": "Не удалось найти запись для ID {file_id} ни в одном измененном BNK файле для исправления.",
-        "bnk_fix_error_msg": "Произошла непредвиденная ошибка при исправлении файла BNK:\n{error}",
-        "bnk_revert_success_msg": "Запись в BNK успешно возвращена к исходному состоянию.",
-        "bnk_revert_fail_msg": "Не удалось вернуть запись в BNK. Возможно, запись уже верна.",
-        "bnk_revert_error_msg": "Произошла непредвиденная ошибка при возврате записи BNK:\n{error}",
-        "select_folder_for_mods_title": "Выберите папку для хранения модов",
-        "welcome_title": "Добро пожаловать!",
-        "first_time_setup_msg": "Похоже, вы запускаете редактор в первый раз.\n\nПожалуйста, выберите корневую папку, где вы хотите хранить профили модов (например, 'Мои документы\\OutlastTrialsMods').\n\nТам будет создан профиль 'Default'.",
-        "setup_required_title": "Требуется настройка",
-        "setup_required_msg": "Для продолжения работы требуется папка для модов. Приложение будет закрыто.",
-        "setup_complete_title": "Настройка завершена",
-        "setup_complete_msg": "Ваш профиль 'Default' был создан в:\n{mods_root}",
-        "setup_failed_title": "Ошибка настройки",
-        "setup_failed_msg": "Произошла ошибка: {e}",
-        "legacy_migration_title": "Новая система профилей модов",
-        "legacy_migration_msg": "Эта версия использует новую систему для управления несколькими модами.\n\nВаша существующая папка 'MOD_P' может быть перенесена в новый профиль с именем 'Default'.\n\nПожалуйста, выберите корневую папку для хранения профилей модов (например, 'Мои документы\\OutlastTrialsMods').",
-        "migration_complete_title": "Перенос завершен",
-        "migration_complete_msg": "Ваш мод был успешно перенесен в профиль 'Default' внутри:\n{mods_root}",
-        "migration_failed_title": "Ошибка переноса",
-        "migration_failed_msg": "Произошла ошибка: {e}",
-        "scan_progress_title": "Сканирование дополнительных аудиофайлов",
-        "scan_progress_msg": "Подготовка к сканированию...",
-        "scan_complete_status": "Сканирование завершено. Найдено и кэшировано {count} дополнительных аудиофайлов.",
-        "no_new_files_found_status": "Новых аудиофайлов во время сканирования не найдено.",
-        "volume_adjust_tooltip_no_selection": "Настроить громкость (сначала выберите файлы)",
-        "volume_adjust_tooltip_single": "Настроить громкость для: {filename}",
-        "volume_adjust_tooltip_batch": "Пакетная настройка громкости для {count} файлов",
-        "easter_egg_title": "Тебя напугал Лунеон!",
-        "easter_egg_loading": "Загрузка испуга...",
-        "easter_egg_message": "Я предупреждал тебя, что Лунеон тебя напугает.",
-        "crash_log_saved_msg": "\n\nЛог сбоя сохранен в: {log_path}",
-        "crash_log_failed_msg": "\n\nНе удалось сохранить лог сбоя: {error}",
-        "app_error_title": "Ошибка приложения",
-        "app_error_msg": "В приложении произошла ошибка, и оно будет закрыто.",
-        "app_error_info": "Пожалуйста, сообщите об этой ошибке с подробностями ниже.",
-        "copy_error_btn": "Копировать ошибку в буфер обмена",
-        "stats_label_text": "Показано {filtered_count} из {total_count} файлов | Субтитры: {subtitle_count}",
-        "shortcut_play_original_action": "Воспроизвести оригинальное аудио",
-        "shortcut_play_original_desc": "Воспроизводит оригинальную версию выбранного аудиофайла.",
-        "shortcut_play_mod_action": "Воспроизвести мод аудио",
-        "shortcut_play_mod_desc": "Воспроизводит измененную версию выбранного аудиофайла.",
-        "shortcut_delete_mod_action": "Удалить мод аудио",
-        "shortcut_delete_mod_desc": "Удаляет измененное аудио для выбранного файла(ов).",
-        "volume_toolbar_btn": "🔊 Громкость",
-        "show_scanned_files_check": "Показать отсканированные",
-        "show_scanned_files_tooltip": "Показать/скрыть аудиофайлы, найденные при сканировании папки 'Wems', которых нет в основной базе данных.",
-        "add_file_btn": "Добавить файл...",
-
-        # === ИНФО-ПАНЕЛЬ ===
-        "bnk_size_label": "Размер в BNK:",
-        "in_game_effects_label": "Внутриигровые эффекты:",
-        "last_modified_label": "Последнее изменение:",
-
-        # === РЕДАКТОР ОБРЕЗКИ (TRIM) ===
-        "trim_editor_title": "Обрезка аудио - {shortname}",
-        "trim_deps_missing": "Обрезка недоступна.\n\nПожалуйста, убедитесь, что установлены следующие библиотеки:\n'pip install numpy scipy matplotlib'",
-        "trimming_audio_for": "Обрезка аудио для: {shortname}",
-        "version_mod": " (версия МОДа)",
-        "version_original": " (оригинальная версия)",
-        "zoom_label": "Масштаб:",
-        "start_time_label": "Время начала:",
-        "end_time_label": "Время конца:",
-        "new_duration_label": "Новая длительность:",
-        "new_duration_format": "{duration_sec:.3f} с ({duration_ms} мс)",
-        "play_pause_btn": "▶️ Пуск/Пауза",
-        "preview_trim_btn": "🎬 Предпросмотр",
-        "stop_btn": "⏹️ Стоп",
-        "apply_trim_btn": "Применить обрезку",
-        "preparing_audio_failed": "Не удалось подготовить аудио: {e}",
-        "trimming_with_ffmpeg": "Обрезка аудио с помощью FFmpeg...",
-        "trim_success_msg": "Аудио успешно обрезано и установлено!",
-        "trim_failed_title": "Ошибка обрезки",
-        "compiling_step_1": "Убираем технический беспорядок...",
-        "compiling_step_2": "Взламываем файлы игры... (На самом деле просто используем FModel)",
-        "compiling_step_3": "Организуем новую аудиоструктуру...",
-        "compiling_step_4": "Просим Китти помочь...",
-        "compiling_step_5": "Помогаем Амелии спланировать новый побег...",
-        "compiling_step_6": "В 97-й раз говорим Мэдди, что кирпич - это не еда...",
-        "compiling_step_7": "Расслабляемся с Нилом, пока Истерман сходит с ума...",
-        "splash_loading_app": "Пробуждаем Осу...",
-        "splash_init_ui": "Инициализация интерфейса...",
-        "splash_loading_profiles": "Загрузка профилей...",
-        "app_already_running_title": "Приложение уже запущено",
-        "app_already_running_msg": "Аудиоредактор Outlast Trials от Мерседес уже запущен.",
-        "project_statistics_title": "Статистика проекта",
-        "mod_profile_label": "Профиль мода:",
-        "general_stats_group": "Общая статистика",
-        "total_audio_files": "Всего изменено аудиофайлов:",
-        "total_subtitle_files": "Всего изменено файлов субтитров:",
-        "total_mod_size": "Общий размер мода (распакованного):",
-        "subtitle_stats_group": "Статистика по субтитрам",
-        "modified_subtitle_entries": "Измененных записей в субтитрах:",
-        "new_subtitle_entries": "Новых записей в субтитрах:",
-        "total_languages_affected": "Затронуто языков:",
-        "modified_files_group": "Список измененных файлов",
-        "copy_list_btn": "Копировать список",
-        "list_copied_msg": "Список измененных файлов скопирован в буфер обмена!",
-        "no_profile_active_for_stats": "Нет активного профиля. Статистика недоступна.",
-        "calculating_stats": "Подсчет...",
-        "recalculate_btn": "🔄 Пересчитать",
-        "resource_updater_tab": "Обновление ресурсов",
-        "updater_header": "Обновить ресурсы игры",
-        "updater_description": "Извлеките последние аудио (.wem) и файлы локализации (.locres) напрямую из .pak архивов игры. Это гарантирует, что вы всегда работаете с самыми актуальными файлами.",
-        "select_pak_file_group": "Выберите .pak файл игры",
-        "pak_file_path_label": "Путь к .pak файлу:",
-        "pak_file_path_placeholder": "Напр., C:/.../The Outlast Trials/OPP/Content/Paks/OPP-WindowsClient.pak",
-        "select_resources_group": "Выберите ресурсы для обновления",
-        "update_audio_check": "Обновить аудиофайлы (Wems)",
-        "update_localization_check": "Обновить файлы локализации",
-        "start_update_btn": "Начать обновление",
-        "update_process_group": "Процесс обновления",
-        "update_log_ready": "Готов к началу процесса обновления.",
-        "update_confirm_title": "Подтвердите обновление ресурсов",
-        "update_confirm_msg": "Это действие заменит ваши текущие локальные папки '{resource_folder}' файлами, извлеченными из игры.\n\n- Ваши текущие файлы будут удалены.\n- Это действие нельзя отменить.\n\nВы уверены, что хотите продолжить?",
-        "pak_file_not_selected": "Пожалуйста, сначала выберите действительный .pak файл игры.",
-        "no_resources_selected": "Пожалуйста, выберите хотя бы один тип ресурсов для обновления (Аудио или Локализация).",
-        "update_process_started": "Процесс обновления запущен...",
-        "unpacking_files_from": "Распаковка файлов из {pak_name}...",
-        "unpacking_path": "Распаковка '{path_to_unpack}'...",
-        "unpack_failed": "Repak не смог распаковать файлы. Подробности ниже.",
-        "clearing_old_files": "Очистка старых файлов в '{folder_name}'...",
-        "moving_new_files": "Перемещение новых файлов в '{folder_name}'...",
-        "organizing_sfx": "Организация SFX файлов...",
-        "update_complete_title": "Обновление завершено",
-        "update_complete_msg": "Следующие ресурсы были успешно обновлены:\n\n{updated_resources}\n\nРекомендуется перезапустить приложение, чтобы применить все изменения.",
-        "update_failed_title": "Ошибка обновления",
-        "update_failed_msg": "Процесс обновления не удался. Пожалуйста, проверьте лог для получения подробной информации.",
-        "restart_recommended": "Рекомендуется перезапуск",
-        "settings_saved_title": "Настройки сохранены",
-        "close_required_message": "Настройки языка были изменены.\n\nПриложение необходимо закрыть, чтобы изменения вступили в силу.",
-        "close_now_button": "Закрыть сейчас",
-        "update_warning_title": "Идет обновление",
-        "update_warning_msg": "Процесс обновления ресурсов запущен.\n\nПожалуйста, не используйте и не закрывайте приложение до его завершения. Это может занять несколько минут в зависимости от вашей системы.",
-        "update_fun_status_1": "Смотрим, как Авелланос читает лекцию Истерману...",
-        "update_fun_status_2": "Пытаемся прорезать прутья комнаты сна...",
-        "update_fun_status_3": "Готовим шаттл к следующим испытаниям...",
-        "update_fun_status_4": "Тренируем новых самозванцев для вторжения...",
-        "update_fun_status_5": "Удерживаем главные активы, пока они не прозрели...",
-        "update_fun_status_6": "Предупреждаем реагентов о новых изменениях...",
-        "update_fun_status_7": "Завершаем процесс обновления...",
-        "update_step_unpacking": "Распаковка файлов из архива игры...",
-        "update_step_clearing": "Удаление старых локальных файлов...",
-        "update_step_moving": "Перемещение новых файлов...",
-        "update_step_organizing": "Организация новых файлов...",
-        "update_unpacking_long_wait": "Начат процесс распаковки. Это может занять несколько минут в зависимости от вашей системы...",
-        "update_cancelled_by_user": "Обновление отменено пользователем",
-        "update_step_finishing": "Завершение...",
-        "update_in_progress_title": "Идёт обновление",
-        "confirm_exit_during_update_message": "Процесс обновления ресурсов всё ещё запущен.\n\nВы уверены, что хотите выйти? Это отменит обновление.",
-        "update_rescanning_orphans": "Обновление завершено. Пересканирование папки Wems на наличие изменений...",
-        "initial_setup_title": "Первоначальная настройка",
-        "wems_folder_missing_message": "Папка 'Wems' с аудиофайлами игры не найдена.\n\nОна необходима для корректной работы приложения.\n\nХотите перейти на вкладку 'Обновление ресурсов', чтобы извлечь их из игры сейчас?",
-        "localization_folder_missing_message": "Папка 'Localization' с файлами субтитров игры не найдена.\n\nОна необходима для редактирования субтитров.\n\nХотите перейти на вкладку 'Обновление ресурсов', чтобы извлечь их из игры сейчас?",
-        "go_to_updater_button": "Перейти к обновлению",
-        "import_mod_title": "Импорт мода",
-        "select_pak_to_import": "Выберите .pak файл для импорта",
-        "pak_files": "PAK файлы",
-        "enter_profile_name_for_pak": "Введите имя для нового профиля (основано на имени .pak файла):",
-        "importing_mod_progress": "Импорт мода...",
-        "unpacking_pak_file": "Распаковка .pak файла...",
-        "creating_profile_structure": "Создание структуры профиля...",
-        "moving_mod_files": "Перемещение файлов мода...",
-        "cleaning_up": "Очистка...",
-        "import_successful_title": "Импорт успешно завершен",
-        "import_successful_message": "Мод '{pak_name}' был успешно импортирован как профиль '{profile_name}'.",
-        "import_failed_title": "Ошибка импорта",
-        "import_mod_from_pak": "Импортировать мод из .pak...",
-        "wems_folder_loose_files_title": "Обнаружены неуместные аудиофайлы",
-        "wems_folder_loose_files_message": "Найдено {count} аудиофайлов (.wem/.bnk) в главной папке 'Wems'.",
-        "wems_folder_loose_files_details": "Обычно эти файлы должны находиться в подпапке 'Wems/SFX'. Их перемещение поможет поддерживать порядок в проекте и обеспечит их правильное обнаружение.\n\nХотите переместить их в папку 'Wems/SFX' сейчас?",
-        "move_all_files_btn": "Переместить все файлы",
-        "ignore_btn": "Игнорировать",
-        "move_complete_title": "Перемещение завершено",
-        "move_complete_message": "Успешно перемещено {count} файл(ов) в папку 'Wems/SFX'.",
-        "move_complete_errors": "Не удалось переместить {count} файл(ов):\n{errors}",
-        "soundbanksinfo_missing_title": "Отсутствует файл базы данных",
-        "soundbanksinfo_missing_message": "Основной файл базы данных аудио (SoundbanksInfo.json) не найден.",
-        "soundbanksinfo_missing_details": "Этот файл необходим для идентификации большинства аудиофайлов. Хотите перейти на вкладку 'Обновление ресурсов', чтобы извлечь последние файлы игры сейчас?",
-        "go_to_updater_btn": "Перейти к обновлению",
-        "later_btn": "Позже",
-        "critical_file_missing_title": "Отсутствует критический файл",
-        "critical_file_missing_message": "SoundbanksInfo.json отсутствует, и вкладка 'Обновление ресурсов' не найдена.",
-        "move_complete_restart_note": "\n\nРекомендуется перезапустить приложение, чтобы изменения вступили в силу.",
-        "outdated_mod_structure_title": "Устаревшая структура мода",
-        "outdated_mod_structure_msg": "Импортируемый мод использует старую структуру файлов (до обновления игры).\n\nТеперь игра требует, чтобы аудиофайлы находились в подпапке 'Media'.\nВы хотите автоматически перестроить файлы в новый формат?"
-    },
-    
-    "pl": {
-        # === PODSTAWOWE ELEMENTY INTERFEJSU ===
-        "wemprocces_desc": "Wybierz język do zmiany nazwy i umieszczenia plików WEM podczas przetwarzania",
-        "exports_modified_subtitles_desc": "Eksportuje zmodyfikowane napisy w odpowiedniej strukturze dla gry:",
-        "creates_mod_p_structure": "Tworzy strukturę MOD_P/OPP/Content/Localization/",
-        "supports_multiple_categories": "Obsługuje wiele kategorii napisów",
-        "each_language_separate_folder": "Każdy język w osobnym folderze",
-        "ready_files_for_mods": "Gotowe pliki można używać w modach",
-        "app_title": "Edytor Audio Outlast Trials Mercedes",
-        "file_menu": "Plik",
-        "edit_menu": "Edycja",
-        "tools_menu": "Narzędzia",
-        "help_menu": "Pomoc",
-        "save_subtitles": "Zapisz napisy",
-        "export_subtitles": "Eksportuj napisy...",
-        "import_subtitles": "Importuj napisy...",
-        "import_custom_subtitles": "Importuj niestandardowe napisy (Beta)...",
-        "exit": "Wyjście",
-        "revert_to_original": "Przywróć oryginał",
-        "find_replace": "Znajdź i zamień...",
-        "compile_mod": "Kompiluj mod",
-        "deploy_and_run": "Wdróż mod i uruchom grę",
-        "show_debug": "Pokaż konsolę debugowania",
-        "settings": "Ustawienia...",
-        "about": "O programie",
-        
-        # === FILTRY I SORTOWANIE ===
-        "filter": "Filtr:",
-        "sort": "Sortuj:",
-        "all_files": "Wszystkie pliki",
-        "with_subtitles": "Z napisami",
-        "without_subtitles": "Bez napisów",
-        "modified": "Zmodyfikowane",
-        "modded": "Zmodyfikowane (audio)",
-        "name_a_z": "Nazwa (A-Z)",
-        "name_z_a": "Nazwa (Z-A)",
-        "id_asc": "ID ↑",
-        "id_desc": "ID ↓",
-        "recent_first": "Najnowsze pierwsze",
-        
-        # === PODSTAWOWE SŁOWA ===
-        "name": "Nazwa",
-        "id": "ID",
-        "subtitle": "Napisy",
-        "status": "Status",
-        "mod": "MOD",
-        "path": "Ścieżka",
-        "source": "Źródło",
-        "original": "Oryginał",
-        "save": "Zapisz",
-        "cancel": "Anuluj",
-        "browse": "Przeglądaj...",
-        "confirmation": "Potwierdzenie",
-        "error": "Błąd",
-        "warning": "Ostrzeżenie",
-        "success": "Sukces",
-        "info": "Informacja",
-        "close": "Zamknij",
-        "ready": "Gotowy",
-        "waiting": "Oczekiwanie...",
-        "done": "Gotowe",
-        "error_status": "Błąd",
-        "size_warning": "Ostrzeżenie rozmiaru",
-        "loading": "Ładowanie...",
-        "processing": "Przetwarzanie...",
-        "converting": "Konwertowanie...",
-        "complete": "Zakończone",
-        "stop": "Stop",
-        "clear": "Wyczyść",
-        "language": "Język",
-        
-        # === OKNA DIALOGOWE I KOMUNIKATY ===
-        "edit_subtitle": "Edytuj napisy",
-        "subtitle_preview": "Podgląd napisów",
-        "file_info": "Informacje o pliku",
-        "select_game_path": "Wybierz główny folder gry",
-        "game_path_saved": "Ścieżka gry zapisana",
-        "mod_deployed": "Mod wdrożony pomyślnie!",
-        "game_launching": "Uruchamianie gry...",
-        "no_game_path": "Najpierw ustaw ścieżkę gry w ustawieniach",
-        "no_changes": "Brak zmian",
-        "no_modified_subtitles": "Brak zmodyfikowanych napisów do eksportu",
-        "import_error": "Błąd importu",
-        "export_error": "Błąd eksportu",
-        "save_error": "Błąd zapisu",
-        "file_not_found": "Plik nie znaleziony",
-        "conversion_stopped": "Konwersja zatrzymana",
-        "deployment_complete": "Wdrożenie zakończone",
-        "characters": "Znaków:",
-        
-        # === KONFLIKTY NAPISÓW ===
-        "conflict_detected": "Wykryto konflikt napisów",
-        "conflict_message": "Następujące klucze już mają napisy:\n\n{conflicts}\n\nKtóre napisy chcesz zachować?",
-        "use_existing": "Zachowaj istniejące",
-        "use_new": "Użyj nowych",
-        "merge_all": "Połącz wszystkie (zachowaj istniejące)",
-        
-        # === KONWERTER WAV DO WEM ===
-        "wav_to_wem_converter": "Konwerter Audio do WEM",
-        "conversion_mode": "Tryb konwersji (Tylko Size matching mode)",
-        "strict_mode": "Tryb ścisły",
-        "adaptive_mode": "Tryb adaptacyjny",
-        "strict_mode_desc": "❌ Zawodzi jeśli za duży",
-        "adaptive_mode_desc": "✅ Auto-dostosowanie jakości",
-        "path_configuration": "Konfiguracja ścieżek",
-        "wwise_path": "Wwise:",
-        "project_path": "Projekt:",
-        "wav_path": "Audio:",
-        "files_for_conversion": "Pliki do konwersji",
-        "add_all_wav": "Dodaj wszystkie pliki Audio",
-        "convert": "Konwertuj",
-        "files_ready": "Pliki gotowe:",
-        "wav_file": "Plik Audio",
-        "target_wem": "Docelowy WEM",
-        "target_size": "Docelowy rozmiar",
-        "files_ready_count": "Pliki gotowe: {count}",
-        "confirm_clear": "Wyczyścić wszystkie pliki?",
-        
-        # === KONWERSJA I LOGI ===
-        "conversion_complete": "Konwersja zakończona",
-        "conversion_logs": "Logi konwersji",
-        "clear_logs": "Wyczyść logi",
-        "save_logs": "Zapisz logi",
-        "logs_cleared": "Logi wyczyszczone...",
-        "logs_saved": "Logi zapisane",
-        "error_saving_logs": "Nie udało się zapisać logów",
-        "starting_conversion": "Rozpoczynanie konwersji w trybie {mode}...",
-        "file_status": "Plik {current}/{total}: {name}",
-        "attempting": "próba {attempts} (Conversion={value})",
-        "testing_sample_rate": "Testowanie {rate}Hz...",
-        "resampled_to": "Przepróbkowano do {rate}Hz",
-        "results_summary": "✅ Konwersja i wdrożenie zakończone!\n\nUdane: {successful}\nBłędy: {failed}\nOstrzeżenia rozmiaru: {warnings}\n\nPliki wdrożone do MOD_P\nZobacz zakładkę 'Logi' dla szczegółów",
-        "add_files_warning": "Najpierw dodaj pliki do konwersji!",
-        
-        # === INSTRUKCJE ===
-        "converter_instructions": "Konwerter Audio do WEM:\n1) Ustaw ścieżkę Wwise 2) Wybierz folder tymczasowego projektu 3) Wybierz folder Audio 4) Dodaj pliki 5) Konwertuj",
-        "converter_instructions2": "Konwerter WEM:\n1) Ustaw ścieżkę projektu Wwise 2) Konwertuj do moda",
-        
-        # === ŚCIEŻKI I PLACEHOLDERY ===
-        "wwise_path_placeholder": "Ścieżka instalacji Wwise... (Przykład: D:/Audiokinetic/Wwise2019.1.6.7110)",
-        "project_path_placeholder": "Ścieżka nowego/starego projektu... (Przykład: D:/ExampleProjects/MyNewProject) P.S. Może być pusta",
-        "wav_folder_placeholder": "Folder z plikami Audio...",
-        
-        # === WYSZUKIWANIE I PRZETWARZANIE ===
-        "select_wav_folder": "Najpierw wybierz folder Audio!",
-        "wems_folder_not_found": "Nie znaleziono folderu Wems",
-        "no_wav_files": "Nie znaleziono plików Audio w folderze!",
-        "search_complete": "Wyszukiwanie zakończone",
-        "auto_search_result": "Automatycznie znaleziono dopasowania: {matched} z {total}",
-        "target_language": "Język docelowy dla plików głosowych",
-        "no_matches_found": "Nie znaleziono dopasowań dla",
-        
-        # === EKSPORT NAPISÓW ===
-        "cleanup_mod_subtitles": "Wyczyść napisy MOD_P",
-        "export_subtitles_for_game": "Eksportuj napisy dla gry",
-        "subtitle_export_ready": "Gotowy do eksportu napisów...",
-        "deploying_files": "Wdrażanie plików do struktury gry...",
-        "deployment_error": "Błąd wdrożenia",
-        "conversion_failed": "Konwersja nieudana",
-        "all_files_failed": "Wszystkie pliki nieudane",
-        "see_logs_for_details": "Zobacz zakładkę 'Logi' dla szczegółów",
-        
-        # === PROCESOR WEM ===
-        "wem_processor_warning": "⚠️ Procesor WEM (Niezalecane)",
-        "wem_processor_desc": "Starsze narzędzie do przetwarzania gotowych plików WEM.",
-        "wem_processor_recommendation": "Zaleca się używanie „Audio do WEM” dla nowych użytkowników.",
-        
-        # === EKSPORTER LOKALIZACJI ===
-        "localization_exporter": "Eksporter lokalizacji",
-        "export_modified_subtitles": "Eksportuj zmodyfikowane napisy",
-        "localization_editor": "Edytor lokalizacji",
-        "localization_editor_desc": "Edytuj lokalizację bezpośrednio. Użyj globalnego pola wyszukiwania powyżej, aby filtrować wyniki.",
-        # === CZYSZCZENIE NAPISÓW ===
-        "cleanup_subtitles_found": "Znaleziono {count} plików napisów w MOD_P",
-        "select_files_to_delete": "Proszę wybrać pliki do usunięcia",
-        "confirm_deletion": "Potwierdź usunięcie",
-        "delete_files_warning": "Czy na pewno chcesz usunąć {count} plików napisów?\n\nTej akcji nie można cofnąć!",
-        "cleanup_complete": "Czyszczenie zakończone",
-        "cleanup_with_errors": "Czyszczenie zakończone z błędami",
-        "files_deleted_successfully": "Pomyślnie usunięto {count} plików napisów z MOD_P",
-        "files_deleted_with_errors": "Usunięto {count} plików pomyślnie\n{errors} plików z błędami\n\nSprawdź log statusu dla szczegółów",
-        "no_localization_found": "Nie znaleziono plików",
-        "no_localization_message": "Nie znaleziono folderu lokalizacji w:\n{path}",
-        "no_subtitle_files": "Nie znaleziono plików napisów w:\n{path}",
-        "select_all": "Zaznacz wszystkie",
-        "select_none": "Odznacz wszystkie",
-        "quick_select": "Szybki wybór:",
-        "select_by_language": "Wybierz według języka...",
-        "delete_selected": "Usuń wybrane",
-        "no_selection": "Brak wyboru",
-        
-        # === INFORMACJE O AUDIO ===
-        "audio_comparison": "Porównanie audio",
-        "original_audio": "Oryginalne audio",
-        "modified_audio": "Zmodyfikowane audio",
-        "duration": "Czas trwania",
-        "size": "Rozmiar",
-        "sample_rate": "Częstotliwość próbkowania",
-        "bitrate": "Bitrate",
-        "channels": "Kanały",
-        "audio_markers": "Markery audio",
-        "original_markers": "Oryginalne markery",
-        "modified_markers": "Zmodyfikowane markery",
-        
-        # === MENU KONTEKSTOWE ===
-        "play_original": "▶ Odtwórz oryginał",
-        "play_mod": "▶ Odtwórz mod",
-        "export_as_wav": "💾 Eksportuj jako WAV",
-        "delete_mod_audio": "🗑 Usuń audio moda",
-        "copy_key": "📋 Kopiuj klucz",
-        "copy_text": "📋 Kopiuj tekst",
-        "remove": "❌ Usuń",
-        "browse_target_wem": "📁 Przeglądaj docelowy WEM...",
-        "quick_select_menu": "⚡ Szybki wybór",
-        
-        # === NARZĘDZIA ===
-        "expand_all": "📂 Rozwiń wszystkie",
-        "collapse_all": "📁 Zwiń wszystkie",
-        "edit_button": "✏ Edytuj",
-        "export_button": "💾 Eksportuj",
-        "delete_mod_button": "🗑 Usuń mod AUDIO",
-        
-        # === EKSPORT AUDIO ===
-        "export_audio": "Eksport audio",
-        "which_version_export": "Którą wersję chcesz wyeksportować?",
-        "save_as_wav": "Zapisz jako WAV",
-        "wav_files": "Pliki WAV",
-        "batch_export": "Eksport wsadowy",
-        "select_output_directory": "Wybierz katalog wyjściowy",
-        "exporting_files": "Eksportowanie {count} plików...",
-        "export_results": "Wyeksportowano {successful} plików pomyślnie.\nWystąpiło {errors} błędów.",
-        "export_complete": "Eksport zakończony",
-        
-        # === DIALOGI ZAPISU ===
-        "save_changes_question": "Zapisać zmiany?",
-        "unsaved_changes_message": "Masz niezapisane zmiany napisów. Zapisać przed zamknięciem?",
-        
-        # === KOMPILACJA MODÓW ===
-        "mod_not_found_compile": "Plik moda nie znaleziony. Skompilować najpierw?",
-        "mod_compilation_failed": "Kompilacja moda nieudana",
-        "repak_not_found": "repak.exe nie znaleziony!",
-        "compiling_mod": "Kompilowanie moda",
-        "running_repak": "Uruchamianie repak...",
-        "mod_compiled_successfully": "Mod skompilowany pomyślnie!",
-        "compilation_failed": "Kompilacja nieudana!",
-        
-        # === USTAWIENIA ===
-        "auto_save": "Automatyczny zapis napisów co 5 minut",
-        "interface_language": "Język interfejsu (WYMAGA RESTART):",
-        "theme": "Motyw:",
-        "subtitle_language": "Język napisów:",
-        "game_path": "Ścieżka gry:",
-        "wem_process_language": "Język przetwarzania WEM:",
-        "light": "Jasny",
-        "dark": "Ciemny",
-        "rename_french_audio": "Zmień nazwy francuskich plików audio na ID (dodatkowo do angielskich)",
-        
-        # === POMOC I RAPORTY ===
-        "keyboard_shortcuts": "Skróty klawiszowe",
-        "documentation": "📖 Dokumentacja",
-        "check_updates": "🔄 Sprawdź aktualizacje",
-        "report_bug": "🐛 Zgłoś błąd",
-        "getting_started": "Rozpoczęcie pracy",
-        "features": "Funkcje",
-        "file_structure": "Struktura plików",
-        "credits": "Autorzy",
-        "license": "Licencja",
-        "github": "GitHub",
-        "discord": "Discord",
-        "donate": "Wspomóż",
-        
-        # === RAPORT BŁĘDU ===
-        "bug_report_info": "Znalazłeś błąd? Podaj szczegóły poniżej.\nLogi debugowania zostaną automatycznie dołączone.",
-        "description": "Opis",
-        "email_optional": "Email (opcjonalnie)",
-        "copy_report_clipboard": "Kopiuj raport do schowka",
-        "open_github_issues": "Otwórz GitHub Issues",
-        "bug_report_copied": "Raport błędu skopiowany do schowka!",
-        
-        # === PODPOWIEDZI ===
-        "has_audio_file": "Ma plik audio",
-        "no_audio_file": "Brak pliku audio",
-        
-        # === O PROGRAMIE ===
-        "about_description": "Narzędzie do zarządzania plikami audio WEM i napisami gry dla Outlast Trials, zaprojektowane dla moddersów i zespołów lokalizacyjnych.",
-        "key_features": "Kluczowe funkcje",
-        "audio_management": "🎵 <b>Zarządzanie audio:</b> Odtwarzanie, konwersja i organizacja plików WEM",
-        "subtitle_editing": "📝 <b>Edycja napisów:</b> Łatwa edycja z rozwiązywaniem konfliktów",
-        "mod_creation": "📦 <b>Tworzenie modów:</b> Kompilacja i wdrażanie modów jednym kliknięciem",
-        "multi_language": "🌍 <b>Wielojęzyczność:</b> Wsparcie dla 14+ języków",
-        "modern_ui": "🎨 <b>Interfejs:</b> Czysty interfejs z ciemnymi/jasnymi motywami",
-        "technology_stack": "Stos technologiczny",
-        "built_with": "Zbudowane z Python 3 i PyQt5, wykorzystując:",
-        "unreal_locres_tool": "UnrealLocres do obsługi plików .locres",
-        "vgmstream_tool": "vgmstream do konwersji audio",
-        "repak_tool": "repak do pakowania modów",
-        "ffmpeg_tool": "FFmpeg do obróbki audio",
-        "development_team": "Zespół deweloperski",
-        "lead_developer": "<b>Główni deweloperzy:</b> Bezna i Mercedes",
-        "developers_label": "Deweloperzy:",
-        "developers_names": "Bezna i Mercedes",
-        "polish_translator_label": "Tester/Tłumacz Polski:",
-        "polish_translator_name": "Alaneg",
-        "spanish_translator_label": "Tłumacz Hiszpański:",
-        "spanish_translator_name": "Mercedes",
-        "special_thanks": "Specjalne podziękowania",
-        "vgmstream_thanks": "Zespół vgmstream - Za narzędzia konwersji audio",
-        "unreal_locres_thanks": "Deweloperzy UnrealLocres - Za wsparcie lokalizacji",
-        "hypermetric_thanks": "hypermetric - Za pakowanie modów",
-        "ffmpeg_thanks": "FFmpeg - Za obróbkę audio",
-        "red_barrels_thanks": "Red Barrels - Za stworzenie Outlast Trials",
-        "open_source_libraries": "Biblioteki open source",
-        "pyqt5_lib": "PyQt5 - GUI Framework",
-        "python_lib": "Standardowa biblioteka Python",
-        "software_disclaimer": "To oprogramowanie jest dostarczane \"jak jest\" bez żadnej gwarancji. Używaj na własne ryzyko.",
-        "license_agreement": "Umowa licencyjna",
-        "copyright_notice": "Copyright (c) 2026 Edytor Audio Outlast Trials Mercedes",
-        "credits": "Kredyty",
-        "license": "Licencja",
-        "mit_license_text": "Niniejszym udziela się bezpłatnego zezwolenia każdej osobie uzyskującej kopię tego oprogramowania i powiązanych plików dokumentacji (\"Oprogramowanie\") na nieograniczone korzystanie z Oprogramowania, w tym bez ograniczeń prawami do używania, kopiowania, modyfikowania, łączenia, publikowania, dystrybucji, sublicencjonowania i/lub sprzedaży kopii Oprogramowania, oraz zezwalania osobom, którym Oprogramowanie jest dostarczone, na takie działania, pod warunkiem spełnienia następujących warunków:\n\nPowyższa informacja o prawach autorskich i niniejsza informacja o zezwoleniu muszą być zawarte we wszystkich kopiach lub istotnych częściach Oprogramowania.\n\nOPROGRAMOWANIE JEST DOSTARCZANE \"JAK JEST\", BEZ JAKICHKOLWIEK GWARANCJI, WYRAŹNYCH LUB DOROZUMIANYCH, W TYM GWARANCJI PRZYDATNOŚCI HANDLOWEJ, PRZYDATNOŚCI DO OKREŚLONEGO CELU I NIENARUSZANIA PRAW. W ŻADNYM PRZYPADKU AUTORZY LUB POSIADACZE PRAW AUTORSKICH NIE PONOSZĄ ODPOWIEDZIALNOŚCI ZA JAKIEKOLWIEK ROSZCZENIA, SZKODY LUB INNE ZOBOWIĄZANIA, CZY TO W RAMACH UMOWY, DELIKTU CZY W INNY SPOSÓB, WYNIKAJĄCE Z LUB W ZWIĄZKU Z OPROGRAMOWANIEM LUB UŻYTKOWANIEM LUB INNYMI DZIAŁANIAMI W OPROGRAMOWANIU.",
-        
-        "software_disclaimer": "To oprogramowanie jest dostarczane \"jak jest\" bez żadnych gwarancji. Używaj na własne ryzyko.",
-        "license_agreement": "Umowa licencyjna",
-        "copyright_notice": "Copyright (c) 2026 Edytor Audio Outlast Trials Mercedes",
-        "mit_license_text": "Niniejszym udziela się bezpłatnego zezwolenia każdej osobie uzyskującej kopię tego oprogramowania i powiązanych plików dokumentacji (\"Oprogramowanie\") na nieograniczone korzystanie z Oprogramowania, w tym bez ograniczeń prawami do używania, kopiowania, modyfikowania, łączenia, publikowania, dystrybucji, sublicencjonowania i/lub sprzedaży kopii Oprogramowania, oraz zezwalania osobom, którym Oprogramowanie jest dostarczone, na takie działania, pod warunkiem spełnienia następujących warunków:\n\nPowyższa informacja o prawach autorskich i niniejsza informacja o zezwoleniu muszą być zawarte we wszystkich kopiach lub istotnych częściach Oprogramowania.\n\nOPROGRAMOWANIE JEST DOSTARCZANE \"JAK JEST\", BEZ JAKICHKOLWIEK GWARANCJI, WYRAŹNYCH LUB DOROZUMIANYCH, W TYM GWARANCJI PRZYDATNOŚCI HANDLOWEJ, PRZYDATNOŚCI DO OKREŚLONEGO CELU I NIENARUSZANIA PRAW. W ŻADNYM PRZYPADKU AUTORZY LUB POSIADACZE PRAW AUTORSKICH NIE PONOSZĄ ODPOWIEDZIALNOŚCI ZA JAKIEKOLWIEK ROSZCZENIA, SZKODY LUB INNE ZOBOWIĄZANIA, CZY TO W RAMACH UMOWY, DELIKTU CZY W INNY SPOSÓB, WYNIKAJĄCE Z LUB W ZWIĄZKU Z OPROGRAMOWANIEM LUB UŻYTKOWANIEM LUB INNYMI DZIAŁANIAMI W OPROGRAMOWANIU.",
-        
-        # === SKRÓTY KLAWISZOWE ===
-        "shortcuts_table_action": "Akcja",
-        "shortcuts_table_shortcut": "Skrót",
-        "shortcuts_table_description": "Opis",
-        "shortcut_edit_subtitle": "Edytuj napisy",
-        "shortcut_save_subtitles": "Zapisz napisy",
-        "shortcut_export_audio": "Eksport audio",
-        "shortcut_revert_original": "Przywróć do oryginału",
-        "shortcut_deploy_run": "Wdróż i uruchom",
-        "shortcut_debug_console": "Konsola debugowania",
-        "shortcut_settings": "Ustawienia",
-        "shortcut_documentation": "Dokumentacja",
-        "shortcut_exit": "Wyjście",
-        "shortcut_edit_selected": "Edytuj wybrany napis",
-        "shortcut_save_all_changes": "Zapisz wszystkie zmiany napisów",
-        "shortcut_export_selected": "Eksportuj wybrane audio jako WAV",
-        "shortcut_revert_selected": "Przywróć wybrany napis do oryginału",
-        "shortcut_deploy_launch": "Wdróż mod i uruchom grę",
-        "shortcut_show_debug": "Pokaż konsolę debugowania",
-        "shortcut_open_settings": "Otwórz dialog ustawień",
-        "shortcut_show_help": "Pokaż dokumentację",
-        "shortcut_close_app": "Zamknij aplikację",
-        "mouse_actions": "Akcje myszy",
-        "mouse_double_subtitle": "<b>Podwójne kliknięcie napisu:</b> Edytuj napis",
-        "mouse_double_file": "<b>Podwójne kliknięcie pliku:</b> Odtwórz audio",
-        "mouse_right_click": "<b>Prawy klik:</b> Pokaż menu kontekstowe",
-        "verify_mod_integrity": "Sprawdź spójność moda",
-        "rebuild_bnk_index": "Przebuduj indeks BNK moda",
-        "rebuild_bnk_tooltip": "Wymusza synchronizację wszystkich plików BNK z rzeczywistymi plikami WEM w twoim modzie.",
-        "verifying_mod_integrity": "Sprawdzanie spójności moda...",
-        "bnk_verification_complete": "Weryfikacja zakończona",
-        "bnk_no_issues_found": "Wszystkie zmodyfikowane pliki audio są zgodne z wpisami BNK. Nie znaleziono problemów!",
-        "bnk_issues_found_title": "Znaleziono problemy ze spójnością moda",
-        "bnk_issues_found_text": "Znaleziono {count} problemów w twoim modzie.\n\nTe problemy mogą powodować nieprawidłowe odtwarzanie dźwięków w grze.\n\nCzy chcesz automatycznie naprawić te wpisy?",
-        "fix_all_btn": "Napraw wszystko",
-        "bnk_size_mismatch": "Niezgodność rozmiaru",
-        "bnk_entry_missing": "Brak wpisu w BNK",
-        "bnk_report_size": "Typ: {type} w {bnk_name}\n  Dźwięk: {short_name} (ID: {source_id})\n  - Rozmiar w BNK: {bnk_size} bajtów\n  - Rozmiar WEM: {wem_size} bajtów\n\n",
-        "bnk_report_missing": "Typ: {type}\n  Dźwięk: {short_name} (ID: {source_id})\n  - Plik .wem istnieje, ale odpowiadający mu wpis nie został znaleziony w żadnym zmodyfikowanym pliku .bnk.\n\n",
-        "fixing_mod_issues": "Naprawianie problemów z modem...",
-        "fix_complete_no_issues": "Nie znaleziono problemów, które można naprawić automatycznie (np. 'Brak wpisu w BNK').",
-        "fix_complete_title": "Naprawianie zakończone",
-        "fix_complete_message": "Naprawiono {count} problemów z niezgodnością rozmiaru.",
-        "fix_complete_with_errors": "Naprawiono {fixed} problemów z niezgodnością rozmiaru.\nNie udało się naprawić {errors} wpisów. Zobacz konsolę debugowania, aby uzyskać szczegóły.",
-        "verification_error": "Błąd weryfikacji",
-        "verification_error_message": "Wystąpił błąd podczas weryfikacji:\n\n{error}",
-        "rebuild_bnk_confirm_title": "Przebuduj indeks BNK",
-        "rebuild_bnk_confirm_text": "Ta operacja przeskanuje wszystkie zmodyfikowane pliki audio (.wem) i wymusi aktualizację rekordów rozmiaru w plikach .bnk twojego moda.\n\nJest to przydatne do naprawy niespójności po ręcznym dodawaniu, usuwaniu lub edytowaniu plików WEM.\n\nCzy chcesz kontynuować?",
-        "rebuilding_mod_bnk": "Przebudowywanie indeksu BNK moda...",
-        "rebuild_complete_title": "Przebudowa zakończona",
-        "rebuild_complete_message": "Przebudowa zakończona!\n\n✅ Utworzono ponownie {created} plików BNK w twoim modzie z oryginałów.\n🔄 Zaktualizowano {updated} wpisów, aby pasowały do twoich plików WEM.\n⚙️ Zastosowano {reverted} niestandardowych ustawień 'Efektów w grze'.",
-        "profiles": "Profile",
-        "profile_manager_tooltip": "Otwórz menedżera profili modów",
-        "edit_profile": "Edytuj profil moda",
-        "create_profile": "Utwórz nowy profil moda",
-        "profile_name": "Nazwa profilu:",
-        "author": "Autor:",
-        "version": "Wersja:",
-        "icon_png": "Ikona (PNG):",
-        "no_icon_selected": "Nie wybrano ikony.",
-        "select_icon": "Wybierz ikonę",
-        "png_images": "Obrazy PNG",
-        "validation_error": "Błąd walidacji",
-        "profile_name_empty": "Nazwa profilu nie może być pusta.",
-        "profile_manager_title": "Menedżer profili modów",
-        "create_new_profile_btn": "➕ Utwórz nowy...",
-        "add_existing_profile_btn": "📁 Dodaj istniejący...",
-        "remove_from_list_btn": "➖ Usuń z listy",
-        "select_a_profile": "Wybierz profil",
-        "author_label": "<b>Autor:</b>",
-        "version_label": "<b>Wersja:</b>",
-        "no_description": "<i>Brak opisu.</i>",
-        "edit_details_btn": "⚙️ Edytuj...",
-        "active_profile_btn": "✓ Aktywny",
-        "activate_profile_btn": "Aktywuj profil",
-        "error_reading_profile": "<i style='color:red;'>Nie można odczytać profile.json</i>",
-        "error_author": "<i style='color:red;'>Błąd</i>",
-        "select_folder_for_profile": "Wybierz folder do utworzenia nowego profilu",
-        "profile_exists_error": "Profil o tej nazwie już istnieje.",
-        "create_profile_error": "Nie można utworzyć profilu: {e}",
-        "select_existing_profile": "Wybierz istniejący folder profilu",
-        "invalid_profile_folder": "Wybrany folder nie zawiera wymaganego podfolderu '{folder}'.",
-        "profile_already_added": "Profil o tej nazwie został już dodany.",
-        "remove_profile_title": "Usuń profil",
-        "remove_profile_text": "Czy na pewno chcesz usunąć profil '{name}' z listy?\n\nTo NIE usunie plików na dysku.",
-        "profile_activated_title": "Profil aktywowany",
-        "profile_activated_text": "Profil '{name}' jest teraz aktywny.",
-        "no_active_profile_title": "Brak aktywnego profilu",
-        "no_active_profile_text": "Obecnie nie ma aktywnego profilu. Proszę utworzyć lub aktywować profil.",
-        "rebuild_complete_message_details": "Przebudowa zakończona!\n\n"
-                                  "✅ Utworzono ponownie {created} plików BNK w twoim modzie z oryginałów.\n"
-                                  "🔄 Zaktualizowano {updated} wpisów, aby pasowały do twoich plików WEM.\n"
-                                  "⚙️ Zastosowano {reverted} niestandardowych ustawień 'Efektów w grze'.",
-        "select_version_title": "Wybierz wersję",
-        "adjust_volume_for": "Dostosuj głośność dla: {filename}\n\nKtórą wersję chcesz dostosować?",
-        "batch_adjust_volume_for": "Zbiorcze dostosowywanie głośności dla {count} plików\n\nKtórą wersję chcesz dostosować?",
-        "no_language_selected": "Nie wybrano języka",
-        "select_language_tab_first": "Proszę najpierw wybrać zakładkę języka.",
-        "no_files_selected": "Nie wybrano plików",
-        "select_files_for_volume": "Proszę wybrać jeden lub więcej plików audio, aby dostosować głośność.",
-        "quick_load_audio_title": "🎵 Szybkie ładowanie audio...",
-        "quick_load_audio_tooltip": "Zastąp ten dźwięk własnym plikiem (dowolny format)",
-        "restore_from_backup_title": "🔄 Przywróć z kopii zapasowej",
-        "restore_from_backup_tooltip": "Przywróć poprzednią wersję zmodyfikowanego audio",
-        "adjust_original_volume_title": "🔊 Dostosuj głośność oryginału...",
-        "trim_original_audio_title": "✂️ Przytnij oryginał...",
-        "adjust_mod_volume_title": "🔊 Dostosuj głośność moda...",
-        "trim_mod_audio_title": "✂️ Przytnij mod...",
-        "toggle_ingame_effects_title": "✨ Przełącz efekty w grze",
-        "marking_menu_title": "🖍 Oznaczanie",
-        "set_color_menu_title": "🎨 Ustaw kolor",
-        "set_tag_menu_title": "🏷 Ustaw tag",
-        "color_green": "Zielony",
-        "color_yellow": "Żółty",
-        "color_red": "Czerwony",
-        "color_blue": "Niebieski",
-        "color_none": "Brak",
-        "tag_important": "Ważne",
-        "tag_check": "Do sprawdzenia",
-        "tag_done": "Gotowe",
-        "tag_review": "Do przeglądu",
-        "tag_none": "Brak",
-        "tag_custom": "Niestandardowy...",
-        "custom_tag_title": "Tag niestandardowy",
-        "custom_tag_prompt": "Wprowadź tag niestandardowy:",
-        "select_folder_to_open_title": "Wybierz folder do otwarcia",
-        "which_folder_to_open": "Który folder chcesz otworzyć?",
-        "voice_files_folder": "🎙 Pliki głosowe\n{path}",
-        "sfx_files_folder": "🔊 Efekty dźwiękowe\n{path}",
-        "subtitles_folder": "📝 Napisy\n{path}",
-        "no_target_folders_found": "Nie znaleziono folderów docelowych!",
-        "quick_load_mode_label": "Wybierz tryb konwersji dla Szybkiego ładowania audio:",
-        "quick_load_strict": "Tryb ścisły - Błąd, jeśli plik jest za duży",
-        "quick_load_adaptive": "Tryb adaptacyjny - Automatyczne dostosowanie jakości",
-        "audio_files_dialog_title": "Pliki audio",
-        "volume_editor_title": "Edytor głośności - {shortname}",
-        "volume_deps_missing": "⚠️ Edycja głośności wymaga bibliotek NumPy i SciPy.\n\nZainstaluj je za pomocą:\npip install numpy scipy",
-        "audio_analysis_group": "Analiza audio",
-        "analyzing": "Analizowanie...",
-        "current_rms": "Aktualne RMS:",
-        "current_peak": "Aktualny szczyt:",
-        "duration_label": "Czas trwania:",
-        "recommended_max": "Zalecane maks.:",
-        "no_limit": "Brak limitu",
-        "volume_control_group": "Kontrola głośności",
-        "volume_label_simple": "Głośność:",
-        "quick_presets": "Szybkie ustawienia:",
-        "waiting_for_analysis": "Oczekiwanie na analizę...",
-        "preview_rms_peak": "Podgląd: RMS {new_rms:.1f}%, Szczyt {new_peak:.1f}%",
-        "preview_clipping": " ⚠️ PRZESTEROWANIE (ponad {over:.1f}%)",
-        "preview_near_clipping": " ⚠️ Blisko przesterowania",
-        "apply_volume_change_btn": "Zastosuj zmianę głośności",
-        "volume_no_change_msg": "Głośność ustawiona na 100% (bez zmian).",
-        "config_required": "Wymagana konfiguracja",
-        "wwise_config_required_msg": "Wwise nie jest skonfigurowany.\n\nSprawdź:\n1. Przejdź do zakładki 'Konwerter' i skonfiguruj ścieżki Wwise\n2. Upewnij się, że projekt Wwise istnieje\n3. Spróbuj najpierw przekonwertować przynajmniej jeden plik w zakładce 'Konwerter'",
-        "status_preparing": "Przygotowywanie...",
-        "status_using_backup": "Używanie kopii zapasowej jako źródła...",
-        "status_backup_created": "Utworzono kopię zapasową i użyto jako źródła...",
-        "status_using_original": "Używanie oryginału jako źródła...",
-        "status_converting_to_wav": "Konwertowanie WEM na WAV...",
-        "status_adjusting_volume": "Dostosowywanie głośności...",
-        "status_preparing_for_wem": "Przygotowywanie do konwersji na WEM...",
-        "status_converting_to_wem": "Konwertowanie na WEM...",
-        "status_deploying_to_mod": "Wdrażanie do MOD_P...",
-        "status_complete": "Zakończono!",
-        "volume_change_success_msg": "Głośność pomyślnie zmieniona na {volume}%\nRzeczywista zmiana: {actual_change:.0f}%\n{clipping_info}\n{source_info}\n{backup_info}",
-        "clipping_info_text": "\nPrzesterowanie: {percent:.2f}% próbek",
-        "backup_available_info": "\n\n💾 Dostępna kopia zapasowa - w razie potrzeby możesz przywrócić poprzednią wersję.",
-        "source_info_backup": "\n📁 Źródło: Kopia zapasowa (zachowanie oryginalnej jakości)",
-        "source_info_mod_backup_created": "\n📁 Źródło: Aktualny mod (utworzono kopię zapasową)",
-        "source_info_original": "\n📁 Źródło: Oryginalny plik",
-        "wem_conversion_failed_msg": "Konwersja na WEM nie powiodła się!\n\nMożliwe rozwiązania:\n1. Sprawdź konfigurację Wwise w zakładce 'Konwerter'\n2. Spróbuj najpierw przekonwertować zwykły plik WAV, aby przetestować konfigurację\n3. Upewnij się, że projekt Wwise ma prawidłowe ustawienia audio\n4. Sprawdź, czy docelowy rozmiar pliku jest osiągalny\n\nBłąd techniczny: {error_message}",
-        "wwise_not_configured_msg": "Wwise nie jest prawidłowo skonfigurowany!\n\nProszę:\n1. Przejdź do zakładki 'Konwerter'\n2. Ustaw prawidłową ścieżkę instalacji Wwise\n3. Ustaw ścieżkę projektu\n4. Spróbuj przekonwertować przynajmniej jeden plik, aby zweryfikować konfigurację\n\nNastępnie spróbuj ponownie dostosować głośność.",
-        "required_file_not_found_msg": "Nie znaleziono wymaganego pliku!\n\n{error_message}\n\nSprawdź, czy:\n- Plik audio istnieje\n- Uprawnienia do pliku są prawidłowe\n- Żaden inny program nie używa pliku",
-        "volume_change_failed_title": "Zmiana głośności nie powiodła się",
-
-        # === EDYTOR GŁOŚNOŚCI (WSADOWY) ===
-        "batch_volume_editor_title": "Wsadowy edytor głośności ({count} plików)",
-        "wwise_configured_auto": "✅ Wwise skonfigurowany automatycznie",
-        "wwise_not_configured_warning": "⚠️ Wwise nie jest skonfigurowany - skonfiguruj w zakładce 'Konwerter'",
-        "backups_stored_in": "Kopie zapasowe są przechowywane w: {path}",
-        "volume_control_all_files_group": "Kontrola głośności (dla wszystkich plików)",
-        "files_to_process_group": "Pliki do przetworzenia",
-        "file_header": "Plik",
-        "language_header": "Język",
-        "current_rms_header": "Aktualne RMS",
-        "current_peak_header": "Aktualny szczyt",
-        "new_preview_header": "Nowy podgląd",
-        "status_header": "Status",
-        "apply_to_all_btn": "Zastosuj do wszystkich plików",
-        "status_skipped_no_analysis": "✗ Pominięto (brak analizy)",
-        "batch_process_complete_title": "Przetwarzanie wsadowe zakończone",
-        "batch_process_complete_msg": "Wsadowa zmiana głośności zakończona!\n\nGłośność zmieniona na: {volume}%\nUdane: {successful}\nNieudane: {failed}",
-        "batch_process_error_title": "Błąd przetwarzania wsadowego",
-
-        # === KONSOLA DEBUGOWANIA ===
-        "debug_console_title": "Konsola debugowania",
-        "auto_scroll_check": "Automatyczne przewijanie",
-        "save_log_btn": "Zapisz log",
-        "save_debug_log_title": "Zapisz log debugowania",
-        "log_files_filter": "Pliki log (*.log)",
-
-        # === PRZECIĄGNIJ I UPUŚĆ AUDIO ===
-        "invalid_file_title": "Nieprawidłowy plik",
-        "audio_only_drop_msg": "Obsługiwane jest tylko przeciąganie plików audio.",
-        "drop_audio_title": "Upuszczanie audio",
-        "drop_on_file_msg": "Proszę upuścić na konkretny plik audio.",
-        "replace_audio_title": "Zamień audio",
-        "replace_audio_confirm_msg": "Zamienić audio dla:\n{shortname}\n\nplikiem:\n{filename}?",
-
-        # === WYSZUKIWANIE ===
-        "search_placeholder": "Szukaj...",
-
-        # === ŁADOWARKA NAPISÓW ===
-        "processing_file_status": "Przetwarzanie {filename}...",
-        "processing_additional_subs_status": "Przetwarzanie dodatkowych napisów...",
-        "loaded_subs_from_files_status": "Załadowano {count} napisów z {processed_files} plików",
-        
-        # === EDYTOR NAPISÓW (GLOBALNY) ===
-        "subtitle_editor_tab_title": "Edytor lokalizacji",
-        "subtitle_editor_header": "Edytor lokalizacji",
-        "subtitle_editor_desc": "Edytuj lokalizację bezpośrednio. Użyj globalnego paska wyszukiwania, aby filtrować.",
-        "without_audio_filter": "Bez audio",
-        "without_audio_filter_tooltip": "Pokaż tylko napisy, które nie mają odpowiadających im plików audio",
-        "modified_only_filter": "Tylko zmodyfikowane",
-        "modified_only_filter_tooltip": "Pokaż tylko zmodyfikowane napisy",
-        "with_audio_only_filter": "Tylko z audio",
-        "with_audio_only_filter_tooltip": "Pokaż tylko napisy, które mają odpowiadające im pliki audio",
-        "refresh_btn": "🔄 Odśwież",
-        "refresh_btn_tooltip": "Odśwież dane napisów z plików",
-        "key_header": "Klucz",
-        "original_header": "Oryginał",
-        "current_header": "Aktualny",
-        "audio_header": "Audio",
-        "edit_selected_btn": "✏ Edytuj zaznaczone",
-        "save_all_changes_btn": "💾 Zapisz wszystkie zmiany",
-        "subtitle_save_success": "Wszystkie zmiany w napisach zostały zapisane!",
-        "go_to_audio_action": "🔊 Przejdź do pliku audio",
-        "audio_not_found_for_key": "Nie można znaleźć pliku audio dla klucza napisu: {key}",
-        "tab_not_found_for_lang": "Nie można znaleźć zakładki dla języka: {lang}",
-
-        # === PROCESOR WEM (STARY) ===
-        "wem_processor_tab_title": "Procesor WEM (Stary)",
-        "process_wem_files_btn": "Przetwórz pliki WEM",
-        "open_target_folder_btn": "Otwórz folder docelowy",
-
-        # === CZYSZCZENIE NAPISÓW ===
-        "no_working_files_found": "Nie znaleziono roboczych plików napisów (_working.locres) w folderze Localization.",
-        "cleanup_complete_msg": "Usunięto {deleted} roboczych plików napisów.",
-        "cleanup_complete_with_errors_msg": "Usunięto {deleted} roboczych plików napisów.\nBłędy: {errors}",
-
-        # === RÓŻNE UI ===
-        "quick_load_settings_group": "Ustawienia szybkiego ładowania",
-        "conversion_method_group": "Metoda konwersji",
-        "bnk_overwrite_radio": "Nadpisanie BNK (Zalecane)",
-        "bnk_overwrite_tooltip": "Konwertuje z maksymalną jakością i nadpisuje rozmiar pliku w pliku .bnk.",
-        "adaptive_size_matching_radio": "Adaptacyjne dopasowanie rozmiaru",
-        "adaptive_size_matching_tooltip": "Dostosowuje jakość audio, aby dopasować rozmiar oryginalnego pliku WEM.",
-        "rescan_orphans_action": "Przeskanuj osierocone pliki",
-        "rescan_orphans_tooltip": "Wymusza ponowne skanowanie folderu Wems w celu znalezienia plików, których nie ma w SoundbanksInfo",
-        "in_progress_msg": "Już w toku. Proszę czekać.",
-        "add_single_file_title": "Wybierz plik audio",
-        "audio_files_filter": "Pliki audio (*.wav *.mp3 *.ogg *.flac *.m4a *.aac *.wma *.opus *.webm);;Wszystkie pliki (*.*)",
-        "file_added_status": "Dodano: {filename}",
-        "file_not_added_status": "Plik nie został dodany: {filename}",
-        "error_adding_file_msg": "Błąd podczas dodawania pliku:\n\n{error}",
-        "update_file_q_title": "Plik już dodany",
-        "update_file_q_msg": "Plik '{filename}' jest już na liście konwersji.\n\nCzy chcesz zaktualizować jego ustawienia?",
-        "update_btn": "Aktualizuj",
-        "skip_btn": "Pomiń",
-        "duplicate_target_q_title": "Zduplikowany docelowy WEM",
-        "duplicate_target_q_msg": "Docelowy WEM '{file_id}.wem' jest już przypisany do:\n\nObecny: {existing_name}\nNowy: {new_name}\n\nCzy chcesz go zastąpić?",
-        "replace_btn": "Zastąp",
-        "replace_all_btn": "Zastąp wszystkie",
-        "skip_all_btn": "Pomiń wszystkie",
-        "tags_group_filter": "--- Tagi ---",
-        "with_tag_filter": "Z tagiem: {tag}",
-        "numeric_id_files_group": "Pliki z numerycznym ID",
-        "voice_group_name": "VO (Głos)",
-        "bnk_size_mismatch_tooltip": "BNK oczekuje {expected_size:,} bajtów, ale plik ma {actual_size:,} bajtów.\nKliknij, aby zaktualizować wpis w BNK.",
-        "bnk_size_missing_wem_tooltip": "Wpis w BNK został zmodyfikowany, ale brakuje pliku WEM.\nKliknij, aby przywrócić wpis w BNK do stanu pierwotnego.",
-        "bnk_size_ok_tooltip": "OK: Rzeczywisty rozmiar pliku zgadza się z wpisem w BNK.",
-        "bnk_size_mismatch_btn": "Niezgodność! Kliknij, aby naprawić",
-        "bnk_size_missing_wem_btn": "Brak WEM! Kliknij, aby przywrócić",
-        "bnk_fix_success_msg": "Rozmiar pliku w BNK został pomyślnie zaktualizowany!",
-        "bnk_fix_not_found_msg": "Nie można znaleźć wpisu dla ID {file_id} w żadnym zmodyfikowanym pliku BNK do naprawy.",
-        "bnk_fix_error_msg": "Wystąpił nieoczekiwany błąd podczas naprawiania pliku BNK:\n{error}",
-        "bnk_revert_success_msg": "Wpis w BNK został pomyślnie przywrócony do stanu pierwotnego.",
-        "bnk_revert_fail_msg": "Nie udało się przywrócić wpisu w BNK. Wpis może być już poprawny.",
-        "bnk_revert_error_msg": "Wystąpił nieoczekiwany błąd podczas przywracania wpisu BNK:\n{error}",
-        "select_folder_for_mods_title": "Wybierz folder do przechowywania modów",
-        "welcome_title": "Witaj!",
-        "first_time_setup_msg": "Wygląda na to, że uruchamiasz edytor po raz pierwszy.\n\nWybierz folder główny, w którym chcesz przechowywać profile modów (np. 'Moje dokumenty\\OutlastTrialsMods').\n\nZostanie tam utworzony profil 'Default'.",
-        "setup_required_title": "Wymagana konfiguracja",
-        "setup_required_msg": "Do kontynuacji wymagany jest folder na mody. Aplikacja zostanie zamknięta.",
-        "setup_complete_title": "Konfiguracja zakończona",
-        "setup_complete_msg": "Twój profil 'Default' został utworzony w:\n{mods_root}",
-        "setup_failed_title": "Błąd konfiguracji",
-        "setup_failed_msg": "Wystąpił błąd: {e}",
-        "legacy_migration_title": "Nowy system profili modów",
-        "legacy_migration_msg": "Ta wersja używa nowego systemu do zarządzania wieloma modami.\n\nTwój istniejący folder 'MOD_P' może zostać przeniesiony do nowego profilu o nazwie 'Default'.\n\nWybierz folder główny, w którym chcesz przechowywać swoje profile modów (np. 'Moje dokumenty\\OutlastTrialsMods').",
-        "migration_complete_title": "Migracja zakończona",
-        "migration_complete_msg": "Twój mod został pomyślnie przeniesiony do profilu 'Default' wewnątrz:\n{mods_root}",
-        "migration_failed_title": "Błąd migracji",
-        "migration_failed_msg": "Wystąpił błąd: {e}",
-        "scan_progress_title": "Skanowanie w poszukiwaniu dodatkowych plików audio",
-        "scan_progress_msg": "Przygotowywanie do skanowania...",
-        "scan_complete_status": "Skanowanie zakończone. Znaleziono i zapisano w pamięci podręcznej {count} dodatkowych plików audio.",
-        "no_new_files_found_status": "Podczas skanowania nie znaleziono nowych plików audio.",
-        "volume_adjust_tooltip_no_selection": "Dostosuj głośność (najpierw wybierz pliki)",
-        "volume_adjust_tooltip_single": "Dostosuj głośność dla: {filename}",
-        "volume_adjust_tooltip_batch": "Wsadowe dostosowywanie głośności dla {count} plików",
-        "easter_egg_title": "Zostałeś przestraszony przez Mooneona!",
-        "easter_egg_loading": "Ładowanie strachu...",
-        "easter_egg_message": "Ostrzegałem cię, że Mooneon cię przestraszy.",
-        "crash_log_saved_msg": "\n\nLog awarii zapisany w: {log_path}",
-        "crash_log_failed_msg": "\n\nNie udało się zapisać logu awarii: {error}",
-        "app_error_title": "Błąd aplikacji",
-        "app_error_msg": "Wystąpił błąd aplikacji, która zostanie zamknięta.",
-        "app_error_info": "Zgłoś ten błąd z poniższymi szczegółami.",
-        "copy_error_btn": "Kopiuj błąd do schowka",
-        "stats_label_text": "Wyświetlanie {filtered_count} z {total_count} plików | Napisy: {subtitle_count}",
-        "shortcut_play_original_action": "Odtwórz oryginalne audio",
-        "shortcut_play_original_desc": "Odtwarza oryginalną wersję wybranego pliku audio.",
-        "shortcut_play_mod_action": "Odtwórz audio moda",
-        "shortcut_play_mod_desc": "Odtwarza zmodyfikowaną wersję wybranego pliku audio.",
-        "shortcut_delete_mod_action": "Usuń audio moda",
-        "shortcut_delete_mod_desc": "Usuwa zmodyfikowane audio dla wybranego pliku (plików).",
-        "volume_toolbar_btn": "🔊 Głośność",
-        "show_scanned_files_check": "Pokaż zeskanowane pliki",
-        "show_scanned_files_tooltip": "Pokaż/ukryj pliki audio znalezione podczas skanowania folderu 'Wems', których nie ma w głównej bazie danych.",
-        "add_file_btn": "Dodaj plik...",
-
-        # === PANEL INFORMACYJNY ===
-        "bnk_size_label": "Rozmiar w BNK:",
-        "in_game_effects_label": "Efekty w grze:",
-        "last_modified_label": "Ostatnia modyfikacja:",
-
-        # === EDYTOR PRZYCINANIA (TRIM) ===
-        "trim_editor_title": "Przycinanie audio - {shortname}",
-        "trim_deps_missing": "Przycinanie nie jest dostępne.\n\nUpewnij się, że zainstalowane są następujące biblioteki:\n'pip install numpy scipy matplotlib'",
-        "trimming_audio_for": "Przycinanie audio dla: {shortname}",
-        "version_mod": " (wersja MOD)",
-        "version_original": " (wersja oryginalna)",
-        "zoom_label": "Powiększenie:",
-        "start_time_label": "Czas rozpoczęcia:",
-        "end_time_label": "Czas zakończenia:",
-        "new_duration_label": "Nowy czas trwania:",
-        "new_duration_format": "{duration_sec:.3f} s ({duration_ms} ms)",
-        "play_pause_btn": "▶️ Odtwarzaj/Pauza",
-        "preview_trim_btn": "🎬 Podgląd przycięcia",
-        "stop_btn": "⏹️ Zatrzymaj",
-        "apply_trim_btn": "Zastosuj przycięcie",
-        "preparing_audio_failed": "Nie udało się przygotować audio: {e}",
-        "trimming_with_ffmpeg": "Przycinanie audio za pomocą FFmpeg...",
-        "trim_success_msg": "Audio pomyślnie przycięte i wdrożone!",
-        "trim_failed_title": "Błąd przycinania",
-        "compiling_step_1": "Sprzątanie technicznego bałaganu...",
-        "compiling_step_2": "Hakowanie plików gry... (Właściwie tylko używamy FModel)",
-        "compiling_step_3": "Organizowanie nowej struktury audio...",
-        "compiling_step_4": "Proszenie Kitty o pomoc...",
-        "compiling_step_5": "Pomaganie Amelii zaplanować nową ucieczkę...",
-        "compiling_step_6": "Mówienie Maddie po raz #97, że cegła to nie jedzenie...",
-        "compiling_step_7": "Wyluzowanie z Neilem, podczas gdy Easterman traci głowę...",
-        "splash_loading_app": "Budzenie Osy...",
-        "splash_init_ui": "Inicjalizacja interfejsu...",
-        "splash_loading_profiles": "Ładowanie profili...",
-        "app_already_running_title": "Aplikacja jest już uruchomiona",
-        "app_already_running_msg": "Edytor Audio Outlast Trials Mercedes jest już uruchomiony.",
-        "project_statistics_title": "Statystyki projektu",
-        "mod_profile_label": "Profil moda:",
-        "general_stats_group": "Statystyki ogólne",
-        "total_audio_files": "Całkowita liczba zmodyfikowanych plików audio:",
-        "total_subtitle_files": "Całkowita liczba zmodyfikowanych plików napisów:",
-        "total_mod_size": "Całkowity rozmiar moda (rozpakowany):",
-        "subtitle_stats_group": "Statystyki napisów",
-        "modified_subtitle_entries": "Zmodyfikowane wpisy w napisach:",
-        "new_subtitle_entries": "Nowe wpisy w napisach:",
-        "total_languages_affected": "Języki, których dotyczy zmiana:",
-        "modified_files_group": "Lista zmodyfikowanych plików",
-        "copy_list_btn": "Kopiuj listę",
-        "list_copied_msg": "Lista zmodyfikowanych plików została skopiowana do schowka!",
-        "no_profile_active_for_stats": "Brak aktywnego profilu. Statystyki są niedostępne.",
-        "calculating_stats": "Obliczanie...",
-        "recalculate_btn": "🔄 Przelicz ponownie",
-        "resource_updater_tab": "Aktualizator zasobów",
-        "updater_header": "Aktualizuj zasoby gry",
-        "updater_description": "Wyodrębnij najnowsze pliki audio (.wem) i lokalizacyjne (.locres) bezpośrednio z archiwów .pak gry. Zapewnia to, że zawsze pracujesz z najbardziej aktualnymi plikami.",
-        "select_pak_file_group": "Wybierz plik .pak gry",
-        "pak_file_path_label": "Ścieżka do pliku .pak:",
-        "pak_file_path_placeholder": "np. C:/.../The Outlast Trials/OPP/Content/Paks/OPP-WindowsClient.pak",
-        "select_resources_group": "Wybierz zasoby do aktualizacji",
-        "update_audio_check": "Aktualizuj pliki audio (Wems)",
-        "update_localization_check": "Aktualizuj pliki lokalizacyjne",
-        "start_update_btn": "Rozpocznij aktualizację",
-        "update_process_group": "Proces aktualizacji",
-        "update_log_ready": "Gotowy do rozpoczęcia procesu aktualizacji.",
-        "update_confirm_title": "Potwierdź aktualizację zasobów",
-        "update_confirm_msg": "Ta operacja zastąpi Twoje obecne lokalne foldery '{resource_folder}' plikami wyodrębnionymi z gry.\n\n- Twoje obecne pliki zostaną usunięte.\n- Tej operacji nie można cofnąć.\n\nCzy na pewno chcesz kontynuować?",
-        "pak_file_not_selected": "Najpierw wybierz prawidłowy plik .pak gry.",
-        "no_resources_selected": "Wybierz co najmniej jeden typ zasobów do aktualizacji (Audio lub Lokalizacja).",
-        "update_process_started": "Rozpoczęto proces aktualizacji...",
-        "unpacking_files_from": "Rozpakowywanie plików z {pak_name}...",
-        "unpacking_path": "Rozpakowywanie '{path_to_unpack}'...",
-        "unpack_failed": "Repak nie zdołał rozpakować plików. Szczegóły poniżej.",
-        "clearing_old_files": "Usuwanie starych plików w '{folder_name}'...",
-        "moving_new_files": "Przenoszenie nowych plików do '{folder_name}'...",
-        "organizing_sfx": "Organizowanie plików SFX...",
-        "update_complete_title": "Aktualizacja zakończona",
-        "update_complete_msg": "Następujące zasoby zostały pomyślnie zaktualizowane:\n\n{updated_resources}\n\nZaleca się ponowne uruchomienie aplikacji, aby zastosować wszystkie zmiany.",
-        "update_failed_title": "Aktualizacja nie powiodła się",
-        "update_failed_msg": "Proces aktualizacji nie powiódł się. Sprawdź log, aby uzyskać szczegółowe informacje.",
-        "restart_recommended": "Zalecane ponowne uruchomienie",
-        "settings_saved_title": "Ustawienia Zapisane",
-        "close_required_message": "Ustawienia języka zostały zmienione.\n\nAplikacja musi zostać zamknięta, aby zmiany w pełni zaczęły obowiązywać.",
-        "close_now_button": "Zamknij teraz",
-        "update_warning_title": "Aktualizacja w toku",
-        "update_warning_msg": "Rozpoczęto proces aktualizacji zasobów.\n\nProszę nie używać ani nie zamykać aplikacji, dopóki nie zostanie ukończony. Może to potrwać kilka minut, w zależności od systemu.",
-        "update_fun_status_1": "Oglądanie wykładu Avellanos dla Eastermana...",
-        "update_fun_status_2": "Próba przecięcia krat pokoju snu...",
-        "update_fun_status_3": "Przygotowanie wahadłowca do kolejnych prób...",
-        "update_fun_status_4": "Szkolenie nowych oszustów do inwazji...",
-        "update_fun_status_5": "Powstrzymywanie głównych aktywów, zanim się zorientują...",
-        "update_fun_status_6": "Ostrzeganie reagentów o najnowszych zmianach...",
-        "update_fun_status_7": "Finalizowanie procesu aktualizacji...",
-        "update_step_unpacking": "Rozpakowywanie plików z archiwum gry...",
-        "update_step_clearing": "Usuwanie starych plików lokalnych...",
-        "update_step_moving": "Przenoszenie nowych plików na miejsce...",
-        "update_step_organizing": "Organizowanie nowych plików...",
-        "update_unpacking_long_wait": "Rozpoczęto proces rozpakowywania. Może to potrwać kilka minut w zależności od systemu...",
-        "update_cancelled_by_user": "Aktualizacja anulowana przez użytkownika",
-        "update_step_finishing": "Kończenie...",
-        "update_in_progress_title": "Aktualizacja w toku",
-        "confirm_exit_during_update_message": "Proces aktualizacji zasobów jest wciąż w toku.\n\nCzy na pewno chcesz wyjść? Spowoduje to anulowanie aktualizacji.",
-        "update_rescanning_orphans": "Aktualizacja zakończona. Ponowne skanowanie folderu Wems w poszukiwaniu zmian...",
-        "initial_setup_title": "Konfiguracja początkowa",
-        "wems_folder_missing_message": "Nie znaleziono folderu 'Wems' z plikami audio gry.\n\nJest on wymagany do poprawnego działania aplikacji.\n\nCzy chcesz przejść do zakładki 'Aktualizator zasobów', aby teraz wypakować je z gry?",
-        "localization_folder_missing_message": "Nie znaleziono folderu 'Localization' z plikami napisów gry.\n\nJest on wymagany do edycji napisów.\n\nCzy chcesz przejść do zakładki 'Aktualizator zasobów', aby teraz wypakować je z gry?",
-        "go_to_updater_button": "Przejdź do aktualizatora",
-        "import_mod_from_pak": "Importuj mod z .pak...",
-        "wems_folder_loose_files_title": "Znaleziono nieprawidłowo umieszczone pliki audio",
-        "wems_folder_loose_files_message": "Znaleziono {count} plików audio (.wem/.bnk) w głównym folderze 'Wems'.",
-        "wems_folder_loose_files_details": "Te pliki zazwyczaj powinny znajdować się w podfolderze 'Wems/SFX'. Przeniesienie ich pomoże w utrzymaniu porządku w projekcie i zapewni ich prawidłowe odnalezienie.\n\nCzy chcesz przenieść je teraz do folderu 'Wems/SFX'?",
-        "move_all_files_btn": "Przenieś wszystkie pliki",
-        "ignore_btn": "Ignoruj",
-        "move_complete_title": "Przenoszenie zakończone",
-        "move_complete_message": "Pomyślnie przeniesiono {count} plików do folderu 'Wems/SFX'.",
-        "move_complete_errors": "Nie udało się przenieść {count} plików:\n{errors}",
-        "soundbanksinfo_missing_title": "Brak pliku bazy danych",
-        "soundbanksinfo_missing_message": "Nie znaleziono podstawowego pliku bazy danych audio (SoundbanksInfo.json).",
-        "soundbanksinfo_missing_details": "Ten plik jest wymagany do identyfikacji większości plików audio. Czy chcesz przejść do zakładki 'Aktualizator zasobów', aby teraz wypakować najnowsze pliki gry?",
-        "go_to_updater_btn": "Przejdź do aktualizatora",
-        "later_btn": "Później",
-        "critical_file_missing_title": "Brak krytycznego pliku",
-        "critical_file_missing_message": "Brak pliku SoundbanksInfo.json, a zakładka 'Aktualizator zasobów' nie została znaleziona.",
-        "move_complete_restart_note": "\n\nZaleca się ponowne uruchomienie aplikacji, aby zmiany w pełni zaczęły obowiązywać.",
-        "outdated_mod_structure_title": "Przestarzała struktura moda",
-        "outdated_mod_structure_msg": "Importowany mod używa starej struktury plików (sprzed aktualizacji).\n\nGra wymaga teraz, aby pliki audio znajdowały się w podfolderze 'Media'.\nCzy chcesz automatycznie zreorganizować pliki do nowego formatu?"
-    },
-    "es-MX": {
-        # === ELEMENTOS PRINCIPALES DE LA INTERFAZ ===
-        "app_title": "Editor de Audio de Outlast Trials de Mercedes",
-        "file_menu": "Archivo",
-        "edit_menu": "Editar",
-        "tools_menu": "Herramientas",
-        "help_menu": "Ayuda",
-        "save_subtitles": "Guardar Subtítulos",
-        "export_subtitles": "Exportar Subtítulos...",
-        "import_subtitles": "Importar Subtítulos...",
-        "import_custom_subtitles": "Importar Subtítulos Personalizados (Beta)...",
-        "exit": "Salir",
-        "revert_to_original": "Revertir a Original",
-        "find_replace": "Buscar y Reemplazar...",
-        "compile_mod": "Compilar Mod",
-        "deploy_and_run": "Desplegar Mod y Ejecutar Juego",
-        "show_debug": "Mostrar Consola de Depuración",
-        "settings": "Configuración...",
-        "about": "Acerca de",
-        
-        # === FILTROS Y ORDENAMIENTO ===
-        "filter": "Filtro:",
-        "sort": "Ordenar:",
-        "all_files": "Todos los Archivos",
-        "with_subtitles": "Con Subtítulos",
-        "without_subtitles": "Sin Subtítulos",
-        "modified": "Modificado",
-        "modded": "Modificado (Audio)",
-        "name_a_z": "Nombre (A-Z)",
-        "name_z_a": "Nombre (Z-A)",
-        "id_asc": "ID ↑",
-        "id_desc": "ID ↓",
-        "recent_first": "Más Recientes Primero",
-        
-        # === PALABRAS BÁSICAS ===
-        "name": "Nombre",
-        "id": "ID",
-        "subtitle": "Subtítulo",
-        "status": "Estado",
-        "mod": "MOD",
-        "path": "Ruta",
-        "source": "Fuente",
-        "original": "Original",
-        "save": "Guardar",
-        "cancel": "Cancelar",
-        "browse": "Examinar...",
-        "confirmation": "Confirmación",
-        "error": "Error",
-        "warning": "Advertencia",
-        "success": "Éxito",
-        "info": "Información",
-        "close": "Cerrar",
-        "ready": "Listo",
-        "waiting": "Esperando...",
-        "done": "Completado",
-        "error_status": "Error",
-        "size_warning": "Advertencia de Tamaño",
-        "loading": "Cargando...",
-        "processing": "Procesando...",
-        "converting": "Convirtiendo...",
-        "complete": "Completo",
-        "stop": "Detener",
-        "clear": "Limpiar",
-        "language": "Idioma",
-        
-        # === DIÁLOGOS Y MENSAJES ===
-        "edit_subtitle": "Editar Subtítulo",
-        "subtitle_preview": "Vista Previa de Subtítulo",
-        "file_info": "Información del Archivo",
-        "select_game_path": "Seleccionar carpeta raíz del juego",
-        "game_path_saved": "Ruta del juego guardada",
-        "mod_deployed": "¡Mod desplegado exitosamente!",
-        "game_launching": "Iniciando juego...",
-        "no_game_path": "Por favor establece la ruta del juego en configuración primero",
-        "no_changes": "Sin Cambios",
-        "no_modified_subtitles": "No hay subtítulos modificados para exportar",
-        "import_error": "Error de Importación",
-        "export_error": "Error de Exportación",
-        "save_error": "Error al Guardar",
-        "file_not_found": "Archivo no encontrado",
-        "conversion_stopped": "Conversión detenida",
-        "deployment_complete": "Despliegue completo",
-        "characters": "Caracteres:",
-        
-        # === CONFLICTOS DE SUBTÍTULOS ===
-        "conflict_detected": "Conflicto de Subtítulos Detectado",
-        "conflict_message": "Las siguientes claves ya tienen subtítulos:\n\n{conflicts}\n\n¿Qué subtítulos te gustaría conservar?",
-        "use_existing": "Mantener Existentes",
-        "use_new": "Usar Nuevos",
-        "merge_all": "Combinar Todos (Mantener Existentes)",
-        
-        # === CONVERTIDOR WAV TO WEM ===
-        "wav_to_wem_converter": "Convertidor de Audio a WEM",
-        "conversion_mode": "Modo de Conversión (Solo Modo de Coincidencia de Tamaño)",
-        "strict_mode": "Modo Estricto",
-        "adaptive_mode": "Modo Adaptativo",
-        "strict_mode_desc": "❌ Falla si es demasiado grande",
-        "adaptive_mode_desc": "✅ Ajusta calidad automáticamente",
-        "path_configuration": "Configuración de Rutas",
-        "wwise_path": "Wwise:",
-        "project_path": "Proyecto:",
-        "wav_path": "Audio:",
-        "files_for_conversion": "Archivos para Conversión",
-        "add_all_wav": "Agregar Todos los Archivos de Audio",
-        "convert": "Convertir",
-        "files_ready": "Archivos listos:",
-        "wav_file": "Archivo de Audio",
-        "target_wem": "WEM Objetivo",
-        "target_size": "Tamaño Objetivo",
-        "files_ready_count": "Archivos listos: {count}",
-        "confirm_clear": "¿Limpiar todos los archivos?",
-        
-        # === CONVERSIÓN Y REGISTROS ===
-        "conversion_complete": "Conversión Completa",
-        "conversion_logs": "Registros de Conversión",
-        "clear_logs": "Limpiar Registros",
-        "save_logs": "Guardar Registros",
-        "logs_cleared": "Registros limpiados...",
-        "logs_saved": "Registros guardados",
-        "error_saving_logs": "Error al guardar registros",
-        "starting_conversion": "Iniciando conversión en modo {mode}...",
-        "file_status": "Archivo {current}/{total}: {name}",
-        "attempting": "intento {attempts} (Conversión={value})",
-        "testing_sample_rate": "Probando {rate}Hz...",
-        "resampled_to": "Remuestreado a {rate}Hz",
-        "results_summary": "✅ ¡Conversión y despliegue completos!\n\nExitosos: {successful}\nErrores: {failed}\nAdvertencias de tamaño: {warnings}\n\nArchivos desplegados a MOD_P\nVer pestaña 'Registros' para resultados detallados",
-        "add_files_warning": "¡Por favor agrega archivos para conversión primero!",
-        
-        # === INSTRUCCIONES ===
-        "converter_instructions": "Convertidor de Audio a WEM:\n1) Establece ruta de Wwise 2) Elige carpeta temporal del proyecto 3) Selecciona carpeta de Audio 4) Agrega archivos 5) Convierte",
-        "converter_instructions2": "Convertidor WEM:\n1) Establece ruta del proyecto Wwise 2) Convierte a mod",
-        
-        # === RUTAS Y MARCADORES DE POSICIÓN ===
-        "wwise_path_placeholder": "Ruta de instalación de Wwise... (Ejemplo: D:/Audiokinetic/Wwise2019.1.6.7110)",
-        "project_path_placeholder": "Ruta de Proyecto Nuevo/Viejo... (Ejemplo: D:/ProyectosEjemplo/MiNuevoProyecto) P.D. Puede estar vacío",
-        "wav_folder_placeholder": "Carpeta de archivos de audio...",
-        
-        # === BÚSQUEDA Y PROCESAMIENTO ===
-        "select_wav_folder": "¡Por favor selecciona la carpeta de Audio primero!",
-        "wems_folder_not_found": "Carpeta Wems no encontrada",
-        "no_wav_files": "¡No se encontraron archivos de Audio en la carpeta!",
-        "search_complete": "Búsqueda completa",
-        "auto_search_result": "Coincidencias encontradas automáticamente: {matched} de {total}",
-        "target_language": "Idioma objetivo para archivos de voz",
-        "no_matches_found": "No se encontraron coincidencias para",
-        
-        # === EXPORTACIÓN DE SUBTÍTULOS ===
-        "cleanup_mod_subtitles": "Limpiar Subtítulos de MOD_P",
-        "export_subtitles_for_game": "Exportar Subtítulos para el Juego",
-        "subtitle_export_ready": "Listo para exportar subtítulos...",
-        "deploying_files": "Desplegando archivos a la estructura del juego...",
-        "deployment_error": "Error de despliegue",
-        "conversion_failed": "Conversión fallida",
-        "all_files_failed": "Todos los archivos fallaron",
-        "see_logs_for_details": "Ver pestaña 'Registros' para detalles",
-        "localization_editor": "Editor de Localización",
-        
-        # === PROCESADOR WEM ===
-        "wem_processor_warning": "⚠️ Procesador WEM (No Recomendado)",
-        "wem_processor_desc": "Herramienta heredada para procesar archivos WEM listos.",
-        "wem_processor_recommendation": "Usa 'Audio a WEM' para principiantes.",
-        
-        # === EXPORTADOR DE LOCALIZACIÓN ===
-        "localization_exporter": "Exportador de Localización",
-        "export_modified_subtitles": "Exportar Subtítulos Modificados",
-        "localization_editor_desc": "Edita localización directamente. Usa la barra de búsqueda global arriba para filtrar resultados.",
-        
-        # === LIMPIEZA DE SUBTÍTULOS ===
-        "cleanup_subtitles_found": "Se encontraron {count} archivos de subtítulos en MOD_P",
-        "select_files_to_delete": "Por favor selecciona archivos para eliminar",
-        "confirm_deletion": "Confirmar Eliminación",
-        "delete_files_warning": "¿Estás seguro de que quieres eliminar {count} archivos de subtítulos?\n\n¡Esta acción no se puede deshacer!",
-        "cleanup_complete": "Limpieza Completa",
-        "cleanup_with_errors": "Limpieza Completa con Errores",
-        "files_deleted_successfully": "Se eliminaron exitosamente {count} archivos de subtítulos de MOD_P",
-        "files_deleted_with_errors": "Se eliminaron {count} archivos exitosamente\n{errors} archivos tuvieron errores\n\nRevisa el registro de estado para detalles",
-        "no_localization_found": "No se Encontraron Archivos",
-        "no_localization_message": "No se encontró carpeta de localización en:\n{path}",
-        "no_subtitle_files": "No se encontraron archivos de subtítulos en:\n{path}",
-        "select_all": "Seleccionar Todo",
-        "select_none": "Deseleccionar Todo",
-        "quick_select": "Selección rápida:",
-        "select_by_language": "Seleccionar por idioma...",
-        "delete_selected": "Eliminar Seleccionados",
-        "no_selection": "Sin Selección",
-        
-        # === INFORMACIÓN DE AUDIO ===
-        "audio_comparison": "Comparación de Audio",
-        "original_audio": "Audio Original",
-        "modified_audio": "Audio Modificado",
-        "duration": "Duración",
-        "size": "Tamaño",
-        "sample_rate": "Tasa de Muestreo",
-        "bitrate": "Tasa de Bits",
-        "channels": "Canales",
-        "audio_markers": "Marcadores de Audio",
-        "original_markers": "Marcadores Originales",
-        "modified_markers": "Marcadores Modificados",
-        "bnk_size_label": "Tamaño BNK",
-        "in_game_effects_label": "Efectos en Juego",
-        "last_modified_label": "Última Modificación",
-        "fix_bnk_size_btn": "🔧 Arreglar Tamaño BNK",
-        
-        # === ACCIONES DE AUDIO ===
-        "play_original": "▶️ Reproducir Original",
-        "play_modified": "▶️ Reproducir Modificado",
-        "replace_audio": "🔄 Reemplazar Audio...",
-        "trim_audio": "✂️ Recortar Audio...",
-        "adjust_volume": "🔊 Ajustar Volumen...",
-        "delete_mod_audio": "🗑️ Eliminar Audio Modificado",
-        "restore_from_backup": "🔄 Restaurar desde Respaldo",
-        
-        # === TOOLTIPS DE AUDIO ===
-        "play_original_tooltip": "Reproducir audio original del juego",
-        "play_modified_tooltip": "Reproducir audio modificado",
-        "replace_audio_tooltip": "Reemplazar con nuevo archivo de audio",
-        "trim_audio_tooltip": "Recortar audio a duración específica",
-        "adjust_volume_tooltip": "Ajustar volumen del audio",
-        "delete_mod_audio_tooltip": "Eliminar audio modificado y revertir a original",
-        "restore_from_backup_tooltip": "Restaurar versión anterior del audio modificado",
-        "trim_original_audio_title": "✂️ Recortar Audio Original...",
-        
-        # === AJUSTE DE VOLUMEN ===
-        "adjust_volume_title": "Ajustar Volumen",
-        "volume_adjustment": "Ajuste de Volumen:",
-        "preview_volume": "Vista Previa",
-        "current_volume": "Volumen Actual:",
-        "new_volume": "Nuevo Volumen:",
-        "volume_db": "{value} dB",
-        "applying_volume": "Aplicando ajuste de volumen...",
-        "volume_applied": "Volumen ajustado exitosamente",
-        "volume_error": "Error al ajustar volumen",
-        
-        # === RECORTE DE AUDIO ===
-        "trim_audio_title": "Recortar Audio",
-        "start_time": "Tiempo de Inicio:",
-        "end_time": "Tiempo Final:",
-        "total_duration": "Duración Total:",
-        "new_duration": "Nueva Duración:",
-        "trim_and_save": "Recortar y Guardar",
-        "invalid_times": "Tiempos de recorte inválidos",
-        "trimming_audio": "Recortando audio...",
-        "trim_successful": "Audio recortado exitosamente",
-        "trim_error": "Error al recortar audio",
-        
-        # === COMPILACIÓN DE MOD ===
-        "compile_mod_title": "Compilar Mod",
-        "compile_mod_message": "¿Compilar mod actual en archivo .pak?",
-        "compiling": "Compilando...",
-        "compile_success": "Mod compilado exitosamente",
-        "compile_error": "Error al compilar mod",
-        
-        # === DESPLIEGUE DE MOD ===
-        "deploy_mod_title": "Desplegar Mod",
-        "deploy_and_run_title": "Desplegar y Ejecutar",
-        "deploying_mod": "Desplegando mod...",
-        "mod_deployed_success": "¡Mod desplegado exitosamente!",
-        "deploy_error": "Error al desplegar mod",
-        
-        # === ACTUALIZADOR DE RECURSOS ===
-        "resource_updater": "Actualizador de Recursos",
-        "update_resources": "Actualizar Recursos del Juego",
-        "select_pak_file": "Seleccionar Archivo .pak del Juego",
-        "extract_audio": "Extraer Audio",
-        "extract_localization": "Extraer Localización",
-        "start_extraction": "Iniciar Extracción",
-        "extraction_complete": "Extracción completa",
-        "extraction_error": "Error de extracción",
-        "updater_description": "Extrae los archivos de audio (.wem) y localización (.locres) más recientes directamente de los archivos .pak del juego. Esto asegura que siempre estés trabajando con los archivos más actualizados.",
-        
-        # === ACTUALIZACIONES DE APLICACIÓN ===
-        "check_updates": "🔄 Buscar Actualizaciones",
-        "update_available": "Actualización Disponible",
-        "update_message": "Una nueva versión está disponible:\nVersión Actual: {current}\nÚltima Versión: {latest}\n\n¿Quieres descargar la actualización?",
-        "no_updates": "Sin Actualizaciones",
-        "up_to_date": "Ya estás usando la versión más reciente.",
-        "update_error": "Error al buscar actualizaciones",
-        "checking_updates": "Buscando actualizaciones...",
-        
-        # === CONFIGURACIÓN ===
-        "settings_title": "Configuración",
-        "general_settings": "General",
-        "paths_settings": "Rutas",
-        "advanced_settings": "Avanzado",
-        "game_path": "Ruta del Juego:",
-        "wwise_path_setting": "Ruta de Wwise:",
-        "auto_save": "Guardado Automático:",
-        "auto_save_interval": "Intervalo de Guardado Automático (minutos):",
-        "interface_language": "Idioma de la Interfaz:",
-        "theme": "Tema:",
-        "dark_theme": "Tema Oscuro",
-        "light_theme": "Tema Claro",
-        
-        # === PERFILES ===
-        "profiles": "Perfiles",
-        "create_profile": "Crear Perfil Nuevo",
-        "delete_profile": "Eliminar Perfil",
-        "rename_profile": "Renombrar Perfil",
-        "profile_name": "Nombre del Perfil:",
-        "active_profile": "Perfil Activo:",
-        "switch_profile": "Cambiar Perfil",
-        "profile_created": "Perfil creado",
-        "profile_deleted": "Perfil eliminado",
-        "profile_renamed": "Perfil renombrado",
-        "profile_error": "Error de perfil",
-        "confirm_delete_profile": "¿Estás seguro de que quieres eliminar este perfil?",
-        
-        # === DEPURACIÓN ===
-        "debug_console": "Consola de Depuración",
-        "debug_log": "Registro de Depuración",
-        "clear_log": "Limpiar Registro",
-        "save_log": "Guardar Registro",
-        "copy_log": "Copiar Registro",
-        
-        # === ACERCA DE ===
-        "about_title": "Acerca de",
-        "version": "Versión",
-        "created_by": "Creado por",
-        "contributors": "Colaboradores",
-        "license": "Licencia",
-        "github": "GitHub",
-        
-        # === MENSAJES DE ERROR COMUNES ===
-        "file_access_error": "Error de acceso al archivo",
-        "permission_denied": "Permiso denegado",
-        "disk_space_error": "Espacio insuficiente en disco",
-        "invalid_file_format": "Formato de archivo inválido",
-        "corrupted_file": "Archivo corrupto",
-        
-        # === MENSAJES DE ESTADO DE SPLASH ===
-        "splash_loading_app": "Despertando a Osa...",
-        "splash_init_ui": "Iniciando interfaz de usuario...",
-        "splash_loading_profiles": "Cargando perfiles...",
-        
-        # === BÚSQUEDA Y REEMPLAZO ===
-        "find_replace_title": "Buscar y Reemplazar",
-        "find_what": "Buscar:",
-        "replace_with": "Reemplazar con:",
-        "match_case": "Coincidir mayúsculas/minúsculas",
-        "find_next": "Buscar Siguiente",
-        "replace": "Reemplazar",
-        "replace_all": "Reemplazar Todo",
-        "search_results": "{count} resultados encontrados",
-        
-        # === MENSAJES DE REBUILD BNK ===
-        "rebuild_bnk_index": "Reconstruir Índice BNK del Mod",
-        "rebuild_bnk_confirm_title": "Confirmar Reconstrucción",
-        "rebuild_bnk_confirm_text": "¿Reconstruir índices BNK del mod basándose en archivos de audio modificados?",
-        "rebuilding_mod_bnk": "Reconstruyendo BNK del Mod...",
-        "rebuild_complete_title": "Reconstrucción Completa",
-        "rebuild_complete_message_details": "¡Reconstrucción completa!\n\nBNKs creados: {created}\nSonidos actualizados: {updated}\nRevertidos: {reverted}",
-        
-        # === HERRAMIENTAS DIVERSAS ===
-        "batch_operations": "Operaciones en Lote",
-        "import_audio_batch": "Importar Múltiples Audios...",
-        "export_audio_batch": "Exportar Múltiples Audios...",
-        "backup_manager": "Administrador de Respaldos",
-        "view_backups": "Ver Respaldos",
-        "restore_backup": "Restaurar Respaldo",
-        "delete_backup": "Eliminar Respaldo",
-        
-        # === ESTADOS DE CONVERSIÓN ===
-        "update_fun_status_1": "Pidiendo pizza de anchoas para la víctima...",
-        "update_fun_status_2": "Usando teléfono regurgitado más reciente para robar ahorros bancarios...",
-        "update_fun_status_3": "Afilando cuchillos con esponja de última víctima...",
-        "update_fun_status_4": "Robando identidades de prisioneros pasados...",
-        "update_fun_status_5": "Suplantando identidad de última víctima y troleando sus contactos...",
-        "update_fun_status_6": "Tragando bocadillo más reciente... (¡Ñam!)",
-        "update_fun_status_7": "Ajustando disfraz de víctima anterior...",
-        
-        # === INFORMACIÓN DETALLADA DE SOUNDBANKSINFO ===
-        "soundbanksinfo_missing_title": "Falta SoundbanksInfo.json",
-        "soundbanksinfo_missing_details": "Este archivo es necesario para identificar la mayoría de los archivos de audio. ¿Te gustaría ir a la pestaña 'Actualizador de Recursos' para extraer los archivos más recientes del juego ahora?",
-        "go_to_updater": "Ir al Actualizador",
-        "continue_anyway": "Continuar de Todas Formas",
-        
-        # === NOMBRES DE PESTAÑAS ===
-        "tab_audio_editor": "Editor de Audio",
-        "tab_subtitle_editor": "Editor de Subtítulos",
-        "tab_wav_converter": "Convertidor Audio → WEM",
-        "tab_wem_processor": "Procesador WEM",
-        "tab_resource_updater": "Actualizador de Recursos",
-        "tab_localization": "Localización",
-        "tab_debug": "Depuración",
-        
-        # === BOTONES Y TOOLTIPS FALTANTES ===
-        "edit_button": "✏ Editar",
-        "export_button": "💾 Exportar",
-        "delete_mod_button": "🗑 Eliminar Audio de MOD",
-        "volume_toolbar_btn": "🔊 Volumen",
-        "delete_mod_button": "🗑️ Eliminar",
-        "expand_all": "Expandir Todo",
-        "collapse_all": "Colapsar Todo",
-        "search_placeholder": "Buscar...",
-        "show_scanned_files_check": "Mostrar archivos escaneados",
-        "stats_label_text": "Estadísticas",
-        
-        # === ADMINISTRADOR DE PERFILES ===
-        "profile_manager_title": "Administrador de Perfiles de Mods",
-        "profile_manager_tooltip": "Abrir el Administrador de Perfiles de Mods",
-        "edit_profile": "Editar Perfil de Mod",
-        "create_profile": "Crear Nuevo Perfil de Mod",
-        "create_new_profile_btn": "➕ Crear Nuevo...",
-        "add_existing_profile_btn": "📁 Agregar Existente...",
-        "import_mod_from_pak": "Importar Mod desde .pak",
-        "remove_from_list_btn": "➖ Quitar de la Lista",
-        "select_a_profile": "Selecciona un perfil",
-        "author_label": "<b>Autor:</b>",
-        "version_label": "<b>Versión:</b>",
-        "no_description": "<i>Sin descripción.</i>",
-        "edit_details_btn": "⚙️ Editar Detalles...",
-        "active_profile_btn": "✓ Activo",
-        "activate_profile_btn": "Activar Perfil",
-        "error_reading_profile": "<i style='color:red;'>No se pudo leer profile.json</i>",
-        "error_author": "<i style='color:red;'>Error</i>",
-        "error_version": "<i style='color:red;'>Error</i>",
-        "profile_name": "Nombre del Perfil:",
-        "author": "Autor:",
-        "icon_png": "Icono (PNG):",
-        "no_icon_selected": "No se seleccionó icono.",
-        "select_icon": "Seleccionar Icono",
-        "png_images": "Imágenes PNG",
-        "validation_error": "Error de Validación",
-        "profile_name_empty": "El Nombre del Perfil no puede estar vacío.",
-        "project_statistics_title": "Estadísticas del Proyecto",
-        
-        # === REBUILD BNK ===
-        "rebuild_bnk_index": "Reconstruir Índice BNK del Mod",
-        "rebuild_bnk_confirm_title": "Reconstruir Índice BNK",
-        "rebuild_bnk_confirm_text": "Esto escaneará todos los archivos de audio modificados (.wem) y actualizará forzosamente los registros de tamaño en los archivos .bnk de tu mod para que coincidan.\n\nEsto es útil para corregir inconsistencias después de agregar, eliminar o editar archivos WEM manualmente.\n\n¿Deseas continuar?",
-        "rebuilding_mod_bnk": "Reconstruyendo Índice BNK del Mod...",
-        "rebuild_complete_title": "Reconstrucción Completa",
-        "rebuild_complete_message": "¡Reconstrucción completa!\n\n✅ Re-creados {created} archivo(s) BNK en tu mod desde originales.\n🔄 Actualizadas {updated} entradas para coincidir con tus archivos WEM.\n⚙️ Aplicadas {reverted} configuraciones personalizadas de 'Efectos en Juego'.",
-        
-        # === EDITOR DE SUBTÍTULOS ===
-        "subtitle_editor_tab_title": "Editor de Localización",
-        "subtitle_editor_header": "Editor de Localización",
-        "subtitle_editor_desc": "Edita localización directamente. Usa la barra de búsqueda global arriba para filtrar resultados.",
-        "without_audio_filter": "Sin audio",
-        "without_audio_filter_tooltip": "Mostrar solo subtítulos que no tienen archivos de audio correspondientes",
-        "modified_only_filter": "Solo modificados",
-        "modified_only_filter_tooltip": "Mostrar solo subtítulos que han sido modificados",
-        "with_audio_only_filter": "Solo con audio",
-        "with_audio_only_filter_tooltip": "Mostrar solo subtítulos que tienen archivos de audio correspondientes",
-        "refresh_btn": "🔄 Actualizar",
-        "refresh_btn_tooltip": "Actualizar datos de subtítulos desde archivos",
-        "key_header": "Clave",
-        "original_header": "Original",
-        "current_header": "Actual",
-        "audio_header": "Audio",
-        "edit_selected_btn": "✏ Editar Seleccionado",
-        "save_all_changes_btn": "💾 Guardar Todos los Cambios",
-        "subtitle_save_success": "¡Todos los cambios de subtítulos han sido guardados!",
-        
-        # === EXPORTACIÓN DE AUDIO ===
-        "export_audio": "Exportar Audio",
-        "which_version_export": "¿Qué versión te gustaría exportar?",
-        "save_as_wav": "Guardar como WAV",
-        "wav_files": "Archivos WAV",
-        "batch_export": "Exportación por Lotes",
-        "select_output_directory": "Seleccionar Directorio de Salida",
-        "exporting_files": "Exportando {count} archivos...",
-        "export_results": "Se exportaron {successful} archivos exitosamente.\nOcurrieron {errors} errores.",
-        "export_complete": "Exportación Completa",
-        
-        # === DIÁLOGOS DE GUARDADO ===
-        "save_changes_question": "¿Guardar Cambios?",
-        "unsaved_changes_message": "Tienes cambios de subtítulos sin guardar. ¿Guardar antes de cerrar?",
-        
-        # === COMPILACIÓN DE MODS ===
-        "mod_not_found_compile": "Archivo de mod no encontrado. ¿Compilarlo primero?",
-        "mod_compilation_failed": "Compilación de mod fallida",
-        "repak_not_found": "¡repak.exe no encontrado!",
-        "compiling_mod": "Compilando Mod",
-        "running_repak": "Ejecutando repak...",
-        "mod_compiled_successfully": "¡Mod compilado exitosamente!",
-        "wemprocces_desc": "Selecciona idioma para renombrar y colocar archivos WEM durante el procesamiento",
-        
-        # === ARRASTRAR Y SOLTAR ===
-        "drop_on_file_msg": "Por favor suelta sobre un archivo de audio específico.",
-        "replace_audio_title": "Reemplazar Audio",
-        "replace_audio_confirm_msg": "¿Reemplazar audio para:\n{shortname}\n\ncon archivo:\n{filename}?",
-        
-        # === PROCESAMIENTO ===
-        "processing_file_status": "Procesando {filename}...",
-        "processing_additional_subs_status": "Procesando subtítulos adicionales...",
-        "loaded_subs_from_files_status": "Se cargaron {count} subtítulos de {processed_files} archivos",
-        
-        # === WEM PROCESSOR ===
-        "wem_process_language": "Idioma de Proceso WEM:",
-        
-        # === MENÚ CONTEXTUAL (Right-click menu) ===
-        "quick_load_audio_title": "🎵 Cargar Audio Personalizado Rápido...",
-        "quick_load_audio_tooltip": "Reemplaza este audio con tu propio archivo (cualquier formato)",
-        "adjust_original_volume_title": "🔊 Ajustar Volumen Original...",
-        "adjust_original_volume_tooltip": "Cambia el volumen del audio original antes de reemplazar",
-        "toggle_ingame_effects_title": "✨ Alternar Efectos en Juego",
-        "toggle_ingame_effects_tooltip": "Habilitar/deshabilitar efectos de audio en el juego para este sonido",
-        "marking_menu_title": "🖍 Marcar",
-        "export_as_wav": "💾 Exportar como WAV",
-        
-        # === ACERCA DE (About Dialog) ===
-        "about_description": "Una herramienta para gestionar archivos de audio WEM y subtítulos del juego para Outlast Trials, diseñada para modders y equipos de localización.",
-        "key_features": "Características Principales",
-        "audio_management": "🎵 <b>Gestión de Audio:</b> Reproduce, convierte y organiza archivos WEM",
-        "subtitle_editing": "📝 <b>Edición de Subtítulos:</b> Edición fácil con resolución de conflictos",
-        "mod_creation": "📦 <b>Creación de Mods:</b> Compilación y despliegue de mods con un clic",
-        "multi_language": "🌍 <b>Multiidioma:</b> Soporte para más de 14 idiomas",
-        "modern_ui": "🎨 <b>Interfaz:</b> Interfaz limpia con temas oscuro/claro",
-        "technology_stack": "Stack Tecnológico",
-        "built_with": "Construido con Python 3 y PyQt5, utilizando:",
-        "unreal_locres_tool": "UnrealLocres - para editar archivos .locres",
-        "vgmstream_tool": "vgmstream - para reproducir audio WEM",
-        "repak_tool": "repak - para empaquetar archivos .pak",
-        "ffmpeg_tool": "FFmpeg - para conversión de audio",
-        "credits_tab": "Créditos",
-        "license_tab": "Licencia",
-        "original_author": "Autor Original",
-        "original_author_desc": "Creado por Bezna",
-        "maintainer": "Mantenedor Actual",
-        "maintainer_desc": "Actualizado y mantenido por Mercedes",
-        "developers_label": "Desarrolladores:",
-        "developers_names": "Bezna y Mercedes",
-        "polish_translator_label": "Probador/Traductor Polaco:",
-        "polish_translator_name": "Alaneg",
-        "spanish_translator_label": "Traductora Española:",
-        "spanish_translator_name": "Mercedes",
-        "special_thanks": "Agradecimientos Especiales",
-        "contributors": "A todos los contribuidores y la comunidad de modding",
-        "credits": "Créditos",
-        "license": "Licencia",
-        "open_source": "Proyecto de Código Abierto",
-        "mit_license": "Licencia MIT - Libre de usar, modificar y distribuir",
-        "development_team": "Equipo de Desarrollo",
-        "lead_developer": "<b>Desarrolladores Principales:</b> Bezna y Mercedes",
-        "vgmstream_thanks": "Equipo de vgmstream - Por las herramientas de conversión de audio",
-        "unreal_locres_thanks": "Desarrolladores de UnrealLocres - Por el soporte de localización",
-        "hypermetric_thanks": "hypermetric - Por el empaquetado de mods",
-        "red_barrels_thanks": "Red Barrels - Por crear Outlast Trials",
-        "open_source_libraries": "Bibliotecas de Código Abierto",
-        "pyqt5_lib": "PyQt5 - Framework de GUI",
-        "python_lib": "Biblioteca Estándar de Python",
-        "software_disclaimer": "Este software se proporciona \"tal cual\" sin garantía de ningún tipo. Úselo bajo su propio riesgo.",
-        "license_agreement": "Acuerdo de Licencia",
-        "copyright_notice": "Copyright (c) 2026 Editor de Audio de Outlast Trials de Mercedes",
-        "mit_license_text": "Por la presente se concede permiso, libre de cargos, a cualquier persona que obtenga una copia de este software y de los archivos de documentación asociados (el \"Software\"), a utilizar el Software sin restricción, incluyendo sin limitación los derechos a usar, copiar, modificar, fusionar, publicar, distribuir, sublicenciar, y/o vender copias del Software, y a permitir a las personas a las que se les proporcione el Software a hacer lo mismo, sujeto a las siguientes condiciones:\n\nEl aviso de copyright anterior y este aviso de permiso se incluirán en todas las copias o partes sustanciales del Software.\n\nEL SOFTWARE SE PROPORCIONA \"COMO ESTÁ\", SIN GARANTÍA DE NINGÚN TIPO, EXPRESA O IMPLÍCITA, INCLUYENDO PERO NO LIMITADO A GARANTÍAS DE COMERCIALIZACIÓN, IDONEIDAD PARA UN PROPÓSITO PARTICULAR E INCUMPLIMIENTO. EN NINGÚN CASO LOS AUTORES O PROPIETARIOS DE DERECHOS DE AUTOR SERÁN RESPONSABLES DE NINGUNA RECLAMACIÓN, DAÑOS U OTRAS RESPONSABILIDADES, YA SEA EN UNA ACCIÓN DE CONTRATO, AGRAVIO O CUALQUIER OTRO MOTIVO, DERIVADAS DE, FUERA DE O EN CONEXIÓN CON EL SOFTWARE O SU USO U OTRO TIPO DE ACCIONES EN EL SOFTWARE.",
-        
-        # === DIÁLOGO DE ACTUALIZACIÓN (Update Dialog) ===
-        "new_version_available": "Nueva Versión Disponible",
-        "current_version": "Versión Actual",
-        "latest_version": "Última Versión",
-        "release_notes": "Notas de la Versión",
-        "download": "Descargar",
-        "skip_version": "Omitir Esta Versión",
-        "remind_later": "Recordar Después",
-        
-        # === AJUSTE DE VOLUMEN (Volume Adjustment) ===
-        "volume_adjustment_title": "Ajustar Volumen de Audio",
-        "volume_adjustment_desc": "Ajusta el volumen del audio antes de guardarlo",
-        "preview": "Vista Previa",
-        "apply": "Aplicar",
-        "volume_change": "Cambio de Volumen:",
-        
-        # === ACTUALIZADOR DE RECURSOS (Resource Updater) ===
-        "resource_updater_tab": "Actualizador de Recursos",
-        "pak_file_path": "Ruta del Archivo .pak:",
-        "browse_pak": "Examinar .pak",
-        "extract_audio_files": "Extraer Archivos de Audio",
-        "extract_localization_files": "Extraer Archivos de Localización",
-        "start_update": "Iniciar Actualización",
-        "cancel_update": "Cancelar",
-        "extracting": "Extrayendo...",
-        "extraction_progress": "Progreso de Extracción:",
-        "select_pak_file": "Seleccionar archivo .pak del juego",
-        "pak_files": "Archivos PAK",
-        "extraction_cancelled": "Extracción cancelada",
-        "extraction_failed": "Extracción fallida",
-        "extraction_success": "¡Extracción exitosa!",
-        "files_extracted": "Archivos extraídos exitosamente",
-        
-        # === PROCESO DE REBUILD (Rebuild Process Messages) ===
-        "scanning_modified_files": "Escaneando archivos modificados...",
-        "found_modified_files": "Se encontraron {count} archivos WEM modificados",
-        "mapping_to_bnk": "Mapeando archivos a BNKs padre...",
-        "updating_bnk_file": "Actualizando {filename}...",
-        "rebuild_progress": "Progreso de Reconstrucción: {percent}%",
-        "checking_size_mismatches": "Verificando discrepancias de tamaño...",
-        "fixing_mismatches": "Corrigiendo discrepancias...",
-        "auto_fixed": "Se corrigieron automáticamente {count} discrepancias de tamaño",
-        
-        # === WEM PROCESSOR (Old Tool) ===
-        "wem_processor_tab": "Procesador WEM",
-        "select_wem_files": "Seleccionar Archivos WEM",
-        "wem_files": "Archivos WEM",
-        "add_wem_files": "Agregar Archivos WEM",
-        "remove_selected": "Quitar Seleccionados",
-        "process_files": "Procesar Archivos",
-        "processing": "Procesando...",
-        "wem_process_complete": "Procesamiento WEM Completo",
-        
-        # === BOTONES COMUNES (Common Buttons) ===
-        "ok": "Aceptar",
-        "yes": "Sí",
-        "no": "No",
-        "apply": "Aplicar",
-        "reset": "Restablecer",
-        "default": "Predeterminado",
-        "advanced": "Avanzado",
-        "basic": "Básico",
-        
-        # === TEMAS (Themes) ===
-        "light": "Claro",
-        "dark": "Oscuro",
-        "theme_changed": "Tema cambiado. Reinicia la aplicación para ver los cambios completos.",
-        
-        # === ETIQUETAS DE INFORMACIÓN ===
-        "information": "Información",
-        "details": "Detalles",
-        "options": "Opciones",
-        "preferences": "Preferencias",
-        "general": "General",
-        "appearance": "Apariencia",
-        
-        # === MENÚ CONTEXTUAL - FALTANTES ===
-        "play_mod": "▶ Reproducir Mod",
-        "restore_from_backup_title": "🔄 Restaurar desde Respaldo",
-        "adjust_mod_volume_title": "🔊 Ajustar Volumen del Mod...",
-        "trim_mod_audio_title": "✂️ Recortar Audio del Mod...",
-        
-        # === ACTUALIZADOR DE RECURSOS - COMPLETO ===
-        "updater_header": "Actualizar Recursos del Juego",
-        "pak_file_path_label": "1. Ruta del archivo .pak:",
-        "select_resources_group": "2. Selecciona Recursos a Actualizar",
-        "update_audio_check": "Actualizar Archivos de Audio (Wems)",
-        "update_localization_check": "Actualizar Archivos de Localización",
-        "start_update_btn": "Iniciar Actualización",
-        "update_process_group": "3. Proceso de Actualización",
-        "update_log_ready": "Listo para iniciar el proceso de actualización.",
-        "unpacking_files_from": "Desempaquetando archivos de {pak_name}...",
-        "update_step_unpacking": "Desempaquetando archivos del archivo del juego...",
-        "extracting_audio": "Extrayendo archivos de audio...",
-        "extracting_localization": "Extrayendo archivos de localización...",
-        "copying_files": "Copiando archivos a carpetas de destino...",
-        "update_audio_success": "Archivos de audio actualizados exitosamente",
-        "update_localization_success": "Archivos de localización actualizados exitosamente",
-        "update_complete_msg": "Actualización completa. Los recursos del juego se han actualizado.",
-        "update_error_msg": "Error durante la actualización: {error}",
-        
-        # === PROCESO DE COMPILACIÓN ===
-        "compiling_mod_pak": "Compilando mod a .pak...",
-        "packing_files": "Empaquetando archivos...",
-        "creating_pak": "Creando archivo .pak...",
-        "mod_pak_created": "Archivo .pak del mod creado exitosamente",
-        "preparing_files": "Preparando archivos para compilación...",
-        "compiling_progress": "Progreso de Compilación: {percent}%",
-        "compression_step": "Comprimiendo archivos...",
-        "finalizing_pak": "Finalizando archivo .pak...",
-        
-        # === ATAJOS DE TECLADO ===
-        "shortcut_play_mod_action": "Reproducir Audio del Mod",
-        "shortcut_play_mod_desc": "Reproduce la versión modificada del archivo de audio seleccionado.",
-        "shortcut_play_original_action": "Reproducir Audio Original",
-        "shortcut_play_original_desc": "Reproduce la versión original del archivo de audio seleccionado.",
-        
-        # === CONFIGURACIÓN - FALTANTES ===
-        "subtitle_language": "Idioma de Subtítulos:",
-        "quick_load_settings_group": "Configuración de Carga Rápida",
-        "quick_load_mode_label": "Elige modo de conversión para Cargar Audio Personalizado Rápido:",
-        "quick_load_strict": "Modo Estricto - Falla si es demasiado grande",
-        "quick_load_adaptive": "Modo Adaptativo - Ajusta calidad automáticamente",
-        "conversion_method_group": "Método de Conversión",
-        "bnk_overwrite_radio": "Sobreescritura BNK (Recomendado)",
-        "bnk_overwrite_tooltip": "Convierte con calidad máxima y sobreescribe el tamaño del archivo en el archivo .bnk.",
-        "adaptive_size_matching_radio": "Coincidencia Adaptativa de Tamaño",
-        "adaptive_size_matching_tooltip": "Ajusta la calidad del audio para coincidir con el tamaño del archivo WEM original.",
-        
-        # === MENSAJES DE COMPILACIÓN DIVERTIDOS ===
-        "compiling_step_1": "Limpiando desorden técnico...",
-        "compiling_step_2": "Hackeando archivos del juego... (En realidad solo usando FModel)",
-        "compiling_step_3": "Organizando nueva estructura de audio...",
-        "compiling_step_4": "Pidiéndole ayuda a Kitty...",
-        "compiling_step_5": "Ayudando a Amelia a planear un nuevo escape...",
-        "compiling_step_6": "Diciéndole a Maddie por #97 vez que un ladrillo no es comida...",
-        "compiling_step_7": "Relajándose con Neil mientras Easterman pierde la cabeza...",
-        
-        # === MENSAJES DE ACTUALIZACIÓN DIVERTIDOS ===
-        "update_fun_status_1": "Viendo a Avellanos darle una lección a Easterman...",
-        "update_fun_status_2": "Intentando cortar los barrotes de la sala de sueño...",
-        "update_fun_status_3": "Preparando la lanzadera para las próximas pruebas...",
-        "update_fun_status_4": "Entrenando nuevos impostores para la invasión...",
-        "update_fun_status_5": "Conteniendo los activos principales antes de que se aviven...",
-        "update_fun_status_6": "Advirtiendo a los reactivos sobre los cambios más recientes...",
-        "update_fun_status_7": "Finalizando proceso de actualización...",
-        
-        # === EASTER EGG ===
-        "easter_egg_title": "¡Fuiste asustado por Mooneon!",
-        "easter_egg_loading": "Cargando susto...",
-        "easter_egg_message": "Te advertí que Mooneon te asustaría.",
-    }
-}
+class TranslationCatalog:
+    """UI strings per language, read from data/translations/<lang>.json on first use.
+
+    Only the tables that are actually asked for are loaded, and each is kept
+    once read. Keys missing from a language fall back to English, then to the
+    key itself.
+    """
+
+    FALLBACK = "en"
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._tables = {}
+        self._lock = threading.Lock()
+
+    def get(self, lang: str) -> dict:
+        """The table for lang, loading it if needed (empty if the file is missing)."""
+        table = self._tables.get(lang)
+        if table is not None:
+            return table
+        with self._lock:
+            if lang not in self._tables:
+                path = os.path.join(self.directory, f"{lang}.json")
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        self._tables[lang] = json.load(f)
+                except (OSError, ValueError) as e:
+                    DEBUG.log(f"Could not load translations for '{lang}' from {path}: {e}", "WARNING")
+                    self._tables[lang] = {}
+            return self._tables[lang]
+
+    def text(self, lang: str, key: str, default: Optional[str] = None) -> str:
+        value = self.get(lang).get(key)
+        if value is None and lang != self.FALLBACK:
+            value = self.get(self.FALLBACK).get(key)
+        if value is None:
+            return key if default is None else default
+        return value
+
+TRANSLATIONS = TranslationCatalog(os.path.join(
+    os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else os.path.dirname(os.path.abspath(__file__)),
+    "data", "translations"))
 
 class ResourceUpdaterThread(QtCore.QThread):
 
@@ -3190,7 +190,8 @@ class ResourceUpdaterThread(QtCore.QThread):
 
     def _cleanup_previous_session(self):
         self.log_update.emit("Preparing workspace...")
-        if PSUTIL_AVAILABLE:
+        psutil = get_psutil()
+        if psutil is not None:
             for proc in psutil.process_iter(['name', 'exe', 'pid']):
                 try:
                     if proc.info['name'].lower() == 'repak.exe' and os.path.normpath(proc.info['exe']) == os.path.normpath(self.parent_app.repak_path):
@@ -3324,9 +325,11 @@ class StatisticsDialog(QtWidgets.QDialog):
         self.audio_files_label = QtWidgets.QLabel(self.tr("calculating_stats"))
         self.subtitle_files_label = QtWidgets.QLabel(self.tr("calculating_stats"))
         self.mod_size_label = QtWidgets.QLabel(self.tr("calculating_stats"))
+        self.audio_duration_label = QtWidgets.QLabel(self.tr("calculating_stats"))
         general_layout.addRow(self.tr("total_audio_files"), self.audio_files_label)
         general_layout.addRow(self.tr("total_subtitle_files"), self.subtitle_files_label)
         general_layout.addRow(self.tr("total_mod_size"), self.mod_size_label)
+        general_layout.addRow(self.tr("total_audio_duration"), self.audio_duration_label)
         self.layout.addWidget(general_group)
         
         subtitle_group = QtWidgets.QGroupBox(self.tr("subtitle_stats_group"))
@@ -3361,6 +364,7 @@ class StatisticsDialog(QtWidgets.QDialog):
             self.audio_files_label.setText(error_msg)
             self.subtitle_files_label.setText(error_msg)
             self.mod_size_label.setText(error_msg)
+            self.audio_duration_label.setText(error_msg)
             self.modified_subs_label.setText(error_msg)
             self.new_subs_label.setText(error_msg)
             self.affected_langs_label.setText(error_msg)
@@ -3373,6 +377,7 @@ class StatisticsDialog(QtWidgets.QDialog):
         audio_files = []
         subtitle_files = []
         total_size = 0
+        total_duration_ms = 0
 
         if os.path.exists(self.parent_app.mod_p_path):
             for root, dirs, files in os.walk(self.parent_app.mod_p_path):
@@ -3383,6 +388,9 @@ class StatisticsDialog(QtWidgets.QDialog):
                     rel_path = os.path.relpath(file_path, self.parent_app.mod_p_path)
                     if file.endswith(".wem"):
                         audio_files.append(rel_path)
+                        info = self.parent_app.wem_catalog.lookup(file_path)
+                        if info:
+                            total_duration_ms += info.get('duration_ms') or 0
                     elif file.endswith(".locres"):
                         subtitle_files.append(rel_path)
         
@@ -3394,6 +402,9 @@ class StatisticsDialog(QtWidgets.QDialog):
         else:
             self.mod_size_label.setText(f"{total_size / 1024:.2f} KB")
 
+        minutes, seconds = divmod(total_duration_ms / 1000.0, 60)
+        self.audio_duration_label.setText(f"{int(minutes):02d}:{seconds:05.2f}")
+
         modified_count = len(self.parent_app.modified_subtitles)
         new_count = sum(1 for key in self.parent_app.modified_subtitles if key not in self.parent_app.original_subtitles)
         self.modified_subs_label.setText(f"{modified_count} ({modified_count - new_count} existing)")
@@ -3564,10 +575,12 @@ class BNKSizeFixer:
 class BNKRebuildErrorHandler:
     """Comprehensive error handler for BNK rebuild operations"""
     
-    def __init__(self, mod_p_path: str, wems_base_path: str, debug_mode: bool = False):
+    def __init__(self, mod_p_path: str, wems_base_path: str, debug_mode: bool = False, mod_audio_index=None):
         self.mod_p_path = mod_p_path
         self.wems_base_path = wems_base_path
         self.debug_mode = debug_mode
+        self.mod_audio_index = mod_audio_index or ModAudioIndex(
+            os.path.join(mod_p_path, "OPP", "Content", "WwiseAudio", "Windows"))
         self.mismatches: List[SizeMismatch] = []
         self.analyzer = WEMAnalyzer()
         self.fixer = BNKSizeFixer(debug_mode=debug_mode)
@@ -3577,35 +590,37 @@ class BNKRebuildErrorHandler:
         mismatches = []
         
         try:
-            all_sounds = bnk_editor.find_all_sounds()
+            table = bnk_editor.sound_table()
+            
+            wem_paths = {}
+            wem_sizes = {}
+            for source_id in set(table.source_id_list()):
+                # The index only locates the file; the size must be current,
+                # since files replaced in place do not change the folder mtime
+                wem_path = self.mod_audio_index.find(source_id)
+                if not wem_path:
+                    continue
+                try:
+                    wem_sizes[source_id] = os.stat(wem_path).st_size
+                except OSError:
+                    continue
+                wem_paths[source_id] = wem_path
             
-            for sound_entry in all_sounds:
+            for index in table.size_mismatches(wem_sizes):
+                sound_entry = table.entry(index)
                 source_id = sound_entry.source_id
-                bnk_expected_size = sound_entry.file_size
-                
-                wem_filename = f"{source_id}.wem"
-                mod_audio_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows")
-                
-                wem_path = None
-                for root, _, files in os.walk(mod_audio_path):
-                    if wem_filename in files:
-                        wem_path = os.path.join(root, wem_filename)
-                        break
-                
-                if wem_path and os.path.exists(wem_path):
-                    wem_actual_size = os.path.getsize(wem_path)
-                    
-                    if wem_actual_size != bnk_expected_size:
-                        mismatch = SizeMismatch(
-                            file_id=str(source_id),
-                            wem_actual_size=wem_actual_size,
-                            bnk_expected_size=bnk_expected_size,
-                            difference=wem_actual_size - bnk_expected_size,
-                            bnk_file=mod_bnk_path,
-                            wem_file=wem_path,
-                            file_name=os.path.basename(wem_path)
-                        )
-                        mismatches.append(mismatch)
+                wem_path = wem_paths[source_id]
+                wem_actual_size = wem_sizes[source_id]
+                mismatch = SizeMismatch(
+                    file_id=str(source_id),
+                    wem_actual_size=wem_actual_size,
+                    bnk_expected_size=sound_entry.file_size,
+                    difference=wem_actual_size - sound_entry.file_size,
+                    bnk_file=mod_bnk_path,
+                    wem_file=wem_path,
+                    file_name=os.path.basename(wem_path)
+                )
+                mismatches.append(mismatch)
         
         except Exception as e:
             if self.debug_mode:
@@ -3654,54 +669,357 @@ class SoundEntry:
     source_id: int
     file_size: int
     override_fx: bool
+
+class SoundTable:
+    """Struct-of-arrays view of a bank's Sound records, ordered by record offset.
+
+    Columns are NumPy arrays when NumPy is available and plain lists otherwise.
+    SoundEntry objects are only created on demand through entry()/entries().
+    """
+
+    def __init__(self, offsets, sound_ids, source_ids, file_sizes, override_fx):
+        self.offsets = offsets
+        self.sound_ids = sound_ids
+        self.source_ids = source_ids
+        self.file_sizes = file_sizes
+        self.override_fx = override_fx
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def entry(self, index: int) -> SoundEntry:
+        return SoundEntry(
+            offset=int(self.offsets[index]),
+            sound_id=int(self.sound_ids[index]),
+            source_id=int(self.source_ids[index]),
+            file_size=int(self.file_sizes[index]),
+            override_fx=bool(self.override_fx[index])
+        )
+
+    def entries(self) -> List[SoundEntry]:
+        return [self.entry(i) for i in range(len(self))]
+
+    def source_id_list(self) -> List[int]:
+        return self.source_ids if isinstance(self.source_ids, list) else self.source_ids.tolist()
+
+    def first_by_source(self) -> dict:
+        """Map source_id -> index of its first (lowest offset) record."""
+        first = {}
+        for index, source_id in enumerate(self.source_id_list()):
+            first.setdefault(source_id, index)
+        return first
+
+    def size_mismatches(self, wem_sizes: dict) -> List[int]:
+        """Indices of records whose source_id is in {source_id: size} with a different size."""
+        if not wem_sizes or not len(self):
+            return []
+        np = get_numpy()
+        if np is None:
+            return [i for i, (source_id, file_size) in enumerate(zip(self.source_ids, self.file_sizes))
+                    if source_id in wem_sizes and wem_sizes[source_id] != file_size]
+
+        ids = np.fromiter(wem_sizes.keys(), dtype=np.int64, count=len(wem_sizes))
+        sizes = np.fromiter(wem_sizes.values(), dtype=np.int64, count=len(wem_sizes))
+        order = np.argsort(ids)
+        ids, sizes = ids[order], sizes[order]
+        positions = np.minimum(np.searchsorted(ids, self.source_ids), len(ids) - 1)
+        found = ids[positions] == self.source_ids
+        differs = sizes[positions] != self.file_sizes
+        return np.nonzero(found & differs)[0].tolist()
+
+class ParsedBankCache:
+    """Thread-safe LRU of parsed bank layouts shared by every BNKEditor.
+
+    Entries are keyed by path and validated against the file's (size, mtime_ns),
+    so a bank rewritten on disk is parsed again on its next open. The least
+    recently used banks are evicted once the estimated size exceeds max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: str, key):
+        """Return the cached {name: value} parts for path if key still matches, else None."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != key:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(path)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, path: str, key, name: str, value, nbytes: int):
+        """Store one parsed part (e.g. the sound map) of the bank at path."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != key:
+                self._drop(path)
+                entry = (key, {}, {})
+                self._entries[path] = entry
+            parts, sizes = entry[1], entry[2]
+            self._bytes += nbytes - sizes.get(name, 0)
+            parts[name] = value
+            sizes[name] = nbytes
+            self._entries.move_to_end(path)
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                self._drop(next(iter(self._entries)))
+
+    def _drop(self, path: str):
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._bytes -= sum(entry[2].values())
+
+    def invalidate(self, path: str):
+        with self._lock:
+            self._drop(path)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+BNK_PARSE_CACHE = ParsedBankCache()
+
 class BNKEditor:
-    def __init__(self, file_path: str):
+    """Reads and patches Wwise SoundBank (.bnk) files.
+
+    The bank is walked chunk by chunk (BKHD/DIDX/DATA/HIRC/...) and every
+    HIRC Sound object is decoded in a single linear pass, producing an exact
+    source_id -> record offset table. Record layout (offsets from the object ID):
+        +0  ulID (sound_id)      +4  ulPluginID     +8  StreamType
+        +9  sourceID             +13 uInMemoryMediaSize
+        +17 uSourceBits          +18 bIsOverrideParentFX
+
+    With use_mmap=True the bank is mapped read-only instead of copied into memory,
+    edits go to a small patch journal and save_file() only writes the touched
+    bytes (copying the bank first when saving to a different path). Close mapped
+    editors (or use them as a context manager) before moving or deleting the file.
+
+    The HIRC sound map and the unpatched sound table are shared through
+    BNK_PARSE_CACHE, so reopening an unchanged bank does not walk HIRC again.
+    """
+
+    HIRC_TYPE_SOUND = 0x02
+    VORBIS_PLUGIN_ID = 0x00040001
+    STREAM_TYPE_DATA = 0x00
+
+    SOURCE_ID_OFFSET = 9
+    FILE_SIZE_OFFSET = 13
+    FX_FLAG_OFFSET = 18
+    RECORD_SIZE = 19
+
+    def __init__(self, file_path: str, use_mmap: bool = False):
         self.file_path = Path(file_path)
         if not self.file_path.exists():
             raise FileNotFoundError(f"File {file_path} not found")
+        self.use_mmap = use_mmap
         self.data = None
+        self._file = None
+        self._patches = {}
+        self.sections = {}
+        self.media_index = {}
         self._sound_map = None
+        self._cache_key = None
         self.load_file()
 
+    def _walk_sections(self):
+        """Index top-level chunks as {tag: (data_offset, data_size)}."""
+        sections = {}
+        data_len = len(self.data)
+        offset = 0
+        while offset + 8 <= data_len:
+            tag = bytes(self.data[offset:offset+4])
+            size = struct.unpack_from('<I', self.data, offset + 4)[0]
+            data_offset = offset + 8
+            if data_offset + size > data_len or not tag.isalpha():
+                DEBUG.log(f"Malformed chunk at 0x{offset:08X} in {self.file_path.name}, stopping section walk", "WARNING")
+                break
+            sections[tag.decode('ascii')] = (data_offset, size)
+            offset = data_offset + size
+        return sections
+
+    def _parse_didx(self):
+        """Parse the DIDX table into {media_id: (absolute_offset, size)} inside DATA."""
+        self.media_index = {}
+        didx = self.sections.get('DIDX')
+        data = self.sections.get('DATA')
+        if not didx or not data:
+            return
+        didx_offset, didx_size = didx
+        data_offset = data[0]
+        for pos in range(didx_offset, didx_offset + didx_size - 11, 12):
+            media_id, media_offset, media_size = struct.unpack_from('<III', self.data, pos)
+            self.media_index[media_id] = (data_offset + media_offset, media_size)
+
+    def media_view(self, media_id: int) -> Optional[memoryview]:
+        """Zero-copy view of an embedded WEM inside DATA, or None.
+
+        Release the view before closing a mapped editor.
+        """
+        location = self.media_index.get(media_id)
+        if location is None:
+            return None
+        offset, size = location
+        if offset + size > len(self.data):
+            DEBUG.log(f"Media {media_id} runs past the end of {self.file_path.name}", "WARNING")
+            return None
+        return memoryview(self.data)[offset:offset + size]
+
+    def export_media(self, media_id: int, output_path: str) -> bool:
+        view = self.media_view(media_id)
+        if view is None:
+            return False
+        try:
+            with open(output_path, 'wb') as f:
+                f.write(view)
+        finally:
+            view.release()
+        return True
+
     def _build_sound_map(self):
 
         if self._sound_map is not None:
             return
 
+        cached = BNK_PARSE_CACHE.get(str(self.file_path), self._cache_key) if self._cache_key else None
+        if cached and "sound_map" in cached:
+            self._sound_map = cached["sound_map"]
+            return
+
+        self._parse_sound_map()
+        if self._cache_key:
+            record_count = sum(len(offsets) for offsets in self._sound_map.values())
+            BNK_PARSE_CACHE.put(str(self.file_path), self._cache_key, "sound_map", self._sound_map,
+                                100 * len(self._sound_map) + 36 * record_count)
+
+    def _parse_sound_map(self):
         DEBUG.log(f"Building sound map for {self.file_path.name}...")
         self._sound_map = {}
 
-        search_pattern = b'\x01\x00\x04\x00\x00'
-        offset = 0
-        while True:
-            try:
-                offset = self.data.index(search_pattern, offset)
-                
-                id_offset = offset + 5
-                if id_offset + 4 <= len(self.data):
-                    source_id = struct.unpack('<I', self.data[id_offset:id_offset+4])[0]
-                    
-                    entry_start_offset = offset - 4 
-                    
-                    if source_id not in self._sound_map:
-                        self._sound_map[source_id] = []
-                    self._sound_map[source_id].append(entry_start_offset)
+        hirc = self.sections.get('HIRC')
+        if hirc is None:
+            DEBUG.log(f"No HIRC section in {self.file_path.name}, falling back to pattern scan", "WARNING")
+            self._build_sound_map_by_pattern()
+            return
+
+        hirc_offset, hirc_size = hirc
+        hirc_end = hirc_offset + hirc_size
+        object_count = struct.unpack_from('<I', self.data, hirc_offset)[0]
+        offset = hirc_offset + 4
+
+        for _ in range(object_count):
+            if offset + 5 > hirc_end:
+                DEBUG.log(f"HIRC in {self.file_path.name} ends early, {object_count} objects declared", "WARNING")
+                break
+            obj_type = self.data[offset]
+            obj_size = struct.unpack_from('<I', self.data, offset + 1)[0]
+            record_offset = offset + 5
+
+            if (obj_type == self.HIRC_TYPE_SOUND and obj_size >= self.RECORD_SIZE
+                    and record_offset + self.RECORD_SIZE <= hirc_end):
+                plugin_id, stream_type, source_id = struct.unpack_from('<IBI', self.data, record_offset + 4)
+                if plugin_id == self.VORBIS_PLUGIN_ID and stream_type == self.STREAM_TYPE_DATA:
+                    self._sound_map.setdefault(source_id, []).append(record_offset)
+
+            offset = record_offset + obj_size
 
-                offset += len(search_pattern)
-            except ValueError:
-                break 
         DEBUG.log(f"Sound map for {self.file_path.name} built. Found {len(self._sound_map)} unique sound IDs.")
 
+    def _build_sound_map_by_pattern(self):
+        """Legacy byte-pattern scan, kept for banks without a readable HIRC chunk."""
+        search_pattern = b'\x01\x00\x04\x00\x00'
+        offset = self.data.find(search_pattern)
+        while offset != -1:
+            id_offset = offset + 5
+            if id_offset + 4 <= len(self.data):
+                source_id = struct.unpack_from('<I', self.data, id_offset)[0]
+                self._sound_map.setdefault(source_id, []).append(offset - 4)
+            offset = self.data.find(search_pattern, offset + len(search_pattern))
+        DEBUG.log(f"Sound map for {self.file_path.name} built by pattern scan. Found {len(self._sound_map)} unique sound IDs.")
+
     def load_file(self):
-        with open(self.file_path, 'rb') as f:
-            self.data = bytearray(f.read())
+        self.close()
+        stat = self.file_path.stat()
+        self._cache_key = (stat.st_size, stat.st_mtime_ns)
+        if self.use_mmap and stat.st_size > 0:
+            self._file = open(self.file_path, 'rb')
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            with open(self.file_path, 'rb') as f:
+                self.data = bytearray(f.read())
+        self._patches = {}
+        self.sections = self._walk_sections()
+        self._parse_didx()
+        self._sound_map = None
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+            self.data = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def _is_mapped(self) -> bool:
+        return isinstance(self.data, mmap.mmap)
+
+    def _read(self, offset: int, length: int) -> bytes:
+        """Read bytes from the bank with pending journal patches applied."""
+        chunk = self.data[offset:offset+length]
+        if not self._patches:
+            return chunk
+        chunk = bytearray(chunk)
+        end = offset + len(chunk)
+        for patch_offset, value in self._patches.items():
+            if patch_offset < end and patch_offset + len(value) > offset:
+                start = max(patch_offset, offset)
+                stop = min(patch_offset + len(value), end)
+                chunk[start-offset:stop-offset] = value[start-patch_offset:stop-patch_offset]
+        return chunk
+
+    def _write(self, offset: int, value: bytes):
+        if self._is_mapped():
+            self._patches[offset] = bytes(value)
+        else:
+            self.data[offset:offset+len(value)] = value
+            # The in-memory copy no longer matches the file on disk
+            self._cache_key = None
 
     def save_file(self, output_path: Optional[str] = None):
         if output_path is None:
             output_path = self.file_path
-            
-        with open(output_path, 'wb') as f:
-            f.write(self.data)
+
+        if not self._is_mapped():
+            with open(output_path, 'wb') as f:
+                f.write(self.data)
+            self._cache_key = None
+            return
+
+        in_place = os.path.abspath(output_path) == os.path.abspath(self.file_path)
+        if not in_place:
+            shutil.copy2(self.file_path, output_path)
+
+        with open(output_path, 'r+b') as f:
+            for offset, value in sorted(self._patches.items()):
+                f.seek(offset)
+                f.write(value)
+
+        if in_place:
+            # The shared mapping now reflects the written bytes
+            self._patches = {}
+            self._cache_key = None
 
     def find_sound_by_source_id(self, source_id: int, expected_size: Optional[int] = None) -> List[SoundEntry]:
         self._build_sound_map() 
@@ -3719,31 +1037,67 @@ class BNKEditor:
         return found_entries
         
     def find_all_sounds(self) -> List[SoundEntry]:
-     
+        return self.sound_table().entries()
+
+    def sound_table(self) -> SoundTable:
+        """Gather every Sound record into a SoundTable in one pass.
+
+        With NumPy and no pending journal patches, the columns are gathered from
+        the bank buffer with fancy indexing instead of unpacking record by record.
+        """
         self._build_sound_map()
-        all_entries = []
-        for source_id, offsets in self._sound_map.items():
-            for offset in offsets:
-                entry = self._parse_sound_entry(offset)
-                if entry:
-                    all_entries.append(entry)
-        return all_entries
+        cacheable = self._cache_key is not None and not self._patches
+        if cacheable:
+            cached = BNK_PARSE_CACHE.get(str(self.file_path), self._cache_key)
+            if cached and "sound_table" in cached:
+                return cached["sound_table"]
+
+        offsets = sorted(offset for offsets in self._sound_map.values() for offset in offsets
+                         if offset + self.RECORD_SIZE <= len(self.data))
+
+        np = get_numpy()
+        if np is not None and not self._patches:
+            record_offsets = np.array(offsets, dtype=np.int64)
+            buffer = np.frombuffer(self.data, dtype=np.uint8)
+            try:
+                def gather_u32(field_offset):
+                    positions = (record_offsets + field_offset)[:, None] + np.arange(4)
+                    return np.ascontiguousarray(buffer[positions]).view('<u4').ravel().astype(np.int64)
+
+                table = SoundTable(
+                    record_offsets,
+                    gather_u32(0),
+                    gather_u32(self.SOURCE_ID_OFFSET),
+                    gather_u32(self.FILE_SIZE_OFFSET),
+                    buffer[record_offsets + self.FX_FLAG_OFFSET] == 0x01
+                )
+            finally:
+                # Release the buffer export so a mapped bank can be closed
+                del buffer
+            if cacheable:
+                nbytes = sum(column.nbytes for column in (table.offsets, table.sound_ids, table.source_ids,
+                                                          table.file_sizes, table.override_fx))
+                BNK_PARSE_CACHE.put(str(self.file_path), self._cache_key, "sound_table", table, nbytes)
+            return table
+
+        entries = [entry for entry in (self._parse_sound_entry(offset) for offset in offsets) if entry]
+        return SoundTable(
+            [entry.offset for entry in entries],
+            [entry.sound_id for entry in entries],
+            [entry.source_id for entry in entries],
+            [entry.file_size for entry in entries],
+            [entry.override_fx for entry in entries]
+        )
 
     def _parse_sound_entry(self, offset: int) -> Optional[SoundEntry]:
         try:
-            if offset + 19 > len(self.data):
+            record = self._read(offset, self.RECORD_SIZE)
+            if len(record) < self.RECORD_SIZE:
                 return None
             
-            sound_id = struct.unpack('<I', self.data[offset:offset+4])[0]
-
-            source_id_offset = offset + 9
-            source_id = struct.unpack('<I', self.data[source_id_offset:source_id_offset+4])[0]
-            
-            file_size_offset = source_id_offset + 4
-            file_size = struct.unpack('<I', self.data[file_size_offset:file_size_offset+4])[0]
-            
-            fx_flag_offset = file_size_offset + 5 
-            override_fx = self.data[fx_flag_offset] == 0x01
+            sound_id = struct.unpack_from('<I', record, 0)[0]
+            source_id, file_size = struct.unpack_from('<II', record, self.SOURCE_ID_OFFSET)
+            override_fx = record[self.FX_FLAG_OFFSET] == 0x01
             
             return SoundEntry(
                 offset=offset,
@@ -3768,9 +1122,9 @@ class BNKEditor:
             # DEBUG.log(f"Modifying entry in BNK at offset 0x{entry.offset:08X} (ID: {entry.source_id}, current size: {entry.file_size})")
 
             if override_fx is not None:
-                fx_flag_offset = entry.offset + 18
+                fx_flag_offset = entry.offset + self.FX_FLAG_OFFSET
                 new_byte = 0x01 if override_fx else 0x00
-                self.data[fx_flag_offset] = new_byte
+                self._write(fx_flag_offset, bytes([new_byte]))
                 # DEBUG.log(f"  Override FX changed to: {override_fx}")
                 modified = True
                 
@@ -3779,12 +1133,1676 @@ class BNKEditor:
                     # DEBUG.log(f"  Size {new_size} is too large", "ERROR")
                     continue
                     
-                file_size_offset = entry.offset + 13
-                struct.pack_into('<I', self.data, file_size_offset, new_size)
+                file_size_offset = entry.offset + self.FILE_SIZE_OFFSET
+                self._write(file_size_offset, struct.pack('<I', new_size))
                 # DEBUG.log(f"  File size changed from {entry.file_size} to: {new_size}")
                 modified = True
                 
         return modified    
+class BnkSourceIndex:
+    """Persistent source_id -> owning bank index for the original banks in Wems.
+
+    Each bank's sound records are stored with the size and mtime_ns the bank had
+    when it was parsed, so a bank is only re-read after it changes on disk.
+    """
+
+    VERSION = 1
+
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        self.banks = {}
+        self._by_source = None
+        self._lock = threading.RLock()
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self.banks = data.get("banks", {})
+                DEBUG.log(f"Loaded BNK index with {len(self.banks)} banks from {self.index_path}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            DEBUG.log(f"Could not load BNK index, it will be rebuilt: {e}", "WARNING")
+            self.banks = {}
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+                temp_path = self.index_path + ".tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({"version": self.VERSION, "banks": self.banks}, f, separators=(',', ':'))
+                os.replace(temp_path, self.index_path)
+                self._dirty = False
+            except Exception as e:
+                DEBUG.log(f"Failed to save BNK index: {e}", "WARNING")
+
+    def _index_bank(self, bnk_path, bnk_type, stat):
+        records = {}
+        with BNKEditor(bnk_path, use_mmap=True) as editor:
+            table = editor.sound_table()
+        for source_id, i in table.first_by_source().items():
+            records[str(source_id)] = [int(table.offsets[i]), int(table.sound_ids[i]),
+                                       int(table.file_sizes[i]), int(table.override_fx[i])]
+        self.banks[bnk_path] = {
+            "type": bnk_type,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "records": records,
+        }
+
+    def refresh(self, bnk_files_info):
+        """Re-index every listed bank whose size or mtime changed since it was indexed."""
+        with self._lock:
+            changed = False
+            for bnk_path, bnk_type in bnk_files_info:
+                try:
+                    stat = os.stat(bnk_path)
+                except OSError:
+                    if self.banks.pop(bnk_path, None) is not None:
+                        changed = True
+                    continue
+
+                cached = self.banks.get(bnk_path)
+                if (cached and cached["size"] == stat.st_size
+                        and cached["mtime_ns"] == stat.st_mtime_ns and cached["type"] == bnk_type):
+                    continue
+
+                try:
+                    self._index_bank(bnk_path, bnk_type, stat)
+                    changed = True
+                except Exception as e:
+                    DEBUG.log(f"Error indexing BNK {bnk_path}: {e}", "WARNING")
+
+            if changed:
+                self._by_source = None
+                self._dirty = True
+                self.save()
+
+    def invalidate(self, bnk_path):
+        with self._lock:
+            if self.banks.pop(bnk_path, None) is not None:
+                self._by_source = None
+                self._dirty = True
+
+    def _build_reverse_map(self):
+        self._by_source = {}
+        for bnk_path, bank in self.banks.items():
+            for key in bank["records"]:
+                self._by_source.setdefault(int(key), []).append(bnk_path)
+
+    def lookup(self, source_id: int, bnk_files_info, refresh: bool = True) -> List[tuple]:
+        """Return [(bnk_path, bnk_type, SoundEntry)] for every listed bank that owns source_id.
+
+        Results keep the order of bnk_files_info, so callers that take the first
+        hit behave like the old per-bank scan. Loops over many IDs call refresh()
+        once up front and pass refresh=False, so each lookup is a dict access.
+        """
+        if refresh:
+            self.refresh(bnk_files_info)
+        with self._lock:
+            if self._by_source is None:
+                self._build_reverse_map()
+            owners = set(self._by_source.get(int(source_id), ()))
+            if not owners:
+                return []
+
+            results = []
+            for bnk_path, bnk_type in bnk_files_info:
+                if bnk_path not in owners:
+                    continue
+                offset, sound_id, file_size, override_fx = self.banks[bnk_path]["records"][str(source_id)]
+                results.append((bnk_path, bnk_type, SoundEntry(
+                    offset=offset,
+                    sound_id=sound_id,
+                    source_id=int(source_id),
+                    file_size=file_size,
+                    override_fx=bool(override_fx)
+                )))
+            return results
+class BnkTransaction:
+    """Collects BNK record edits across many banks and writes each bank once.
+
+    commit() opens every affected bank a single time, applies all of its edits
+    and writes the result to a temp file next to the target. Targets are only
+    swapped in with os.replace after every bank was written, and banks that were
+    already swapped are moved back if a later swap fails.
+
+    With a BnkDeltaStore, targets that are in the delta (or do not exist yet)
+    are edited as overrides instead and the delta is saved once for all of them.
+    """
+
+    def __init__(self, delta_store=None):
+        self.banks = {}
+        self.delta_store = delta_store
+
+    def __len__(self):
+        return sum(len(bank["edits"]) for bank in self.banks.values())
+
+    def add(self, target_bnk_path, source_id, new_size: Optional[int] = None,
+            override_fx: Optional[bool] = None, toggle_fx: bool = False, source_bnk_path=None):
+        """Queue an edit for target_bnk_path.
+
+        If the target does not exist at commit time it is created from
+        source_bnk_path (copy-then-patch). toggle_fx flips the flag found in the bank.
+        """
+        bank = self.banks.setdefault(target_bnk_path, {"source": None, "edits": {}})
+        if source_bnk_path:
+            bank["source"] = source_bnk_path
+
+        edit = bank["edits"].setdefault(int(source_id), {"new_size": None, "override_fx": None, "toggle_fx": False})
+        if new_size is not None:
+            edit["new_size"] = new_size
+        if override_fx is not None:
+            edit["override_fx"] = override_fx
+            edit["toggle_fx"] = False
+        if toggle_fx:
+            edit["toggle_fx"] = not edit["toggle_fx"]
+
+    def _uses_delta(self, target_path) -> bool:
+        if self.delta_store is None:
+            return False
+        return self.delta_store.has_bank(target_path) or not os.path.exists(target_path)
+
+    @staticmethod
+    def _apply_edits(editor, bank):
+        applied = {}
+        for source_id, edit in bank["edits"].items():
+            entries = editor.find_sound_by_source_id(source_id)
+            if not entries:
+                DEBUG.log(f"ID {source_id} not found in {editor.file_path.name}, edit skipped", "WARNING")
+                continue
+
+            override_fx = edit["override_fx"]
+            if edit["toggle_fx"]:
+                current_fx = entries[0].override_fx if override_fx is None else override_fx
+                override_fx = not current_fx
+
+            if editor.modify_sound(source_id, override_fx=override_fx, new_size=edit["new_size"]):
+                applied[source_id] = entries[0]
+        return applied
+
+    def _stage_delta_bank(self, target_path, bank):
+        source_path = None if self.delta_store.has_bank(target_path) else bank["source"]
+        if source_path is None and not self.delta_store.has_bank(target_path):
+            raise FileNotFoundError(f"No BNK to edit for {target_path}")
+
+        with self.delta_store.open(target_path, source_path=source_path) as editor:
+            applied = self._apply_edits(editor, bank)
+            return (str(editor.file_path), editor.overrides()), applied
+
+    def _write_bank(self, target_path, bank):
+        source_path = target_path if os.path.exists(target_path) else bank["source"]
+        if not source_path or not os.path.exists(source_path):
+            raise FileNotFoundError(f"No BNK to edit for {target_path}")
+
+        with BNKEditor(source_path, use_mmap=True) as editor:
+            applied = self._apply_edits(editor, bank)
+
+            if not applied:
+                return None, applied
+
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            temp_path = target_path + ".tmp"
+            editor.save_file(temp_path)
+        return temp_path, applied
+
+    def commit(self):
+        """Apply every queued edit.
+
+        Returns {target_path: {source_id: SoundEntry as it was before the edit}}.
+        On failure no target is left half-written and the exception is re-raised.
+        """
+        results = {}
+        staged = []
+        delta_updates = []
+        try:
+            for target_path, bank in self.banks.items():
+                if self._uses_delta(target_path):
+                    delta_bank, applied = self._stage_delta_bank(target_path, bank)
+                    if applied:
+                        delta_updates.append((target_path, delta_bank))
+                else:
+                    temp_path, applied = self._write_bank(target_path, bank)
+                    if temp_path:
+                        staged.append((target_path, temp_path))
+                results[target_path] = applied
+        except Exception:
+            for target_path, temp_path in staged:
+                self._remove_quietly(temp_path)
+            for target_path in self.banks:
+                self._remove_quietly(target_path + ".tmp")
+            raise
+
+        delta_snapshot = None
+        if delta_updates:
+            delta_snapshot = self.delta_store.snapshot()
+            for target_path, (source_path, overrides) in delta_updates:
+                self.delta_store.set_bank(target_path, source_path, overrides)
+            try:
+                self.delta_store.save()
+            except Exception:
+                self.delta_store.banks = delta_snapshot
+                for _, temp_path in staged:
+                    self._remove_quietly(temp_path)
+                raise
+
+        replaced = []
+        try:
+            for target_path, temp_path in staged:
+                backup_path = None
+                if os.path.exists(target_path):
+                    backup_path = target_path + ".bak"
+                    os.replace(target_path, backup_path)
+                replaced.append((target_path, backup_path))
+                os.replace(temp_path, target_path)
+        except Exception:
+            self._rollback(replaced, staged)
+            if delta_snapshot is not None:
+                self.delta_store.restore(delta_snapshot)
+            raise
+
+        for _, backup_path in replaced:
+            if backup_path:
+                self._remove_quietly(backup_path)
+
+        self.banks = {}
+        return results
+
+    def _rollback(self, replaced, staged):
+        DEBUG.log("BNK transaction failed, rolling back swapped banks", "WARNING")
+        for target_path, backup_path in reversed(replaced):
+            try:
+                if backup_path:
+                    os.replace(backup_path, target_path)
+                elif os.path.exists(target_path):
+                    os.remove(target_path)
+            except OSError as e:
+                DEBUG.log(f"Rollback failed for {target_path}: {e}", "ERROR")
+        for _, temp_path in staged:
+            self._remove_quietly(temp_path)
+
+    def discard(self):
+        self.banks = {}
+
+    @staticmethod
+    def _remove_quietly(path):
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError:
+            pass
+class DeltaBankEditor(BNKEditor):
+    """BNKEditor over an original bank with a profile's delta overrides applied.
+
+    The original is mapped read-only and the overrides live in the patch
+    journal, so reads see the mod state without a copy of the bank existing.
+    save_file() without a path writes the overrides back to the BnkDeltaStore;
+    with a path it materialises a real bank there (copy-then-patch).
+    """
+
+    def __init__(self, delta_store, mod_bnk_path: str, source_path: str, overrides: Optional[dict] = None):
+        super().__init__(source_path, use_mmap=True)
+        self.delta_store = delta_store
+        self.mod_bnk_path = mod_bnk_path
+        self._touched = set()
+        for source_id, (new_size, override_fx) in (overrides or {}).items():
+            self.modify_sound(int(source_id), new_size=new_size, override_fx=override_fx)
+
+    def modify_sound(self, source_id: int, override_fx: Optional[bool] = None,
+                     new_size: Optional[int] = None, find_by_size: Optional[int] = None):
+        modified = super().modify_sound(source_id, override_fx=override_fx, new_size=new_size, find_by_size=find_by_size)
+        if modified:
+            self._touched.add(int(source_id))
+        return modified
+
+    def overrides(self) -> dict:
+        """{str(source_id): [file_size, override_fx]} for records that differ from the original.
+
+        A field that matches the original is stored as None.
+        """
+        self._build_sound_map()
+        result = {}
+        for source_id in sorted(self._touched):
+            for offset in self._sound_map.get(source_id, ()):
+                original = self.data[offset:offset+self.RECORD_SIZE]
+                current = self._read(offset, self.RECORD_SIZE)
+                if current == original:
+                    continue
+                original_size = struct.unpack_from('<I', original, self.FILE_SIZE_OFFSET)[0]
+                current_size = struct.unpack_from('<I', current, self.FILE_SIZE_OFFSET)[0]
+                current_fx = current[self.FX_FLAG_OFFSET] == 0x01
+                result[str(source_id)] = [
+                    current_size if current_size != original_size else None,
+                    current_fx if current[self.FX_FLAG_OFFSET] != original[self.FX_FLAG_OFFSET] else None
+                ]
+                break
+        return result
+
+    def save_file(self, output_path: Optional[str] = None):
+        if output_path is None or os.path.abspath(output_path) == os.path.abspath(self.mod_bnk_path):
+            self.delta_store.set_bank(self.mod_bnk_path, str(self.file_path), self.overrides())
+            self.delta_store.save()
+            return
+        if os.path.abspath(output_path) == os.path.abspath(self.file_path):
+            raise ValueError(f"Refusing to write mod overrides into the original bank {self.file_path}")
+        super().save_file(output_path)
+
+class BnkDeltaStore:
+    """Per-profile mod SoundBanks stored as overrides against the original banks.
+
+    Banks are keyed by their path relative to the mod's WwiseAudio/Windows folder
+    (the layout get_mod_bnk_path produces). Each records its original bank,
+    relative to the Wems folder, and {source_id: [file_size, override_fx]} for
+    the records that differ from it. Real .bnk files are only written when the
+    profile is staged for packing. The file lives next to the profile's _P folder.
+    """
+
+    VERSION = 1
+    FILE_NAME = "bnk_delta.json"
+
+    def __init__(self, profile_path: str, audio_root: str, wems_root: str):
+        self.path = os.path.join(profile_path, self.FILE_NAME)
+        self.audio_root = audio_root
+        self.wems_root = wems_root
+        self.banks = {}
+        self._lock = threading.RLock()
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self.banks = data.get("banks", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            DEBUG.log(f"Could not read BNK delta {self.path}: {e}", "ERROR")
+            self.banks = {}
+
+    def save(self):
+        with self._lock:
+            temp_path = self.path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": self.VERSION, "banks": self.banks}, f, indent=1)
+            os.replace(temp_path, self.path)
+
+    def key(self, mod_bnk_path: str) -> str:
+        return os.path.relpath(mod_bnk_path, self.audio_root).replace(os.sep, '/')
+
+    def has_bank(self, mod_bnk_path: str) -> bool:
+        return self.key(mod_bnk_path) in self.banks
+
+    def source_of(self, mod_bnk_path: str) -> Optional[str]:
+        bank = self.banks.get(self.key(mod_bnk_path))
+        if not bank:
+            return None
+        return os.path.join(self.wems_root, *bank["source"].split('/'))
+
+    def set_bank(self, mod_bnk_path: str, source_path: str, overrides: dict):
+        with self._lock:
+            self.banks[self.key(mod_bnk_path)] = {
+                "source": os.path.relpath(source_path, self.wems_root).replace(os.sep, '/'),
+                "overrides": overrides,
+            }
+
+    def remove_bank(self, mod_bnk_path: str):
+        with self._lock:
+            self.banks.pop(self.key(mod_bnk_path), None)
+
+    def open(self, mod_bnk_path: str, source_path: Optional[str] = None, fresh: bool = False) -> DeltaBankEditor:
+        """Open a mod bank. source_path is required for banks not yet in the delta; fresh ignores stored overrides."""
+        bank = self.banks.get(self.key(mod_bnk_path))
+        source_path = source_path or self.source_of(mod_bnk_path)
+        if not source_path:
+            raise FileNotFoundError(f"No original bank recorded for {mod_bnk_path}")
+        overrides = bank["overrides"] if bank and not fresh else {}
+        return DeltaBankEditor(self, mod_bnk_path, source_path, overrides)
+
+    def entry(self, mod_bnk_path: str, original_entry: SoundEntry) -> SoundEntry:
+        """original_entry with this profile's override for its source applied."""
+        bank = self.banks.get(self.key(mod_bnk_path), {})
+        new_size, override_fx = bank.get("overrides", {}).get(str(original_entry.source_id), (None, None))
+        return SoundEntry(
+            offset=original_entry.offset,
+            sound_id=original_entry.sound_id,
+            source_id=original_entry.source_id,
+            file_size=original_entry.file_size if new_size is None else new_size,
+            override_fx=original_entry.override_fx if override_fx is None else override_fx
+        )
+
+    def capture(self, mod_bnk_path: str, source_path: str):
+        """Convert a full mod bank copy into delta overrides and delete the copy."""
+        with BNKEditor(mod_bnk_path, use_mmap=True) as mod_editor:
+            table = mod_editor.sound_table()
+        with self.open(mod_bnk_path, source_path=source_path, fresh=True) as editor:
+            for source_id, i in table.first_by_source().items():
+                editor.modify_sound(source_id, new_size=int(table.file_sizes[i]), override_fx=bool(table.override_fx[i]))
+            self.set_bank(mod_bnk_path, source_path, editor.overrides())
+        os.remove(mod_bnk_path)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return json.loads(json.dumps(self.banks))
+
+    def restore(self, snapshot: dict):
+        with self._lock:
+            self.banks = snapshot
+            self.save()
+
+    def materialise(self, target_audio_root: str) -> int:
+        """Write every bank in the delta as a real .bnk under target_audio_root."""
+        count = 0
+        for key in list(self.banks):
+            target_path = os.path.join(target_audio_root, *key.split('/'))
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            if os.path.exists(target_path):
+                os.remove(target_path)
+            with self.open(os.path.join(self.audio_root, *key.split('/'))) as editor:
+                editor.save_file(target_path)
+            count += 1
+        return count
+
+    def stage_profile(self, mod_p_path: str, staging_path: str) -> int:
+        """Mirror mod_p_path into staging_path (hard links where possible) and materialise the banks into it."""
+        if os.path.exists(staging_path):
+            shutil.rmtree(staging_path)
+        for root, _, files in os.walk(mod_p_path):
+            target_dir = os.path.join(staging_path, os.path.relpath(root, mod_p_path))
+            os.makedirs(target_dir, exist_ok=True)
+            for file in files:
+                source_file = os.path.join(root, file)
+                target_file = os.path.join(target_dir, file)
+                try:
+                    os.link(source_file, target_file)
+                except OSError:
+                    shutil.copy2(source_file, target_file)
+        target_audio_root = os.path.join(staging_path, os.path.relpath(self.audio_root, mod_p_path))
+        count = self.materialise(target_audio_root)
+        DEBUG.log(f"Staged {mod_p_path} with {count} materialised BNK files")
+        return count
+
+class BnkRebuildManifest:
+    """Per-profile record of the mod WEMs as of the last successful BNK rebuild.
+
+    Each WEM is stored with its path, size, mtime_ns, content hash and owning
+    bank. The file lives next to the profile's _P folder so it is never packed.
+    """
+
+    VERSION = 1
+    FILE_NAME = "bnk_rebuild_manifest.json"
+
+    def __init__(self, profile_path: str):
+        self.path = os.path.join(profile_path, self.FILE_NAME)
+        self.wems = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self.wems = data.get("wems", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            DEBUG.log(f"Could not read rebuild manifest, a full rebuild will be used: {e}", "WARNING")
+            self.wems = {}
+
+    def save(self):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": self.VERSION, "wems": self.wems}, f, separators=(',', ':'))
+        os.replace(temp_path, self.path)
+
+    @staticmethod
+    def hash_file(path: str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def diff(self, current_wems, mod_bank_exists):
+        """Compare {file_id: (path, size, mtime_ns)} against the manifest.
+
+        Returns (changed_ids, removed_ids). A WEM whose mtime changed but whose
+        content hash did not is treated as unchanged. WEMs owned by a bank for
+        which mod_bank_exists(bank, bank_type) is false are reported as changed.
+        """
+        missing_banks = set()
+        for record in self.wems.values():
+            bank = record.get("bank")
+            if bank and bank not in missing_banks:
+                if not mod_bank_exists(bank, record.get("bank_type")):
+                    missing_banks.add(bank)
+
+        changed_ids = []
+        for file_id, (path, size, mtime_ns) in current_wems.items():
+            record = self.wems.get(file_id)
+            if (record is None or record["path"] != path or record["size"] != size
+                    or record.get("bank") in missing_banks):
+                changed_ids.append(file_id)
+            elif record["mtime_ns"] != mtime_ns:
+                if record.get("hash") == self.hash_file(path):
+                    record["mtime_ns"] = mtime_ns
+                else:
+                    changed_ids.append(file_id)
+
+        removed_ids = [file_id for file_id in self.wems if file_id not in current_wems]
+        return changed_ids, removed_ids
+
+    def update(self, current_wems, rebuilt_ids, owners):
+        """Record the post-rebuild state; owners maps file_id -> (bank, bank_type)."""
+        for file_id in list(self.wems):
+            if file_id not in current_wems:
+                del self.wems[file_id]
+
+        for file_id, (path, _, _) in current_wems.items():
+            if file_id not in rebuilt_ids and file_id in self.wems:
+                continue
+            try:
+                stat = os.stat(path)
+                bank, bank_type = owners.get(file_id, (None, None))
+                self.wems[file_id] = {
+                    "path": path,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "hash": self.hash_file(path),
+                    "bank": bank,
+                    "bank_type": bank_type,
+                }
+            except OSError as e:
+                DEBUG.log(f"Could not record {path} in rebuild manifest: {e}", "WARNING")
+                self.wems.pop(file_id, None)
+        self.save()
+
+def verify_bnk_shard(shard):
+    """Process-pool worker for mod integrity verification.
+
+    shard is [(mod_bnk_path, [source_id, ...])]. Each bank is parsed once and the
+    recorded sizes of the requested sources are returned as
+    {mod_bnk_path: {source_id: file_size}}.
+    """
+    results = {}
+    for mod_bnk_path, source_ids in shard:
+        wanted = set(source_ids)
+        sizes = {}
+        try:
+            with BNKEditor(mod_bnk_path, use_mmap=True) as editor:
+                table = editor.sound_table()
+            for source_id, i in table.first_by_source().items():
+                if source_id in wanted:
+                    sizes[source_id] = int(table.file_sizes[i])
+        except Exception as e:
+            DEBUG.log(f"Could not verify {os.path.basename(mod_bnk_path)}: {e}", "WARNING")
+        results[mod_bnk_path] = sizes
+    return results
+
+class ModAudioIndex:
+    """source_id -> location index of the WEM files under a profile's MOD_P audio root.
+
+    Built with a single os.scandir pass that records every file's size and
+    mtime_ns plus each directory's mtime_ns. Lookups re-check the directory
+    mtimes at most every VALIDATE_INTERVAL seconds, so files added, moved or
+    deleted outside the app trigger a rescan; in-app writes that replace a file
+    in place are reported through note_written()/note_removed().
+    """
+
+    VALIDATE_INTERVAL = 2.0
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root
+        self._lock = threading.RLock()
+        self._by_id = None
+        self._files = {}
+        self._dir_mtimes = {}
+        self._validated_at = 0.0
+
+    def set_root(self, root: Optional[str]):
+        with self._lock:
+            if root != self.root:
+                self.root = root
+                self.invalidate()
+
+    def invalidate(self):
+        with self._lock:
+            self._by_id = None
+
+    def _scan(self):
+        by_id = {}
+        files = {}
+        dir_mtimes = {}
+        if self.root:
+            stack = [self.root]
+            while stack:
+                directory = stack.pop()
+                try:
+                    dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+                    with os.scandir(directory) as it:
+                        for item in it:
+                            if item.is_dir(follow_symlinks=False):
+                                stack.append(item.path)
+                            elif item.name.lower().endswith('.wem'):
+                                stat = item.stat()
+                                files[item.path] = (stat.st_size, stat.st_mtime_ns)
+                                by_id.setdefault(os.path.splitext(item.name)[0], []).append(item.path)
+                except OSError:
+                    dir_mtimes.setdefault(directory, None)
+
+        self._by_id = by_id
+        self._files = files
+        self._dir_mtimes = dir_mtimes
+        self._validated_at = time.monotonic()
+        DEBUG.log(f"Mod audio index built: {len(files)} WEM files in {len(dir_mtimes)} folders")
+
+    def _is_current(self) -> bool:
+        for directory, mtime_ns in self._dir_mtimes.items():
+            try:
+                current = os.stat(directory).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime_ns:
+                return False
+        return True
+
+    def _ensure(self):
+        if self._by_id is None:
+            self._scan()
+        elif time.monotonic() - self._validated_at >= self.VALIDATE_INTERVAL:
+            if self._is_current():
+                self._validated_at = time.monotonic()
+            else:
+                self._scan()
+
+    def paths(self, file_id) -> List[str]:
+        with self._lock:
+            self._ensure()
+            return list(self._by_id.get(str(file_id), ()))
+
+    def find(self, file_id) -> Optional[str]:
+        """Best location for file_id, preferring the Media folders over legacy ones."""
+        paths = self.paths(file_id)
+        if not paths:
+            return None
+        return min(paths, key=lambda path: (not os.path.relpath(path, self.root).startswith("Media"), path.count(os.sep)))
+
+    def contains(self, path: str) -> bool:
+        with self._lock:
+            self._ensure()
+            return path in self._files
+
+    def stat(self, path: str):
+        """(size, mtime_ns) recorded for path, or None."""
+        with self._lock:
+            self._ensure()
+            return self._files.get(path)
+
+    def _owns(self, path: str) -> bool:
+        if not self.root:
+            return False
+        try:
+            return os.path.commonpath([os.path.abspath(path), os.path.abspath(self.root)]) == os.path.abspath(self.root)
+        except ValueError:
+            return False
+
+    def note_written(self, path: str):
+        with self._lock:
+            if self._by_id is None or not self._owns(path):
+                return
+            try:
+                stat = os.stat(path)
+            except OSError:
+                self.note_removed(path)
+                return
+            if path not in self._files:
+                self._by_id.setdefault(os.path.splitext(os.path.basename(path))[0], []).append(path)
+            self._files[path] = (stat.st_size, stat.st_mtime_ns)
+            directory = os.path.dirname(path)
+            if directory not in self._dir_mtimes:
+                # New folder: let the next validation rescan so its parents are tracked too
+                self._validated_at = 0.0
+            else:
+                self._note_dir_changed(directory)
+
+    def note_removed(self, path: str):
+        with self._lock:
+            if self._by_id is None or path not in self._files:
+                return
+            del self._files[path]
+            file_id = os.path.splitext(os.path.basename(path))[0]
+            paths = self._by_id.get(file_id, [])
+            if path in paths:
+                paths.remove(path)
+            if not paths:
+                self._by_id.pop(file_id, None)
+            self._note_dir_changed(os.path.dirname(path))
+
+    def _note_dir_changed(self, directory: str):
+        """Record a folder's new mtime after an in-app write or delete.
+
+        The mtime is only taken over when the folder's listing still matches
+        the index; anything else changed there outside the app forces a rescan.
+        """
+        try:
+            current = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._validated_at = 0.0
+            return
+        if current == self._dir_mtimes.get(directory):
+            return
+        try:
+            with os.scandir(directory) as it:
+                subdirs = set()
+                wems = set()
+                for item in it:
+                    if item.is_dir(follow_symlinks=False):
+                        subdirs.add(item.path)
+                    elif item.name.lower().endswith('.wem'):
+                        wems.add(item.path)
+        except OSError:
+            self._validated_at = 0.0
+            return
+        indexed = {path for path in self._files if os.path.dirname(path) == directory}
+        if wems == indexed and subdirs <= self._dir_mtimes.keys():
+            self._dir_mtimes[directory] = current
+        else:
+            self._validated_at = 0.0
+
+class EmbeddedMediaIndex:
+    """media_id -> (bnk_path, size) for WEMs stored inside the original banks' DATA chunks.
+
+    Only the section headers and DIDX tables are read (through mmap), so the
+    index is cheap to build; the media itself is reached later through
+    BNKEditor.media_view() without extracting the bank.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root
+        self._lock = threading.Lock()
+        self._by_id = None
+
+    def set_root(self, root: Optional[str]):
+        with self._lock:
+            if root != self.root:
+                self.root = root
+                self._by_id = None
+
+    def invalidate(self):
+        with self._lock:
+            self._by_id = None
+
+    def _scan(self):
+        by_id = {}
+        if self.root and os.path.isdir(self.root):
+            for directory, _, files in os.walk(self.root):
+                for name in files:
+                    if not name.lower().endswith('.bnk'):
+                        continue
+                    bnk_path = os.path.join(directory, name)
+                    try:
+                        with BNKEditor(bnk_path, use_mmap=True) as editor:
+                            for media_id, (_, size) in editor.media_index.items():
+                                by_id.setdefault(str(media_id), (bnk_path, size))
+                    except Exception as e:
+                        DEBUG.log(f"Skipping media table of {name}: {e}", "WARNING")
+        self._by_id = by_id
+        DEBUG.log(f"Embedded media index built: {len(by_id)} WEMs inside banks")
+
+    def lookup(self, media_id):
+        """(bnk_path, size) of the bank holding media_id, or None."""
+        with self._lock:
+            if self._by_id is None:
+                self._scan()
+            return self._by_id.get(str(media_id))
+
+    def export(self, media_id, output_path: str) -> bool:
+        """Write one embedded WEM to output_path straight from the mapped bank."""
+        location = self.lookup(media_id)
+        if location is None:
+            return False
+        with BNKEditor(location[0], use_mmap=True) as editor:
+            return editor.export_media(int(media_id), output_path)
+
+class AudioEntry(MutableMapping):
+    """One audio line of a language tab, stored as a slotted record.
+
+    The SoundbanksInfo fields (Id, Language, ShortName, Path, Source) are
+    slots. Any other keys live in a small dict that is only created when
+    needed. The integer id, the subtitle key (ShortName without extension)
+    and the source kind are worked out once, when the record is created or
+    the field they come from is set. Dict-style access (entry.get("Id"),
+    entry["ShortName"], "Path" in entry) keeps working; a field that was
+    never set reads as a missing key.
+    """
+
+    __slots__ = ('Id', 'Language', 'ShortName', 'Path', 'Source', 'id_int', 'key', 'source_kind', '_extra')
+
+    FIELDS = ('Id', 'Language', 'ShortName', 'Path', 'Source')
+    SOURCE_OTHER, SOURCE_STREAMED, SOURCE_LOOSE, SOURCE_BANK, SOURCE_SCANNED = range(5)
+    _SOURCE_KINDS = {
+        "StreamedFiles": SOURCE_STREAMED,
+        "MediaFilesNotInAnyBank": SOURCE_LOOSE,
+        "ScannedFromFileSystem": SOURCE_SCANNED,
+    }
+
+    def __init__(self, fields=None):
+        self._extra = None
+        self.id_int = 0
+        self.key = ""
+        self.source_kind = self.SOURCE_OTHER
+        if fields:
+            for name, value in fields.items():
+                self[name] = value
+
+    def __getitem__(self, name):
+        if name in self.FIELDS:
+            try:
+                return getattr(self, name)
+            except AttributeError:
+                raise KeyError(name) from None
+        if self._extra is None:
+            raise KeyError(name)
+        return self._extra[name]
+
+    def __setitem__(self, name, value):
+        if name not in self.FIELDS:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[name] = value
+            return
+        if isinstance(value, str) and name in ('Language', 'Source'):
+            # A few dozen distinct values shared by every entry
+            value = sys.intern(value)
+        setattr(self, name, value)
+        if name == 'Id':
+            try:
+                self.id_int = int(value)
+            except (TypeError, ValueError):
+                self.id_int = 0
+        elif name == 'ShortName':
+            self.key = os.path.splitext(value or "")[0]
+        elif name == 'Source':
+            source = value or ""
+            self.source_kind = self.SOURCE_BANK if source.startswith("Bank: ") else \
+                self._SOURCE_KINDS.get(source, self.SOURCE_OTHER)
+
+    def __delitem__(self, name):
+        if name in self.FIELDS:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                raise KeyError(name) from None
+        elif self._extra is None:
+            raise KeyError(name)
+        else:
+            del self._extra[name]
+
+    def __iter__(self):
+        for name in self.FIELDS:
+            if hasattr(self, name):
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"AudioEntry({dict(self)!r})"
+
+    def copy(self) -> "AudioEntry":
+        return AudioEntry(self)
+
+class SearchIndex:
+    """Lower-cased search text for the global search box.
+
+    Audio lines are matched on "Id ShortName subtitle" and subtitle keys on
+    key, original and current text, the same strings the per-row checks
+    used to build. Each scope (a language tab, the subtitle editor) keeps
+    its texts in a list built on first search and rebuilt only when its
+    source list or dict is replaced or changes size; invalidate() marks a
+    key whose subtitle was edited so just its rows are rebuilt. When a
+    query extends the previous one for a scope, only the previous matches
+    are tested again. Searches may run on worker threads.
+    """
+
+    def __init__(self, wem_app):
+        self.wem_app = wem_app
+        self._lock = threading.Lock()
+        self._scopes = {}
+
+    def clear(self):
+        with self._lock:
+            self._scopes.clear()
+
+    def invalidate(self, key):
+        """Rebuild the text of a subtitle key on the next search."""
+        with self._lock:
+            for state in self._scopes.values():
+                state["dirty"].add(key)
+
+    def search_entries(self, scope, entries, query):
+        """Return the entries, in order, whose search text contains query."""
+        subtitles = self.wem_app.subtitles
+
+        def text_for(entry):
+            return f"{entry.get('Id', '')} {entry.get('ShortName', '')} {subtitles.get(entry.key, '')}".lower()
+
+        return self._search(("audio", scope), entries, query, lambda entry: entry.key, text_for)
+
+    def search_subtitles(self, query):
+        """Return the set of subtitle keys whose search text contains query."""
+        subtitles = self.wem_app.subtitles
+        original_subtitles = self.wem_app.original_subtitles
+
+        def text_for(key):
+            return f"{key}\n{original_subtitles.get(key, '')}\n{subtitles.get(key, '')}".lower()
+
+        return set(self._search("subtitles", subtitles, query, lambda key: key, text_for))
+
+    def _search(self, scope, source, query, key_of, text_for):
+        with self._lock:
+            return self._search_locked(scope, source, query, key_of, text_for)
+
+    def _search_locked(self, scope, source, query, key_of, text_for):
+        state = self._scopes.get(scope)
+        if state is None or state["source"] is not source or state["size"] != len(source):
+            items = list(source)
+            positions = {}
+            for i, item in enumerate(items):
+                positions.setdefault(key_of(item), []).append(i)
+            state = self._scopes[scope] = {
+                "source": source,
+                "size": len(source),
+                "items": items,
+                "texts": [text_for(item) for item in items],
+                "positions": positions,
+                "dirty": set(),
+                "query": None,
+                "matches": None,
+            }
+
+        items = state["items"]
+        texts = state["texts"]
+        narrow = state["query"] is not None and state["query"] in query
+        if state["dirty"]:
+            # An edited row may now match a query it failed before
+            narrow = False
+            for key in state["dirty"]:
+                for i in state["positions"].get(key, ()):
+                    texts[i] = text_for(items[i])
+            state["dirty"].clear()
+
+        candidates = state["matches"] if narrow else range(len(texts))
+        matches = [i for i in candidates if query in texts[i]]
+        state["query"] = query
+        state["matches"] = matches
+        return [items[i] for i in matches]
+
+class SoundbanksCatalog:
+    """Normalised file list from SoundbanksInfo.json/.xml, cached on the source's size and mtime.
+
+    The parsed list is kept in memory and pickled next to the other data
+    caches, so SoundbanksInfo is only parsed again after it changes on disk.
+    XML sources are read with iterparse instead of building the whole tree.
+    load() returns AudioEntry records that are shared between callers, so they
+    are treated as read-only; the pickle holds plain dicts.
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+        self._key = None
+        self._entries = None
+
+    @staticmethod
+    def _clean_path(raw_path) -> str:
+        return (raw_path or "").replace("Media/", "").replace("Media\\", "")
+
+    def _parse_json(self, path: str) -> List[dict]:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        soundbanks_info = data.get("SoundBanksInfo") or data.get("SoundbanksInfo") or data
+        if not soundbanks_info:
+            DEBUG.log("ERROR: Could not find SoundBanksInfo block.", "ERROR")
+            return []
+
+        all_files = []
+        for section in ("StreamedFiles", "MediaFilesNotInAnyBank"):
+            for file_entry in soundbanks_info.get(section, []):
+                file_entry["Source"] = section
+                if "Path" in file_entry:
+                    file_entry["Path"] = self._clean_path(file_entry["Path"])
+                all_files.append(file_entry)
+        loose_count = len(all_files)
+
+        for sb in soundbanks_info.get("SoundBanks", []):
+            bnk_name = sb.get("ShortName", "UnknownBank")
+            for media_entry in sb.get("Media", []):
+                if media_entry.get("Id"):
+                    if "Path" in media_entry:
+                        media_entry["Path"] = self._clean_path(media_entry["Path"])
+                    media_entry["Source"] = f"Bank: {bnk_name}"
+                    all_files.append(media_entry)
+
+        DEBUG.log(f"Loaded {loose_count} streamed/loose files and {len(all_files) - loose_count} "
+                  f"files from SoundBanks Media.")
+        return all_files
+
+    def _parse_xml(self, path: str) -> List[dict]:
+        sections = {"StreamedFiles": [], "MediaFilesNotInAnyBank": []}
+        bank_files = []
+        current_bank = []
+        bnk_name = "Unknown"
+        stack = []
+        for event, elem in ET.iterparse(path, events=("start", "end")):
+            if event == "start":
+                stack.append(elem.tag)
+                continue
+            stack.pop()
+            if elem.tag == "File":
+                file_entry = {
+                    "Id": elem.get("Id"),
+                    "Language": elem.get("Language"),
+                    "ShortName": elem.findtext("ShortName", ""),
+                    "Path": self._clean_path(elem.findtext("Path")),
+                }
+                if len(stack) == 2 and stack[1] in sections:
+                    file_entry["Source"] = stack[1]
+                    sections[stack[1]].append(file_entry)
+                elif stack[-2:] == ["SoundBank", "Media"]:
+                    current_bank.append(file_entry)
+                elem.clear()
+            elif elem.tag == "ShortName" and stack and stack[-1] == "SoundBank":
+                bnk_name = elem.text or "Unknown"
+            elif elem.tag == "SoundBank":
+                # ShortName is not guaranteed to come before Media
+                for file_entry in current_bank:
+                    file_entry["Source"] = f"Bank: {bnk_name}"
+                bank_files.extend(current_bank)
+                current_bank = []
+                bnk_name = "Unknown"
+                elem.clear()
+        return sections["StreamedFiles"] + sections["MediaFilesNotInAnyBank"] + bank_files
+
+    def _parse(self, path: str) -> List[dict]:
+        ext = os.path.splitext(path)[1].lower()
+        if ext == '.json':
+            all_files = self._parse_json(path)
+        elif ext == '.xml':
+            all_files = self._parse_xml(path)
+        else:
+            raise ValueError(f"Unsupported file format: {ext}")
+
+        unique_files = {}
+        for f in all_files:
+            fid = f.get("Id")
+            if fid and fid not in unique_files:
+                unique_files[fid] = f
+        return list(unique_files.values())
+
+    def _read_cache(self, key):
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = pickle.load(f)
+            if data.get("version") == self.VERSION and data.get("key") == key:
+                return data["entries"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            DEBUG.log(f"Could not read SoundbanksInfo cache, it will be rebuilt: {e}", "WARNING")
+        return None
+
+    def _write_cache(self, key, entries):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            temp_path = self.cache_path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                pickle.dump({"version": self.VERSION, "key": key, "entries": entries}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.cache_path)
+        except Exception as e:
+            DEBUG.log(f"Failed to save SoundbanksInfo cache: {e}", "WARNING")
+
+    def load(self, path: str) -> List[dict]:
+        """Unique entries of the SoundbanksInfo file at path (empty if it is missing or unreadable)."""
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError):
+            DEBUG.log("SoundbanksInfo file not found.", "WARNING")
+            return []
+        key = (os.path.normcase(os.path.abspath(path)), stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            if self._key != key:
+                entries = self._read_cache(key)
+                if entries is None:
+                    try:
+                        entries = self._parse(path)
+                    except Exception as e:
+                        DEBUG.log(f"Error loading soundbank: {e}", "ERROR")
+                        DEBUG.log(traceback.format_exc(), "ERROR")
+                        return []
+                    self._write_cache(key, entries)
+                    DEBUG.log(f"Total unique files loaded from SoundbanksInfo: {len(entries)}")
+                self._key, self._entries = key, [AudioEntry(entry) for entry in entries]
+            entries = self._entries
+        return list(entries)
+
+class WemCatalog:
+    """Persistent SQLite catalogue of WEM metadata keyed by (path, size, mtime_ns).
+
+    Rows keep what the probe reports for a file (sample rate, channels,
+    samples, duration, bitrate, codec and markers), so an unchanged WEM is
+    answered by a primary-key lookup instead of being parsed again. refresh()
+    brings whole folders up to date incrementally and is meant for a
+    background thread. Loudness analyses from the volume dialogs are stored in
+    a second table under the same key.
+    """
+
+    SCHEMA_VERSION = 1
+    COLUMNS = ('sample_rate', 'channels', 'samples', 'duration_ms', 'bitrate', 'format')
+
+    def __init__(self, db_path: str, probe):
+        self.db_path = db_path
+        self.probe = probe
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS wem_meta")
+                conn.execute("DROP TABLE IF EXISTS wem_loudness")
+                conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS wem_meta (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+                "sample_rate INTEGER, channels INTEGER, samples INTEGER, duration_ms INTEGER, "
+                "bitrate INTEGER, format TEXT, markers TEXT)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS wem_loudness (path TEXT PRIMARY KEY, size INTEGER, "
+                "mtime_ns INTEGER, analysis TEXT)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    @staticmethod
+    def _stat(path: str):
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    def get(self, path: str, stat=None) -> Optional[dict]:
+        """Catalogued info for path while it is unchanged on disk, else None."""
+        stat = stat or self._stat(path)
+        if stat is None:
+            return None
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT size, mtime_ns, sample_rate, channels, samples, duration_ms, bitrate, format, markers "
+                "FROM wem_meta WHERE path = ?", (self._key(path),)).fetchone()
+        if row is None or row[0] != stat.st_size or row[1] != stat.st_mtime_ns:
+            return None
+        info = dict(zip(self.COLUMNS, row[2:8]))
+        info['markers'] = json.loads(row[8]) if row[8] else []
+        return info
+
+    def lookup(self, path: str) -> Optional[dict]:
+        """Catalogued info for path, probing and storing it first if it is new or changed."""
+        stat = self._stat(path)
+        if stat is None:
+            return None
+        info = self.get(path, stat)
+        if info is None:
+            info = self.probe(path)
+            if info is not None:
+                self._store([(self._key(path), stat.st_size, stat.st_mtime_ns, info)])
+        return info
+
+    def _store(self, rows):
+        if not rows:
+            return
+        values = [(key, size, mtime_ns, *(info.get(column) for column in self.COLUMNS),
+                   json.dumps(info.get('markers') or []))
+                  for key, size, mtime_ns, info in rows]
+        with self._lock:
+            conn = self._connect()
+            conn.executemany("INSERT OR REPLACE INTO wem_meta VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+            conn.commit()
+
+    def refresh(self, roots, should_stop=None, progress=None) -> int:
+        """Probe every new or changed WEM under roots and drop rows for deleted files.
+
+        Returns the number of files (re)catalogued.
+        """
+        seen = {}
+        for root in roots:
+            if not root or not os.path.isdir(root):
+                continue
+            stack = [root]
+            while stack:
+                try:
+                    with os.scandir(stack.pop()) as it:
+                        for item in it:
+                            if item.is_dir(follow_symlinks=False):
+                                stack.append(item.path)
+                            elif item.name.lower().endswith('.wem'):
+                                stat = item.stat()
+                                seen[self._key(item.path)] = (item.path, stat.st_size, stat.st_mtime_ns)
+                except OSError:
+                    continue
+
+        prefixes = tuple(self._key(root) + os.sep for root in roots if root)
+        with self._lock:
+            known = {row[0]: (row[1], row[2]) for row in
+                     self._connect().execute("SELECT path, size, mtime_ns FROM wem_meta")}
+        stale = [key for key in known if key not in seen and key.startswith(prefixes)]
+        pending = [(key, entry) for key, entry in seen.items() if known.get(key) != entry[1:]]
+
+        batch = []
+        done = 0
+        for done, (key, (path, size, mtime_ns)) in enumerate(pending, 1):
+            if should_stop and should_stop():
+                break
+            try:
+                info = self.probe(path)
+            except Exception as e:
+                DEBUG.log(f"Catalogue probe failed for {path}: {e}", "WARNING")
+                info = None
+            if info is not None:
+                batch.append((key, size, mtime_ns, info))
+            if len(batch) >= 500:
+                self._store(batch)
+                batch = []
+            if progress and done % 500 == 0:
+                progress(done, len(pending))
+        self._store(batch)
+
+        if stale and not (should_stop and should_stop()):
+            with self._lock:
+                conn = self._connect()
+                conn.executemany("DELETE FROM wem_meta WHERE path = ?", [(key,) for key in stale])
+                conn.executemany("DELETE FROM wem_loudness WHERE path = ?", [(key,) for key in stale])
+                conn.commit()
+        DEBUG.log(f"WEM catalogue refreshed: {done} probed, {len(stale)} removed, {len(seen)} on disk")
+        return done
+
+    def get_loudness(self, path: str) -> Optional[dict]:
+        stat = self._stat(path)
+        if stat is None:
+            return None
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT size, mtime_ns, analysis FROM wem_loudness WHERE path = ?", (self._key(path),)).fetchone()
+        if row is None or row[0] != stat.st_size or row[1] != stat.st_mtime_ns:
+            return None
+        return json.loads(row[2])
+
+    def put_loudness(self, path: str, analysis: dict):
+        stat = self._stat(path)
+        if stat is None:
+            return
+        payload = {}
+        for name, value in analysis.items():
+            # NumPy scalars and dtypes from VolumeProcessor are stored as plain values
+            payload[name] = value.item() if hasattr(value, 'item') and not isinstance(value, (int, float)) else value
+            if not isinstance(payload[name], (int, float, str, type(None))):
+                payload[name] = str(payload[name])
+        with self._lock:
+            conn = self._connect()
+            conn.execute("INSERT OR REPLACE INTO wem_loudness VALUES (?, ?, ?, ?)",
+                         (self._key(path), stat.st_size, stat.st_mtime_ns, json.dumps(payload)))
+            conn.commit()
+
+class OrphanWemScanner:
+    """Finds WEMs under the Wems folder that SoundbanksInfo does not list.
+
+    The scan state remembers, per directory, its mtime, its subdirectories and
+    the display name of every WEM in it. A directory whose mtime is unchanged
+    is not listed again, so a rescan only touches folders where files were
+    added, removed or renamed. Marker labels for new orphans are read through
+    the WemCatalog on a small thread pool.
+    """
+
+    STATE_VERSION = 2
+    SOURCE = "ScannedFromFileSystem"
+
+    def __init__(self, wem_root: str, catalog, max_workers: Optional[int] = None):
+        self.wem_root = wem_root
+        self.catalog = catalog
+        self.max_workers = max_workers or min(8, os.cpu_count() or 4)
+
+    @staticmethod
+    def language_for(rel_dir: str) -> str:
+        parts = rel_dir.split(os.sep)
+        if rel_dir in ('.', "SFX"):
+            return "SFX"
+        if parts[0] == "Media":
+            return parts[1] if len(parts) > 1 else "SFX"
+        return rel_dir
+
+    @classmethod
+    def load_state(cls, cache_path: str) -> dict:
+        """Read orphaned_files_cache.json; the old flat-list format yields entries without directory state."""
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            return {"version": cls.STATE_VERSION, "wem_root": None, "entries": data, "dirs": {}}
+        if data.get("version") != cls.STATE_VERSION:
+            return {"version": cls.STATE_VERSION, "wem_root": None, "entries": data.get("entries", []), "dirs": {}}
+        return data
+
+    @staticmethod
+    def save_state(cache_path: str, state: dict):
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, cache_path)
+
+    def _entry(self, rel_dir, file_name, short_name):
+        return {
+            "Id": os.path.splitext(file_name)[0],
+            "Language": self.language_for(rel_dir),
+            "ShortName": short_name,
+            "Path": file_name,
+            "Source": self.SOURCE
+        }
+
+    def _read_label(self, rel_dir, file_name):
+        full_path = os.path.join(self.wem_root, rel_dir, file_name)
+        short_name = f"{os.path.splitext(file_name)[0]}.wav"
+        try:
+            info = self.catalog.lookup(full_path)
+            markers = info['markers'] if info else []
+            if markers and markers[0]['label']:
+                short_name = f"{markers[0]['label']}.wav"
+        except Exception as e:
+            DEBUG.log(f"Could not analyze markers for orphaned file {file_name}: {e}", "WARNING")
+        return short_name
+
+    @staticmethod
+    def _list_dir(path):
+        """Subdirectory names and {wem name: None} for one directory."""
+        subdirs = []
+        files = {}
+        with os.scandir(path) as it:
+            for item in it:
+                if item.is_dir(follow_symlinks=False):
+                    subdirs.append(item.name)
+                elif item.name.lower().endswith('.wem'):
+                    files[item.name] = None
+        return sorted(subdirs), files
+
+    def scan(self, known_ids, state=None, should_stop=None, on_entry=None):
+        """Walk the Wems folder and return (orphan entries, new state), or None if stopped.
+
+        Labels in a changed directory are read again through the catalogue, which
+        only probes files whose size or mtime moved. on_entry is called with
+        every orphan that was not in the previous state, as soon as its label
+        is known, so new files can be shown before the scan ends.
+        """
+        if not os.path.isdir(self.wem_root):
+            return [], {"version": self.STATE_VERSION, "wem_root": self.wem_root, "entries": [], "dirs": {}}
+        old_dirs = {}
+        if state and state.get("wem_root") == self.wem_root:
+            old_dirs = state.get("dirs", {})
+        shown = {(entry.get("Language"), entry.get("Id")) for entry in (state or {}).get("entries", [])}
+
+        dirs = {}
+        pending = []
+        reused = listed = 0
+        stack = ['.']
+        while stack:
+            if should_stop and should_stop():
+                return None
+            rel_dir = stack.pop()
+            path = self.wem_root if rel_dir == '.' else os.path.join(self.wem_root, rel_dir)
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            record = old_dirs.get(rel_dir)
+            if record is not None and record.get("mtime_ns") == mtime_ns:
+                reused += 1
+            else:
+                try:
+                    subdirs, files = self._list_dir(path)
+                except OSError as e:
+                    DEBUG.log(f"Orphan scan could not list {path}: {e}", "WARNING")
+                    continue
+                record = {"mtime_ns": mtime_ns, "subdirs": subdirs, "files": files}
+                listed += 1
+            dirs[rel_dir] = record
+            stack.extend(sub if rel_dir == '.' else os.path.join(rel_dir, sub) for sub in record["subdirs"])
+            for file_name, short_name in record["files"].items():
+                if short_name is None and os.path.splitext(file_name)[0] not in known_ids:
+                    pending.append((rel_dir, file_name))
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as pool:
+                futures = {pool.submit(self._read_label, *job): job for job in pending}
+                try:
+                    for future in as_completed(futures):
+                        if should_stop and should_stop():
+                            return None
+                        rel_dir, file_name = futures[future]
+                        short_name = future.result()
+                        dirs[rel_dir]["files"][file_name] = short_name
+                        entry = self._entry(rel_dir, file_name, short_name)
+                        if on_entry and (entry["Language"], entry["Id"]) not in shown:
+                            on_entry(entry)
+                finally:
+                    for future in futures:
+                        future.cancel()
+
+        entries = []
+        for rel_dir, record in dirs.items():
+            for file_name, short_name in record["files"].items():
+                if short_name is not None and os.path.splitext(file_name)[0] not in known_ids:
+                    entries.append(self._entry(rel_dir, file_name, short_name))
+        DEBUG.log(f"Orphan scan: {listed} folders listed, {reused} unchanged, "
+                  f"{len(pending)} labels read, {len(entries)} orphans")
+        return entries, {"version": self.STATE_VERSION, "wem_root": self.wem_root, "entries": entries, "dirs": dirs}
+
+class WavDecodeService:
+    """Runs WEM -> WAV decodes on a bounded thread pool.
+
+    Every worker only waits on its own vgmstream-cli process, so up to
+    max_workers decodes (the core count by default) run side by side. run()
+    yields results in completion order so callers can report progress per file.
+    """
+
+    def __init__(self, decode, max_workers: Optional[int] = None):
+        self.decode = decode
+        self.max_workers = max_workers or os.cpu_count() or 4
+
+    def _decode_one(self, job):
+        try:
+            return self.decode(job.wem_path, job.wav_path)
+        except Exception as e:
+            return False, str(e)
+
+    def run(self, jobs, should_stop=None):
+        """Yield (job, ok, error) for every DecodeJob as it finishes."""
+        if not jobs:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as pool:
+            futures = {pool.submit(self._decode_one, job): job for job in jobs}
+            try:
+                for future in as_completed(futures):
+                    ok, err = future.result()
+                    yield futures[future], ok, err
+                    if should_stop and should_stop():
+                        break
+            finally:
+                for future in futures:
+                    future.cancel()
+
+class DecodedWavCache:
+    """Disk-backed LRU of decoded WAVs keyed by (source path, size, mtime_ns).
+
+    WAVs live in a per-session folder that close() removes. Once the folder
+    holds more than max_bytes, the least recently played WAVs are deleted,
+    except the one currently playing. prefetch() decodes likely next lines on a
+    small background pool; a play request for a WAV that is still being
+    prefetched waits for that decode instead of starting another.
+    """
+
+    PREFETCH_WORKERS = 2
+
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._bytes = 0
+        self._pinned = None
+        self._lock = threading.Lock()
+        self._pool = None
+        self._prefetches = []
+
+    @staticmethod
+    def key_for(path: str, tag=""):
+        """Cache key for a decode of path (plus tag, e.g. a media ID inside a bank), or None."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (os.path.normcase(os.path.abspath(path)), stat.st_size, stat.st_mtime_ns, str(tag))
+
+    @staticmethod
+    def purge_stale(parent: str, prefix: str):
+        """Remove cache folders left behind by sessions that are no longer running."""
+        psutil = get_psutil()
+        if psutil is None or not os.path.isdir(parent):
+            return
+        for name in os.listdir(parent):
+            pid = name[len(prefix):]
+            if name.startswith(prefix) and pid.isdigit() and not psutil.pid_exists(int(pid)):
+                shutil.rmtree(os.path.join(parent, name), ignore_errors=True)
+
+    def _path_for(self, key) -> str:
+        digest = hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.directory, f"{digest}.wav")
+
+    def fetch(self, key, decode):
+        """(ok, wav_path, error) for key; on a miss decode(wav_path) -> (ok, error) fills it."""
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    if os.path.exists(entry[0]):
+                        self._entries.move_to_end(key)
+                        return True, entry[0], ""
+                    del self._entries[key]
+                    self._bytes -= entry[1]
+                event = self._pending.get(key)
+                if event is None:
+                    self._pending[key] = threading.Event()
+                    break
+            event.wait()
+
+        wav_path = self._path_for(key)
+        temp_path = wav_path + ".part"
+        ok, err, size = False, "", 0
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            ok, err = decode(temp_path)
+            if ok:
+                os.replace(temp_path, wav_path)
+                size = os.path.getsize(wav_path)
+        except Exception as e:
+            ok, err = False, str(e)
+        finally:
+            if not ok and os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            with self._lock:
+                if ok:
+                    self._entries[key] = (wav_path, size)
+                    self._bytes += size
+                    self._evict(keep=key)
+                self._pending.pop(key).set()
+        return ok, wav_path if ok else "", err
+
+    def _evict(self, keep):
+        for key in list(self._entries):
+            if self._bytes <= self.max_bytes:
+                break
+            wav_path, size = self._entries[key]
+            if key == keep or wav_path == self._pinned:
+                continue
+            try:
+                os.remove(wav_path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Still opened by the player; try again on a later eviction
+                continue
+            del self._entries[key]
+            self._bytes -= size
+
+    def peek(self, key) -> Optional[str]:
+        """Path of an already decoded WAV for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not os.path.exists(entry[0]):
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def pin(self, wav_path: Optional[str]):
+        """Protect the WAV that is currently playing from eviction."""
+        with self._lock:
+            self._pinned = wav_path
+
+    def prefetch(self, jobs):
+        """Decode (key, decode) jobs in the background, dropping the previous batch's queued ones."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.PREFETCH_WORKERS, thread_name_prefix="wav-prefetch")
+            for future in self._prefetches:
+                future.cancel()
+            wanted = [(key, decode) for key, decode in jobs
+                      if key is not None and key not in self._entries and key not in self._pending]
+            self._prefetches = [self._pool.submit(self.fetch, key, decode) for key, decode in wanted]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        shutil.rmtree(self.directory, ignore_errors=True)
+
 class BnkInfoLoader(QtCore.QThread):
     info_loaded = QtCore.pyqtSignal(int, object, object)  # source_id, original_info, modified_info
 
@@ -3797,27 +2815,29 @@ class BnkInfoLoader(QtCore.QThread):
         self.parent_app = parent
         
     def run(self):
-        original_bnk_info, original_bnk_path = self.find_info_in_bnks(self.bnk_files_info, self.source_id, is_mod=False)
-        if original_bnk_info:
+        owners = self.parent_app.bnk_index.lookup(self.source_id, self.bnk_files_info)
+        if owners:
+            original_bnk_path, _, original_bnk_info = owners[0]
             DEBUG.log(f"Original information for ID {self.source_id} found in BNK: {os.path.basename(original_bnk_path)}")
         else:
+            original_bnk_info = None
             DEBUG.log(f"Original information for ID {self.source_id} not found in any BNK.")
 
+        # Delta banks are answered from the original record; full copies are read from disk
+        bnk_delta = self.parent_app.get_bnk_delta()
         mod_bnk_paths_info = []
-        for bnk_path, bnk_type in self.bnk_files_info:
-            if bnk_type == 'sfx':
-                base_for_relpath = os.path.join(self.wems_base_path, "SFX")
-                rel_path = os.path.relpath(bnk_path, base_for_relpath)
-                mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-            else:
-                base_for_relpath = self.wems_base_path
-                rel_path = os.path.relpath(bnk_path, base_for_relpath)
-                mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-            
-            if os.path.exists(mod_bnk_path):
+        modified_bnk_info, modified_bnk_path = None, None
+        for bnk_path, bnk_type, owner_entry in owners:
+            mod_bnk_path = self.parent_app.get_mod_bnk_path(bnk_path, bnk_type)
+            if bnk_delta is not None and bnk_delta.has_bank(mod_bnk_path):
                 mod_bnk_paths_info.append((mod_bnk_path, bnk_type))
+                modified_bnk_info, modified_bnk_path = bnk_delta.entry(mod_bnk_path, owner_entry), mod_bnk_path
+            elif os.path.exists(mod_bnk_path):
+                mod_bnk_paths_info.append((mod_bnk_path, bnk_type))
+                modified_bnk_info, modified_bnk_path = self.find_info_in_bnks([(mod_bnk_path, bnk_type)], self.source_id, is_mod=True)
+            if modified_bnk_info:
+                break
         
-        modified_bnk_info, modified_bnk_path = self.find_info_in_bnks(mod_bnk_paths_info, self.source_id, is_mod=True)
         if modified_bnk_info:
             DEBUG.log(f"Modified information for ID {self.source_id} found in BNK: {os.path.basename(modified_bnk_path)}")
         else:
@@ -3827,25 +2847,13 @@ class BnkInfoLoader(QtCore.QThread):
         self.info_loaded.emit(self.source_id, original_bnk_info, modified_bnk_info)
 
     def find_info_in_bnks(self, bnk_paths_info, source_id, is_mod=False):
-        cache_name = 'bnk_cache_mod' if is_mod else 'bnk_cache_orig'
-        cache = getattr(self.parent_app, cache_name, {})
-        
+        # Reopening a bank is cheap: its parsed layout comes from BNK_PARSE_CACHE
         for bnk_path, bnk_type in bnk_paths_info:
-            if bnk_path in cache and source_id in cache[bnk_path]:
-                return cache[bnk_path][source_id], bnk_path
-
             try:
-                editor = BNKEditor(bnk_path)
-                entries = editor.find_sound_by_source_id(source_id)
+                with BNKEditor(bnk_path, use_mmap=True) as editor:
+                    entries = editor.find_sound_by_source_id(source_id)
                 if entries:
-                    entry = entries[0]
-                    
-                    if bnk_path not in cache:
-                        cache[bnk_path] = {}
-                    cache[bnk_path][source_id] = entry
-                    setattr(self.parent_app, cache_name, cache)
-                    
-                    return entry, bnk_path
+                    return entries[0], bnk_path
             except Exception as e:
                 DEBUG.log(f"Error reading BNK {bnk_path}: {e}", "WARNING")
                 continue
@@ -3922,41 +2930,12 @@ class AudioToWavConverter:
             return False, str(e)
 class VolumeProcessor:
     def __init__(self):
-        self.has_numpy = False
-        self.has_scipy = False
-        self.np = None
-        self.wavfile = None
-        try:
-            DEBUG.log("VolumeProcessor: trying to import numpy...", "INFO")
-            import numpy as np
-            DEBUG.log("VolumeProcessor: numpy imported successfully", "INFO")
-            self.np = np
-        except Exception as e:
-            import traceback
-            DEBUG.log(f"VolumeProcessor: NumPy import error: {e}", "ERROR")
-            DEBUG.log(traceback.format_exc(), "ERROR")
-            self.np = None
-
-        try:
-            DEBUG.log("VolumeProcessor: trying to import scipy.io.wavfile...", "INFO")
-            import scipy.io.wavfile
-            DEBUG.log("VolumeProcessor: scipy.io.wavfile imported successfully", "INFO")
-            self.wavfile = scipy.io.wavfile
-        except Exception as e:
-            import traceback
-            DEBUG.log(f"VolumeProcessor: SciPy import error: {e}", "ERROR")
-            DEBUG.log(traceback.format_exc(), "ERROR")
-            self.wavfile = None
-
-        if self.np is not None:
-            self.has_numpy = True
-        if self.wavfile is not None:
-            self.has_scipy = True
-
-        DEBUG.log(f"VolumeProcessor: has_numpy={self.has_numpy}, has_scipy={self.has_scipy}", "INFO")
+        self.np = get_numpy()
+        self.wavfile = get_wavfile()
+        self.has_numpy = self.np is not None
+        self.has_scipy = self.wavfile is not None
 
     def is_available(self):
-        DEBUG.log(f"VolumeProcessor.is_available: {self.has_numpy=}, {self.has_scipy=}", "INFO")
         return self.has_numpy and self.has_scipy
 
     def analyze_audio(self, wav_path):
@@ -4275,15 +3254,7 @@ class WemVolumeEditDialog(QtWidgets.QDialog):
                 self.current_rms_label.setText("File not found")
                 return
             
-            temp_wav = tempfile.NamedTemporaryFile(suffix='.wav', delete=False).name
-            self.temp_files.append(temp_wav)
-            
-            ok, err = self.parent.wem_to_wav_vgmstream(wem_path, temp_wav)
-            if not ok:
-                self.current_rms_label.setText("Conversion error")
-                return
-            
-            self.current_analysis = self.volume_processor.analyze_audio(temp_wav)
+            self.current_analysis = self.parent.get_loudness_analysis(wem_path, self.volume_processor)
             if self.current_analysis:
                 self.current_rms_label.setText(f"{self.current_analysis['rms_percent']:.1f}%")
                 self.current_peak_label.setText(f"{self.current_analysis['peak_percent']:.1f}%")
@@ -4509,6 +3480,7 @@ class WemVolumeEditDialog(QtWidgets.QDialog):
             
             output_wem = conversion_result['output_path']
             shutil.copy2(output_wem, target_path)
+            self.parent.get_mod_audio_index().note_written(target_path)
             
             try:
                 if os.path.exists(temp_output):
@@ -4628,6 +3600,28 @@ class WemVolumeEditDialog(QtWidgets.QDialog):
                 pass
         
         QtWidgets.QMessageBox.critical(self, self.tr("error"), f"{self.tr('volume_change_failed_title')}:\n\n{error}")
+class LoudnessAnalysisThread(QtCore.QThread):
+    """Decodes and analyses WEMs for the batch volume dialog, one result per file."""
+    result_ready = QtCore.pyqtSignal(str, object)
+
+    def __init__(self, wem_app, wem_paths, volume_processor, parent=None):
+        super().__init__(parent)
+        self.wem_app = wem_app
+        self.wem_paths = wem_paths
+        self.volume_processor = volume_processor
+        self._is_running = True
+
+    def run(self):
+        try:
+            self.wem_app.get_loudness_analyses(self.wem_paths, self.volume_processor,
+                                               on_result=self.result_ready.emit,
+                                               should_stop=lambda: not self._is_running)
+        except Exception as e:
+            DEBUG.log(f"Batch loudness analysis failed: {e}", "ERROR")
+
+    def stop(self):
+        self._is_running = False
+
 class BatchVolumeEditDialog(QtWidgets.QDialog):
     """Dialog for batch editing volume of multiple files"""
     
@@ -4639,6 +3633,7 @@ class BatchVolumeEditDialog(QtWidgets.QDialog):
         self.is_mod = is_mod
         self.volume_processor = VolumeProcessor()
         self.temp_files = []
+        self.analysis_thread = None
         
         self.setWindowTitle(self.tr("batch_volume_editor_title").format(count=len(entries_and_lang)))
         self.setMinimumSize(800, 700)
@@ -4838,7 +3833,8 @@ class BatchVolumeEditDialog(QtWidgets.QDialog):
     def analyze_files(self):
         """Analyze all files"""
         self.files_table.setRowCount(len(self.entries_and_lang))
-        self.file_analyses = []
+        self.file_analyses = [None] * len(self.entries_and_lang)
+        rows_by_path = {}
         
         for i, (entry, lang) in enumerate(self.entries_and_lang):
        
@@ -4863,29 +3859,47 @@ class BatchVolumeEditDialog(QtWidgets.QDialog):
                     wem_path = os.path.join(self.parent.wem_root, lang, f"{file_id}.wem")
                 
                 if os.path.exists(wem_path):
-                    temp_wav = tempfile.NamedTemporaryFile(suffix='.wav', delete=False).name
-                    self.temp_files.append(temp_wav)
-                    
-                    ok, err = self.parent.wem_to_wav_vgmstream(wem_path, temp_wav)
-                    if ok:
-                        analysis = self.volume_processor.analyze_audio(temp_wav)
-                        if analysis:
-                            self.file_analyses.append(analysis)
-                            self.files_table.setItem(i, 2, QtWidgets.QTableWidgetItem(f"{analysis['rms_percent']:.1f}%"))
-                            self.files_table.setItem(i, 3, QtWidgets.QTableWidgetItem(f"{analysis['peak_percent']:.1f}%"))
-                            self.files_table.setItem(i, 5, QtWidgets.QTableWidgetItem("Ready"))
-                            continue
+                    rows_by_path.setdefault(wem_path, []).append(i)
+                    continue
                 
-                self.file_analyses.append(None)
-                self.files_table.setItem(i, 2, QtWidgets.QTableWidgetItem("N/A"))
-                self.files_table.setItem(i, 3, QtWidgets.QTableWidgetItem("N/A"))
-                self.files_table.setItem(i, 5, QtWidgets.QTableWidgetItem("Error"))
+                self._show_analysis(i, None)
                 
             except Exception as e:
-                self.file_analyses.append(None)
                 self.files_table.setItem(i, 5, QtWidgets.QTableWidgetItem("Error"))
-        
+
+        self.rows_by_path = rows_by_path
+        self.analysis_thread = LoudnessAnalysisThread(self.parent, list(rows_by_path), self.volume_processor, self)
+        self.analysis_thread.result_ready.connect(self._on_analysis_ready)
+        self.analysis_thread.finished.connect(self._on_analysis_finished)
+        self.process_btn.setEnabled(False)
+        self.analysis_thread.start()
+
+    def _on_analysis_ready(self, wem_path, analysis):
+        for row in self.rows_by_path.get(wem_path, ()):
+            self._show_analysis(row, analysis)
+
+    def _on_analysis_finished(self):
+        self.process_btn.setEnabled(True)
         self.update_preview_all()
+
+    def done(self, result):
+        if self.analysis_thread and self.analysis_thread.isRunning():
+            self.analysis_thread.result_ready.disconnect()
+            self.analysis_thread.finished.disconnect()
+            self.analysis_thread.stop()
+            self.analysis_thread.wait()
+        super().done(result)
+
+    def _show_analysis(self, row, analysis):
+        self.file_analyses[row] = analysis
+        if analysis:
+            self.files_table.setItem(row, 2, QtWidgets.QTableWidgetItem(f"{analysis['rms_percent']:.1f}%"))
+            self.files_table.setItem(row, 3, QtWidgets.QTableWidgetItem(f"{analysis['peak_percent']:.1f}%"))
+            self.files_table.setItem(row, 5, QtWidgets.QTableWidgetItem("Ready"))
+        else:
+            self.files_table.setItem(row, 2, QtWidgets.QTableWidgetItem("N/A"))
+            self.files_table.setItem(row, 3, QtWidgets.QTableWidgetItem("N/A"))
+            self.files_table.setItem(row, 5, QtWidgets.QTableWidgetItem("Error"))
     
     def on_volume_changed(self, value):
         """Handle volume slider change"""
@@ -5103,6 +4117,7 @@ class BatchVolumeEditDialog(QtWidgets.QDialog):
                     target_path = os.path.join(target_dir, f"{file_id}.wem")
                     
                     shutil.copy2(output_wem, target_path)
+                    self.parent.get_mod_audio_index().note_written(target_path)
                     
                     successful += 1
                     
@@ -5244,22 +4259,385 @@ class DebugWindow(QtWidgets.QDialog):
             with open(path, 'w', encoding='utf-8') as f:
                 f.write(DEBUG.get_logs())
 
-class ModernButton(QtWidgets.QPushButton):
-    def __init__(self, text="", icon=None, primary=False):
-        super().__init__(text)
-        self.primary = primary
-        self.setProperty("primary", primary)
-        if icon:
-            self.setIcon(QtGui.QIcon(icon))
-        self.setCursor(QtCore.Qt.PointingHandCursor)
-        self.setMinimumHeight(36)
-class AudioTreeWidget(QtWidgets.QTreeWidget):
+class ModernButton(QtWidgets.QPushButton):
+    def __init__(self, text="", icon=None, primary=False):
+        super().__init__(text)
+        self.primary = primary
+        self.setProperty("primary", primary)
+        if icon:
+            self.setIcon(QtGui.QIcon(icon))
+        self.setCursor(QtCore.Qt.PointingHandCursor)
+        self.setMinimumHeight(36)
+class AudioTreeNode:
+    """A group or audio line in an AudioTreeModel.
+
+    Offers the read side of the QTreeWidgetItem API (data, text, childCount,
+    child, parent, treeWidget) plus setSelected/setExpanded, so code written
+    against the old tree items keeps working. Display values are computed
+    by the model from the app's current state rather than stored per row.
+    """
+
+    __slots__ = ('parent_node', 'children', 'entry', 'label', 'row', 'count', 'fetched', 'model')
+
+    def __init__(self, entry=None, label="", model=None):
+        self.parent_node = None
+        self.children = []
+        self.entry = entry
+        self.label = label
+        self.row = 0
+        self.count = 0
+        self.fetched = 0
+        self.model = model
+
+    def add(self, node):
+        node.parent_node = self
+        node.row = len(self.children)
+        self.children.append(node)
+        return node
+
+    def root(self):
+        node = self
+        while node.parent_node is not None:
+            node = node.parent_node
+        return node
+
+    def childCount(self):
+        return len(self.children)
+
+    def child(self, index):
+        return self.children[index]
+
+    def parent(self):
+        parent = self.parent_node
+        return None if parent is None or parent.parent_node is None else parent
+
+    def data(self, column, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.UserRole:
+            return self.entry if column == 0 else None
+        model = self.root().model
+        return model.node_data(self, column, role) if model else None
+
+    def text(self, column):
+        return self.data(column) or ""
+
+    def treeWidget(self):
+        model = self.root().model
+        return model.view if model else None
+
+    def setSelected(self, selected):
+        view = self.treeWidget()
+        if view is not None:
+            flags = QtCore.QItemSelectionModel.Select if selected else QtCore.QItemSelectionModel.Deselect
+            view.selectionModel().select(view.audio_model.index_for(self),
+                                         flags | QtCore.QItemSelectionModel.Rows)
+
+    def setExpanded(self, expanded):
+        view = self.treeWidget()
+        if view is not None:
+            view.setExpanded(view.audio_model.index_for(self), expanded)
+
+class AudioTreeModel(QtCore.QAbstractItemModel):
+    """Model behind an audio tab: a tree of AudioTreeNode built by populate_tree.
+
+    Rows are handed to the view in batches through canFetchMore/fetchMore,
+    so a refresh only creates the nodes and the view lays out what is
+    visible. Names, subtitles, status, tags and colours are read from the
+    app when a row is painted; after an edit, refresh_node() repaints that
+    row instead of the whole tab being rebuilt. The first node of each
+    subtitle key and Id (in tree order) is indexed for node_for_key() and
+    node_for_id().
+    """
+
+    FETCH_BATCH = 500
+    COLUMNS = 5
+    LOOSE_MEDIA_BRUSH = QtGui.QBrush(QtGui.QColor(100, 100, 200))
+    NO_SUBTITLE_BRUSH = QtGui.QBrush(QtGui.QColor(128, 128, 128))
+    HIGHLIGHT_BRUSH = QtGui.QBrush(QtGui.QColor(255, 255, 180))
+
+    def __init__(self, wem_app, view=None):
+        super().__init__(view)
+        self.wem_app = wem_app
+        self.view = view
+        self.headers = [""] * self.COLUMNS
+        self.mod_audio_ids = set()
+        self.highlighted = None
+        self.root = AudioTreeNode(model=self)
+        self.nodes_by_key = {}
+        self.nodes_by_id = {}
+
+    def set_root(self, root, mod_audio_ids=()):
+        """Replace the whole tree; group counts are taken from the entries below each group."""
+        nodes_by_key = {}
+        nodes_by_id = {}
+
+        def count(node):
+            if node.entry is not None:
+                nodes_by_key.setdefault(node.entry.key, node)
+                nodes_by_id.setdefault(str(node.entry.get("Id", "")), node)
+                return 1
+            node.count = sum(count(child) for child in node.children)
+            return node.count
+
+        count(root)
+        root.model = self
+        self.beginResetModel()
+        self.root = root
+        self.nodes_by_key = nodes_by_key
+        self.nodes_by_id = nodes_by_id
+        self.mod_audio_ids = set(mod_audio_ids)
+        self.highlighted = None
+        self.endResetModel()
+
+    def node_for_key(self, key):
+        return self.nodes_by_key.get(key)
+
+    def node_for_id(self, file_id):
+        return self.nodes_by_id.get(str(file_id))
+
+    def node(self, index):
+        return index.internalPointer() if index.isValid() else self.root
+
+    def index_for(self, node):
+        """Model index of node, fetching the rows above it that the view has not asked for yet."""
+        if node is None or node.parent_node is None or node.root() is not self.root:
+            return QtCore.QModelIndex()
+        parent_index = self.index_for(node.parent_node)
+        parent = node.parent_node
+        if parent.fetched <= node.row:
+            self.beginInsertRows(parent_index, parent.fetched, node.row)
+            parent.fetched = node.row + 1
+            self.endInsertRows()
+        return self.createIndex(node.row, 0, node)
+
+    def refresh_node(self, node):
+        index = self.index_for(node)
+        if index.isValid():
+            self.dataChanged.emit(index, index.sibling(index.row(), self.COLUMNS - 1))
+
+    def set_highlighted(self, node):
+        previous, self.highlighted = self.highlighted, node
+        if previous is not node:
+            for changed in (previous, node):
+                if changed is not None:
+                    self.refresh_node(changed)
+
+    def append_to_group(self, label, entry, has_mod_audio=False):
+        """Add entry under the top-level group called label, creating the group if needed."""
+        group = next((node for node in self.root.children if node.entry is None and node.label == label), None)
+        if group is None:
+            group = AudioTreeNode(label=label)
+            self._insert(self.root, group)
+        if has_mod_audio:
+            self.mod_audio_ids.add(entry.id_int)
+        node = AudioTreeNode(entry)
+        self._insert(group, node)
+        self.nodes_by_key.setdefault(entry.key, node)
+        self.nodes_by_id.setdefault(str(entry.get("Id", "")), node)
+        group.count += 1
+        self.refresh_node(group)
+        return group
+
+    def _insert(self, parent, node):
+        # Rows the view has not fetched yet are revealed by fetchMore later on
+        if parent.fetched < len(parent.children):
+            parent.add(node)
+            return
+        row = len(parent.children)
+        self.beginInsertRows(self.index_for(parent), row, row)
+        parent.add(node)
+        parent.fetched = row + 1
+        self.endInsertRows()
+
+    def fetch_all(self):
+        def fetch(node, index):
+            if node.fetched < len(node.children):
+                self.beginInsertRows(index, node.fetched, len(node.children) - 1)
+                node.fetched = len(node.children)
+                self.endInsertRows()
+            for child in node.children:
+                if child.children:
+                    fetch(child, self.createIndex(child.row, 0, child))
+        fetch(self.root, QtCore.QModelIndex())
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        node = self.node(parent)
+        if 0 <= row < node.fetched and 0 <= column < self.COLUMNS:
+            return self.createIndex(row, column, node.children[row])
+        return QtCore.QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        parent = index.internalPointer().parent_node
+        if parent is None or parent.parent_node is None:
+            return QtCore.QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return self.node(parent).fetched
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return self.COLUMNS
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        if parent.column() > 0:
+            return False
+        return bool(self.node(parent).children)
+
+    def canFetchMore(self, parent):
+        node = self.node(parent)
+        return node.fetched < len(node.children)
+
+    def fetchMore(self, parent):
+        node = self.node(parent)
+        count = min(len(node.children) - node.fetched, self.FETCH_BATCH)
+        if count <= 0:
+            return
+        self.beginInsertRows(parent, node.fetched, node.fetched + count - 1)
+        node.fetched += count
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole and section < len(self.headers):
+            return self.headers[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.ItemIsDropEnabled
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsDropEnabled
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == QtCore.Qt.UserRole:
+            return node.entry if index.column() == 0 else None
+        return self.node_data(node, index.column(), role)
+
+    def node_data(self, node, column, role):
+        entry = node.entry
+        if entry is None:
+            if role == QtCore.Qt.DisplayRole and column == 0:
+                return f"{node.label} ({node.count})"
+            if role == QtCore.Qt.BackgroundRole and node is self.highlighted:
+                return self.HIGHLIGHT_BRUSH
+            return None
+
+        app = self.wem_app
+        key = entry.key
+        if role == QtCore.Qt.DisplayRole:
+            if column == 0:
+                return entry.get("ShortName", "")
+            if column == 1:
+                return entry.get("Id", "")
+            if column == 2:
+                return app.subtitles.get(key, "")
+            if column == 3:
+                mod_status = "♪" if entry.id_int in self.mod_audio_ids else ""
+                return "✓" + mod_status if key in app.modified_subtitles else mod_status
+            if column == 4:
+                return app.marked_items.get(key, {}).get('tag', "")
+        elif role == QtCore.Qt.BackgroundRole:
+            if node is self.highlighted:
+                return self.HIGHLIGHT_BRUSH
+            color = app.marked_items.get(key, {}).get('color')
+            if color is not None:
+                return QtGui.QBrush(color)
+        elif role == QtCore.Qt.ForegroundRole:
+            if column == 2 and not app.subtitles.get(key, ""):
+                return self.NO_SUBTITLE_BRUSH
+            if column == 0 and entry.source_kind == AudioEntry.SOURCE_LOOSE:
+                return self.LOOSE_MEDIA_BRUSH
+        return None
+
+class AudioTreeWidget(QtWidgets.QTreeView):
+    """Tree view of one language tab over an AudioTreeModel.
+
+    Keeps the QTreeWidget calls the app relies on (selectedItems,
+    setCurrentItem, itemAt, itemAbove/itemBelow, itemSelectionChanged,
+    itemDoubleClicked), with AudioTreeNode standing in for the items.
+    """
+    itemSelectionChanged = QtCore.pyqtSignal()
+    itemDoubleClicked = QtCore.pyqtSignal(object, int)
+
     def __init__(self, parent=None, wem_app=None, lang=None):
         super().__init__(parent)
         self.wem_app = wem_app
         self.lang = lang
-        self._highlighted_item = None
-        self._highlighted_brush = QtGui.QBrush(QtGui.QColor(255, 255, 180))
+        self.audio_model = AudioTreeModel(wem_app, self)
+        self.setModel(self.audio_model)
+        self.setUniformRowHeights(True)
+        self.selectionModel().selectionChanged.connect(lambda *_: self.itemSelectionChanged.emit())
+        self.doubleClicked.connect(
+            lambda index: self.itemDoubleClicked.emit(self.itemFromIndex(index), index.column()))
+
+    def setHeaderLabels(self, labels):
+        self.audio_model.headers = list(labels)
+        self.audio_model.headerDataChanged.emit(QtCore.Qt.Horizontal, 0, len(labels) - 1)
+
+    def set_root(self, root, mod_audio_ids=()):
+        self.audio_model.set_root(root, mod_audio_ids)
+
+    def clear(self):
+        self.audio_model.set_root(AudioTreeNode())
+
+    def invisibleRootItem(self):
+        return self.audio_model.root
+
+    def topLevelItemCount(self):
+        return len(self.audio_model.root.children)
+
+    def topLevelItem(self, index):
+        children = self.audio_model.root.children
+        return children[index] if 0 <= index < len(children) else None
+
+    def itemFromIndex(self, index):
+        return index.internalPointer() if index.isValid() else None
+
+    def item_for_key(self, key):
+        """First audio line shown for a subtitle key, or None."""
+        return self.audio_model.node_for_key(key)
+
+    def item_for_id(self, file_id):
+        """First audio line shown for a file Id, or None."""
+        return self.audio_model.node_for_id(file_id)
+
+    def itemAt(self, pos):
+        return self.itemFromIndex(self.indexAt(pos))
+
+    def itemAbove(self, item):
+        return self.itemFromIndex(self.indexAbove(self.audio_model.index_for(item)))
+
+    def itemBelow(self, item):
+        return self.itemFromIndex(self.indexBelow(self.audio_model.index_for(item)))
+
+    def selectedItems(self):
+        return [self.itemFromIndex(index) for index in self.selectionModel().selectedRows(0)]
+
+    def currentItem(self):
+        return self.itemFromIndex(self.currentIndex())
+
+    def setCurrentItem(self, item):
+        index = self.audio_model.index_for(item)
+        if index.isValid():
+            self.setCurrentIndex(index)
+
+    def scrollToItem(self, item):
+        index = self.audio_model.index_for(item)
+        if index.isValid():
+            self.scrollTo(index)
+
+    def refresh_item(self, item):
+        """Repaint one row after the subtitle, status or marking behind it changed."""
+        self.audio_model.refresh_node(item)
+
+    def expandAll(self):
+        self.audio_model.fetch_all()
+        super().expandAll()
+
     def keyPressEvent(self, event):
         """Handle key presses for audio playback and other actions."""
         key = event.key()
@@ -5332,50 +4710,60 @@ class AudioTreeWidget(QtWidgets.QTreeWidget):
         event.acceptProposedAction()
 
     def _set_highlighted_item(self, item):
-   
-        if self._highlighted_item is not None:
-            for col in range(self.columnCount()):
-                self._highlighted_item.setBackground(col, QtGui.QBrush())
-    
-        self._highlighted_item = item
-        if item is not None:
-            for col in range(self.columnCount()):
-                item.setBackground(col, self._highlighted_brush)
+        self.audio_model.set_highlighted(item)
 class WEMAnalyzer:
-    def __init__(self, filename):
+    """Reads a WEM's RIFF header in-process: format, length, cue points and labels.
+
+    The fmt, vorb, data, cue and LIST chunks are parsed in one pass over an mmap
+    of the file, or over a buffer such as BNKEditor.media_view(). audio_info()
+    covers the PCM and Wwise Vorbis media the game ships and returns None for
+    other codecs, which callers still probe with `vgmstream-cli -m`.
+    """
+
+    CODEC_NAMES = {
+        0x0001: "PCM",
+        0xFFFE: "PCM",
+        0xFFFF: "Wwise Vorbis",
+    }
+
+    def __init__(self, filename, data=None, verbose=True):
         self.filename = filename
+        self.data = data
+        self.verbose = verbose
         self.sample_rate = 0
         self.channels = 0
+        self.audio_format = 0
+        self.block_align = 0
+        self.total_samples = 0
+        self.data_size = 0
+        self.file_size = 0
         self.cue_points = []
         self.labels = {}
-        
-    def read_chunk_header(self, file):
-  
-        chunk_id = file.read(4)
-        if len(chunk_id) < 4:
-            return None, 0
-        chunk_size = struct.unpack('<I', file.read(4))[0]
-        return chunk_id.decode('ascii', errors='ignore'), chunk_size
-    
-    def parse_fmt_chunk(self, file, size):
-   
-        fmt_data = file.read(size)
-        
-        if len(fmt_data) < 8:
+        self._vorb_samples = 0
+
+    def _log(self, message):
+        if self.verbose:
+            DEBUG.log(message)
+
+    def parse_fmt_chunk(self, buf, offset, size):
+
+        if size < 8:
             return
-            
-        audio_format = struct.unpack('<H', fmt_data[0:2])[0]
-        self.channels = struct.unpack('<H', fmt_data[2:4])[0]
-        self.sample_rate = struct.unpack('<I', fmt_data[4:8])[0]
-        
 
-        DEBUG.log(f"Audio format: 0x{audio_format:04X}")
-        DEBUG.log(f"Channels: {self.channels}")
-        DEBUG.log(f"Sample rate: {self.sample_rate} Hz")
-    def parse_cue_chunk(self, file, size):
-        
-        cue_data = file.read(size)
+        self.audio_format, self.channels, self.sample_rate = struct.unpack_from('<HHI', buf, offset)
+        if size >= 14:
+            self.block_align = struct.unpack_from('<H', buf, offset + 12)[0]
+        if self.audio_format == 0xFFFF and size >= 0x1C and not self._vorb_samples:
+            # Wwise 2012+ keeps the vorb header inside the extended fmt chunk
+            self._vorb_samples = struct.unpack_from('<I', buf, offset + 0x18)[0]
+
+        self._log(f"Audio format: 0x{self.audio_format:04X}")
+        self._log(f"Channels: {self.channels}")
+        self._log(f"Sample rate: {self.sample_rate} Hz")
+    def parse_cue_chunk(self, cue_data):
         
+        if len(cue_data) < 4:
+            return
         num_cues = struct.unpack('<I', cue_data[0:4])[0]
         offset = 4
         
@@ -5392,10 +4780,8 @@ class WEMAnalyzer:
                 self.cue_points.append(cue_point)
                 offset += 24
     
-    def parse_list_chunk(self, file, size):
+    def parse_list_chunk(self, list_data):
      
-        list_data = file.read(size)
-        
         if len(list_data) < 4:
             return
             
@@ -5425,7 +4811,7 @@ class WEMAnalyzer:
                         
                         if label_text:
                             self.labels[cue_id] = label_text
-                            DEBUG.log(f"Found label ID {cue_id}: '{label_text}'")
+                            self._log(f"Found label ID {cue_id}: '{label_text}'")
                             
                     except Exception as e:
                         DEBUG.log(f"Error decoding label for cue {cue_id}: {e}", "ERROR")
@@ -5437,58 +4823,84 @@ class WEMAnalyzer:
     def analyze(self):
 
         try:
+            if self.data is not None:
+                return self._parse(self.data)
             with open(self.filename, 'rb') as f:
-                riff_id = f.read(4)
-                if riff_id != b'RIFF':
+                if os.fstat(f.fileno()).st_size < 12:
                     DEBUG.log(f"Not a RIFF file: {self.filename}", "ERROR")
                     return False
-                
-                file_size = struct.unpack('<I', f.read(4))[0]
-                wave_id = f.read(4)
-                
-                if wave_id != b'WAVE':
-                    DEBUG.log(f"Not a WAVE file: {self.filename}", "ERROR")
-                    return False
-                
-                DEBUG.log(f"Analyzing WEM file: {os.path.basename(self.filename)} (size: {file_size + 8} bytes)")
-                
-                while f.tell() < file_size + 8:
-                    chunk_id, chunk_size = self.read_chunk_header(f)
-                    if chunk_id is None:
-                        break
-                    
-                    current_pos = f.tell()
-                    
-                    if chunk_id == 'fmt ':
-                        self.parse_fmt_chunk(f, chunk_size)
-                    elif chunk_id == 'cue ':
-                        self.parse_cue_chunk(f, chunk_size)
-                    elif chunk_id == 'LIST':
-                        self.parse_list_chunk(f, chunk_size)
-                    else:
-                        f.seek(current_pos + chunk_size)
-                    
-                    if chunk_size % 2 == 1:
-                        f.read(1)
-                
-           
-                DEBUG.log(f"Final analysis result:")
-                DEBUG.log(f"  Sample rate: {self.sample_rate} Hz")
-                DEBUG.log(f"  Channels: {self.channels}")
-                DEBUG.log(f"  Cue points: {len(self.cue_points)}")
-                DEBUG.log(f"  Labels: {len(self.labels)}")
-                
-          
-                for cue in self.cue_points:
-                    if self.sample_rate > 0:
-                        calc_time = cue.position / self.sample_rate
-                        DEBUG.log(f"  Cue {cue.id}: {cue.position} samples = {calc_time:.3f} seconds")
-                
-                return True
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return self._parse(mapped)
                 
         except Exception as e:
             DEBUG.log(f"Error analyzing WEM file {self.filename}: {e}", "ERROR")
             return False
+
+    def _parse(self, buf):
+        if bytes(buf[0:4]) != b'RIFF':
+            DEBUG.log(f"Not a RIFF file: {self.filename}", "ERROR")
+            return False
+
+        riff_size = struct.unpack_from('<I', buf, 4)[0]
+        if bytes(buf[8:12]) != b'WAVE':
+            DEBUG.log(f"Not a WAVE file: {self.filename}", "ERROR")
+            return False
+
+        self.file_size = len(buf)
+        end = min(riff_size + 8, len(buf))
+        self._log(f"Analyzing WEM file: {os.path.basename(self.filename)} (size: {riff_size + 8} bytes)")
+
+        offset = 12
+        while offset + 8 <= end:
+            chunk_id = bytes(buf[offset:offset+4])
+            chunk_size = struct.unpack_from('<I', buf, offset + 4)[0]
+            body = offset + 8
+            available = min(chunk_size, end - body)
+
+            if chunk_id == b'fmt ':
+                self.parse_fmt_chunk(buf, body, available)
+            elif chunk_id == b'vorb' and available >= 4:
+                self._vorb_samples = struct.unpack_from('<I', buf, body)[0]
+            elif chunk_id == b'data':
+                self.data_size = chunk_size
+            elif chunk_id == b'cue ':
+                self.parse_cue_chunk(bytes(buf[body:body+available]))
+            elif chunk_id == b'LIST':
+                self.parse_list_chunk(bytes(buf[body:body+available]))
+
+            offset = body + chunk_size + (chunk_size % 2)
+
+        if self.audio_format in (0x0001, 0xFFFE) and self.block_align:
+            self.total_samples = self.data_size // self.block_align
+        elif self.audio_format == 0xFFFF:
+            self.total_samples = self._vorb_samples
+
+        self._log(f"Final analysis result:")
+        self._log(f"  Sample rate: {self.sample_rate} Hz")
+        self._log(f"  Channels: {self.channels}")
+        self._log(f"  Cue points: {len(self.cue_points)}")
+        self._log(f"  Labels: {len(self.labels)}")
+
+        for cue in self.cue_points:
+            if self.sample_rate > 0:
+                calc_time = cue.position / self.sample_rate
+                self._log(f"  Cue {cue.id}: {cue.position} samples = {calc_time:.3f} seconds")
+
+        return True
+
+    def audio_info(self):
+        """Audio info in the get_wem_audio_info() layout, or None if the codec needs vgmstream."""
+        if self.sample_rate <= 0 or self.total_samples <= 0:
+            return None
+        duration_ms = int((self.total_samples / self.sample_rate) * 1000)
+        return {
+            'sample_rate': self.sample_rate,
+            'channels': self.channels,
+            'samples': self.total_samples,
+            'duration_ms': duration_ms,
+            'bitrate': int((self.file_size * 8) / (duration_ms / 1000)) if duration_ms > 0 else 0,
+            'format': self.CODEC_NAMES.get(self.audio_format, f"0x{self.audio_format:04X}"),
+        }
     def get_markers_info(self):
         markers = []
         sorted_cues = sorted(self.cue_points, key=lambda x: x.position)
@@ -5580,7 +4992,7 @@ class SubtitleLoaderThread(QtCore.QThread):
     
     def __init__(self, parent, all_subtitle_files, locres_manager, subtitles, original_subtitles, 
                  selected_lang, selected_category, orphaned_only, modified_only, with_audio_only, 
-                 search_text, audio_keys_cache, modified_subtitles):
+                 search_keys, audio_keys_cache, modified_subtitles):
         super().__init__(parent)
         self.all_subtitle_files = all_subtitle_files
         self.locres_manager = locres_manager
@@ -5591,7 +5003,7 @@ class SubtitleLoaderThread(QtCore.QThread):
         self.orphaned_only = orphaned_only
         self.modified_only = modified_only
         self.with_audio_only = with_audio_only
-        self.search_text = search_text.lower().strip()
+        self.search_keys = search_keys
         self.audio_keys_cache = audio_keys_cache
         self.modified_subtitles = modified_subtitles
         self._should_stop = False
@@ -5651,11 +5063,8 @@ class SubtitleLoaderThread(QtCore.QThread):
                         if self.modified_only and not is_modified:
                             continue
 
-                        if self.search_text:
-                            if (self.search_text not in sub_key.lower() and 
-                                self.search_text not in sub_value.lower() and
-                                self.search_text not in current_text.lower()):
-                                continue
+                        if self.search_keys is not None and sub_key not in self.search_keys:
+                            continue
                         
                         subtitles_to_show[sub_key] = {
                             'original': sub_value,
@@ -5690,12 +5099,8 @@ class SubtitleLoaderThread(QtCore.QThread):
                     if self.modified_only and not is_modified:
                         continue
                     
-                    if self.search_text:
-                        original_text = self.original_subtitles.get(sub_key, "")
-                        if (self.search_text not in sub_key.lower() and 
-                            self.search_text not in sub_value.lower() and
-                            self.search_text not in original_text.lower()):
-                            continue
+                    if self.search_keys is not None and sub_key not in self.search_keys:
+                        continue
                     
                     if self.selected_category != "All Categories" or self.selected_lang != "All Languages":
   
@@ -6094,10 +5499,105 @@ class AppSettings:
         except Exception as e:
             DEBUG.log(f"Failed to save settings: {e}", "ERROR")
 
+class PcmRingBuffer:
+    """Bounded byte ring between a decoder thread and the audio output.
+
+    write() blocks while the ring is full, which throttles the decoder to
+    playback speed; read() never blocks and returns what is buffered.
+    """
+
+    def __init__(self, capacity: int):
+        self._data = bytearray(capacity)
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+        self._closed = False
+        self.eof = False
+        self._cond = threading.Condition()
+
+    def write(self, chunk) -> bool:
+        """Append chunk, waiting for space; False once the ring was closed."""
+        view = memoryview(chunk)
+        while len(view):
+            with self._cond:
+                while self._size == self._capacity and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return False
+                count = min(len(view), self._capacity - self._size)
+                end = (self._start + self._size) % self._capacity
+                first = min(count, self._capacity - end)
+                self._data[end:end + first] = view[:first]
+                self._data[:count - first] = view[first:count]
+                self._size += count
+            view = view[count:]
+        return True
+
+    def read(self, max_bytes: int) -> bytes:
+        with self._cond:
+            count = min(max_bytes, self._size)
+            first = min(count, self._capacity - self._start)
+            data = bytes(self._data[self._start:self._start + first]) + bytes(self._data[:count - first])
+            self._start = (self._start + count) % self._capacity
+            self._size -= count
+            self._cond.notify_all()
+            return data
+
+    def finish(self):
+        """Mark the end of the decoded stream."""
+        with self._cond:
+            self.eof = True
+            self._cond.notify_all()
+
+    def close(self):
+        """Unblock and stop the writer."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def drained(self) -> bool:
+        with self._cond:
+            return self.eof and self._size == 0
+
+def read_wav_stream_header(stream):
+    """Consume a WAV header from a pipe up to the data chunk; returns (channels, sample_rate, bits)."""
+    def read_exact(count):
+        data = b""
+        while len(data) < count:
+            chunk = stream.read(count - len(data))
+            if not chunk:
+                raise EOFError("WAV stream ended inside its header")
+            data += chunk
+        return data
+
+    if read_exact(12)[8:12] != b'WAVE':
+        raise ValueError("Decoder output is not a WAV stream")
+    fmt = None
+    while True:
+        chunk_id, chunk_size = struct.unpack('<4sI', read_exact(8))
+        if chunk_id == b'data':
+            break
+        body = read_exact(chunk_size + (chunk_size % 2))
+        if chunk_id == b'fmt ':
+            fmt = struct.unpack_from('<HHIIHH', body)
+    if fmt is None:
+        raise ValueError("WAV stream has no fmt chunk")
+    return fmt[1], fmt[2], fmt[5]
+
 class AudioPlayer(QtCore.QObject):
+    """Plays decoded WAV files through QMediaPlayer, or decoder pipes through QAudioOutput.
+
+    play_stream() starts playback as soon as the decoder emits its header: a
+    reader thread moves the decoder's stdout into a PcmRingBuffer and a timer
+    feeds QAudioOutput from it. Seeking a stream restarts the decoder at the
+    requested offset.
+    """
     stateChanged = QtCore.pyqtSignal(int)
     positionChanged = QtCore.pyqtSignal(int)
     durationChanged = QtCore.pyqtSignal(int)
+
+    STREAM_BUFFER_SECONDS = 2
     
     def __init__(self):
         super().__init__()
@@ -6106,27 +5606,145 @@ class AudioPlayer(QtCore.QObject):
         self.player.stateChanged.connect(self.stateChanged.emit)
         self.player.positionChanged.connect(self.positionChanged.emit)
         self.player.durationChanged.connect(self.durationChanged.emit)
+
+        self._output = None
+        self._device = None
+        self._process = None
+        self._ring = None
+        self._reader = None
+        self._frame_bytes = 0
+        self._stream_command = None
+        self._stream_offset_ms = 0
+        self._stream_duration_ms = 0
+        self._feed_timer = QtCore.QTimer(self)
+        self._feed_timer.setInterval(10)
+        self._feed_timer.timeout.connect(self._feed_stream)
         
     def play(self, filepath):
+        self._stop_stream()
         url = QtCore.QUrl.fromLocalFile(filepath)
         content = QtMultimedia.QMediaContent(url)
         self.player.setMedia(content)
         self.player.play()
+
+    def play_stream(self, command, duration_ms, start_ms=0):
+        """Play the WAV a decoder writes to stdout; command(start_ms) returns its argv."""
+        self.player.stop()
+        self._stop_stream()
+
+        process = subprocess.Popen(command(start_ms), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                   startupinfo=startupinfo, creationflags=CREATE_NO_WINDOW)
+        try:
+            channels, sample_rate, bits = read_wav_stream_header(process.stdout)
+        except Exception:
+            process.kill()
+            process.wait()
+            raise
+
+        audio_format = QtMultimedia.QAudioFormat()
+        audio_format.setSampleRate(sample_rate)
+        audio_format.setChannelCount(channels)
+        audio_format.setSampleSize(bits)
+        audio_format.setCodec("audio/pcm")
+        audio_format.setByteOrder(QtMultimedia.QAudioFormat.LittleEndian)
+        audio_format.setSampleType(QtMultimedia.QAudioFormat.UnSignedInt if bits == 8 else QtMultimedia.QAudioFormat.SignedInt)
+
+        self._frame_bytes = channels * bits // 8
+        self._ring = PcmRingBuffer(sample_rate * self._frame_bytes * self.STREAM_BUFFER_SECONDS)
+        self._process = process
+        self._stream_command = command
+        self._stream_offset_ms = start_ms
+        self._stream_duration_ms = duration_ms
+        self._reader = threading.Thread(target=self._read_stream, args=(process, self._ring), daemon=True)
+        self._reader.start()
+
+        self._output = QtMultimedia.QAudioOutput(audio_format, self)
+        self._device = self._output.start()
+        self._feed_timer.start()
+        self.durationChanged.emit(duration_ms)
+        self.stateChanged.emit(QtMultimedia.QMediaPlayer.PlayingState)
+
+    @staticmethod
+    def _read_stream(process, ring):
+        try:
+            while True:
+                chunk = process.stdout.read(16384)
+                if not chunk or not ring.write(chunk):
+                    break
+        except (OSError, ValueError):
+            pass
+        finally:
+            ring.finish()
+
+    def _feed_stream(self):
+        if self._output is None:
+            return
+        free = self._output.bytesFree()
+        free -= free % self._frame_bytes
+        if free > 0:
+            data = self._ring.read(free)
+            if data:
+                self._device.write(data)
+        self.positionChanged.emit(self.position())
+        if self._ring.drained and self._output.state() == QtMultimedia.QAudio.IdleState:
+            self._stop_stream()
+            self.stateChanged.emit(QtMultimedia.QMediaPlayer.StoppedState)
+
+    def _stop_stream(self):
+        self._feed_timer.stop()
+        if self._ring is not None:
+            self._ring.close()
+        if self._process is not None:
+            if self._process.poll() is None:
+                self._process.kill()
+            self._process.wait()
+        if self._reader is not None:
+            self._reader.join()
+        if self._process is not None:
+            self._process.stdout.close()
+        if self._output is not None:
+            self._output.stop()
+            self._output.deleteLater()
+        self._output = self._device = self._process = self._ring = self._reader = None
+
+    @property
+    def is_streaming(self):
+        return self._output is not None
         
     def stop(self):
+        self._stop_stream()
         self.player.stop()
         
     def pause(self):
-        self.player.pause()
+        if self.is_streaming:
+            self._output.suspend()
+        else:
+            self.player.pause()
         
     def resume(self):
-        self.player.play()
+        if self.is_streaming:
+            self._output.resume()
+        else:
+            self.player.play()
         
     def set_position(self, position):
-        self.player.setPosition(position)
+        if self.is_streaming:
+            self.play_stream(self._stream_command, self._stream_duration_ms, max(0, position))
+        else:
+            self.player.setPosition(position)
+
+    def position(self):
+        if self.is_streaming:
+            return self._stream_offset_ms + self._output.processedUSecs() // 1000
+        return self.player.position()
+
+    def duration(self):
+        return self._stream_duration_ms if self.is_streaming else self.player.duration()
         
     @property
     def is_playing(self):
+        if self.is_streaming:
+            return self._output.state() in (QtMultimedia.QAudio.ActiveState, QtMultimedia.QAudio.IdleState)
         return self.player.state() == QtMultimedia.QMediaPlayer.PlayingState
 class ClickableProgressBar(QtWidgets.QProgressBar):
     """A progress bar that allows seeking by clicking on it."""
@@ -6164,6 +5782,8 @@ class WavToWemConverter(QtCore.QObject):
         self.output_folder = ""
         self.conversion_cache = {}
         self.adaptive_mode = False  
+        self.bnk_transaction = None
+        self.bnk_files_info = None
          
     def reset_state(self):
         """Reset converter state after stop or error"""
@@ -6210,40 +5830,35 @@ class WavToWemConverter(QtCore.QObject):
             self.parent.append_conversion_log(f"  ✓ Created WEM: {new_wem_size:,} bytes")
 
             self.parent.append_conversion_log("Searching and modifying BNK files...")
-            bnk_files_info = self.parent.find_relevant_bnk_files()
+            bnk_files_info = self.bnk_files_info
+            refresh = bnk_files_info is None
+            if bnk_files_info is None:
+                bnk_files_info = self.parent.find_relevant_bnk_files()
+                if self.bnk_transaction is not None:
+                    # Inside a batch the banks are listed and re-validated once for all files
+                    self.parent.bnk_index.refresh(bnk_files_info)
+                    self.bnk_files_info = bnk_files_info
+                    refresh = False
             
             if not bnk_files_info:
                 raise Exception("BNK Files for modifications not found in Wems")
 
-            bnk_modified = False
-            for bnk_path, bnk_type in bnk_files_info:
-
-                original_editor = BNKEditor(bnk_path)
-                if not original_editor.find_sound_by_source_id(source_id):
-                    continue
-
-                if bnk_type == 'sfx':
-                    rel_path = os.path.relpath(bnk_path, os.path.join(self.parent.base_path, "Wems", "SFX"))
-                    mod_bnk_path = os.path.join(self.parent.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-                else: # 'lang'
-                    rel_path = os.path.relpath(bnk_path, os.path.join(self.parent.base_path, "Wems"))
-                    mod_bnk_path = os.path.join(self.parent.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-
-                source_bnk_for_edit = mod_bnk_path
-                if not os.path.exists(source_bnk_for_edit):
-                    os.makedirs(os.path.dirname(source_bnk_for_edit), exist_ok=True)
-                    shutil.copy2(bnk_path, source_bnk_for_edit)
-                
-                editor = BNKEditor(source_bnk_for_edit)
-                
-                if editor.modify_sound(source_id, new_size=new_wem_size, find_by_size=None):
-                    editor.save_file()
-                    self.parent.invalidate_bnk_cache(source_id)
-                    self.parent.append_conversion_log(f"  ✓ Updated {os.path.basename(mod_bnk_path)}: ID {source_id} -> {new_wem_size} bytes")
-                    bnk_modified = True
-                    break
+            owners = self.parent.find_bnk_owners(source_id, bnk_files_info, refresh=refresh)
+            if owners:
+                # A missing mod bank is created by copy-then-patch from the original
+                bnk_path, bnk_type, _ = owners[0]
+                mod_bnk_path = self.parent.get_mod_bnk_path(bnk_path, bnk_type)
+                mod_bnk_name = os.path.basename(mod_bnk_path)
 
-            if not bnk_modified:
+                if self.bnk_transaction is not None:
+                    self.bnk_transaction.add(mod_bnk_path, source_id, new_size=new_wem_size, source_bnk_path=bnk_path)
+                    self.parent.append_conversion_log(f"  ✓ Queued {mod_bnk_name} update: ID {source_id} -> {new_wem_size} bytes")
+                else:
+                    bnk_transaction = self.parent.new_bnk_transaction()
+                    bnk_transaction.add(mod_bnk_path, source_id, new_size=new_wem_size, source_bnk_path=bnk_path)
+                    self.parent.commit_bnk_transaction(bnk_transaction)
+                    self.parent.append_conversion_log(f"  ✓ Updated {mod_bnk_name}: ID {source_id} -> {new_wem_size} bytes")
+            else:
                 self.parent.append_conversion_log(f"  ✗ Warning: ID {source_id} not found in any BNK. Size not updated.", "WARNING")
 
             return {
@@ -7081,6 +6696,9 @@ class WavToWemConverter(QtCore.QObject):
                     }
                     self.conversion_finished.emit([error_result])
                     return
+
+                # BNK size updates are collected for the whole batch and written once per bank
+                self.bnk_transaction = self.parent.new_bnk_transaction()
                 
                 for i, file_pair in enumerate(self.file_pairs):
            
@@ -7106,6 +6724,8 @@ class WavToWemConverter(QtCore.QObject):
                     
                     if self.should_stop:
                         break
+
+                self.commit_bnk_updates(results)
                 
                 self.conversion_finished.emit(results)
                 
@@ -7116,6 +6736,30 @@ class WavToWemConverter(QtCore.QObject):
                     'result': {'success': False, 'error': f'Conversion thread error: {str(e)}'}
                 }
                 self.conversion_finished.emit([error_result])
+            finally:
+                self.bnk_transaction = None
+                self.bnk_files_info = None
+
+    def commit_bnk_updates(self, results):
+        """Write the BNK updates queued during a batch; a failed commit fails the BNK conversions."""
+        bnk_transaction = self.bnk_transaction
+        self.bnk_transaction = None
+        if not bnk_transaction:
+            return
+
+        self.status_updated.emit(f"Updating BNK files ({len(bnk_transaction)} entries)...", "blue")
+        try:
+            commit_results = self.parent.commit_bnk_transaction(bnk_transaction)
+            for mod_bnk_path, applied in commit_results.items():
+                self.parent.append_conversion_log(f"  ✓ Updated {os.path.basename(mod_bnk_path)}: {len(applied)} entries")
+        except Exception as e:
+            DEBUG.log(f"BNK batch update failed, no BNK was changed: {e}", "ERROR")
+            self.parent.append_conversion_log(f"  ✗ BNK update failed, no BNK was changed: {e}", "ERROR")
+            for item in results:
+                result = item['result']
+                if result.get('success') and result.get('conversion', '').startswith('BNK Overwrite'):
+                    result['success'] = False
+                    result['error'] = f'BNK update failed: {str(e)}'
         
     def cleanup_temp_directories(self, temp_dirs):
         self.status_updated.emit("Cleaning up temporary files...", "blue")
@@ -7244,7 +6888,7 @@ class AudioTrimDialog(QtWidgets.QDialog):
         self.setMinimumSize(800, 450)
         
         self.ffmpeg_path = AudioToWavConverter().find_ffmpeg()
-        if not self.ffmpeg_path or not MATPLOTLIB_AVAILABLE:
+        if not self.ffmpeg_path or not NUMPY_AVAILABLE:
             msg = self.tr("trim_deps_missing")
             QtWidgets.QMessageBox.critical(self, self.tr("error"), msg)
 
@@ -7553,6 +7197,7 @@ class AudioTrimDialog(QtWidgets.QDialog):
             target_path = self.parent.get_mod_path(file_id, self.lang)
             os.makedirs(os.path.dirname(target_path), exist_ok=True)
             shutil.copy2(conversion_result['output_path'], target_path)
+            self.parent.get_mod_audio_index().note_written(target_path)
 
             self.update_progress(100, self.tr("status_complete"))
             QtCore.QMetaObject.invokeMethod(self, "show_success", QtCore.Qt.QueuedConnection)
@@ -7638,7 +7283,8 @@ class WaveformWidget(QtWidgets.QWidget):
         self.viewChanged.emit(0, self.duration_ms)
 
     def set_waveform(self, wav_path):
-        if not MATPLOTLIB_AVAILABLE:
+        np = get_numpy()
+        if np is None:
             self.audio_data = None
             self.update()
             return
@@ -7764,8 +7410,8 @@ class WaveformWidget(QtWidgets.QWidget):
                         if start >= len(visible_data): break
                         
                         chunk = visible_data[start:end]
-                        min_val = np.min(chunk)
-                        max_val = np.max(chunk)
+                        min_val = chunk.min()
+                        max_val = chunk.max()
                         
                         y_max = half_h - max_val * half_h
                         y_min = half_h - min_val * half_h
@@ -7817,74 +7463,81 @@ class WaveformWidget(QtWidgets.QWidget):
         if event.button() == QtCore.Qt.LeftButton:
             self.is_selecting = False     
 class WemScannerThread(QtCore.QThread):
-    """A thread to scan for orphaned WEM files and return them as a list."""
+    """Runs an OrphanWemScanner pass and streams newly found orphans to the UI."""
+    entry_found = QtCore.pyqtSignal(dict)
     scan_finished = QtCore.pyqtSignal(list)
 
-    def __init__(self, wem_root, known_ids, parent=None):
+    def __init__(self, scanner, known_ids, state=None, parent=None):
         super().__init__(parent)
-        self.wem_root = wem_root
+        self.scanner = scanner
         self.known_ids = known_ids
+        self.state = state
         self._is_running = True
 
     def run(self):
-        orphaned_entries = []
-        if not os.path.exists(self.wem_root):
-            self.scan_finished.emit([])
+        result = self.scanner.scan(self.known_ids, self.state,
+                                   should_stop=lambda: not self._is_running,
+                                   on_entry=self.entry_found.emit)
+        if result is None:
             return
+        orphaned_entries, self.state = result
+        self.scan_finished.emit(orphaned_entries)
 
-        for root, _, files in os.walk(self.wem_root):
-            if not self._is_running:
-                break
-                
-            rel_path = os.path.relpath(root, self.wem_root)
-            parts = rel_path.split(os.sep)
-            
-            lang = "SFX"
-            if rel_path == '.' or rel_path == "SFX":
-                lang = "SFX"
-            elif parts[0] == "Media":
-                if len(parts) > 1:
-                    lang = parts[1] 
-                else:
-                    lang = "SFX"
-            else:
-                lang = rel_path
+    def stop(self):
+        self._is_running = False
 
-            for file in files:
-                if not self._is_running:
-                    break
-                if not file.lower().endswith('.wem'):
-                    continue
+class WemCatalogThread(QtCore.QThread):
+    """Brings the WemCatalog up to date for the game and mod audio folders."""
+    progress_updated = QtCore.pyqtSignal(int, int)
+    refresh_finished = QtCore.pyqtSignal(int)
 
-                file_id = os.path.splitext(file)[0]
-                if file_id in self.known_ids:
-                    continue
+    def __init__(self, catalog, roots, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.roots = roots
+        self._is_running = True
 
-                full_path = os.path.join(root, file)
-                
-                short_name = f"{file_id}.wav"
-                try:
-                    analyzer = WEMAnalyzer(full_path)
-                    if analyzer.analyze():
-                        markers = analyzer.get_markers_info()
-                        if markers and markers[0]['label']:
-                            short_name = f"{markers[0]['label']}.wav"
-                except Exception:
-                    pass
+    def run(self):
+        try:
+            count = self.catalog.refresh(self.roots, should_stop=lambda: not self._is_running,
+                                         progress=self.progress_updated.emit)
+        except Exception as e:
+            DEBUG.log(f"WEM catalogue refresh failed: {e}", "ERROR")
+            count = 0
+        self.refresh_finished.emit(count)
 
-                new_entry = {
-                    "Id": file_id,
-                    "Language": lang,
-                    "ShortName": short_name, 
-                    "Path": file, 
-                    "Source": "ScannedFromFileSystem"
-                }
-                orphaned_entries.append(new_entry)
-        
-        self.scan_finished.emit(orphaned_entries)
+    def stop(self):
+        self._is_running = False
+
+class AudioFilterThread(QtCore.QThread):
+    """Filters and sorts one language tab's entries for populate_tree.
+
+    Results carry the generation they were requested under so the app can
+    drop the output of a request that a newer keystroke has superseded.
+    """
+    filtered = QtCore.pyqtSignal(str, int, object)
+
+    def __init__(self, wem_app, lang, options, generation, parent=None):
+        super().__init__(parent)
+        self.wem_app = wem_app
+        self.lang = lang
+        self.options = options
+        self.generation = generation
+        self._is_running = True
+
+    def run(self):
+        try:
+            result = self.wem_app.filter_audio_entries(self.lang, self.options,
+                                                       should_stop=lambda: not self._is_running)
+        except Exception as e:
+            DEBUG.log(f"Filtering {self.lang} entries failed: {e}", "ERROR")
+            return
+        if result is not None and self._is_running:
+            filtered_entries, mod_audio_ids = result
+            self.filtered.emit(self.lang, self.generation, (self.options, filtered_entries, mod_audio_ids))
 
     def stop(self):
-        self._is_running = False       
+        self._is_running = False
 class ProfileDialog(QtWidgets.QDialog):
     def __init__(self, parent=None, existing_data=None, translator=None):
         super().__init__(parent)
@@ -8642,6 +8295,8 @@ class SaveSubtitlesThread(QtCore.QThread):
         return None
 class WemSubtitleApp(QtWidgets.QMainWindow):
     log_signal = QtCore.pyqtSignal(str, str)
+    # WEMs at least this long are streamed rather than decoded to a file first
+    STREAM_MIN_DURATION_MS = 8000
     def __init__(self):
         super().__init__()
         DEBUG.log("=== Mercedes's Outlast Trials Audio Editor Starting ===")
@@ -8691,6 +8346,11 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.orphaned_cache_path = os.path.join(self.base_path, "orphaned_files_cache.json")
         self.check_required_files()
         self.orphaned_files_cache = []
+        self.orphan_scan_state = None
+        self.scanner_thread = None
+        self.scan_message_box = None
+        self.audio_filter_threads = []
+        self.audio_filter_generation = {}
         DEBUG.log(f"Paths configured:")
         DEBUG.log(f"  data_path: {self.data_path}")
         DEBUG.log(f"  unreal_locres_path: {self.unreal_locres_path}")
@@ -8702,8 +8362,11 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.original_subtitles = {}
         self.all_subtitle_files = {}
         self.key_to_file_map = {}
+        self.search_index = SearchIndex(self)
+        self.soundbanks_catalog = SoundbanksCatalog(os.path.join(self.data_path, "soundbanks_cache.pickle"))
         self.all_files = self.load_all_soundbank_files(self.soundbanks_path)
         self.entries_by_lang = self.group_by_language()
+        self.audio_key_index = None
         self.show_orphans_checkbox = QtWidgets.QCheckBox("Show Scanned Files")
         self.show_orphans_checkbox.setToolTip("Show/hide audio files found by scanning the 'Wems' folder that are not in the main database.")
         self.show_orphans_checkbox.setChecked(self.settings.data.get("show_orphaned_files", False))
@@ -8734,8 +8397,18 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.auto_save_timer = QtCore.QTimer()
         self.auto_save_timer.timeout.connect(self.auto_save_subtitles)
         self.auto_save_enabled = False  
-        self.bnk_cache_orig = {}
-        self.bnk_cache_mod = {}
+        self.bnk_index = BnkSourceIndex(os.path.join(self.data_path, "bnk_index.json"))
+        self.mod_audio_index = ModAudioIndex()
+        self.embedded_media_index = EmbeddedMediaIndex(self.wem_root)
+        self.wem_catalog = WemCatalog(os.path.join(self.data_path, "wem_catalog.sqlite3"), self._catalog_probe)
+        self.decode_service = WavDecodeService(partial(self.wem_to_wav_vgmstream, timeout=60),
+                                               self.settings.data.get("decode_workers"))
+        wav_cache_prefix = "OutlastTrialsAudioEditor_wav_"
+        DecodedWavCache.purge_stale(tempfile.gettempdir(), wav_cache_prefix)
+        self.wav_cache = DecodedWavCache(os.path.join(tempfile.gettempdir(), f"{wav_cache_prefix}{os.getpid()}"),
+                                         int(self.settings.data.get("wav_cache_mb", 512)) * 1024 * 1024)
+        self.catalog_thread = None
+        self.bnk_delta = None
         self.bnk_loader_thread = None
         self.first_show_check_done = False
         self.current_bnk_request_id = 0
@@ -8935,108 +8608,137 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.verification_thread.start()
 
     
-    def _verify_batch(self, wem_files, id_to_entry_map, bnk_files_info):
-        mismatches = []
-        bnk_editor_cache = {} 
-        
-        for wem_path in wem_files:
-            wem_name = os.path.basename(wem_path)
-            
-            try:
-                file_id = os.path.splitext(wem_name)[0]
+    def _shard_banks_for_verification(self, work, shard_count):
+        """Split {mod_bnk_path: [source_id]} into shard_count lists of similar total bank size."""
+        shards = [[] for _ in range(shard_count)]
+        loads = [0] * shard_count
+        for mod_bnk_path in sorted(work, key=lambda p: os.path.getsize(p), reverse=True):
+            target = loads.index(min(loads))
+            shards[target].append((mod_bnk_path, work[mod_bnk_path]))
+            loads[target] += os.path.getsize(mod_bnk_path)
+        return [shard for shard in shards if shard]
+
+    def _verify_mod_integrity_thread(self, progress):
+        try:
+            QtCore.QMetaObject.invokeMethod(progress, "set_progress", QtCore.Qt.QueuedConnection,
+                                            QtCore.Q_ARG(int, 5), QtCore.Q_ARG(str, "Scanning modified audio files..."))
+
+            mod_audio_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows")
+            wem_files = {}
+            if os.path.exists(mod_audio_path):
+                for root, _, files in os.walk(mod_audio_path):
+                    for file in files:
+                        file_id, ext = os.path.splitext(file)
+                        if ext.lower() == '.wem' and file_id.isdigit():
+                            wem_files[file_id] = os.path.join(root, file)
+
+            id_to_entry_map = {str(entry.get("Id")): entry for entry in self.all_files}
+            bnk_files_info = self.find_relevant_bnk_files()
+            self.bnk_index.refresh(bnk_files_info)
+
+            QtCore.QMetaObject.invokeMethod(progress, "set_progress", QtCore.Qt.QueuedConnection,
+                                            QtCore.Q_ARG(int, 15), QtCore.Q_ARG(str, "Locating SoundBanks..."))
+
+            # Candidate mod banks per WEM, in owner order; the first bank holding the entry wins.
+            # Banks kept as delta overrides are answered from the BNK index without parsing.
+            bnk_delta = self.get_bnk_delta()
+            bank_sizes = {}
+            candidates = {}
+            work = {}
+            for file_id, wem_path in wem_files.items():
+                if file_id not in id_to_entry_map:
+                    continue
                 source_id = int(file_id)
-            except ValueError:
-                continue
+                mod_bnk_paths = []
+                for bnk_path, bnk_type, original_entry in self.find_bnk_owners(source_id, bnk_files_info, refresh=False):
+                    mod_bnk_path = self.get_mod_bnk_path(bnk_path, bnk_type)
+                    if mod_bnk_path in mod_bnk_paths:
+                        continue
+                    if bnk_delta.has_bank(mod_bnk_path):
+                        mod_bnk_paths.append(mod_bnk_path)
+                        bank_sizes.setdefault(mod_bnk_path, {})[source_id] = bnk_delta.entry(mod_bnk_path, original_entry).file_size
+                    elif os.path.exists(mod_bnk_path):
+                        mod_bnk_paths.append(mod_bnk_path)
+                        work.setdefault(mod_bnk_path, []).append(source_id)
+                candidates[file_id] = mod_bnk_paths
+
+            workers = min(os.cpu_count() or 1, 61, max(len(work), 1))
+            shards = self._shard_banks_for_verification(work, min(len(work), workers * 4)) if work else []
+            DEBUG.log(f"Verifying {len(candidates)} WEM files against {len(work)} mod BNK files "
+                      f"in {len(shards)} shards on {workers} processes")
+
+            pending = list(range(len(shards)))
+
+            def shard_done(index, result):
+                bank_sizes.update(result)
+                pending.remove(index)
+                done = len(shards) - len(pending)
+                QtCore.QMetaObject.invokeMethod(progress, "set_progress", QtCore.Qt.QueuedConnection,
+                                                QtCore.Q_ARG(int, 20 + int(done / len(shards) * 75)),
+                                                QtCore.Q_ARG(str, f"Verified {done} of {len(shards)} BNK batches..."))
 
-            entry = id_to_entry_map.get(file_id)
-            if not entry:
-                continue
-            
-            real_wem_size = os.path.getsize(wem_path)
-            
-            bnk_info, mod_bnk_path = self._find_bnk_for_entry_with_cache(
-                entry, bnk_files_info, bnk_editor_cache
-            )
+            if workers > 1 and len(shards) > 1:
+                try:
+                    with ProcessPoolExecutor(max_workers=workers) as pool:
+                        futures = {pool.submit(verify_bnk_shard, shards[index]): index for index in pending}
+                        for future in as_completed(futures):
+                            shard_done(futures[future], future.result())
+                except Exception as e:
+                    DEBUG.log(f"Process pool unavailable, verifying remaining banks in this process: {e}", "WARNING")
 
-            if bnk_info:
-                if bnk_info.file_size != real_wem_size:
-                    mismatches.append({
-                        "type": "Size Mismatch",
-                        "bnk_path": mod_bnk_path,
-                        "source_id": source_id,
-                        "short_name": entry.get("ShortName", wem_name),
-                        "bnk_size": bnk_info.file_size,
-                        "wem_size": real_wem_size
-                    })
-            else:
-                source_type = entry.get("Source", "")
-                if source_type not in ["StreamedFiles", "MediaFilesNotInAnyBank"]:
+            for index in list(pending):
+                shard_done(index, verify_bnk_shard(shards[index]))
+
+            mismatches = []
+            for file_id, mod_bnk_paths in candidates.items():
+                source_id = int(file_id)
+                entry = id_to_entry_map[file_id]
+                wem_path = wem_files[file_id]
+                real_wem_size = os.path.getsize(wem_path)
+
+                mod_bnk_path = next((path for path in mod_bnk_paths if source_id in bank_sizes.get(path, {})), None)
+                if mod_bnk_path:
+                    bnk_size = bank_sizes[mod_bnk_path][source_id]
+                    if bnk_size != real_wem_size:
+                        mismatches.append({
+                            "type": "Size Mismatch",
+                            "bnk_path": mod_bnk_path,
+                            "source_id": source_id,
+                            "short_name": entry.get("ShortName", os.path.basename(wem_path)),
+                            "bnk_size": bnk_size,
+                            "wem_size": real_wem_size
+                        })
+                elif entry.get("Source", "") not in ["StreamedFiles", "MediaFilesNotInAnyBank"]:
                     mismatches.append({
                         "type": "BNK Entry Missing",
                         "bnk_path": "N/A",
                         "source_id": source_id,
-                        "short_name": entry.get("ShortName", wem_name),
+                        "short_name": entry.get("ShortName", os.path.basename(wem_path)),
                         "bnk_size": "N/A",
                         "wem_size": real_wem_size
                     })
-        
-        return mismatches, len(wem_files)
-
-    def _find_bnk_for_entry_with_cache(self, entry, bnk_files_info, cache):
-        source_id = int(entry.get("Id"))
-        
-        for bnk_path, bnk_type in bnk_files_info:
-            if bnk_path not in cache:
-                try:
-                    cache[bnk_path] = BNKEditor(bnk_path)
-                except Exception:
-                    continue
-            
-            original_bnk = cache[bnk_path]
-            if not original_bnk.find_sound_by_source_id(source_id):
-                continue
-            
-            if bnk_type == 'sfx':
-                rel_path = os.path.relpath(bnk_path, os.path.join(self.base_path, "Wems", "SFX"))
-                mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-            else:
-                rel_path = os.path.relpath(bnk_path, os.path.join(self.base_path, "Wems"))
-                if rel_path.startswith("Windows"): rel_path = os.path.relpath(bnk_path, os.path.join(self.wem_root, "Windows"))
 
-                mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
+            DEBUG.log(f"Mod integrity verification found {len(mismatches)} issues")
+            QtCore.QMetaObject.invokeMethod(progress, "close", QtCore.Qt.QueuedConnection)
+            QtCore.QMetaObject.invokeMethod(self, "_show_bnk_verification_report", QtCore.Qt.QueuedConnection,
+                                            QtCore.Q_ARG(list, mismatches))
 
-            if os.path.exists(mod_bnk_path):
-                if mod_bnk_path not in cache:
-                    try:
-                        cache[mod_bnk_path] = BNKEditor(mod_bnk_path)
-                    except Exception:
-                        continue
-                
-                mod_editor = cache[mod_bnk_path]
-                entries = mod_editor.find_sound_by_source_id(source_id)
-                if entries:
-                    return entries[0], mod_bnk_path
-        
-        return None, None
+        except Exception as e:
+            DEBUG.log(f"Mod integrity verification error: {e}\n{traceback.format_exc()}", "ERROR")
+            QtCore.QMetaObject.invokeMethod(progress, "close", QtCore.Qt.QueuedConnection)
+            QtCore.QMetaObject.invokeMethod(self, "_show_bnk_verification_error", QtCore.Qt.QueuedConnection,
+                                            QtCore.Q_ARG(str, str(e)))
 
     def _find_bnk_for_entry_optimized(self, entry, modified_bnks, bnk_editor_cache):
         source_id = int(entry.get("Id"))
+        bnk_files_info = [(bnk_path, bnk_type) for bnk_path, (_, bnk_type) in modified_bnks.items()]
         
-        for bnk_path, (mod_bnk_path, bnk_type) in modified_bnks.items():
-
-            if bnk_path not in bnk_editor_cache:
-                try:
-                    bnk_editor_cache[bnk_path] = BNKEditor(bnk_path)
-                except Exception:
-                    continue
-            
-            original_bnk = bnk_editor_cache[bnk_path]
-            if not original_bnk.find_sound_by_source_id(source_id):
-                continue
+        for bnk_path, bnk_type, _ in self.find_bnk_owners(source_id, bnk_files_info):
+            mod_bnk_path = modified_bnks[bnk_path][0]
             
             if mod_bnk_path not in bnk_editor_cache:
                 try:
-                    bnk_editor_cache[mod_bnk_path] = BNKEditor(mod_bnk_path)
+                    bnk_editor_cache[mod_bnk_path] = self.open_mod_bank(mod_bnk_path)
                 except Exception:
                     continue
             
@@ -9049,24 +8751,13 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
 
     def _find_bnk_for_entry(self, entry):
         source_id = int(entry.get("Id"))
-        
-        bnk_files_info = self.find_relevant_bnk_files()
 
-        for bnk_path, bnk_type in bnk_files_info:
-            original_bnk = BNKEditor(bnk_path)
-            if not original_bnk.find_sound_by_source_id(source_id):
-                continue
-            
-            if bnk_type == 'sfx':
-                rel_path = os.path.relpath(bnk_path, os.path.join(self.base_path, "Wems", "SFX"))
-                mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-            else:
-                rel_path = os.path.relpath(bnk_path, os.path.join(self.base_path, "Wems"))
-                mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
+        for bnk_path, bnk_type, _ in self.find_bnk_owners(source_id):
+            mod_bnk_path = self.get_mod_bnk_path(bnk_path, bnk_type)
 
-            if os.path.exists(mod_bnk_path):
-                mod_editor = BNKEditor(mod_bnk_path)
-                entries = mod_editor.find_sound_by_source_id(source_id)
+            if self.mod_bank_exists(mod_bnk_path):
+                with self.open_mod_bank(mod_bnk_path) as mod_editor:
+                    entries = mod_editor.find_sound_by_source_id(source_id)
                 if entries:
                     return entries[0], mod_bnk_path
         
@@ -9076,14 +8767,25 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         if not self.ensure_active_profile():
             return
 
-        reply = QtWidgets.QMessageBox.question(self, self.tr("rebuild_bnk_confirm_title"), self.tr("rebuild_bnk_confirm_text"), QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
-        if reply == QtWidgets.QMessageBox.No:
+        msg_box = QtWidgets.QMessageBox(self)
+        msg_box.setWindowTitle(self.tr("rebuild_bnk_confirm_title"))
+        msg_box.setText(self.tr("rebuild_bnk_confirm_text"))
+        msg_box.setInformativeText(self.tr("rebuild_bnk_mode_text"))
+        msg_box.setIcon(QtWidgets.QMessageBox.Question)
+        changed_btn = msg_box.addButton(self.tr("rebuild_bnk_changed_btn"), QtWidgets.QMessageBox.AcceptRole)
+        full_btn = msg_box.addButton(self.tr("rebuild_bnk_full_btn"), QtWidgets.QMessageBox.DestructiveRole)
+        msg_box.addButton(QtWidgets.QMessageBox.Cancel)
+        msg_box.setDefaultButton(changed_btn)
+        msg_box.exec_()
+
+        if msg_box.clickedButton() not in (changed_btn, full_btn):
             return
+        full_rebuild = msg_box.clickedButton() == full_btn
 
         progress = ProgressDialog(self, self.tr("rebuilding_mod_bnk"))
         progress.show()
         
-        self.rebuild_thread = threading.Thread(target=self._rebuild_bnk_thread, args=(progress,))
+        self.rebuild_thread = threading.Thread(target=self._rebuild_bnk_thread, args=(progress, full_rebuild))
         self.rebuild_thread.daemon = True
         self.rebuild_thread.start()
 
@@ -9098,9 +8800,9 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                     bnk_type = 'sfx' if os.path.basename(root) == "SFX" else 'lang'
                     all_bnks.append((os.path.join(root, file), bnk_type))
         return all_bnks
-    def _rebuild_bnk_thread(self, progress):
+    def _rebuild_bnk_thread(self, progress, full_rebuild=False):
         try:
-            DEBUG.log("--- Starting BNK Rebuild (Robust Mode) ---")
+            DEBUG.log(f"--- Starting BNK Rebuild ({'Full' if full_rebuild else 'Incremental'}) ---")
             QtCore.QMetaObject.invokeMethod(progress, "set_progress", QtCore.Qt.QueuedConnection,
                                             QtCore.Q_ARG(int, 5), QtCore.Q_ARG(str, "Scanning modified audio files..."))
 
@@ -9115,51 +8817,58 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                            
                             if file_id.isdigit():
                                 full_path = os.path.join(root, file)
-                                modified_wem_files[file_id] = (full_path, os.path.getsize(full_path))
+                                stat = os.stat(full_path)
+                                modified_wem_files[file_id] = (full_path, stat.st_size, stat.st_mtime_ns)
+
+            manifest = BnkRebuildManifest(os.path.dirname(self.mod_p_path))
+            if not full_rebuild and not manifest.wems:
+                DEBUG.log("No rebuild manifest for this profile yet, running a full rebuild.")
+                full_rebuild = True
 
-            if not modified_wem_files:
+            removed_ids = []
+            if full_rebuild:
+                wems_to_map = modified_wem_files
+            else:
+                changed_ids, removed_ids = manifest.diff(
+                    modified_wem_files, lambda bank, bank_type: self.mod_bank_exists(self.get_mod_bnk_path(bank, bank_type)))
+                wems_to_map = {file_id: modified_wem_files[file_id] for file_id in changed_ids}
+                DEBUG.log(f"Incremental rebuild: {len(changed_ids)} changed and {len(removed_ids)} removed WEM files since the last rebuild.")
+
+            if not modified_wem_files and not removed_ids:
                 raise FileNotFoundError("No modified audio files (IDs) found in MOD_P to rebuild.")
 
-            total_wems = len(modified_wem_files)
-            progress.details_updated.emit(f"Found {total_wems} modified WEM files.")
+            total_wems = len(wems_to_map)
+            progress.details_updated.emit(f"Found {len(modified_wem_files)} modified WEM files, {total_wems} to update.")
             
             all_original_bnks = self.find_all_original_bnks()
+            self.bnk_index.refresh(all_original_bnks)
             
             bnk_update_map = {}
-            
-            bnk_editor_cache = {}
+            wem_owners = {}
 
-            for i, (file_id, (file_path, new_size)) in enumerate(modified_wem_files.items()):
+            for i, (file_id, (file_path, new_size, _)) in enumerate(wems_to_map.items()):
                 progress_percent = 10 + int((i / total_wems) * 30)
                 if i % 10 == 0:
                     QtCore.QMetaObject.invokeMethod(progress, "set_progress", QtCore.Qt.QueuedConnection,
                                                     QtCore.Q_ARG(int, progress_percent),
                                                     QtCore.Q_ARG(str, f"Mapping ID {file_id}..."))
                 
-                found_parent = False
-                source_id_int = int(file_id)
-
-                for original_bnk_path, bnk_type in all_original_bnks:
-                    try:
-                        if original_bnk_path not in bnk_editor_cache:
-                           bnk_editor_cache[original_bnk_path] = BNKEditor(original_bnk_path)
-                        
-                        editor = bnk_editor_cache[original_bnk_path]
-                        
-                        if editor.find_sound_by_source_id(source_id_int):
-                            if original_bnk_path not in bnk_update_map:
-                                bnk_update_map[original_bnk_path] = {'type': bnk_type, 'wems': {}}
-                            
-                            bnk_update_map[original_bnk_path]['wems'][file_id] = {'size': new_size, 'path': file_path}
-                            found_parent = True
-                       
-                            break 
-                    except Exception as e:
-                        DEBUG.log(f"Error reading BNK {os.path.basename(original_bnk_path)}: {e}", "WARNING")
-                
-                if not found_parent:
+                owners = self.find_bnk_owners(file_id, all_original_bnks, refresh=False)
+                if owners:
+                    original_bnk_path, bnk_type, original_entry = owners[0]
+                    wem_owners[file_id] = (original_bnk_path, bnk_type)
+                    if original_bnk_path not in bnk_update_map:
+                        bnk_update_map[original_bnk_path] = {'type': bnk_type, 'wems': {}}
+                    bnk_update_map[original_bnk_path]['wems'][file_id] = {
+                        'size': new_size,
+                        'path': file_path,
+                        'original_size': original_entry.file_size
+                    }
+                else:
                     DEBUG.log(f"Warning: ID {file_id} not found in any known SoundBank.", "WARNING")
 
+            mod_audio_index = self.get_mod_audio_index()
+
             # PRE-REBUILD FIX: Pad files to match original BNK expectations BEFORE updating
             DEBUG.log("Checking for size mismatches against original BNKs...")
             padding_fixed = 0
@@ -9167,22 +8876,12 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 for original_bnk_path, data in bnk_update_map.items():
                     wems_in_bnk = data['wems']
                     
-                    # Load the ORIGINAL BNK to get expected sizes
-                    if original_bnk_path not in bnk_editor_cache:
-                        bnk_editor_cache[original_bnk_path] = BNKEditor(original_bnk_path)
-                    original_bnk = bnk_editor_cache[original_bnk_path]
-                    
                     for file_id_str, wem_data in wems_in_bnk.items():
-                        source_id = int(file_id_str)
                         wem_path = wem_data['path']
                         wem_actual_size = wem_data['size']
                         
-                        # Get the ORIGINAL expected size from the original BNK
-                        sound_entry = original_bnk.find_sound_by_source_id(source_id)
-                        if not sound_entry:
-                            continue
-                        
-                        original_expected_size = sound_entry[0].file_size if isinstance(sound_entry, list) else sound_entry.file_size
+                        # ORIGINAL expected size, as recorded in the BNK index
+                        original_expected_size = wem_data['original_size']
                         difference = wem_actual_size - original_expected_size
                         
                         # If file is smaller than original expectation, pad it NOW
@@ -9191,6 +8890,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                             try:
                                 with open(wem_path, 'ab') as f:
                                     f.write(b'\x00' * bytes_needed)
+                                mod_audio_index.note_written(wem_path)
                                 
                                 new_size = os.path.getsize(wem_path)
                                 # Update the size in our map so rebuild uses correct size
@@ -9208,66 +8908,90 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             updated_count = 0
             created_count = 0
             total_bnks = len(bnk_update_map)
-            
-            for i, (original_bnk_path, data) in enumerate(bnk_update_map.items()):
-                bnk_type = data['type']
-                wems_to_update = data['wems'] # {id_str: size}
-                
-                progress_percent = 40 + int((i / total_bnks) * 60)
-                bnk_name = os.path.basename(original_bnk_path)
-                QtCore.QMetaObject.invokeMethod(progress, "set_progress", QtCore.Qt.QueuedConnection,
-                                                QtCore.Q_ARG(int, progress_percent),
-                                                QtCore.Q_ARG(str, f"Updating {bnk_name}..."))
 
-                if bnk_type == 'sfx':
-                    rel_path = os.path.relpath(original_bnk_path, os.path.join(self.wem_root, "SFX"))
-               
-                    if rel_path.startswith(".."): rel_path = os.path.basename(original_bnk_path)
-                    mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-                else:
-                    rel_path = os.path.relpath(original_bnk_path, self.wem_root)
-                    mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
+            bnk_delta = self.get_bnk_delta()
 
-                old_fx_flags = {}
-                if os.path.exists(mod_bnk_path):
-                    try:
-                        old_mod_editor = BNKEditor(mod_bnk_path)
-                        for entry in old_mod_editor.find_all_sounds():
-                            old_fx_flags[str(entry.source_id)] = entry.override_fx
-                        os.remove(mod_bnk_path) 
-                    except Exception: 
-                        pass
+            if full_rebuild:
+                for i, (original_bnk_path, data) in enumerate(bnk_update_map.items()):
+                    bnk_type = data['type']
+                    wems_to_update = data['wems'] # {id_str: size}
                 
-                os.makedirs(os.path.dirname(mod_bnk_path), exist_ok=True)
-                shutil.copy2(original_bnk_path, mod_bnk_path)
-                created_count += 1
+                    progress_percent = 40 + int((i / total_bnks) * 60)
+                    bnk_name = os.path.basename(original_bnk_path)
+                    QtCore.QMetaObject.invokeMethod(progress, "set_progress", QtCore.Qt.QueuedConnection,
+                                                    QtCore.Q_ARG(int, progress_percent),
+                                                    QtCore.Q_ARG(str, f"Updating {bnk_name}..."))
 
-                new_mod_editor = BNKEditor(mod_bnk_path)
+                    mod_bnk_path = self.get_mod_bnk_path(original_bnk_path, bnk_type)
+
+                    old_fx_flags = {}
+                    if self.mod_bank_exists(mod_bnk_path):
+                        try:
+                            with self.open_mod_bank(mod_bnk_path) as old_mod_editor:
+                                old_table = old_mod_editor.sound_table()
+                            for source_id, fx in zip(old_table.source_ids, old_table.override_fx):
+                                old_fx_flags[str(int(source_id))] = bool(fx)
+                            # Full copies from older profiles are replaced by the delta
+                            if os.path.exists(mod_bnk_path):
+                                os.remove(mod_bnk_path) 
+                        except Exception: 
+                            pass
+
+                    # Rewrite this bank's delta from the original
+                    new_mod_editor = bnk_delta.open(mod_bnk_path, source_path=original_bnk_path, fresh=True)
                 
-                file_modified = False
+                    file_modified = False
                 
-                for file_id_str, wem_data in wems_to_update.items():
-                    source_id = int(file_id_str)
-                    new_size = wem_data['size']
+                    for file_id_str, wem_data in wems_to_update.items():
+                        source_id = int(file_id_str)
+                        new_size = wem_data['size']
                     
-                    fx_flag = old_fx_flags.get(file_id_str) 
+                        fx_flag = old_fx_flags.get(file_id_str) 
                     
-                    if new_mod_editor.modify_sound(source_id, new_size=new_size, override_fx=fx_flag):
-                        updated_count += 1
-                        file_modified = True
-                        DEBUG.log(f"Updated {bnk_name}: ID {source_id} -> {new_size} bytes")
+                        if new_mod_editor.modify_sound(source_id, new_size=new_size, override_fx=fx_flag):
+                            updated_count += 1
+                            file_modified = True
+                            DEBUG.log(f"Updated {bnk_name}: ID {source_id} -> {new_size} bytes")
+                        else:
+                            DEBUG.log(f"FAILED to update {bnk_name}: ID {source_id} not found in binary scan!", "ERROR")
+
+                    bnk_delta.set_bank(mod_bnk_path, original_bnk_path, new_mod_editor.overrides())
+                    new_mod_editor.close()
+                    created_count += 1
+
+                    if file_modified:
+                        self.invalidate_bnk_cache(mod_bnk_path)
                     else:
-                        DEBUG.log(f"FAILED to update {bnk_name}: ID {source_id} not found in binary scan!", "ERROR")
+                        DEBUG.log(f"No changes made to {bnk_name}, keeping original copy.", "WARNING")
 
-                if file_modified:
-                    new_mod_editor.save_file()
+                bnk_delta.save()
 
-                    for file_id_str in wems_to_update.keys():
-                        self.invalidate_bnk_cache(int(file_id_str))
-                else:
-                    DEBUG.log(f"No changes made to {bnk_name}, keeping original copy.", "WARNING")
+            else:
+                # Patch only the changed records in place; removed WEMs get their original record back
+                QtCore.QMetaObject.invokeMethod(progress, "set_progress", QtCore.Qt.QueuedConnection,
+                                                QtCore.Q_ARG(int, 60),
+                                                QtCore.Q_ARG(str, f"Updating {total_bnks} changed BNK files..."))
+                bnk_transaction = self.new_bnk_transaction()
+                for original_bnk_path, data in bnk_update_map.items():
+                    mod_bnk_path = self.get_mod_bnk_path(original_bnk_path, data['type'])
+                    for file_id_str, wem_data in data['wems'].items():
+                        bnk_transaction.add(mod_bnk_path, file_id_str, new_size=wem_data['size'],
+                                            source_bnk_path=original_bnk_path)
+
+                for file_id_str in removed_ids:
+                    owners = self.find_bnk_owners(file_id_str, all_original_bnks, refresh=False)
+                    if not owners:
+                        continue
+                    original_bnk_path, bnk_type, original_entry = owners[0]
+                    mod_bnk_path = self.get_mod_bnk_path(original_bnk_path, bnk_type)
+                    if self.mod_bank_exists(mod_bnk_path):
+                        bnk_transaction.add(mod_bnk_path, file_id_str, new_size=original_entry.file_size,
+                                            override_fx=original_entry.override_fx)
 
-            self.bnk_cache_mod.clear()
+                for mod_bnk_path, applied in self.commit_bnk_transaction(bnk_transaction).items():
+                    if applied:
+                        created_count += 1
+                        updated_count += len(applied)
 
             # Fast targeted fix for size mismatches - only checks already-modified files
             try:
@@ -9275,81 +8999,74 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 for original_bnk_path, data in bnk_update_map.items():
                     bnk_type = data['type']
                     wems_to_check = data['wems']
+                    mod_bnk_path = self.get_mod_bnk_path(original_bnk_path, bnk_type)
                     
-                    if bnk_type == 'sfx':
-                        rel_path = os.path.relpath(original_bnk_path, os.path.join(self.wem_root, "SFX"))
-                        if rel_path.startswith(".."): rel_path = os.path.basename(original_bnk_path)
-                        mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-                    else:
-                        rel_path = os.path.relpath(original_bnk_path, self.wem_root)
-                        mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-                    
-                    if not os.path.exists(mod_bnk_path):
+                    if not self.mod_bank_exists(mod_bnk_path):
                         continue
                     
-                    bnk_editor = BNKEditor(mod_bnk_path)
-                    bnk_needs_save = False
+                    with self.open_mod_bank(mod_bnk_path) as bnk_editor:
+                        bnk_needs_save = False
                     
-                    for file_id_str in wems_to_check.keys():
-                        source_id = int(file_id_str)
-                        sound_entry = bnk_editor.find_sound_by_source_id(source_id)
+                        for file_id_str in wems_to_check.keys():
+                            source_id = int(file_id_str)
+                            sound_entry = bnk_editor.find_sound_by_source_id(source_id)
                         
-                        if not sound_entry:
-                            continue
-                        
-                        bnk_expected_size = sound_entry[0].file_size if isinstance(sound_entry, list) else sound_entry.file_size
-                        
-                        # Find WEM file in known location
-                        wem_filename = f"{source_id}.wem"
-                        
-                        # Check possible locations (Media first for LoadingBackground files)
-                        possible_paths = [
-                            os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", "Media", wem_filename),
-                            os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", "English(US)", wem_filename),
-                        ]
-                        
-                        wem_path = None
-                        for path in possible_paths:
-                            if os.path.exists(path):
-                                wem_path = path
-                                break
+                            if not sound_entry:
+                                continue
                         
-                        if not wem_path:
-                            continue
+                            bnk_expected_size = sound_entry[0].file_size
                         
-                        wem_actual_size = os.path.getsize(wem_path)
-                        difference = wem_actual_size - bnk_expected_size
+                            # Media folders first (LoadingBackground files live there); the
+                            # size comes from disk, the index entry can predate a rewrite
+                            wem_path = mod_audio_index.find(source_id)
+                            if not wem_path:
+                                continue
+                            try:
+                                wem_actual_size = os.stat(wem_path).st_size
+                            except OSError:
+                                continue
+                            difference = wem_actual_size - bnk_expected_size
                         
-                        if difference != 0:
-                            if difference < 0:
-                                # File smaller - add padding
-                                bytes_needed = -difference
-                                try:
-                                    with open(wem_path, 'ab') as f:
-                                        f.write(b'\x00' * bytes_needed)
-                                    fixed_count += 1
-                                except:
-                                    pass
-                            else:
-                                # File larger - update BNK
-                                if bnk_editor.modify_sound(source_id, new_size=wem_actual_size):
-                                    bnk_needs_save = True
-                                    fixed_count += 1
+                            if difference != 0:
+                                if difference < 0:
+                                    # File smaller - add padding
+                                    bytes_needed = -difference
+                                    try:
+                                        with open(wem_path, 'ab') as f:
+                                            f.write(b'\x00' * bytes_needed)
+                                        mod_audio_index.note_written(wem_path)
+                                        fixed_count += 1
+                                    except:
+                                        pass
+                                else:
+                                    # File larger - update BNK
+                                    if bnk_editor.modify_sound(source_id, new_size=wem_actual_size):
+                                        bnk_needs_save = True
+                                        fixed_count += 1
                     
-                    if bnk_needs_save:
-                        bnk_editor.save_file()
+                        if bnk_needs_save:
+                            bnk_editor.save_file()
                 
                 if fixed_count > 0:
                     DEBUG.log(f"Auto-fixed {fixed_count} size mismatches")
             except Exception as e:
                 DEBUG.log(f"Size fix error: {e}", "WARNING")
 
+            manifest.update(modified_wem_files, set(wems_to_map), wem_owners)
+
             QtCore.QMetaObject.invokeMethod(progress, "close", QtCore.Qt.QueuedConnection)
 
-            final_message = (f"Rebuild Complete!\n\n"
-                             f"Processed {len(modified_wem_files)} modified audio files.\n"
-                             f"Re-created {created_count} BNK files.\n"
-                             f"Updated {updated_count} size entries.")
+            if full_rebuild:
+                final_message = (f"Rebuild Complete!\n\n"
+                                 f"Processed {len(modified_wem_files)} modified audio files.\n"
+                                 f"Re-created {created_count} BNK files.\n"
+                                 f"Updated {updated_count} size entries.")
+            else:
+                final_message = (f"Rebuild Complete!\n\n"
+                                 f"{total_wems} of {len(modified_wem_files)} modified audio files changed since the last rebuild"
+                                 f" ({len(removed_ids)} removed).\n"
+                                 f"Patched {created_count} BNK files.\n"
+                                 f"Updated {updated_count} size entries.")
 
             QtCore.QMetaObject.invokeMethod(self, "show_message_box", QtCore.Qt.QueuedConnection,
                                             QtCore.Q_ARG(int, QtWidgets.QMessageBox.Information),
@@ -9450,7 +9167,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 return
             
             bnk_files_info = self.find_relevant_bnk_files()
-            bnk_editor_cache = {}
+            self.bnk_index.refresh(bnk_files_info)
             fixed = 0
             
             for entry_id in to_fix:
@@ -9465,30 +9182,16 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 
                 new_size = os.path.getsize(wem_path)
                 
-                for bnk_path, bnk_type in bnk_files_info:
-                    if bnk_path not in bnk_editor_cache:
-                        bnk_editor_cache[bnk_path] = BNKEditor(bnk_path)
-                    
-                    orig_bnk = bnk_editor_cache[bnk_path]
-                    if not orig_bnk.find_sound_by_source_id(source_id):
-                        continue
-                    
-                    if bnk_type == 'sfx':
-                        mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", "SFX", os.path.basename(bnk_path))
-                    else:
-                        mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", entry.get('Language', 'SFX'), os.path.basename(bnk_path))
+                for bnk_path, bnk_type, _ in self.find_bnk_owners(source_id, bnk_files_info, refresh=False):
+                    mod_bnk_path = self.get_mod_bnk_path(bnk_path, bnk_type)
                     
-                    if not os.path.exists(mod_bnk_path):
+                    if not self.mod_bank_exists(mod_bnk_path):
                         continue
                     
-                    if mod_bnk_path not in bnk_editor_cache:
-                        bnk_editor_cache[mod_bnk_path] = BNKEditor(mod_bnk_path)
-                    
-                    mod_bnk = bnk_editor_cache[mod_bnk_path]
-                    if mod_bnk.modify_sound(source_id, new_size=new_size):
-                        mod_bnk.save_file()
-                        self.invalidate_bnk_cache(source_id)
-                        fixed += 1
+                    with self.open_mod_bank(mod_bnk_path) as mod_bnk:
+                        if mod_bnk.modify_sound(source_id, new_size=new_size):
+                            mod_bnk.save_file()
+                            fixed += 1
                     break
             
             if fixed > 0:
@@ -9527,18 +9230,18 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                                             QtCore.Q_ARG(int, progress_percent), QtCore.Q_ARG(str, f"Fixing {bnk_name}..."))
             
             try:
-                editor = BNKEditor(bnk_path)
                 modified = False
-                for item in items_to_fix:
-                    if editor.modify_sound(item['source_id'], new_size=item['wem_size']):
-                        fixed_count += 1
-                        modified = True
+                with self.open_mod_bank(bnk_path) as editor:
+                    for item in items_to_fix:
+                        if editor.modify_sound(item['source_id'], new_size=item['wem_size']):
+                            fixed_count += 1
+                            modified = True
+                    
+                    if modified:
+                        editor.save_file()
                 
                 if modified:
-                    editor.save_file()
-   
-                    for item in items_to_fix:
-                        self.invalidate_bnk_cache(item['source_id'])
+                    self.invalidate_bnk_cache(bnk_path)
 
             except Exception as e:
                 error_count += len(items_to_fix)
@@ -9574,6 +9277,14 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         dialog.raise_()
         dialog.activateWindow()
         return dialog.exec_()
+    def get_mod_audio_index(self):
+        """The MOD_P WEM location index, pointed at the active profile."""
+        if self.mod_p_path:
+            self.mod_audio_index.set_root(os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows"))
+        else:
+            self.mod_audio_index.set_root(None)
+        return self.mod_audio_index
+
     def get_mod_path(self, file_id, lang):
         if not self.mod_p_path:
             return None
@@ -9583,7 +9294,8 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         else:
             new_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", "Media", f"{file_id}.wem")
             
-        if os.path.exists(new_path):
+        mod_audio_index = self.get_mod_audio_index()
+        if mod_audio_index.contains(new_path):
             return new_path
        
         if lang != "SFX":
@@ -9591,14 +9303,18 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         else:
             old_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", f"{file_id}.wem")
             
-        if os.path.exists(old_path):
+        if mod_audio_index.contains(old_path):
             return old_path
 
         return new_path
 
     @QtCore.pyqtSlot(dict)
     def _add_orphaned_entry(self, entry):
+        # With scanned files hidden, _on_scan_finished only updates the cache
+        if not self.settings.data.get("show_orphaned_files", False):
+            return
 
+        entry = AudioEntry(entry)
         self.all_files.append(entry)
         lang = entry.get("Language", "SFX")
         self.entries_by_lang.setdefault(lang, []).append(entry)
@@ -9608,15 +9324,9 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             tree = widgets["tree"]
             
             scanned_group_name = "Scanned From Filesystem"
-            items = tree.findItems(scanned_group_name, QtCore.Qt.MatchStartsWith, 0)
-            group_item = items[0] if items else None
-            
-            if not group_item:
-                group_item = QtWidgets.QTreeWidgetItem(tree, [scanned_group_name, "", "", "", ""])
-                group_item.setExpanded(True)
-            
-            self.add_tree_item(group_item, entry, lang)
-            group_item.setText(0, f"{scanned_group_name} ({group_item.childCount()})")
+            group = tree.audio_model.append_to_group(scanned_group_name, entry)
+            if group.childCount() == 1:
+                group.setExpanded(True)
             
             current_tab_index = self.tabs.indexOf(widgets["tree"].parent().parent())
             if current_tab_index != -1:
@@ -9732,11 +9442,6 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             self.show_profile_manager()
         
         return self.active_profile_name and self.mod_p_path is not None
-    @QtCore.pyqtSlot(int)
-    def _on_scan_finished(self, count):
-
-        DEBUG.log(f"Orphan scan finished. Found {count} additional files.")
-        self.status_bar.showMessage(f"Scan complete. Found {count} additional audio files.", 5000)
     def get_original_path(self, file_id, lang):
         standard_path = os.path.join(self.wem_root, lang, f"{file_id}.wem")
         if os.path.exists(standard_path):
@@ -9756,6 +9461,49 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 return sfx_path 
                 
         return standard_path
+    def get_mod_bnk_path(self, bnk_path, bnk_type):
+        if bnk_type == 'sfx':
+            rel_path = os.path.relpath(bnk_path, os.path.join(self.wem_root, "SFX"))
+            if rel_path.startswith(".."): rel_path = os.path.basename(bnk_path)
+        else:
+            rel_path = os.path.relpath(bnk_path, self.wem_root)
+            if rel_path.startswith("Windows"): rel_path = os.path.relpath(bnk_path, os.path.join(self.wem_root, "Windows"))
+        return os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
+
+    def get_bnk_delta(self):
+        """The active profile's BnkDeltaStore, or None without a profile."""
+        if not self.mod_p_path:
+            return None
+        profile_path = os.path.dirname(self.mod_p_path)
+        if self.bnk_delta is None or self.bnk_delta.path != os.path.join(profile_path, BnkDeltaStore.FILE_NAME):
+            self.bnk_delta = BnkDeltaStore(profile_path,
+                                           os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows"),
+                                           self.wem_root)
+        return self.bnk_delta
+
+    def mod_bank_exists(self, mod_bnk_path):
+        bnk_delta = self.get_bnk_delta()
+        return (bnk_delta is not None and bnk_delta.has_bank(mod_bnk_path)) or os.path.exists(mod_bnk_path)
+
+    def open_mod_bank(self, mod_bnk_path):
+        """Open a mod bank, from the profile's delta or from a full copy in MOD_P (imported/older profiles)."""
+        bnk_delta = self.get_bnk_delta()
+        if bnk_delta is not None and bnk_delta.has_bank(mod_bnk_path):
+            return bnk_delta.open(mod_bnk_path)
+        return BNKEditor(mod_bnk_path, use_mmap=True)
+
+    def new_bnk_transaction(self):
+        return BnkTransaction(self.get_bnk_delta())
+
+    def find_bnk_owners(self, source_id, bnk_files_info=None, refresh=True):
+        """Return [(bnk_path, bnk_type, original SoundEntry)] for the original banks that own source_id.
+
+        Pass refresh=False inside loops after one self.bnk_index.refresh(bnk_files_info).
+        """
+        if bnk_files_info is None:
+            bnk_files_info = self.find_relevant_bnk_files()
+        return self.bnk_index.lookup(int(source_id), bnk_files_info, refresh=refresh)
+
     def find_relevant_bnk_files(self, force_all=False):
 
         bnk_files_info = []
@@ -9923,9 +9671,18 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             
             if reply == QtWidgets.QMessageBox.Yes:
                 deleted_count = 0
+                bnk_transaction = self.new_bnk_transaction()
+                bnk_files_info = self.find_relevant_bnk_files()
+                self.bnk_index.refresh(bnk_files_info)
                 for entry_to_delete in file_list:
-                    self._perform_single_delete(entry_to_delete, lang)
+                    self._perform_single_delete(entry_to_delete, lang, bnk_transaction, bnk_files_info)
                     deleted_count += 1
+
+                try:
+                    self.commit_bnk_transaction(bnk_transaction)
+                except Exception as e:
+                    DEBUG.log(f"Error reverting BNK records: {e}", "ERROR")
+                    QtWidgets.QMessageBox.warning(self, "Error", f"Mod audio was deleted, but reverting the BNK files failed: {str(e)}")
                 
                 QtCore.QTimer.singleShot(0, lambda: self.populate_tree(lang))
                 self.status_bar.showMessage(f"Deleted {deleted_count} mod audio files", 3000)
@@ -9956,7 +9713,13 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         if reply == QtWidgets.QMessageBox.Yes:
             self._perform_single_delete(entry_to_delete, lang)
             QtCore.QTimer.singleShot(0, lambda: self.populate_tree(lang))
-    def _perform_single_delete(self, entry, lang):
+    def _perform_single_delete(self, entry, lang, transaction=None, bnk_files_info=None):
+        """Delete one mod WEM and revert its BNK record.
+
+        When a BnkTransaction is passed the BNK revert is only queued and the
+        caller commits it once for the whole selection. A caller that passes
+        bnk_files_info has already refreshed the BNK index for it.
+        """
         file_id = entry.get("Id", "")
         shortname = entry.get("ShortName", "")
         source_id = int(file_id)
@@ -9967,40 +9730,28 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
 
             if os.path.exists(mod_wem_path):
                 os.remove(mod_wem_path)
+                self.get_mod_audio_index().note_removed(mod_wem_path)
                 DEBUG.log(f"Deleted wem audio: {mod_wem_path}")
 
-            bnk_reverted = False
-            bnk_files_info = self.find_relevant_bnk_files()
+            bnk_transaction = transaction if transaction is not None else self.new_bnk_transaction()
 
-            for bnk_path, bnk_type in bnk_files_info:
-                if bnk_type == 'sfx':
-                    rel_path = os.path.relpath(bnk_path, os.path.join(self.base_path, "Wems", "SFX"))
-                    mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-                else:
-                    rel_path = os.path.relpath(bnk_path, os.path.join(self.base_path, "Wems"))
-                    mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
+            owners = self.find_bnk_owners(source_id, bnk_files_info, refresh=bnk_files_info is None)
+            for bnk_path, bnk_type, original_entry in owners:
+                mod_bnk_path = self.get_mod_bnk_path(bnk_path, bnk_type)
                 
-                if not os.path.exists(mod_bnk_path):
+                if not self.mod_bank_exists(mod_bnk_path):
                     continue
 
-                original_bnk = BNKEditor(bnk_path)
-                original_entries = original_bnk.find_sound_by_source_id(source_id)
-                
-                if not original_entries:
-                    continue
-                
-                original_entry = original_entries[0]
-
-                mod_bnk_editor = BNKEditor(mod_bnk_path)
-                if mod_bnk_editor.modify_sound(source_id, 
-                                            new_size=original_entry.file_size, 
-                                            override_fx=original_entry.override_fx,
-                                            find_by_size=None):
-                    mod_bnk_editor.save_file()
-                    self.invalidate_bnk_cache(source_id)
-                    DEBUG.log(f"BNK {os.path.basename(mod_bnk_path)} restored to original values.")
-                    bnk_reverted = True
-                    break 
+                bnk_transaction.add(mod_bnk_path, source_id,
+                                    new_size=original_entry.file_size,
+                                    override_fx=original_entry.override_fx)
+                break
+
+            if transaction is not None:
+                return
+
+            results = self.commit_bnk_transaction(bnk_transaction)
+            bnk_reverted = any(results.values())
             
             if bnk_reverted:
                 self.status_bar.showMessage(f"Deleted mod audio and restored BNK for {shortname}", 3000)
@@ -10010,22 +9761,22 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         except Exception as e:
             DEBUG.log(f"Error deleting {shortname}: {e}", "ERROR")
             QtWidgets.QMessageBox.warning(self, "Error", f"Failed to process deletion for {shortname}: {str(e)}")
-    def invalidate_bnk_cache(self, source_id: int):
-        source_id_to_invalidate = int(source_id)
-        DEBUG.log(f"Invalidating BNK cache for Source ID: {source_id_to_invalidate}")
-
-        for bnk_path in list(self.bnk_cache_mod.keys()):
-            if source_id_to_invalidate in self.bnk_cache_mod[bnk_path]:
-                del self.bnk_cache_mod[bnk_path][source_id_to_invalidate]
-                DEBUG.log(f"  > Removed ID {source_id_to_invalidate} from mod cache for {os.path.basename(bnk_path)}")
-
-        for bnk_path in list(self.bnk_cache_orig.keys()):
-            if source_id_to_invalidate in self.bnk_cache_orig[bnk_path]:
-                del self.bnk_cache_orig[bnk_path][source_id_to_invalidate]
-                DEBUG.log(f"  > Removed ID {source_id_to_invalidate} from original cache for {os.path.basename(bnk_path)}")        
+    def commit_bnk_transaction(self, transaction):
+        """Commit a BnkTransaction and drop the parsed layouts of the banks it rewrote."""
+        results = transaction.commit()
+        for mod_bnk_path, applied in results.items():
+            if applied:
+                self.invalidate_bnk_cache(mod_bnk_path)
+                DEBUG.log(f"BNK {os.path.basename(mod_bnk_path)}: {len(applied)} records updated.")
+        return results
+
+    def invalidate_bnk_cache(self, bnk_path: str):
+        """Drop the parsed layout of one bank after it was rewritten."""
+        DEBUG.log(f"Invalidating BNK cache for {os.path.basename(bnk_path)}")
+        BNK_PARSE_CACHE.invalidate(str(Path(bnk_path)))
     def tr(self, key):
         """Translate key to current language"""
-        return self.translations.get(self.current_lang, {}).get(key, key)
+        return self.translations.text(self.current_lang, key)
         
     def check_required_files(self):
         """Check if all required files exist"""
@@ -10197,6 +9948,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                     DEBUG.log(f"Failed to load original subtitles from {file_info['path']}: {e}", "ERROR")
 
         self.subtitles = self.original_subtitles.copy()
+        self.search_index.clear()
         DEBUG.log(f"Loaded {len(self.original_subtitles)} original subtitle entries and mapped them to files.")
 
         if self.mod_p_path and os.path.exists(self.mod_p_path):
@@ -10418,6 +10170,9 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.update_fun_status_label.hide()
         
         self.update_progress_bar.setRange(0, 100)
+
+        # Even a failed or cancelled update may have replaced some game banks
+        self.embedded_media_index.invalidate()
         
         if status == "success":
             self.update_status_label.setText(self.tr('done'))
@@ -10430,7 +10185,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 self.status_bar.showMessage(self.tr("update_rescanning_orphans"), 0)
                 QtWidgets.QApplication.processEvents() 
                 
-                self.perform_blocking_orphan_scan()
+                self.start_orphan_scan()
             QtWidgets.QMessageBox.information(self, self.tr("update_complete_title"), f"{message}\n\n{self.tr('restart_recommended')}")
 
         elif status == "failure":
@@ -10749,11 +10504,14 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         
         self.subtitle_table.setRowCount(0)
 
+        search_text = search_text.lower().strip()
+        search_keys = self.search_index.search_subtitles(search_text) if search_text else None
+
         self.subtitle_loader_thread = SubtitleLoaderThread(
             self, self.all_subtitle_files, self.locres_manager, 
             self.subtitles, self.original_subtitles,
             self.settings.data["subtitle_lang"], selected_category, orphaned_only, modified_only, with_audio_only,
-            search_text, self.audio_keys_cache, self.modified_subtitles
+            search_keys, self.audio_keys_cache, self.modified_subtitles
         )
         
         self.subtitle_loader_thread.dataLoaded.connect(self.on_subtitle_data_loaded)
@@ -10800,6 +10558,8 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             return
         
         sorted_items = sorted(subtitles_to_show.items())
+        search_text = self.get_global_search_text().lower().strip()
+        search_keys = self.search_index.search_subtitles(search_text) if search_text else ()
         
         for row, (key, data) in enumerate(sorted_items):
             key_item = QtWidgets.QTableWidgetItem(key)
@@ -10834,17 +10594,13 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                     if item:
                         item.setBackground(highlight_color)
             
-            search_text = self.get_global_search_text().lower().strip()
-            if search_text:
-                if (search_text in key.lower() or 
-                    search_text in original_text.lower() or 
-                    search_text in current_text.lower()):
-                    for col in range(4):
-                        item = self.subtitle_table.item(row, col)
-                        if item:
-                            font = item.font()
-                            font.setBold(True)
-                            item.setFont(font)
+            if key in search_keys:
+                for col in range(4):
+                    item = self.subtitle_table.item(row, col)
+                    if item:
+                        font = item.font()
+                        font.setBold(True)
+                        item.setFont(font)
 
     def truncate_text(self, text, max_length):
         """Truncate text for display"""
@@ -10870,6 +10626,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             if editor.exec_() == QtWidgets.QDialog.Accepted:
                 new_text = editor.get_text()
                 self.subtitles[key] = new_text
+                self.search_index.invalidate(key)
                 if key in self.key_to_file_map:
                     file_info = self.key_to_file_map[key]
                     self.dirty_subtitle_files.add(file_info['path'])
@@ -11023,17 +10780,8 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         """Navigate to audio file corresponding to subtitle"""
         DEBUG.log(f"Looking for audio file for subtitle key: {subtitle_key}")
         
-        target_entry = None
-        target_lang = None
-        
-        for entry in self.all_files:
-            shortname = entry.get("ShortName", "")
-            if shortname:
-                audio_key = os.path.splitext(shortname)[0]
-                if audio_key == subtitle_key:
-                    target_entry = entry
-                    target_lang = entry.get("Language", "SFX")
-                    break
+        target_entry = self.audio_entry_for_key(subtitle_key)
+        target_lang = target_entry.get("Language", "SFX") if target_entry else None
         
         if not target_entry:
             QtWidgets.QMessageBox.information(
@@ -11063,50 +10811,47 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             self.tr("audio_not_found_for_key").format(key=subtitle_key)
         )
 
+    def audio_entry_for_key(self, key):
+        """First entry in all_files whose ShortName gives this subtitle key.
+
+        The key map is rebuilt whenever all_files is replaced or grows.
+        """
+        index = self.audio_key_index
+        if index is None or index[0] is not self.all_files or index[1] != len(self.all_files):
+            by_key = {}
+            for entry in self.all_files:
+                if entry.get("ShortName", ""):
+                    by_key.setdefault(entry.key, entry)
+            index = self.audio_key_index = (self.all_files, len(self.all_files), by_key)
+        return index[2].get(key)
+
     def find_and_select_audio_item(self, lang, target_entry):
         """Find and select audio item in tree"""
         if lang not in self.tab_widgets:
             return
         
         tree = self.tab_widgets[lang]["tree"]
-        target_id = target_entry.get("Id", "")
         target_shortname = target_entry.get("ShortName", "")
-        
-        def search_items(parent_item):
-            for i in range(parent_item.childCount()):
-                item = parent_item.child(i)
-                
-                if item.childCount() == 0:
-                    try:
-                        entry = item.data(0, QtCore.Qt.UserRole)
-                        if entry:
-                            if (entry.get("Id") == target_id or 
-                                entry.get("ShortName") == target_shortname):
-                                tree.clearSelection()
-                                tree.setCurrentItem(item)
-                                item.setSelected(True)
-                                
-                                parent = item.parent()
-                                if parent:
-                                    parent.setExpanded(True)
-                                
-                                tree.scrollToItem(item)
-                                self.on_selection_changed(lang)
-                                
-                                return True
-                    except RuntimeError:
-                        continue
-                else:
-                    if search_items(item):
-                        return True
-            return False
-        
-        try:
-            root = tree.invisibleRootItem()
-            if not search_items(root):
-                DEBUG.log(f"Could not find item in tree for: {target_shortname}")
-        except RuntimeError:
-            pass
+
+        item = tree.item_for_id(target_entry.get("Id", ""))
+        if item is None:
+            item = tree.item_for_key(target_entry.key)
+            if item is not None and item.entry.get("ShortName") != target_shortname:
+                item = None
+        if item is None:
+            DEBUG.log(f"Could not find item in tree for: {target_shortname}")
+            return
+
+        tree.clearSelection()
+        tree.setCurrentItem(item)
+        item.setSelected(True)
+
+        parent = item.parent()
+        if parent:
+            parent.setExpanded(True)
+
+        tree.scrollToItem(item)
+        self.on_selection_changed(lang)
 
     def revert_subtitle_from_table(self, rows_to_revert):
         """Revert subtitle(s) to original from table for a list of row indices."""
@@ -11126,6 +10871,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                     original_text = self.original_subtitles[key]
                     
                     self.subtitles[key] = original_text
+                    self.search_index.invalidate(key)
                     self.modified_subtitles.discard(key)
                     if key in self.key_to_file_map:
                         file_info = self.key_to_file_map[key]
@@ -11750,184 +11496,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.status_bar.showMessage(status_text)
     def load_all_soundbank_files(self, path=None):
         DEBUG.log(f"Loading soundbank files from: {path}")
-        all_files = []
-        
-        if not path or not os.path.exists(path):
-            DEBUG.log("SoundbanksInfo file not found.", "WARNING")
-            return []
-
-        try:
-            ext = os.path.splitext(path)[1].lower()
-            
-            if ext == '.json':
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                
-                soundbanks_info = data.get("SoundBanksInfo") or data.get("SoundbanksInfo") or data
-                
-                if not soundbanks_info:
-                    DEBUG.log("ERROR: Could not find SoundBanksInfo block.", "ERROR")
-                    return []
-                
-                streamed_files = soundbanks_info.get("StreamedFiles", [])
-                for file_entry in streamed_files:
-                    file_entry["Source"] = "StreamedFiles"
-                    if "Path" in file_entry:
-                        file_entry["Path"] = file_entry["Path"].replace("Media/", "").replace("Media\\", "")
-                all_files.extend(streamed_files)
-                
-                media_not_in_bank = soundbanks_info.get("MediaFilesNotInAnyBank", [])
-                for file_entry in media_not_in_bank:
-                    file_entry["Source"] = "MediaFilesNotInAnyBank"
-                    if "Path" in file_entry:
-                        file_entry["Path"] = file_entry["Path"].replace("Media/", "").replace("Media\\", "")
-                all_files.extend(media_not_in_bank)
-
-                soundbanks_list = soundbanks_info.get("SoundBanks", [])
-                
-                unique_files_map = {f["Id"]: f for f in all_files}
-                
-                for sb in soundbanks_list:
-                 
-                    bnk_name = sb.get("ShortName", "UnknownBank")
-                    
-                    media_list = sb.get("Media", [])
-                    for media_entry in media_list:
-                        file_id = media_entry.get("Id")
-                        
-                        if file_id and file_id not in unique_files_map:
-                      
-                            if "Path" in media_entry:
-                                media_entry["Path"] = media_entry["Path"].replace("Media/", "").replace("Media\\", "")
-                            
-                            media_entry["Source"] = f"Bank: {bnk_name}"
-                            
-                            unique_files_map[file_id] = media_entry
-                            all_files.append(media_entry)
-                
-                DEBUG.log(f"Loaded {len(streamed_files)} StreamedFiles, {len(media_not_in_bank)} LooseMedia, and {len(all_files) - len(streamed_files) - len(media_not_in_bank)} files from SoundBanks Media.")
-
-            elif ext == '.xml':
-          
-                tree = ET.parse(path)
-                root = tree.getroot()
-                
-                streamed_files_elem = root.find("StreamedFiles")
-                if streamed_files_elem is not None:
-                    for file_elem in streamed_files_elem.findall("File"):
-                        raw_path = file_elem.find("Path").text if file_elem.find("Path") is not None else ""
-                        clean_path = raw_path.replace("Media/", "").replace("Media\\", "")
-                        
-                        file_entry = { 
-                            "Id": file_elem.get("Id"), 
-                            "Language": file_elem.get("Language"), 
-                            "ShortName": file_elem.find("ShortName").text if file_elem.find("ShortName") is not None else "", 
-                            "Path": clean_path, 
-                            "Source": "StreamedFiles" 
-                        }
-                        all_files.append(file_entry)
-                
-                media_files_elem = root.find("MediaFilesNotInAnyBank")
-                if media_files_elem is not None:
-                    for file_elem in media_files_elem.findall("File"):
-                        raw_path = file_elem.find("Path").text if file_elem.find("Path") is not None else ""
-                        clean_path = raw_path.replace("Media/", "").replace("Media\\", "")
-
-                        file_entry = { 
-                            "Id": file_elem.get("Id"), 
-                            "Language": file_elem.get("Language"), 
-                            "ShortName": file_elem.find("ShortName").text if file_elem.find("ShortName") is not None else "", 
-                            "Path": clean_path, 
-                            "Source": "MediaFilesNotInAnyBank" 
-                        }
-                        all_files.append(file_entry)
-                        
-                soundbanks_elem = root.find("SoundBanks")
-                if soundbanks_elem is not None:
-                    for sb_elem in soundbanks_elem.findall("SoundBank"):
-                        bnk_name = sb_elem.find("ShortName").text if sb_elem.find("ShortName") is not None else "Unknown"
-                        media_elem = sb_elem.find("Media")
-                        if media_elem is not None:
-                            for file_elem in media_elem.findall("File"):
-                                file_id = file_elem.get("Id")
-                       
-                                raw_path = file_elem.find("Path").text if file_elem.find("Path") is not None else ""
-                                clean_path = raw_path.replace("Media/", "").replace("Media\\", "")
-                                
-                                file_entry = {
-                                    "Id": file_id,
-                                    "Language": file_elem.get("Language"),
-                                    "ShortName": file_elem.find("ShortName").text if file_elem.find("ShortName") is not None else "",
-                                    "Path": clean_path,
-                                    "Source": f"Bank: {bnk_name}"
-                                }
-                                all_files.append(file_entry)
-
-            else:
-                raise ValueError(f"Unsupported file format: {ext}")
-            
-            unique_files = {}
-            for f in all_files:
-                fid = f.get("Id")
-                if fid and fid not in unique_files:
-                    unique_files[fid] = f
-            
-            final_list = list(unique_files.values())
-            DEBUG.log(f"Total unique files loaded from SoundbanksInfo: {len(final_list)}")
-            return final_list
-            
-        except Exception as e:
-            DEBUG.log(f"Error loading soundbank: {e}", "ERROR")
-            import traceback
-            DEBUG.log(traceback.format_exc(), "ERROR")
-            return []
-    def _scan_and_add_orphaned_wems(self, known_ids):
-        """Scans the Wems directory to find and add files not listed in SoundbanksInfo."""
-        orphaned_entries = []
-        if not os.path.exists(self.wem_root):
-            DEBUG.log(f"Wems directory not found at {self.wem_root}, skipping scan.", "WARNING")
-            return orphaned_entries
-
-        for root, _, files in os.walk(self.wem_root):
-            for file in files:
-                if not file.lower().endswith('.wem'):
-                    continue
-
-                file_id = os.path.splitext(file)[0]
-                if file_id in known_ids:
-                    continue
-
-                full_path = os.path.join(root, file)
-                
-                rel_path = os.path.relpath(root, self.wem_root)
-                lang = "SFX" if rel_path == '.' else rel_path
-
-                short_name = f"{file_id}.wav"
-                try:
-                    analyzer = WEMAnalyzer(full_path)
-                    if analyzer.analyze():
-                        markers = analyzer.get_markers_info()
-                        if markers and markers[0]['label']:
-                            short_name = f"{markers[0]['label']}.wav"
-                            DEBUG.log(f"Orphaned file '{file}' named from marker: '{short_name}'")
-                except Exception as e:
-                    DEBUG.log(f"Could not analyze markers for orphaned file {file}: {e}", "WARNING")
-
-                new_entry = {
-                    "Id": file_id,
-                    "Language": lang,
-                    "ShortName": short_name,
-                    "Path": file, 
-                    "Source": "ScannedFromFileSystem"
-                }
-                orphaned_entries.append(new_entry)
-
-        if orphaned_entries:
-            DEBUG.log(f"Added {len(orphaned_entries)} orphaned WEM files found on disk.")
-        else:
-            DEBUG.log("No orphaned WEM files found on disk.")
-            
-        return orphaned_entries
+        return self.soundbanks_catalog.load(path) if path else []
     def group_by_language(self):
         entries_by_lang = {}
         for entry in self.all_files:
@@ -11948,6 +11517,104 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             if current_index < len(languages):
                 return languages[current_index]
         return None
+    def audio_filter_options(self, lang):
+        """Snapshot of a language tab's filter, sort and search settings."""
+        widgets = self.tab_widgets[lang]
+        filter_text = widgets["filter_combo"].currentText()
+        return {
+            "filter_type": widgets["filter_combo"].currentIndex(),
+            "tag": filter_text.split(": ", 1)[1] if filter_text.startswith("With Tag: ") else None,
+            "sort_type": widgets["sort_combo"].currentIndex(),
+            "search_text": self.global_search.text().lower(),
+        }
+
+    def filter_audio_entries(self, lang, options, should_stop=lambda: False):
+        """Filter and sort a language's entries without touching any widget.
+
+        Mod audio presence and times come from the ModAudioIndex, so this
+        can run on an AudioFilterThread. Returns (entries, mod_audio_ids),
+        or None if should_stop() turned true.
+        """
+        lang_entries = self.entries_by_lang.get(lang, [])
+        search_text = options["search_text"]
+        if search_text:
+            lang_entries = self.search_index.search_entries(lang, lang_entries, search_text)
+
+        mod_audio_index = self.get_mod_audio_index()
+        filter_type = options["filter_type"]
+        selected_tag = options["tag"]
+        filtered_entries = []
+        mod_audio_ids = set()
+        for i, entry in enumerate(lang_entries):
+            if i % 1000 == 0 and should_stop():
+                return None
+            key = entry.key
+            if selected_tag is not None:
+                if self.marked_items.get(key, {}).get('tag') == selected_tag:
+                    filtered_entries.append(entry)
+                continue
+
+            subtitle = self.subtitles.get(key, "")
+            mod_path = self.get_mod_path(entry.get("Id", ""), lang)
+            has_mod_audio = mod_audio_index.contains(mod_path) if mod_path else False
+
+            if filter_type == 1 and not subtitle: continue
+            elif filter_type == 2 and subtitle: continue
+            elif filter_type == 3 and key not in self.modified_subtitles: continue
+            elif filter_type == 4 and not has_mod_audio: continue
+
+            if has_mod_audio:
+                mod_audio_ids.add(entry.id_int)
+            filtered_entries.append(entry)
+
+        if should_stop():
+            return None
+
+        sort_type = options["sort_type"]
+        if sort_type == 4: # Recent First
+            mod_times_cache = {}
+            for entry in filtered_entries:
+                file_id = entry.get("Id", "")
+                mod_wem_path = self.get_mod_path(file_id, lang)
+                stat = mod_audio_index.stat(mod_wem_path) if mod_wem_path else None
+                mod_times_cache[file_id] = stat[1] if stat else 0
+
+            filtered_entries.sort(key=lambda x: mod_times_cache.get(x.get("Id", ""), 0), reverse=True)
+        elif sort_type == 0: filtered_entries.sort(key=lambda x: x.get("ShortName", "").lower())
+        elif sort_type == 1: filtered_entries.sort(key=lambda x: x.get("ShortName", "").lower(), reverse=True)
+        elif sort_type == 2: filtered_entries.sort(key=lambda x: x.id_int)
+        elif sort_type == 3: filtered_entries.sort(key=lambda x: x.id_int, reverse=True)
+
+        return filtered_entries, mod_audio_ids
+
+    def request_populate_tree(self, lang):
+        """Rebuild a language tab from a background filter pass.
+
+        Used for search, filter and sort changes: a newer request stops the
+        one in flight and the tree is only rebuilt from the latest result.
+        """
+        if lang not in self.tab_widgets:
+            return
+        generation = self.audio_filter_generation.get(lang, 0) + 1
+        self.audio_filter_generation[lang] = generation
+
+        for thread in self.audio_filter_threads:
+            if thread.lang == lang:
+                thread.stop()
+
+        thread = AudioFilterThread(self, lang, self.audio_filter_options(lang), generation, self)
+        thread.filtered.connect(self._on_audio_filtered)
+        thread.finished.connect(thread.deleteLater)
+        thread.destroyed.connect(lambda *_, thread=thread: self.audio_filter_threads.remove(thread))
+        self.audio_filter_threads.append(thread)
+        thread.start()
+
+    def _on_audio_filtered(self, lang, generation, result):
+        if generation != self.audio_filter_generation.get(lang) or lang not in self.tab_widgets:
+            return
+        options, filtered_entries, mod_audio_ids = result
+        self.apply_filtered_entries(lang, options, filtered_entries, mod_audio_ids)
+
     @QtCore.pyqtSlot(str)
     def populate_tree(self, lang):
         DEBUG.log(f"Populating tree for language: {lang}")
@@ -11955,7 +11622,15 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         if lang not in self.tab_widgets:
             DEBUG.log(f"Language {lang} not in tab_widgets", "WARNING")
             return
-            
+
+        # Anything still filtering for this tab is now out of date
+        self.audio_filter_generation[lang] = self.audio_filter_generation.get(lang, 0) + 1
+        options = self.audio_filter_options(lang)
+        filtered_entries, mod_audio_ids = self.filter_audio_entries(lang, options)
+        self.apply_filtered_entries(lang, options, filtered_entries, mod_audio_ids)
+
+    def apply_filtered_entries(self, lang, options, filtered_entries, mod_audio_ids):
+        """Build the tree of a language tab from an ordered, filtered entry list."""
         widgets = self.tab_widgets[lang]
         tree = widgets["tree"]
         
@@ -11965,78 +11640,20 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 if item.childCount() == 0:
                     entry = item.data(0, QtCore.Qt.UserRole)
                     if entry:
-                        shortname = entry.get("ShortName", "")
-                        key = os.path.splitext(shortname)[0]
-                        selected_keys.append(key)
-        except RuntimeError:
-            pass
-        
-        filter_type = widgets["filter_combo"].currentIndex()
-        try:
-            tree.blockSignals(True) 
-            tree.clear()
-        except RuntimeError:
-            DEBUG.log("Error clearing tree, creating new tree", "WARNING")
-            tree.blockSignals(False)
-            return
-        filter_text = widgets["filter_combo"].currentText()
-        sort_type = widgets["sort_combo"].currentIndex() 
-        search_text = self.global_search.text().lower()
-        
-        try:
-            tree.clear()
+                        selected_keys.append(entry.key)
         except RuntimeError:
-            DEBUG.log("Error clearing tree, creating new tree", "WARNING")
-            return
-        
-        filtered_entries = []
-        if filter_text.startswith("With Tag: "):
-            selected_tag = filter_text.split(": ", 1)[1]
-            for entry in self.entries_by_lang.get(lang, []):
-                key = os.path.splitext(entry.get("ShortName", ""))[0]
-                if self.marked_items.get(key, {}).get('tag') == selected_tag:
-                    if not search_text or search_text in f"{entry.get('Id', '')} {entry.get('ShortName', '')} {self.subtitles.get(key, '')}".lower():
-                        filtered_entries.append(entry)
-        else:
-            for entry in self.entries_by_lang.get(lang, []):
-                key = os.path.splitext(entry.get("ShortName", ""))[0]
-                subtitle = self.subtitles.get(key, "")
-                mod_path = self.get_mod_path(entry.get("Id", ""), lang)
-                has_mod_audio = os.path.exists(mod_path) if mod_path else False
-                
-                if filter_type == 1 and not subtitle: continue
-                elif filter_type == 2 and subtitle: continue
-                elif filter_type == 3 and key not in self.modified_subtitles: continue
-                elif filter_type == 4 and not has_mod_audio: continue
-                if search_text and search_text not in f"{entry.get('Id', '')} {entry.get('ShortName', '')} {subtitle}".lower(): continue
-                
-                entry_with_status = entry.copy()
-                entry_with_status['has_mod_audio'] = has_mod_audio
-                filtered_entries.append(entry_with_status)
-                
-        DEBUG.log(f"Filtered entries: {len(filtered_entries)} out of {len(self.entries_by_lang.get(lang, []))}")
+            pass
 
-        if sort_type == 4: # Recent First
-            mod_times_cache = {}
-            for entry in filtered_entries:
-                file_id = entry.get("Id", "")
-                mod_wem_path = self.get_mod_path(file_id, lang)
-                if os.path.exists(mod_wem_path):
-                    try: mod_times_cache[file_id] = os.path.getmtime(mod_wem_path)
-                    except OSError: mod_times_cache[file_id] = 0
-                else: mod_times_cache[file_id] = 0
-            
-            filtered_entries.sort(key=lambda x: mod_times_cache.get(x.get("Id", ""), 0), reverse=True)
-        elif sort_type == 0: filtered_entries.sort(key=lambda x: x.get("ShortName", "").lower())
-        elif sort_type == 1: filtered_entries.sort(key=lambda x: x.get("ShortName", "").lower(), reverse=True)
-        elif sort_type == 2: filtered_entries.sort(key=lambda x: int(x.get("Id", "0")))
-        elif sort_type == 3: filtered_entries.sort(key=lambda x: int(x.get("Id", "0")), reverse=True)
+        search_text = options["search_text"]
+        sort_type = options["sort_type"]
+        DEBUG.log(f"Filtered entries: {len(filtered_entries)} out of {len(self.entries_by_lang.get(lang, []))}")
 
+        root = AudioTreeNode()
+        expanded_groups = []
         if search_text or sort_type == 4:
             DEBUG.log("Search is active or sorting by recent. Displaying a flat list.")
-            parent_item = tree.invisibleRootItem()
             for entry in filtered_entries:
-                self.add_tree_item(parent_item, entry, lang, entry.get('has_mod_audio', False))
+                root.add(AudioTreeNode(entry))
         else: 
             DEBUG.log("No search. Grouping entries by name categories.")
             
@@ -12058,60 +11675,40 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                     continue
 
                 current_parent_dict = root_groups
-                current_parent_item = tree.invisibleRootItem()
+                current_parent_node = root
 
                 for i, part in enumerate(parts):
                     if part not in current_parent_dict:
                         display_name = "VO (Voice)" if i == 0 and part.upper() == "VO" else part
-                        new_item = QtWidgets.QTreeWidgetItem(current_parent_item, [display_name])
+                        new_node = current_parent_node.add(AudioTreeNode(label=display_name))
                         
                         if i == 0 and part.upper() == "VO":
-                            new_item.setExpanded(True)
+                            expanded_groups.append(new_node)
                         
-                        current_parent_dict[part] = {"__item__": new_item, "__children__": {}}
+                        current_parent_dict[part] = {"__item__": new_node, "__children__": {}}
                     
-                    current_parent_item = current_parent_dict[part]["__item__"]
+                    current_parent_node = current_parent_dict[part]["__item__"]
                     current_parent_dict = current_parent_dict[part]["__children__"]
 
-                self.add_tree_item(current_parent_item, entry, lang, entry.get('has_mod_audio', False))
+                current_parent_node.add(AudioTreeNode(entry))
 
             if id_only_files:
-                id_item = QtWidgets.QTreeWidgetItem(tree, [f"{id_only_category} ({len(id_only_files)})"])
+                id_node = root.add(AudioTreeNode(label=id_only_category))
                 for entry in id_only_files:
-                     self.add_tree_item(id_item, entry, lang, entry.get('has_mod_audio', False))
-            
-            def update_counts(item):
-                if item.childCount() == 0:
-                    return 1
-                
-                count = 0
-                for i in range(item.childCount()):
-                    child = item.child(i)
-                    if child.childCount() > 0:
-                        count += update_counts(child)
-                    else:
-                        count += 1
-                
-                item_text = item.text(0)
-                if "(" not in item_text: 
-                    item.setText(0, f"{item_text} ({count})")
-                return count
-
-            for i in range(tree.topLevelItemCount()):
-                if tree.topLevelItem(i).text(0).startswith(id_only_category):
-                    continue
-                update_counts(tree.topLevelItem(i))
-
+                    id_node.add(AudioTreeNode(entry))
 
+        tree.blockSignals(True)
+        tree.set_root(root, mod_audio_ids)
+        for node in expanded_groups:
+            node.setExpanded(True)
         tree.blockSignals(False)
         
         if selected_keys:
             self.restore_tree_selection(tree, selected_keys)
         elif tree.topLevelItemCount() > 0:
-            first_item = tree.topLevelItem(0)
-            tree.setCurrentItem(first_item)
+            tree.setCurrentItem(tree.topLevelItem(0))
 
-        subtitle_count = sum(1 for entry in filtered_entries if self.subtitles.get(os.path.splitext(entry.get("ShortName", ""))[0], ""))
+        subtitle_count = sum(1 for entry in filtered_entries if self.subtitles.get(entry.key, ""))
         total_lang_entries = len(self.entries_by_lang.get(lang, []))
         stats_text = self.tr("stats_label_text").format(
             filtered_count=len(filtered_entries),
@@ -12119,66 +11716,14 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             subtitle_count=subtitle_count
         )
         widgets["stats_label"].setText(stats_text)
-    def add_tree_item(self, parent_item, entry, lang, has_mod_audio):
-        """Adds a single entry as an item to the tree."""
-        shortname = entry.get("ShortName", "")
-        key = os.path.splitext(shortname)[0]
-        subtitle = self.subtitles.get(key, "")
-        
-        mod_status = ""
-        if has_mod_audio:
-            mod_status = "♪"
-        
-        item = QtWidgets.QTreeWidgetItem(parent_item, [
-            shortname,
-            entry.get("Id", ""),
-            subtitle,
-            "✓" + mod_status if key in self.modified_subtitles else mod_status,
-            ""  
-        ])
-
-        marking = self.marked_items.get(key, {})
-        if 'color' in marking and marking['color'] is not None:
-            for col in range(5):
-                item.setBackground(col, marking['color'])
-        
-        if 'tag' in marking:
-            item.setText(4, marking['tag'])
-        
-        item.setData(0, QtCore.Qt.UserRole, entry)
-        
-        if not subtitle:
-            item.setForeground(2, QtGui.QBrush(QtGui.QColor(128, 128, 128)))
-            
-        if entry.get("Source") == "MediaFilesNotInAnyBank":
-            item.setForeground(0, QtGui.QBrush(QtGui.QColor(100, 100, 200)))    
     def restore_tree_selection(self, tree, target_keys):
         """Restore tree selection after refresh"""
-        def search_and_select(parent_item):
-            for i in range(parent_item.childCount()):
-                try:
-                    item = parent_item.child(i)
-                    if item.childCount() == 0:
-                        entry = item.data(0, QtCore.Qt.UserRole)
-                        if entry:
-                            shortname = entry.get("ShortName", "")
-                            key = os.path.splitext(shortname)[0]
-                            if key in target_keys:
-                                item.setSelected(True)
-                                tree.setCurrentItem(item)
-                                return True
-                    else:
-                        if search_and_select(item):
-                            return True
-                except RuntimeError:
-                    continue
-            return False
-        
-        try:
-            root = tree.invisibleRootItem()
-            search_and_select(root)
-        except RuntimeError:
-            pass
+        for key in target_keys:
+            item = tree.item_for_key(key)
+            if item is not None:
+                item.setSelected(True)
+                tree.setCurrentItem(item)
+                return
 
     def on_selection_changed(self, lang):
         """Updated selection handler without summary"""
@@ -12242,6 +11787,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         widgets["play_mod_btn"].setVisible(has_mod)
         
         self.load_audio_comparison_info(file_id, lang, widgets)
+        self.prefetch_playback(item, lang)
     def load_audio_comparison_info(self, file_id, lang, widgets):
         self.current_bnk_request_id += 1
         request_id = self.current_bnk_request_id
@@ -12251,9 +11797,12 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         
         date_format = "%Y-%m-%d %H:%M:%S"
 
-        original_info = self.get_wem_audio_info_with_markers(original_wem_path) if os.path.exists(original_wem_path) else None
-        if original_info:
-            original_info['file_size'] = os.path.getsize(original_wem_path)
+        if os.path.exists(original_wem_path):
+            original_info = self.get_wem_audio_info_with_markers(original_wem_path)
+            if original_info:
+                original_info['file_size'] = os.path.getsize(original_wem_path)
+        else:
+            original_info = self.get_embedded_audio_info(file_id)
 
         modified_info = self.get_wem_audio_info_with_markers(mod_wem_path) if os.path.exists(mod_wem_path) else None
 
@@ -12357,25 +11906,20 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         try:
             source_id = int(file_id)
             bnk_fixed = False
-            
-            bnk_files_info = self.find_relevant_bnk_files()
 
-            for bnk_path, bnk_type in bnk_files_info:
-                if bnk_type == 'sfx':
-                    rel_path = os.path.relpath(bnk_path, os.path.join(self.base_path, "Wems", "SFX"))
-                    mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-                else:
-                    rel_path = os.path.relpath(bnk_path, os.path.join(self.base_path, "Wems"))
-                    mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
+            for bnk_path, bnk_type, _ in self.find_bnk_owners(source_id):
+                mod_bnk_path = self.get_mod_bnk_path(bnk_path, bnk_type)
                 
-                if not os.path.exists(mod_bnk_path):
+                if not self.mod_bank_exists(mod_bnk_path):
                     continue
                 
-                editor = BNKEditor(mod_bnk_path)
+                with self.open_mod_bank(mod_bnk_path) as editor:
+                    modified = editor.modify_sound(source_id, new_size=new_size, find_by_size=None)
+                    if modified:
+                        editor.save_file()
                 
-                if editor.modify_sound(source_id, new_size=new_size, find_by_size=None):
-                    editor.save_file()
-                    self.invalidate_bnk_cache(source_id)
+                if modified:
+                    self.invalidate_bnk_cache(mod_bnk_path)
                     
                     DEBUG.log(f"Successfully fixed size in {os.path.basename(mod_bnk_path)}.")
                     bnk_fixed = True
@@ -12474,42 +12018,26 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         try:
             source_id = int(file_id)
             reverted = False
-            
-            bnk_files_info = self.find_relevant_bnk_files()
             mod_bnk_path_to_fix = None
-            original_bnk_path_to_use = None
-
-            for bnk_path, bnk_type in bnk_files_info:
-                if bnk_type == 'sfx':
-                    rel_path = os.path.relpath(bnk_path, os.path.join(self.base_path, "Wems", "SFX"))
-                    mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-                else:
-                    rel_path = os.path.relpath(bnk_path, os.path.join(self.base_path, "Wems"))
-                    mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-                
-                if os.path.exists(mod_bnk_path):
+            original_entry = None
 
-                    temp_orig_editor = BNKEditor(bnk_path)
-                    if temp_orig_editor.find_sound_by_source_id(source_id):
-                        mod_bnk_path_to_fix = mod_bnk_path
-                        original_bnk_path_to_use = bnk_path
-                        break
+            for bnk_path, bnk_type, owner_entry in self.find_bnk_owners(source_id):
+                mod_bnk_path = self.get_mod_bnk_path(bnk_path, bnk_type)
+                if self.mod_bank_exists(mod_bnk_path):
+                    mod_bnk_path_to_fix = mod_bnk_path
+                    original_entry = owner_entry
+                    break
             
-            if not mod_bnk_path_to_fix or not original_bnk_path_to_use:
+            if not mod_bnk_path_to_fix:
                 raise FileNotFoundError("Could not locate the modified/original BNK pair for this sound entry.")
 
-            mod_editor = BNKEditor(mod_bnk_path_to_fix)
-            original_editor = BNKEditor(original_bnk_path_to_use)
-            
-            original_entries = original_editor.find_sound_by_source_id(source_id)
-            if not original_entries:
-                raise ValueError(f"Could not find entry for ID {source_id} in the original BNK file to revert to.")
-            original_entry = original_entries[0]
+            with self.open_mod_bank(mod_bnk_path_to_fix) as mod_editor:
+                if mod_editor.modify_sound(source_id, new_size=original_entry.file_size, override_fx=original_entry.override_fx):
+                    mod_editor.save_file()
+                    reverted = True
 
-            if mod_editor.modify_sound(source_id, new_size=original_entry.file_size, override_fx=original_entry.override_fx):
-                mod_editor.save_file()
-                self.invalidate_bnk_cache(source_id)
-                reverted = True
+            if reverted:
+                self.invalidate_bnk_cache(mod_bnk_path_to_fix)
 
             if reverted:
                 QtWidgets.QMessageBox.information(self, "Success", "BNK record reverted successfully to its original state.")
@@ -12557,31 +12085,9 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
     def get_wem_duration(self, wem_path):
 
         try:
-            result = subprocess.run(
-                [self.vgmstream_path, "-m", wem_path],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                startupinfo=startupinfo,
-                creationflags=CREATE_NO_WINDOW,
-                encoding='utf-8',
-                errors='ignore'
-            )
-            
-            if result.returncode == 0:
-                samples = None
-                sample_rate = 48000 
-                
-                for line in result.stdout.split('\n'):
-                    if "stream total samples:" in line:
-                        samples = int(line.split(':')[1].strip().split()[0])
-                    elif "sample rate:" in line:
-                        sample_rate = int(line.split(':')[1].strip().split()[0])
-                
-                if samples:
-                    duration_ms = int((samples / sample_rate) * 1000)
-                    return duration_ms
-                    
+            info = self.get_wem_audio_info(wem_path)
+            if info:
+                return info['duration_ms']
         except Exception as e:
             DEBUG.log(f"Error getting duration: {e}", "ERROR")
             
@@ -12589,9 +12095,13 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
     def get_file_size(self, file_id, lang, widgets):
    
         wem_path = os.path.join(self.wem_root, lang, f"{file_id}.wem")
+        embedded = None if os.path.exists(wem_path) else self.embedded_media_index.lookup(file_id)
         if os.path.exists(wem_path):
             self.original_size = os.path.getsize(wem_path)
             widgets["info_labels"]["size"].setText(f"{self.original_size / 1024:.1f} KB")
+        elif embedded:
+            self.original_size = embedded[1]
+            widgets["info_labels"]["size"].setText(f"{self.original_size / 1024:.1f} KB")
         else:
             self.original_size = 0
             widgets["info_labels"]["size"].setText("N/A")
@@ -12655,28 +12165,88 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             wem_path = self.get_original_path(id_, current_lang)
             
             if not os.path.exists(wem_path):
-                self.status_bar.showMessage(f"File not found: {wem_path}", 3000)
-                return
+                if not self.embedded_media_index.lookup(id_):
+                    self.status_bar.showMessage(f"File not found: {wem_path}", 3000)
+                    return
+                wem_path = None
             self.is_playing_mod = False
             
+        key, decode = self._playback_job(id_, wem_path)
+        if key is None:
+            self.status_bar.showMessage(f"File not found: {wem_path}", 3000)
+            return
+
+        if wem_path is not None and self.wav_cache.peek(key) is None and self._start_stream(wem_path, current_lang):
+            return
+
         source_type = "MOD" if play_mod else "Original"
         self.status_bar.showMessage(f"Converting {source_type} to WAV...")
         QtWidgets.QApplication.processEvents()
         
+        thread = threading.Thread(target=self._convert_and_play, args=(key, decode, current_lang))
+        thread.start()
+    def _playback_job(self, file_id, wem_path):
+        """(cache key, decode) for playing wem_path; None means the media inside an original bank."""
+        if wem_path is None:
+            location = self.embedded_media_index.lookup(file_id)
+            if location is None:
+                return None, None
+            return DecodedWavCache.key_for(location[0], file_id), partial(self.embedded_wem_to_wav, file_id)
+        return DecodedWavCache.key_for(wem_path), partial(self.wem_to_wav_vgmstream, wem_path)
+    def prefetch_playback(self, item, lang, radius=2):
+        """Decode the selected line and its visible neighbours ahead of a play request."""
+        tree = item.treeWidget()
+        if tree is None:
+            return
+        items = [item]
+        for step in (tree.itemBelow, tree.itemAbove):
+            neighbour = item
+            for _ in range(radius):
+                neighbour = step(neighbour)
+                while neighbour is not None and neighbour.childCount() > 0:
+                    neighbour = step(neighbour)
+                if neighbour is None:
+                    break
+                items.append(neighbour)
+
+        jobs = []
+        for candidate in items:
+            entry = candidate.data(0, QtCore.Qt.UserRole)
+            if not entry:
+                continue
+            file_id = entry.get("Id", "")
+            original_path = self.get_original_path(file_id, lang)
+            jobs.append(self._playback_job(file_id, original_path if os.path.exists(original_path) else None))
+            mod_path = self.get_mod_path(file_id, lang)
+            if mod_path and os.path.exists(mod_path):
+                jobs.append(self._playback_job(file_id, mod_path))
+        self.wav_cache.prefetch(jobs)
+    def _start_stream(self, wem_path, lang):
+        """Stream long WEMs from vgmstream's stdout instead of waiting for a full decode."""
+        if not self.settings.data.get("streaming_playback", True):
+            return False
+        info = self.wem_catalog.lookup(wem_path)
+        if not info or not info.get('sample_rate') or info.get('duration_ms', 0) < self.STREAM_MIN_DURATION_MS:
+            return False
+        sample_rate = info['sample_rate']
+
+        def command(start_ms):
+            args = [self.vgmstream_path, "-p", wem_path]
+            if start_ms > 0:
+                args[1:1] = ["-k", str(int(start_ms * sample_rate / 1000))]
+            return args
+
+        self._connect_player_progress(lang)
         try:
-            temp_file_handle = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-            temp_wav = temp_file_handle.name
-            temp_file_handle.close()
-            DEBUG.log(f"Generated unique temp WAV path: {temp_wav}")
+            self.audio_player.play_stream(command, info['duration_ms'])
         except Exception as e:
-            DEBUG.log(f"Failed to create temp file: {e}", "ERROR")
-            self.status_bar.showMessage("Error creating temporary file", 3000)
-            return
-        
-        thread = threading.Thread(target=self._convert_and_play, args=(wem_path, temp_wav, current_lang))
-        thread.start()
-    def _convert_and_play(self, wem_path, wav_path, lang):
-        ok, err = self.wem_to_wav_vgmstream(wem_path, wav_path)
+            DEBUG.log(f"Streaming playback failed, decoding to a file instead: {e}", "WARNING")
+            return False
+        source_type = "MOD" if self.is_playing_mod else "Original"
+        self.status_bar.showMessage(f"Streaming {source_type} audio...", 2000)
+        return True
+    def _convert_and_play(self, key, decode, lang):
+        ok, wav_path, err = self.wav_cache.fetch(key, decode)
         
         QtCore.QMetaObject.invokeMethod(self, "_play_converted", 
                                        QtCore.Qt.QueuedConnection,
@@ -12689,27 +12259,30 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
     def _play_converted(self, ok, wav_path, error, lang):
         if ok:
             self.temp_wav = wav_path
+            self.wav_cache.pin(wav_path)
             self.audio_player.play(wav_path)
             source_type = "MOD" if self.is_playing_mod else "Original"
             self.status_bar.showMessage(f"Playing {source_type} audio...", 2000)
-            
-
-            if lang in self.tab_widgets:
-                widgets = self.tab_widgets[lang]
-                
-                try:
-                    self.audio_player.positionChanged.disconnect()
-                    self.audio_player.durationChanged.disconnect()
-                except:
-                    pass
-                    
-                self.audio_player.positionChanged.connect(
-                    lambda pos: self.update_audio_position(pos, widgets))
-                self.audio_player.durationChanged.connect(
-                    lambda dur: self.update_audio_duration(dur, widgets))
+            self._connect_player_progress(lang)
         else:
             self.status_bar.showMessage(f"Conversion failed: {error}", 3000)
 
+    def _connect_player_progress(self, lang):
+        if lang not in self.tab_widgets:
+            return
+        widgets = self.tab_widgets[lang]
+        
+        try:
+            self.audio_player.positionChanged.disconnect()
+            self.audio_player.durationChanged.disconnect()
+        except:
+            pass
+            
+        self.audio_player.positionChanged.connect(
+            lambda pos: self.update_audio_position(pos, widgets))
+        self.audio_player.durationChanged.connect(
+            lambda dur: self.update_audio_duration(dur, widgets))
+
     def update_audio_position(self, position, widgets):
         widgets["audio_progress"].setValue(position)
         self.update_time_label(widgets)
@@ -12719,8 +12292,8 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.update_time_label(widgets)
 
     def update_time_label(self, widgets):
-        position = self.audio_player.player.position()
-        duration = self.audio_player.player.duration()
+        position = self.audio_player.position()
+        duration = self.audio_player.duration()
         pos_min = position // 60000
         pos_sec = (position % 60000) / 1000
         pos_str = f"{pos_min:02d}:{pos_sec:06.3f}" 
@@ -12737,11 +12310,8 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
 
     def stop_audio(self):
         self.audio_player.stop()
-        if self.temp_wav and os.path.exists(self.temp_wav):
-            try:
-                os.remove(self.temp_wav)
-            except:
-                pass
+        # The decoded WAV stays in wav_cache for the next play of this line
+        self.wav_cache.pin(None)
         self.temp_wav = None
         self.is_playing_mod = False
 
@@ -12773,6 +12343,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         if editor.exec_() == QtWidgets.QDialog.Accepted:
             new_subtitle = editor.get_text()
             self.subtitles[key] = new_subtitle
+            self.search_index.invalidate(key)
         
             if key in self.key_to_file_map:
                 file_info = self.key_to_file_map[key]
@@ -12786,12 +12357,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             
             try:
                 if not self.is_item_deleted(item):
-                    item.setText(2, new_subtitle)
-                    current_status = item.text(3).replace("✓", "")
-                    if key in self.modified_subtitles:
-                        item.setText(3, "✓" + current_status)
-                    else:
-                        item.setText(3, current_status)
+                    tree.refresh_item(item)
                     
                     widgets["subtitle_text"].setPlainText(new_subtitle)
                     if original_subtitle and original_subtitle != new_subtitle:
@@ -12807,38 +12373,10 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             self.update_status()
 
     def find_tree_item_by_key(self, tree, target_key, target_entry):
-
-        def search_items(parent_item):
-            for i in range(parent_item.childCount()):
-                item = parent_item.child(i)
-                
-                if item.childCount() == 0: 
-                    try:
-                        entry = item.data(0, QtCore.Qt.UserRole)
-                        if entry:
-                            shortname = entry.get("ShortName", "")
-                            key = os.path.splitext(shortname)[0]
-                            
-                            if key == target_key:
-                                return item
-                    except RuntimeError:
-                  
-                        continue
-                else:
-           
-                    result = search_items(item)
-                    if result:
-                        return result
-            return None
-        
-        try:
-            root = tree.invisibleRootItem()
-            return search_items(root)
-        except RuntimeError:
-            return None
+        return tree.item_for_key(target_key)
 
     def is_item_deleted(self, item):
-        """Check if QTreeWidgetItem is still valid"""
+        """Check if a tree item is still valid"""
         try:
  
             _ = item.text(0)
@@ -12870,12 +12408,11 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         if key in self.original_subtitles:
             original = self.original_subtitles[key]
             self.subtitles[key] = original
+            self.search_index.invalidate(key)
             self.modified_subtitles.discard(key)
             
 
-            item.setText(2, original)
-            current_status = item.text(3).replace("✓", "")
-            item.setText(3, current_status)
+            tree.refresh_item(item)
             
             widgets["subtitle_text"].setPlainText(original)
             widgets["original_subtitle_label"].hide()
@@ -12966,6 +12503,9 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                         self.original_subtitles[key] = ""
                     if value != self.original_subtitles.get(key, ""):
                         self.modified_subtitles.add(key)
+
+            for key in custom_subtitles:
+                self.search_index.invalidate(key)
             
             current_lang = self.get_current_language()
             if current_lang and current_lang in self.tab_widgets:
@@ -13217,14 +12757,16 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         clicked_button = msg.clickedButton()
         wem_path = None
 
+        embedded = False
         if clicked_button == original_btn:
             wem_path = self.get_original_path(id_, current_lang)
+            embedded = not os.path.exists(wem_path) and self.embedded_media_index.lookup(id_) is not None
         elif mod_btn and clicked_button == mod_btn:
             wem_path = mod_wem_path
         else:
             return
             
-        if not wem_path or not os.path.exists(wem_path):
+        if not embedded and (not wem_path or not os.path.exists(wem_path)):
             self.status_bar.showMessage(f"Source file not found: {wem_path}", 3000)
             return
             
@@ -13252,13 +12794,16 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
 
             thread = threading.Thread(
                 target=self._export_single_wav_thread, 
-                args=(wem_path, save_path, progress)
+                args=(None if embedded else wem_path, save_path, progress, id_)
             )
             thread.daemon = True
             thread.start()
-    def _export_single_wav_thread(self, wem_path, save_path, progress_dialog):
+    def _export_single_wav_thread(self, wem_path, save_path, progress_dialog, file_id=None):
         try:
-            ok, err = self.wem_to_wav_vgmstream(wem_path, save_path)
+            if wem_path is None:
+                ok, err = self.embedded_wem_to_wav(file_id, save_path)
+            else:
+                ok, err = self.wem_to_wav_vgmstream(wem_path, save_path)
             
             QtCore.QMetaObject.invokeMethod(
                 self, "_on_single_export_finished", QtCore.Qt.QueuedConnection,
@@ -13292,19 +12837,82 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 "Error",
                 f"Conversion failed: {error_message}"
             )
-    def wem_to_wav_vgmstream(self, wem_path, wav_path):
+    def wem_to_wav_vgmstream(self, wem_path, wav_path, timeout=10):
         try:
             result = subprocess.run(
                 [self.vgmstream_path, wem_path, "-o", wav_path],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                timeout=10,
+                timeout=timeout,
                 startupinfo=startupinfo,
                 creationflags=CREATE_NO_WINDOW
             )
             return result.returncode == 0, result.stderr.decode()
         except Exception as e:
             return False, str(e)
+    def get_loudness_analysis(self, wem_path, volume_processor):
+        """RMS/peak analysis of a WEM, decoded only when the catalogue has none for this version."""
+        return self.get_loudness_analyses([wem_path], volume_processor).get(wem_path)
+    def get_loudness_analyses(self, wem_paths, volume_processor, on_result=None, should_stop=None):
+        """{wem_path: analysis} for many WEMs; uncatalogued ones are decoded on the shared pool."""
+        results = {}
+        pending = []
+        for wem_path in wem_paths:
+            if should_stop and should_stop():
+                return results
+            analysis = self.wem_catalog.get_loudness(wem_path)
+            if analysis is not None:
+                results[wem_path] = analysis
+                if on_result:
+                    on_result(wem_path, analysis)
+            else:
+                pending.append(wem_path)
+        if not pending:
+            return results
+
+        temp_dir = tempfile.mkdtemp(prefix="loudness_")
+        try:
+            jobs = [DecodeJob(wem_path, os.path.join(temp_dir, f"{i}.wav"), wem_path)
+                    for i, wem_path in enumerate(pending)]
+            for job, ok, err in self.decode_service.run(jobs, should_stop=should_stop):
+                if should_stop and should_stop():
+                    break
+                analysis = None
+                if ok:
+                    analysis = volume_processor.analyze_audio(job.wav_path)
+                    if analysis:
+                        self.wem_catalog.put_loudness(job.wem_path, analysis)
+                        results[job.wem_path] = analysis
+                    try:
+                        os.remove(job.wav_path)
+                    except OSError as e:
+                        DEBUG.log(f"Could not remove temporary WAV {job.wav_path}: {e}", "WARNING")
+                else:
+                    DEBUG.log(f"Loudness analysis conversion failed for {job.wem_path}: {err}", "WARNING")
+                if on_result:
+                    on_result(job.wem_path, analysis)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        return results
+    def embedded_wem_to_wav(self, file_id, wav_path):
+        """Decode a WEM that only exists inside an original bank.
+
+        vgmstream-cli reads from a path, so just this media's slice of the mapped
+        bank is spooled next to the WAV and removed once decoded.
+        """
+        temp_wem = os.path.splitext(wav_path)[0] + f".{file_id}.wem"
+        try:
+            if not self.embedded_media_index.export(file_id, temp_wem):
+                return False, f"Media {file_id} is not embedded in any bank"
+            return self.wem_to_wav_vgmstream(temp_wem, wav_path)
+        except Exception as e:
+            return False, str(e)
+        finally:
+            if os.path.exists(temp_wem):
+                try:
+                    os.remove(temp_wem)
+                except OSError:
+                    pass
     def toggle_ingame_effects(self):
         current_lang = self.get_current_language()
         if not current_lang:
@@ -13321,8 +12929,10 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         if not bnk_files:
             QtWidgets.QMessageBox.warning(self, "Error", "No BNK files found for modification.")
             return
+        self.bnk_index.refresh(bnk_files)
             
-        modified_count = 0
+        bnk_transaction = self.new_bnk_transaction()
+        shortnames = {}
         for item in file_items:
             entry = item.data(0, QtCore.Qt.UserRole)
             if not entry:
@@ -13330,41 +12940,31 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
 
             source_id = int(entry.get("Id", ""))
             shortname = entry.get("ShortName", "")
-            
-            bnk_files_info = self.find_relevant_bnk_files()
-            for bnk_path, bnk_type in bnk_files_info:
-                if bnk_type == 'sfx':
-                    rel_path = os.path.relpath(bnk_path, os.path.join(self.base_path, "Wems", "SFX"))
-                    mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-                else: # 'lang'
-                    rel_path = os.path.relpath(bnk_path, os.path.join(self.base_path, "Wems"))
-                    mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-
-                original_editor = BNKEditor(bnk_path)
-                if not original_editor.find_sound_by_source_id(source_id):
-                    continue 
-
-                if not os.path.exists(mod_bnk_path):
-                    os.makedirs(os.path.dirname(mod_bnk_path), exist_ok=True)
-                    shutil.copy2(bnk_path, mod_bnk_path)
-                
-                editor = BNKEditor(mod_bnk_path)
-                current_entries = editor.find_sound_by_source_id(source_id)
+            owners = self.find_bnk_owners(source_id, bnk_files, refresh=False)
 
-                if current_entries:
-                    current_state = current_entries[0].override_fx
-                    new_state = not current_state
-                    
-                    if editor.modify_sound(source_id, override_fx=new_state, find_by_size=None):
-                        editor.save_file()
-                        self.invalidate_bnk_cache(source_id)
-                        DEBUG.log(f"FX for {shortname} (ID: {source_id}) changed from {current_state} to {new_state} in {os.path.basename(mod_bnk_path)}")
-                        modified_count += 1
-                        bnk_found_and_modified = True
-                        break 
-            
-            if not bnk_found_and_modified:
+            if not owners:
                 DEBUG.log(f"Could not find or modify record for {shortname} (ID: {source_id}) in any BNK file.", "WARNING")
+                continue
+
+            # A missing mod bank is created by copy-then-patch from the original on commit
+            bnk_path, bnk_type, _ = owners[0]
+            bnk_transaction.add(self.get_mod_bnk_path(bnk_path, bnk_type), source_id,
+                                toggle_fx=True, source_bnk_path=bnk_path)
+            shortnames[source_id] = shortname
+
+        modified_count = 0
+        try:
+            results = self.commit_bnk_transaction(bnk_transaction)
+        except Exception as e:
+            DEBUG.log(f"Error changing In-Game Effects: {e}", "ERROR")
+            QtWidgets.QMessageBox.warning(self, "Error", f"Failed to update BNK files: {str(e)}")
+            results = {}
+
+        for mod_bnk_path, applied in results.items():
+            for source_id, previous_entry in applied.items():
+                current_state = previous_entry.override_fx
+                DEBUG.log(f"FX for {shortnames.get(source_id, source_id)} (ID: {source_id}) changed from {current_state} to {not current_state} in {os.path.basename(mod_bnk_path)}")
+                modified_count += 1
 
         self.populate_tree(current_lang)
         self.status_bar.showMessage(f"In-Game Effects changed for {modified_count} files.", 3000)
@@ -13416,7 +13016,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         tools_menu.addSeparator()
         self.rescan_orphans_action = tools_menu.addAction(self.tr("rescan_orphans_action"))
         self.rescan_orphans_action.setToolTip(self.tr("rescan_orphans_tooltip"))
-        self.rescan_orphans_action.triggered.connect(self.perform_blocking_orphan_scan)
+        self.rescan_orphans_action.triggered.connect(lambda: self.start_orphan_scan(force=True))
         tools_menu.addSeparator()
         self.debug_action = tools_menu.addAction(self.tr("show_debug"))
         self.debug_action.setShortcut("Ctrl+D")
@@ -13451,113 +13051,21 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.about_action = help_menu.addAction(self.tr("about"))
         self.about_action.triggered.connect(self.show_about)
     def load_orphans_from_cache_or_scan(self):
-        """Loads orphaned files from cache or performs a synchronous scan with a progress dialog."""
+        """Shows cached orphaned files right away, then brings them up to date with a background scan."""
         if os.path.exists(self.orphaned_cache_path):
             DEBUG.log(f"Loading orphaned files from cache: {self.orphaned_cache_path}")
             try:
-                with open(self.orphaned_cache_path, 'r', encoding='utf-8') as f:
-                    self.orphaned_files_cache = json.load(f)
+                self.orphan_scan_state = OrphanWemScanner.load_state(self.orphaned_cache_path)
+                self.orphaned_files_cache = [AudioEntry(entry) for entry in self.orphan_scan_state.get("entries", [])]
                 DEBUG.log(f"Loaded {len(self.orphaned_files_cache)} orphans from cache.")
                 self.rebuild_file_list_with_orphans()
             except Exception as e:
                 DEBUG.log(f"Error loading orphan cache: {e}. Starting a new scan.", "ERROR")
-                self.perform_blocking_orphan_scan()
+                self.orphan_scan_state = None
+                self.orphaned_files_cache = []
         else:
             DEBUG.log("Orphan cache not found. Starting initial scan.")
-            self.perform_blocking_orphan_scan()
-    def perform_blocking_orphan_scan(self):
-        """Performs a synchronous scan of the Wems folder with a progress dialog, blocking the UI."""
-        self.all_files = [f for f in self.all_files if f.get("Source") != "ScannedFromFileSystem"]
-        self.orphaned_files_cache = []
-        DEBUG.log("Cleared existing orphan files to perform a full rescan.")
-
-        progress = ProgressDialog(self, self.tr("scan_progress_title"))
-        progress.setWindowFlags(progress.windowFlags() | QtCore.Qt.CustomizeWindowHint | QtCore.Qt.WindowTitleHint)
-        progress.setWindowFlags(progress.windowFlags() & ~QtCore.Qt.WindowCloseButtonHint)
-        progress.set_progress(0, "Preparing to scan...")
-        progress.show()
-        QtWidgets.QApplication.processEvents()
-
-        known_ids = {entry.get("Id") for entry in self.load_all_soundbank_files(self.soundbanks_path) if entry.get("Id")}
-        
-        orphaned_entries = []
-        if not os.path.exists(self.wem_root):
-            progress.close()
-            self.rebuild_file_list_with_orphans()
-            return
-
-        all_wem_paths = []
-        for root, _, files in os.walk(self.wem_root):
-            for file in files:
-                if file.lower().endswith('.wem'):
-                    all_wem_paths.append(os.path.join(root, file))
-
-        wem_files_to_scan = [
-            path for path in all_wem_paths 
-            if os.path.splitext(os.path.basename(path))[0] not in known_ids
-        ]
-        
-        total_files = len(wem_files_to_scan)
-        if total_files == 0:
-            DEBUG.log("No new orphan files found.")
-            progress.close()
-            self.rebuild_file_list_with_orphans() 
-            self.status_bar.showMessage("No new audio files found during scan.", 5000)
-            return
-            
-        progress.set_progress(5, f"Scanning {total_files} new files...")
-        QtWidgets.QApplication.processEvents()
-
-        for i, full_path in enumerate(wem_files_to_scan):
-            if i % 20 == 0:
-                QtWidgets.QApplication.processEvents()
-                progress.set_progress(int((i / total_files) * 100), f"Scanning {os.path.basename(full_path)}")
-
-            file_id = os.path.splitext(os.path.basename(full_path))[0]
-      
-            rel_path = os.path.relpath(os.path.dirname(full_path), self.wem_root)
-            parts = rel_path.split(os.sep)
-            
-            lang = "SFX"
-            if rel_path == '.' or rel_path == "SFX":
-                lang = "SFX"
-            elif parts[0] == "Media":
-                if len(parts) > 1:
-                    lang = parts[1]
-                else:
-                    lang = "SFX"
-            else:
-                lang = rel_path
-
-            short_name = f"{file_id}.wav"
-            try:
-                analyzer = WEMAnalyzer(full_path)
-                if analyzer.analyze():
-                    markers = analyzer.get_markers_info()
-                    if markers and markers[0]['label']:
-                        short_name = f"{markers[0]['label']}.wav"
-            except Exception:
-                pass
-
-            new_entry = {
-                "Id": file_id, "Language": lang, "ShortName": short_name, 
-                "Path": os.path.basename(full_path), "Source": "ScannedFromFileSystem"
-            }
-            orphaned_entries.append(new_entry)
-
-        progress.set_progress(100, "Finalizing...")
-        
-        self.orphaned_files_cache = orphaned_entries
-        try:
-            with open(self.orphaned_cache_path, 'w', encoding='utf-8') as f:
-                json.dump(self.orphaned_files_cache, f, indent=2)
-            DEBUG.log(f"Saved {len(orphaned_entries)} orphaned files to cache.")
-        except Exception as e:
-            DEBUG.log(f"Failed to save orphan cache: {e}", "ERROR")
-
-        progress.close()
-        self.rebuild_file_list_with_orphans()
-        self.status_bar.showMessage(f"Rescan complete. Found and cached {len(orphaned_entries)} additional audio files.", 5000)
+        self.start_orphan_scan()
     def start_orphan_scan(self, force=False):
         """Starts the background thread to scan for orphaned WEM files."""
         if self.scanner_thread and self.scanner_thread.isRunning():
@@ -13568,7 +13076,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 self.scanner_thread.stop()
                 self.scanner_thread.wait()
 
-        is_first_scan = not os.path.exists(self.orphaned_cache_path)
+        is_first_scan = self.orphan_scan_state is None
         if is_first_scan or force:
             if self.scan_message_box:
                 self.scan_message_box.close()
@@ -13600,7 +13108,10 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             self.status_bar.showMessage("Scanning for additional audio files... You can continue working.", 0)
 
         known_ids = {entry.get("Id") for entry in self.load_all_soundbank_files(self.soundbanks_path) if entry.get("Id")}
-        self.scanner_thread = WemScannerThread(self.wem_root, known_ids, self)
+        state = None if force else self.orphan_scan_state
+        scanner = OrphanWemScanner(self.wem_root, self.wem_catalog)
+        self.scanner_thread = WemScannerThread(scanner, known_ids, state, self)
+        self.scanner_thread.entry_found.connect(self._add_orphaned_entry)
         self.scanner_thread.scan_finished.connect(self._on_scan_finished)
         self.scanner_thread.start()
     def hide_scan_notification(self):
@@ -13616,10 +13127,10 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         count = len(orphaned_files)
         DEBUG.log(f"Orphan scan finished. Found {count} additional files.")
         
-        self.orphaned_files_cache = orphaned_files
+        self.orphaned_files_cache = [AudioEntry(entry) for entry in orphaned_files]
+        self.orphan_scan_state = self.scanner_thread.state
         try:
-            with open(self.orphaned_cache_path, 'w', encoding='utf-8') as f:
-                json.dump(self.orphaned_files_cache, f, indent=2)
+            OrphanWemScanner.save_state(self.orphaned_cache_path, self.orphan_scan_state)
             DEBUG.log(f"Saved {count} orphaned files to cache.")
         except Exception as e:
             DEBUG.log(f"Failed to save orphan cache: {e}", "ERROR")
@@ -13639,8 +13150,10 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
       
             if file_id and file_id in self.wem_index:
                 filtered_base_files.append(entry)
+            elif file_id and str(entry.get("Source", "")).startswith("Bank: ") and self.embedded_media_index.lookup(file_id):
+                filtered_base_files.append(entry)
         
-        DEBUG.log(f"Filtered SoundbanksInfo: {len(filtered_base_files)} entries have a physical .wem file (out of {len(base_files)} loaded from JSON).")
+        DEBUG.log(f"Filtered SoundbanksInfo: {len(filtered_base_files)} entries have a physical or bank-embedded .wem (out of {len(base_files)} loaded from JSON).")
 
         show_orphans = self.settings.data.get("show_orphaned_files", False)
         
@@ -13820,12 +13333,24 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             DEBUG.log("No active profile.")
         
         self.settings.save()
+        self.start_catalog_refresh()
         current_lang = self.get_current_language()
         if current_lang and current_lang in self.tab_widgets:
             if current_lang not in self.populated_tabs:
                  self.populated_tabs.add(current_lang)
             self.populate_tree(current_lang)
 
+    def start_catalog_refresh(self):
+        """Refresh the WEM catalogue for the game and active mod folders in the background."""
+        if self.catalog_thread and self.catalog_thread.isRunning():
+            self.catalog_thread.stop()
+            self.catalog_thread.wait()
+        roots = [self.wem_root]
+        if self.mod_p_path:
+            roots.append(os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows"))
+        self.catalog_thread = WemCatalogThread(self.wem_catalog, roots, self)
+        self.catalog_thread.start()
+
     def switch_profile_by_index(self, index):
         profile_name = self.profile_combo.itemText(index)
         if profile_name in self.profiles:
@@ -14088,6 +13613,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         try:
             os.makedirs(os.path.dirname(mod_path), exist_ok=True)
             shutil.copy2(backup_path, mod_path)
+            self.get_mod_audio_index().note_written(mod_path)
             DEBUG.log(f"Restored WEM from backup: {backup_path} -> {mod_path}")
         except Exception as e:
             DEBUG.log(f"Failed to restore WEM file: {e}", "ERROR")
@@ -14096,18 +13622,11 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         try:
             source_id = int(file_id)
             bnk_reverted = False
-            
-            bnk_files_info = self.find_relevant_bnk_files()
 
-            for bnk_path, bnk_type in bnk_files_info:
-                # Check original BNK first to get expected size
-                original_bnk = BNKEditor(bnk_path)
-                original_entries = original_bnk.find_sound_by_source_id(source_id)
-                if not original_entries:
-                    continue
-                
-                original_expected_size = original_entries[0].file_size
-                original_fx_flag = original_entries[0].override_fx
+            for bnk_path, bnk_type, original_entry in self.find_bnk_owners(source_id):
+                # Original expected size comes from the BNK index
+                original_expected_size = original_entry.file_size
+                original_fx_flag = original_entry.override_fx
                 
                 # Check if restored file needs padding to match original expectation
                 current_size = os.path.getsize(mod_path)
@@ -14122,24 +13641,21 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                     except Exception as ex:
                         DEBUG.log(f"Failed to pad restored file: {ex}", "WARNING")
                 
-                if bnk_type == 'sfx':
-                    rel_path = os.path.relpath(bnk_path, os.path.join(self.base_path, "Wems", "SFX"))
-                    if rel_path.startswith(".."): rel_path = os.path.basename(bnk_path)
-                    mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
-                else:
-                    rel_path = os.path.relpath(bnk_path, os.path.join(self.base_path, "Wems"))
-                    mod_bnk_path = os.path.join(self.mod_p_path, "OPP", "Content", "WwiseAudio", "Windows", rel_path)
+                mod_bnk_path = self.get_mod_bnk_path(bnk_path, bnk_type)
                 
-                if not os.path.exists(mod_bnk_path):
+                if not self.mod_bank_exists(mod_bnk_path):
                     continue
 
-                mod_bnk_editor = BNKEditor(mod_bnk_path)
-                if mod_bnk_editor.modify_sound(source_id, 
-                                            new_size=backup_wem_size,
-                                            override_fx=original_fx_flag,
-                                            find_by_size=None):
-                    mod_bnk_editor.save_file()
-                    self.invalidate_bnk_cache(source_id)
+                with self.open_mod_bank(mod_bnk_path) as mod_bnk_editor:
+                    restored = mod_bnk_editor.modify_sound(source_id, 
+                                                           new_size=backup_wem_size,
+                                                           override_fx=original_fx_flag,
+                                                           find_by_size=None)
+                    if restored:
+                        mod_bnk_editor.save_file()
+
+                if restored:
+                    self.invalidate_bnk_cache(mod_bnk_path)
                     DEBUG.log(f"BNK {os.path.basename(mod_bnk_path)} reverted to backup size ({backup_wem_size} bytes) for ID {source_id}.")
                     bnk_reverted = True
                     break
@@ -14305,8 +13821,9 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                             self.marked_items[key] = {}
                         self.marked_items[key]['color'] = color
                     
-                    for col in range(5):
-                        item.setBackground(col, color if color else QtGui.QColor(255, 255, 255))
+                    tree = item.treeWidget()
+                    if tree is not None:
+                        tree.refresh_item(item)
         
         self.settings.save()
 
@@ -14326,7 +13843,6 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                         if key not in self.marked_items:
                             self.marked_items[key] = {}
                         self.marked_items[key]['tag'] = tag
-                    item.setText(4, tag)
         current_lang = self.get_current_language()
         if current_lang:
             self.update_filter_combo(current_lang)
@@ -14565,6 +14081,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 DEBUG.log(f"Created new backup from loaded audio: {backup_path}")
             
             shutil.copy2(source_wem, target_path)
+            self.get_mod_audio_index().note_written(target_path)
             
             QtCore.QMetaObject.invokeMethod(
                 progress, "set_progress",
@@ -14668,8 +14185,10 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         errors = []
         successful_count = 0
         overwrite_all = False
+        jobs = []
 
-        for i, item in enumerate(file_items):
+        # Resolve sources and settle every overwrite prompt before any decode starts
+        for item in file_items:
             entry = item.data(0, QtCore.Qt.UserRole)
             if not entry:
                 continue
@@ -14677,10 +14196,6 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             id_ = entry.get("Id", "")
             shortname = entry.get("ShortName", "")
             
-            QtCore.QMetaObject.invokeMethod(progress, "set_progress", QtCore.Qt.QueuedConnection,
-                                            QtCore.Q_ARG(int, int((i / len(file_items)) * 100)),
-                                            QtCore.Q_ARG(str, f"Converting {shortname}..."))
-            
             wem_path = None
             if export_mod:
                 mod_wem_path = self.get_mod_path(id_, lang)
@@ -14708,16 +14223,21 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                     overwrite_all = True
             
             if wem_path and os.path.exists(wem_path):
-                ok, err = self.wem_to_wav_vgmstream(wem_path, wav_path)
-                if not ok:
-                    errors.append(f"{shortname}: {err}")
-                    QtCore.QMetaObject.invokeMethod(progress, "append_details", QtCore.Qt.QueuedConnection,
-                                                    QtCore.Q_ARG(str, f"Failed: {shortname}"))
-                else:
-                    successful_count += 1
+                jobs.append(DecodeJob(wem_path, wav_path, shortname))
             else:
                 errors.append(f"{shortname}: Source WEM file not found")
 
+        for done, (job, ok, err) in enumerate(self.decode_service.run(jobs), 1):
+            if not ok:
+                errors.append(f"{job.label}: {err}")
+                QtCore.QMetaObject.invokeMethod(progress, "append_details", QtCore.Qt.QueuedConnection,
+                                                QtCore.Q_ARG(str, f"Failed: {job.label}"))
+            else:
+                successful_count += 1
+            QtCore.QMetaObject.invokeMethod(progress, "set_progress", QtCore.Qt.QueuedConnection,
+                                            QtCore.Q_ARG(int, int((done / len(jobs)) * 100)),
+                                            QtCore.Q_ARG(str, f"Converted {done} of {len(jobs)}: {job.label}"))
+
         QtCore.QMetaObject.invokeMethod(self, "_on_batch_export_finished", QtCore.Qt.QueuedConnection,
                                         QtCore.Q_ARG(object, progress),
                                         QtCore.Q_ARG(int, successful_count),
@@ -14744,12 +14264,12 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
     @QtCore.pyqtSlot(result=bool)
     def _ask_convert_old_mod_structure(self):
         """Asks the user if they want to convert old mod structure to new Media/ format."""
-        title = self.translations.get(self.current_lang, {}).get(
-            "outdated_mod_structure_title", "Outdated Mod Structure"
+        title = self.translations.text(
+            self.current_lang, "outdated_mod_structure_title", "Outdated Mod Structure"
         )
         
-        msg = self.translations.get(self.current_lang, {}).get(
-            "outdated_mod_structure_msg", 
+        msg = self.translations.text(
+            self.current_lang, "outdated_mod_structure_msg", 
             "The mod you are importing uses the old file structure (pre-update).\n\n"
             "The game now requires audio files to be in a 'Media' subfolder.\n"
             "Do you want to automatically reorganize the files to the new format?"
@@ -14835,7 +14355,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
     def perform_delayed_search(self):
         current_lang = self.get_current_language()
         if current_lang and current_lang in self.tab_widgets:
-            self.populate_tree(current_lang)    
+            self.request_populate_tree(current_lang)
 
     def on_tab_changed(self, index):
 
@@ -14932,7 +14452,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             border-bottom: 2px solid #FFA500;
         }
 
-        QTreeWidget, QTableWidget {
+        QTreeView, QTableWidget {
             background-color: #2b2b2b;
             alternate-background-color: #3c3f41; 
             border: 1px solid #4a4d4f;
@@ -14940,7 +14460,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             selection-color: #ffffff; 
             gridline-color: #4a4d4f; 
         }
-        QTreeWidget::item:hover, QTableWidget::item:hover {
+        QTreeView::item:hover, QTableWidget::item:hover {
             background-color: #45494a;
         }
         QHeaderView::section {
@@ -15108,14 +14628,14 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             border-bottom: 2px solid #f71eaa;
         }
         
-        QTreeWidget {
+        QTreeView {
             background-color: #ffffff;
             alternate-background-color: #f9f9f9;
             border: 1px solid #cccccc;
             selection-background-color: #bee6fd;
         }
         
-        QTreeWidget::item:hover {
+        QTreeView::item:hover {
             background-color: #e5f3ff;
         }
         
@@ -15247,7 +14767,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         except Exception:
             pass
         
-        self.compile_thread = CompileModThread(self.repak_path, self.mod_p_path)
+        self.compile_thread = CompileModThread(self.repak_path, self.mod_p_path, self.get_bnk_delta())
 
         self.compile_thread.finished.connect(self.on_compilation_finished)
         self.compile_thread.start()
@@ -16750,6 +16270,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 dest_path = os.path.join(target_dir, dest_filename)
                 
                 shutil.copy2(source_path, dest_path)
+                self.get_mod_audio_index().note_written(dest_path)
                 deployed_count += 1
                 
                 DEBUG.log(f"Deployed: {file_pair['audio_name']} -> {dest_filename} in {language} (Media folder)")
@@ -16779,6 +16300,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                 dest_path = os.path.join(target_dir, filename)
                 
                 shutil.copy2(source_path, dest_path)
+                self.get_mod_audio_index().note_written(dest_path)
                 copied_count += 1
                 
                 DEBUG.log(f"Deployed: {filename} to {language}")
@@ -17311,7 +16833,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         else:
             filter_combo.setCurrentIndex(0)
 
-        filter_combo.currentIndexChanged.connect(lambda: self.populate_tree(lang))
+        filter_combo.currentIndexChanged.connect(lambda: self.request_populate_tree(lang))
         
    
     def create_language_tab(self, lang):
@@ -17332,7 +16854,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             self.tr("modified"),
             self.tr("modded")
         ])
-        filter_combo.currentIndexChanged.connect(lambda: self.populate_tree(lang))
+        filter_combo.currentIndexChanged.connect(lambda: self.request_populate_tree(lang))
 
         sort_combo = QtWidgets.QComboBox()
         sort_combo.addItems([
@@ -17342,7 +16864,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             self.tr("id_desc"), 
             self.tr("recent_first")
         ])
-        sort_combo.currentIndexChanged.connect(lambda: self.populate_tree(lang))
+        sort_combo.currentIndexChanged.connect(lambda: self.request_populate_tree(lang))
         show_orphans_checkbox = QtWidgets.QCheckBox(self.tr("show_scanned_files_check"))
         show_orphans_checkbox.setToolTip(self.tr("show_scanned_files_tooltip"))
         show_orphans_checkbox.setChecked(self.settings.data.get("show_orphaned_files", False))
@@ -17365,7 +16887,6 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         tree.setAcceptDrops(True)
         tree.setDragDropMode(QtWidgets.QAbstractItemView.DropOnly)
         tree.viewport().setAcceptDrops(True)
-        tree.setColumnCount(5) 
         tree.setHeaderLabels([self.tr("name"), self.tr("id"), self.tr("subtitle"), self.tr("status"), "Tag"])
         tree.setColumnWidth(0, 350)
         tree.setColumnWidth(1, 100)
@@ -17697,26 +17218,46 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         self.rebuild_file_list_with_orphans()
     def get_wem_audio_info_with_markers(self, wem_path):
         """Get detailed audio information including markers from WEM file"""
-        info = self.get_wem_audio_info(wem_path)
-        
+        return self.wem_catalog.lookup(wem_path)
+
+    def _catalog_probe(self, wem_path):
+        """Probe used to fill the WemCatalog: header parse, vgmstream for other codecs."""
+        analyzer = WEMAnalyzer(wem_path, verbose=False)
+        analyzed = analyzer.analyze()
+
+        info = (analyzer.audio_info() if analyzed else None) or self._probe_wem_vgmstream(wem_path)
         if info is None:
             return None
+
+        info['markers'] = analyzer.get_markers_info() if analyzed else []
+        if analyzed and analyzer.sample_rate > 0:
+            info['sample_rate'] = analyzer.sample_rate
         
+        return info
 
+    def get_embedded_audio_info(self, file_id):
+        """Audio info and markers of a WEM that only exists inside an original bank."""
+        location = self.embedded_media_index.lookup(file_id)
+        if location is None:
+            return None
         try:
-            analyzer = WEMAnalyzer(wem_path)
-            if analyzer.analyze():
-                info['markers'] = analyzer.get_markers_info()
-       
-                if analyzer.sample_rate > 0:
-                    info['sample_rate'] = analyzer.sample_rate
-            else:
-                info['markers'] = []
+            with BNKEditor(location[0], use_mmap=True) as editor:
+                view = editor.media_view(int(file_id))
+                if view is None:
+                    return None
+                try:
+                    analyzer = WEMAnalyzer(f"{os.path.basename(location[0])}:{file_id}", data=view)
+                    info = analyzer.audio_info() if analyzer.analyze() else None
+                    if info is not None:
+                        info['markers'] = analyzer.get_markers_info()
+                        info['file_size'] = location[1]
+                    return info
+                finally:
+                    analyzer.data = None
+                    view.release()
         except Exception as e:
-            DEBUG.log(f"Error analyzing markers: {e}", "ERROR")
-            info['markers'] = []
-        
-        return info
+            DEBUG.log(f"Error analyzing embedded media {file_id}: {e}", "ERROR")
+            return None
 
     def format_markers_for_display(self, markers):
 
@@ -17752,6 +17293,10 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         return formatted_markers
     def get_wem_audio_info(self, wem_path):
         """Get detailed audio information from WEM file"""
+        return self.wem_catalog.lookup(wem_path)
+
+    def _probe_wem_vgmstream(self, wem_path):
+        """Fallback for codecs WEMAnalyzer cannot size (ADPCM, Opus, ...)."""
         try:
             result = subprocess.run(
                 [self.vgmstream_path, "-m", wem_path],
@@ -17914,6 +17459,7 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
                     self.subtitles.update(imported)
                     
                     for key, value in imported.items():
+                        self.search_index.invalidate(key)
                         if key in self.original_subtitles and self.original_subtitles[key] != value:
                             self.modified_subtitles.add(key)
                         else:
@@ -18023,6 +17569,8 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
         thread.start()
 
     def _check_updates_thread(self, silent=False):
+        import requests
+        from packaging import version
         try:
             # Updated to check YOUR version.json on GitHub Gist
             repo_url = "https://gist.githubusercontent.com/FastDrive01/bb672471ff9a02d98734439f116ecf80/raw"
@@ -18580,7 +18128,19 @@ class WemSubtitleApp(QtWidgets.QMainWindow):
             elif reply == QtWidgets.QMessageBox.Yes:
                 self.save_subtitles_to_file()
         self.save_converter_file_list()        
+        if self.scanner_thread and self.scanner_thread.isRunning():
+            self.scanner_thread.stop()
+            self.scanner_thread.wait()
+        for thread in list(self.audio_filter_threads):
+            thread.stop()
+            thread.wait()
+        if self.catalog_thread and self.catalog_thread.isRunning():
+            self.catalog_thread.stop()
+            self.catalog_thread.wait()
+        self.wem_catalog.close()
         self.stop_audio()
+        self.audio_player.stop()
+        self.wav_cache.close()
         event.accept()
 class EasterEggLoader(QObject):
     config_loaded = pyqtSignal(dict)    
@@ -18668,6 +18228,89 @@ class EasterEggLoader(QObject):
         thread = threading.Thread(target=download_image)
         thread.daemon = True
         thread.start()
+class StartupBenchmark:
+    """Repeatable cold-start timings, run with --benchmark-startup [runs].
+
+    The app is started runs times (5 by default) in child processes that quit
+    as soon as the main window is shown. Each child reports milliseconds since
+    the first line of the module for each startup stage. The parent prints the
+    median of every stage and, when running from source, the slowest
+    top-level imports taken from python -X importtime.
+    """
+
+    FLAG = "--benchmark-startup"
+    CHILD_FLAG = "--benchmark-startup-child"
+    STAGES = ("module_loaded", "splash_shown", "window_created", "window_shown")
+
+    def __init__(self):
+        self.marks = {}
+
+    def mark(self, stage: str):
+        self.marks[stage] = round((time.perf_counter() - _STARTUP_T0) * 1000, 1)
+
+    def report(self):
+        print(json.dumps(self.marks), flush=True)
+
+    @staticmethod
+    def _median(values):
+        values = sorted(values)
+        middle = len(values) // 2
+        return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+    @staticmethod
+    def _top_level_imports(stderr: str) -> dict:
+        """{module: cumulative ms} for the top-level entries of -X importtime output."""
+        imports = {}
+        for line in stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            parts = line[len("import time:"):].split("|")
+            if len(parts) != 3 or not parts[1].strip().isdigit():
+                continue
+            name = parts[2].rstrip()
+            # Nested imports are indented by two spaces per level
+            if name.startswith(" ") and not name.startswith("  "):
+                imports[name.strip()] = int(parts[1]) / 1000
+        return imports
+
+    @classmethod
+    def run(cls, runs: int = 5) -> int:
+        frozen = getattr(sys, 'frozen', False)
+        if frozen:
+            command = [sys.executable, cls.CHILD_FLAG]
+        else:
+            command = [sys.executable, "-X", "importtime", os.path.abspath(__file__), cls.CHILD_FLAG]
+
+        marks = {stage: [] for stage in cls.STAGES}
+        imports = {}
+        for index in range(1, runs + 1):
+            result = subprocess.run(command, capture_output=True, text=True, timeout=300)
+            lines = [line for line in result.stdout.splitlines() if line.startswith("{")]
+            if result.returncode != 0 or not lines:
+                print(f"Run {index} failed (exit code {result.returncode})")
+                print(result.stderr[-2000:])
+                return 1
+            run_marks = json.loads(lines[-1])
+            print(f"Run {index}: " + ", ".join(f"{stage} {run_marks.get(stage, 0):.0f} ms" for stage in cls.STAGES))
+            for stage in cls.STAGES:
+                marks[stage].append(run_marks.get(stage, 0))
+            for name, ms in cls._top_level_imports(result.stderr).items():
+                imports.setdefault(name, []).append(ms)
+
+        print(f"\nMedian of {runs} runs:")
+        print(f"  time to splash: {cls._median(marks['splash_shown']):8.1f} ms")
+        print(f"  time to window: {cls._median(marks['window_shown']):8.1f} ms")
+        for stage in cls.STAGES:
+            print(f"  {stage:<15} {cls._median(marks[stage]):8.1f} ms")
+        if imports:
+            print("\nSlowest top-level imports (median cumulative):")
+            slowest = sorted(imports.items(), key=lambda item: cls._median(item[1]), reverse=True)[:15]
+            for name, values in slowest:
+                print(f"  {cls._median(values):8.1f} ms  {name}")
+        elif frozen:
+            print("\nImport breakdown is only available when running from source.")
+        return 0
+
 def global_exception_handler(exc_type, exc_value, exc_traceback):
     error_details = ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
     full_error_msg = f"An unexpected error occurred:\n\n{error_details}"
@@ -18723,14 +18366,24 @@ class CompileModThread(QtCore.QThread):
 
     finished = QtCore.pyqtSignal(bool, str) 
 
-    def __init__(self, repak_path, mod_p_path, parent=None):
+    def __init__(self, repak_path, mod_p_path, bnk_delta=None, parent=None):
         super().__init__(parent)
         self.repak_path = repak_path
         self.mod_p_path = mod_p_path
+        self.bnk_delta = bnk_delta
 
     def run(self):
         command = [self.repak_path, "pack", "--version", "V11", "--compression", "Zlib", self.mod_p_path]
+        staging_root = None
         try:
+            if self.bnk_delta is not None and self.bnk_delta.banks:
+                # Materialise the delta banks into a staging copy of MOD_P and pack that instead
+                staging_root = os.path.join(os.path.dirname(self.mod_p_path), ".staging")
+                staging_path = os.path.join(staging_root, os.path.basename(self.mod_p_path))
+                self.bnk_delta.stage_profile(self.mod_p_path, staging_path)
+                command = [self.repak_path, "pack", "--version", "V11", "--compression", "Zlib",
+                           staging_path, f"{self.mod_p_path}.pak"]
+
             if sys.platform == "win32":
                 startupinfo = subprocess.STARTUPINFO()
                 startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
@@ -18757,6 +18410,9 @@ class CompileModThread(QtCore.QThread):
                 self.finished.emit(False, result.stderr)
         except Exception as e:
             self.finished.emit(False, str(e))
+        finally:
+            if staging_root:
+                shutil.rmtree(staging_root, ignore_errors=True)
 class AddFilesThread(QtCore.QThread):
     progress_updated = QtCore.pyqtSignal(int, str) 
     details_updated = QtCore.pyqtSignal(str) 
@@ -18963,6 +18619,13 @@ class DropFilesThread(QtCore.QThread):
         except Exception as e:
             self.error_occurred.emit(str(e))
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    if StartupBenchmark.FLAG in sys.argv:
+        runs = sys.argv[sys.argv.index(StartupBenchmark.FLAG) + 1:]
+        sys.exit(StartupBenchmark.run(int(runs[0]) if runs and runs[0].isdigit() else 5))
+    benchmark = StartupBenchmark() if StartupBenchmark.CHILD_FLAG in sys.argv else None
+    if benchmark:
+        benchmark.mark("module_loaded")
     from PyQt5.QtCore import QSharedMemory
     from PyQt5.QtWidgets import QMessageBox
 
@@ -18997,9 +18660,10 @@ if __name__ == "__main__":
     
     temp_settings = AppSettings()
     lang = temp_settings.data.get("ui_language", "en")
-    temp_tr = lambda key: TRANSLATIONS.get(lang, {}).get(key, key)
+    temp_tr = lambda key: TRANSLATIONS.text(lang, key)
     
-    if not shared_memory.create(1):
+    # Benchmark runs may overlap with an open editor, so they skip the single-instance check
+    if not benchmark and not shared_memory.create(1):
         QMessageBox.warning(
             None, 
             temp_tr("app_already_running_title"), 
@@ -19047,10 +18711,14 @@ if __name__ == "__main__":
         show_splash_message("splash_loading_app")
         splash.show()
         app.processEvents()
+    if benchmark:
+        benchmark.mark("splash_shown")
     
     try:
         if splash: show_splash_message("splash_init_ui")
         window = WemSubtitleApp()
+        if benchmark:
+            benchmark.mark("window_created")
 
         # Force main window to use the same icon as the app
         try:
@@ -19067,6 +18735,15 @@ if __name__ == "__main__":
             splash.finish(window)
         
         window.show()
+
+        if benchmark:
+            def finish_benchmark():
+                benchmark.mark("window_shown")
+                benchmark.report()
+                # Leave without closeEvent: a timing run must not save settings or open prompts
+                os._exit(0)
+            QtCore.QTimer.singleShot(0, finish_benchmark)
+            sys.exit(app.exec_())
         
         # Check for updates AFTER splash closes and window is shown
         QtCore.QTimer.singleShot(500, window.check_updates_on_startup)